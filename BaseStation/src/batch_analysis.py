@@ -0,0 +1,235 @@
+"""
+Headless analysis of flight files: every flight goes through the processing pipeline of the replays, without Qt, and
+the flights are spread across a pool of processes.
+
+    python -m src.batch_analysis src/resources/*.csv -o summary.csv --columns processed/ -j 8
+"""
+import argparse
+import csv
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterable, List
+
+import numpy as np
+
+from src.config import Config, ConfigLoader
+from src.data_processing.consumer import Consumer
+from src.data_processing.consumer_factory import ConsumerFactory
+from src.data_processing.gps.coordinate_conversion_strategy_factory import CoordinateConversionStrategyFactory
+from src.data_processing.gps.gps_fix_validator import GpsFixValidatorFactory
+from src.data_producer import DataProducer
+from src.domain_error import DomainError
+from src.persistence.binary_data_persister import BinaryDataPersister
+from src.persistence.csv_data_persister import CsvDataPersister
+from src.persistence.sqlite_data_persister import SqliteDataPersister
+from src.rocket_packet.rocket_packet_parser_factory import RocketPacketParserFactory, RocketPacketVersionException
+from src.rocket_packet.rocket_packet_repository import RocketPacketRepository
+
+VOLTAGE_FIELD = "voltage"
+
+
+class FlightAnalysis:
+    FIELD_NAMES = ("filename", "rocket_packet_version", "packet_count", "duration", "apogee_altitude_feet",
+                   "apogee_time_stamp", "time_to_apogee", "drift_distance", "base_camp_spread", "orientation_spread",
+                   "max_voltage_drop", "columns_filename", "error")
+
+    def __init__(self, filename: str, rocket_packet_version: int = None, packet_count: int = None,
+                 duration: float = None, apogee_altitude_feet: float = None, apogee_time_stamp: float = None,
+                 time_to_apogee: float = None, drift_distance: float = None, base_camp_spread: float = None,
+                 orientation_spread: float = None, max_voltage_drop: float = None, columns_filename: str = None,
+                 error: str = None):
+        """
+        :param time_to_apogee: Time between the first packet and the apogee, or None if the apogee was not reached.
+        :param drift_distance: Horizontal distance in meters between the base camp and the last GPS position.
+        :param base_camp_spread: Horizontal standard deviation in meters of the positions averaged into the base camp,
+                                 which tells how precise the drift distance is.
+        :param orientation_spread: Standard deviation in degrees of the measures averaged into the initial orientation,
+                                   combined over its axes, which tells how steady the rocket was on the pad.
+        :param max_voltage_drop: Largest fall of the voltage below its highest value so far.
+        :param error: Why the flight could not be analyzed, or None if it was analyzed.
+        """
+        self.filename = filename
+        self.rocket_packet_version = rocket_packet_version
+        self.packet_count = packet_count
+        self.duration = duration
+        self.apogee_altitude_feet = apogee_altitude_feet
+        self.apogee_time_stamp = apogee_time_stamp
+        self.time_to_apogee = time_to_apogee
+        self.drift_distance = drift_distance
+        self.base_camp_spread = base_camp_spread
+        self.orientation_spread = orientation_spread
+        self.max_voltage_drop = max_voltage_drop
+        self.columns_filename = columns_filename
+        self.error = error
+
+    def is_valid(self) -> bool:
+        return self.error is None
+
+    def to_row(self) -> list:
+        return ["" if getattr(self, name) is None else getattr(self, name) for name in self.FIELD_NAMES]
+
+
+def create_rocket_packet_repository(config: Config) -> RocketPacketRepository:
+    rocket_packet_repository = RocketPacketRepository(
+        CsvDataPersister(), RocketPacketParserFactory(),
+        {BinaryDataPersister.EXTENSION: BinaryDataPersister(), SqliteDataPersister.EXTENSION: SqliteDataPersister()})
+    rocket_packet_repository.set_raw_journal_format(config.rocket_packet_config.version,
+                                                    config.serial_port_config.start_character)
+    return rocket_packet_repository
+
+
+def create_consumer_factory() -> ConsumerFactory:
+    return ConsumerFactory(CoordinateConversionStrategyFactory(), GpsFixValidatorFactory())
+
+
+def analyze_flight(filename: str, config: Config, columns_directory: str = None,
+                   consumer_factory: ConsumerFactory = None) -> FlightAnalysis:
+    """
+    Run a flight through the consumer chunk by chunk, with no acquisition thread: the packets are added to the data
+    producer and processed right away. Runs in the worker processes, so it only takes picklable arguments and builds
+    its own repository.
+    :param columns_directory: Where to write the processed columns of the flight, or None not to write them.
+    """
+    consumer_factory = consumer_factory or create_consumer_factory()
+    analysis = FlightAnalysis(filename)
+    try:
+        rocket_packet_repository = create_rocket_packet_repository(config)
+        rocket_packet_version, rocket_packets_chunks = rocket_packet_repository.iter_load(filename)
+
+        data_producer = DataProducer(threading.Lock())
+        consumer = consumer_factory.create(data_producer, rocket_packet_version, config)
+
+        for rocket_packets in rocket_packets_chunks:
+            data_producer.rocket_packets.extend(rocket_packets)
+            consumer.update()
+
+        # The text persisters read the version as a number of any type
+        analysis.rocket_packet_version = int(rocket_packet_version)
+        _summarize(analysis, consumer, RocketPacketParserFactory.create(rocket_packet_version).get_field_names())
+
+        if columns_directory is not None and consumer.has_data():
+            analysis.columns_filename = _save_columns(filename, rocket_packet_version, consumer, columns_directory)
+    except (DomainError, RocketPacketVersionException, OSError, ValueError, TypeError, IndexError) as error:
+        analysis.error = str(error) or type(error).__name__
+
+    return analysis
+
+
+def _summarize(analysis: FlightAnalysis, consumer: Consumer, field_names: List[str]):
+    time_stamps = consumer["time_stamp"]
+    analysis.packet_count = len(time_stamps)
+    if len(time_stamps) == 0:
+        return
+
+    analysis.duration = float(time_stamps[-1] - time_stamps[0])
+
+    apogee = consumer.get_apogee()
+    if apogee.is_reached:
+        analysis.apogee_altitude_feet = float(apogee.altitude)
+        analysis.apogee_time_stamp = float(apogee.timestamp)
+        analysis.time_to_apogee = float(apogee.timestamp - time_stamps[0])
+
+    easting, northing = consumer.get_projected_coordinates()
+    if len(easting) > 0:
+        analysis.drift_distance = float(np.hypot(easting[-1], northing[-1]))
+
+    base_camp_spread = consumer.get_base_camp_spread()
+    if base_camp_spread is not None:
+        analysis.base_camp_spread = float(np.hypot(base_camp_spread.easting, base_camp_spread.northing))
+
+    orientation_spread = consumer.get_orientation_spread()
+    if orientation_spread is not None:
+        analysis.orientation_spread = float(np.linalg.norm([orientation_spread.roll, orientation_spread.pitch,
+                                                            orientation_spread.yaw]))
+
+    # Not every packet version sends the voltage
+    if VOLTAGE_FIELD in field_names:
+        voltages = consumer[VOLTAGE_FIELD]
+        analysis.max_voltage_drop = float(np.max(np.maximum.accumulate(voltages) - voltages))
+
+
+def _save_columns(filename: str, rocket_packet_version: int, consumer: Consumer, columns_directory: str) -> str:
+    database_filename, flight_name = SqliteDataPersister.split_flight_filename(filename)
+    name = os.path.splitext(os.path.basename(database_filename))[0]
+    if flight_name is not None:
+        name += "_" + flight_name
+    columns_filename = os.path.join(columns_directory, name + "_processed" + BinaryDataPersister.EXTENSION)
+
+    columns = consumer.data.snapshot()
+    os.makedirs(columns_directory, exist_ok=True)
+    BinaryDataPersister().save_columns(columns_filename, rocket_packet_version, list(columns), columns)
+
+    return columns_filename
+
+
+def analyze_flights(filenames: Iterable[str], config: Config, columns_directory: str = None,
+                    max_workers: int = None, consumer_factory: ConsumerFactory = None) -> List[FlightAnalysis]:
+    """
+    :param max_workers: Number of processes, the number of processors by default. With a single worker the flights are
+                        analyzed in this process.
+    :return: The analyses, in the order of the file names.
+    """
+    filenames = list(filenames)
+    if max_workers == 1:
+        return [_get_analysis(filename, lambda filename=filename: analyze_flight(
+            filename, config, columns_directory, consumer_factory)) for filename in filenames]
+
+    analyses = [None] * len(filenames)
+    with ProcessPoolExecutor(max_workers) as executor:
+        futures = {executor.submit(analyze_flight, filename, config, columns_directory, consumer_factory): i
+                   for i, filename in enumerate(filenames)}
+        for future in as_completed(futures):
+            i = futures[future]
+            analyses[i] = _get_analysis(filenames[i], future.result)
+
+    return analyses
+
+
+def _get_analysis(filename: str, analyze: Callable[[], FlightAnalysis]) -> FlightAnalysis:
+    try:
+        return analyze()
+    except Exception as error:
+        # A flight that breaks the pipeline or its worker must not stop the analysis of the others
+        return FlightAnalysis(filename, error=str(error) or type(error).__name__)
+
+
+def write_summary(analyses: Iterable[FlightAnalysis], file):
+    writer = csv.writer(file)
+    writer.writerow(FlightAnalysis.FIELD_NAMES)
+    for analysis in analyses:
+        writer.writerow(analysis.to_row())
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.batch_analysis",
+                                     description="Analyse des fichiers de vol sans interface graphique")
+    parser.add_argument("filenames", nargs="+", metavar="fichier",
+                        help="fichiers de vol (.csv, .bin, .raw ou bibliotheque.db::vol)")
+    parser.add_argument("-o", "--output", help="fichier CSV du sommaire, la sortie standard par défaut")
+    parser.add_argument("--columns", metavar="DOSSIER",
+                        help="dossier où écrire les colonnes calculées de chaque vol")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="nombre de processus, un par processeur par défaut")
+    parser.add_argument("--config", default=ConfigLoader.FILENAME, help="fichier de configuration")
+    arguments = parser.parse_args(argv)
+
+    config = ConfigLoader.load(arguments.config)
+    analyses = analyze_flights(arguments.filenames, config, arguments.columns, arguments.jobs)
+
+    if arguments.output is None:
+        write_summary(analyses, sys.stdout)
+    else:
+        with open(arguments.output, "w", newline="") as file:
+            write_summary(analyses, file)
+
+    for analysis in analyses:
+        if not analysis.is_valid():
+            print("Impossible d'analyser le fichier {}: {}".format(analysis.filename, analysis.error), file=sys.stderr)
+
+    return 0 if all(analysis.is_valid() for analysis in analyses) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
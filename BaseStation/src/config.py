@@ -18,6 +18,9 @@ class SerialPortConfig:
 
 class GpsConfig:
     def __init__(self, gps_device_name: str, utm_zone: UTMZone, initialization_delay: int):
+        """
+        :param utm_zone: Zone of the projected positions, or None to detect it from the first GPS positions.
+        """
         self.gps_device_name = gps_device_name
         self.utm_zone = utm_zone
         self.initialization_delay = initialization_delay
@@ -28,29 +31,45 @@ class OrientationConfig:
         self.initialization_delay_in_seconds = initialization_delay_in_seconds
 
 
+class JournalConfig:
+    # Used for the config files written before the journal, which have no journal section
+    DEFAULT_DIRECTORY = "./src/resources/journals/"
+    DEFAULT_FSYNC_INTERVAL_IN_SECONDS = 1.0
+
+    def __init__(self, directory: str, fsync_interval_in_seconds: float):
+        self.directory = directory
+        self.fsync_interval_in_seconds = fsync_interval_in_seconds
+
+
 class Config:
     def __init__(self, target_altitude: int, gui_fps: float, rocket_packet_config: RocketPacketConfig,
-                 gps_config: GpsConfig, orientation_config: OrientationConfig, serial_port_config: SerialPortConfig):
+                 gps_config: GpsConfig, orientation_config: OrientationConfig, serial_port_config: SerialPortConfig,
+                 journal_config: JournalConfig):
         self.target_altitude = target_altitude
         self.gui_fps = gui_fps
         self.rocket_packet_config = rocket_packet_config
         self.gps_config = gps_config
         self.orientation_config = orientation_config
         self.serial_port_config = serial_port_config
+        self.journal_config = journal_config
 
 
 class ConfigLoader:
+    FILENAME = "config.ini"
+    # Value of utm_zone for a zone detected from the first GPS positions
+    AUTO_UTM_ZONE = "auto"
+
     @staticmethod
-    def load():
+    def load(filename: str = FILENAME):
         config_parser = ConfigParser()
-        config_parser.read("config.ini")
+        config_parser.read(filename)
 
         rocket_packet_version = int(config_parser["rocket_packet"]["version"])
         sampling_frequency = float(config_parser["rocket_packet"]["sampling_frequency"])
         rocket_packet_config = RocketPacketConfig(rocket_packet_version, sampling_frequency)
 
         gps_device_name = config_parser["gps"]["gps_device_name"]
-        utm_zone = UTMZone(config_parser["gps"]["utm_zone"])
+        utm_zone = ConfigLoader._parse_utm_zone(config_parser["gps"].get("utm_zone", ""))
         gps_initialization_delay = int(config_parser["gps"]["initialization_delay_in_seconds"])
         gps_config = GpsConfig(gps_device_name, utm_zone, gps_initialization_delay)
 
@@ -62,7 +81,24 @@ class ConfigLoader:
         timeout = int(config_parser["serial_port"]["timeout"])
         port_config = SerialPortConfig(start_byte, baudrate, timeout)
 
+        journal_directory = config_parser.get("journal", "directory", fallback=JournalConfig.DEFAULT_DIRECTORY)
+        fsync_interval = config_parser.getfloat("journal", "fsync_interval_in_seconds",
+                                                fallback=JournalConfig.DEFAULT_FSYNC_INTERVAL_IN_SECONDS)
+        journal_config = JournalConfig(journal_directory, fsync_interval)
+
         target_altitude = int(config_parser["general"]["target_altitude"])
         gui_fps = float(config_parser["general"]["gui_fps"])
 
-        return Config(target_altitude, gui_fps, rocket_packet_config, gps_config, orientation_config, port_config)
+        return Config(target_altitude, gui_fps, rocket_packet_config, gps_config, orientation_config, port_config,
+                      journal_config)
+
+    @staticmethod
+    def _parse_utm_zone(value: str) -> UTMZone:
+        """
+        :return: The configured zone, or None if the zone is detected.
+        """
+        value = value.strip()
+        if not value or value.lower() == ConfigLoader.AUTO_UTM_ZONE:
+            return None
+
+        return UTMZone(value)
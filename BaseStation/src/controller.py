@@ -1,10 +1,13 @@
 import abc
+import time
 
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import QTimer, Qt
 from PyQt5.QtGui import QCloseEvent
 
 from src.config import Config
 from src.data_processing.consumer_factory import ConsumerFactory
+from src.data_processing.consumer_snapshot import ConsumerSnapshot
+from src.data_processing.consumer_worker import ConsumerWorker
 from src.data_producer import DataProducer
 from src.message_sender import MessageSender
 from src.message_type import MessageType
@@ -25,10 +28,16 @@ class Controller(MessageSender):
         self.data_producer = data_producer
         self.target_altitude = config.target_altitude
         self.consumer = None
+        self.consumer_worker = None
+        self.snapshot = None
+        self.snapshot_changed = False
+        self.last_render_time = 0.0
         self.consumer_factory = consumer_factory
         self.updates_interval_in_millis = 1000.0 / config.gui_fps
         self.current_config = config
+        # Single shot timer that coalesces the snapshots received during a frame into one render
         self.timer = timer
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.update)
 
     def add_open_rocket_simulation(self, filename):
@@ -40,12 +49,38 @@ class Controller(MessageSender):
             self.notify_all_message_listeners(str(error), MessageType.ERROR)
 
     def update(self):
-        self.consumer.update()
-
-        if self.consumer.has_data():
+        """
+        Render the last snapshot published by the consumer worker, unless it was already rendered. The processing itself
+        is done by the worker thread.
+        """
+        if self.snapshot_changed and self.snapshot.has_data():
             self.update_ui()
 
-        self.consumer.clear()
+        self.snapshot_changed = False
+        self.last_render_time = time.monotonic()
+
+    def on_snapshot_ready(self, snapshot: ConsumerSnapshot):
+        """
+        Schedule a render of the snapshot. Snapshots received before the end of the current frame replace the pending
+        one, so there is at most one render per frame.
+        """
+        self.snapshot = snapshot
+        self.snapshot_changed = True
+
+        if not self.timer.isActive():
+            elapsed_time_in_millis = (time.monotonic() - self.last_render_time) * 1000
+            self.timer.start(max(0, int(self.updates_interval_in_millis - elapsed_time_in_millis)))
+
+    def refresh(self):
+        """
+        Process the packets already produced and render them right away, without waiting for the consumer worker.
+        """
+        snapshot = self.consumer_worker.update()
+        if snapshot is not None:
+            self.snapshot = snapshot
+            self.snapshot_changed = True
+
+        self.update()
 
     def update_ui(self):
         self.update_plots()
@@ -54,34 +89,38 @@ class Controller(MessageSender):
         self.update_3d_model()
 
     def update_plots(self):
-        self.data_widget.draw_altitude(self.consumer["time_stamp"], self.consumer["altitude_feet"])
-        self.data_widget.draw_apogee(self.consumer.get_apogee())
-        self.data_widget.draw_map(*self.consumer.get_projected_coordinates())
-        self.data_widget.show_current_coordinates(self.consumer.get_last_gps_coordinates())
-        self.data_widget.draw_voltage(self.consumer["voltage"])
+        generation = self.snapshot.get_generation()
+        self.data_widget.draw_altitude(self.snapshot["time_stamp"], self.snapshot["altitude_feet"], generation)
+        self.data_widget.draw_apogee(self.snapshot.get_apogee())
+        self.data_widget.draw_map(*self.snapshot.get_projected_coordinates(), self.snapshot.get_positions_generation())
+        self.data_widget.show_current_coordinates(self.snapshot.get_last_gps_coordinates())
+        self.data_widget.draw_voltage(self.snapshot["time_stamp"], self.snapshot["voltage"], generation)
 
     def update_3d_model(self):
-        self.data_widget.set_rocket_model_orientation(self.consumer.get_rocket_orientation())
+        self.data_widget.set_rocket_model_orientation(self.snapshot.get_rocket_orientation())
 
     def update_leds(self):
-        self.data_widget.set_led_state(1, self.consumer["acquisition_board_state_1"][-1])
-        self.data_widget.set_led_state(2, self.consumer["acquisition_board_state_2"][-1])
-        self.data_widget.set_led_state(3, self.consumer["acquisition_board_state_3"][-1])
-        self.data_widget.set_led_state(4, self.consumer["power_supply_state_1"][-1])
-        self.data_widget.set_led_state(5, self.consumer["power_supply_state_2"][-1])
-        self.data_widget.set_led_state(6, self.consumer["payload_board_state_1"][-1])
+        self.data_widget.set_led_state(1, self.snapshot["acquisition_board_state_1"][-1])
+        self.data_widget.set_led_state(2, self.snapshot["acquisition_board_state_2"][-1])
+        self.data_widget.set_led_state(3, self.snapshot["acquisition_board_state_3"][-1])
+        self.data_widget.set_led_state(4, self.snapshot["power_supply_state_1"][-1])
+        self.data_widget.set_led_state(5, self.snapshot["power_supply_state_2"][-1])
+        self.data_widget.set_led_state(6, self.snapshot["payload_board_state_1"][-1])
 
     def update_thermometer(self):
-        self.data_widget.set_thermometer_value(self.consumer.get_average_temperature())
+        self.data_widget.set_thermometer_value(self.snapshot.get_average_temperature())
 
     def start_updates(self):
         self.data_producer.start()
+        if self.consumer_worker is not None:
+            self.consumer_worker.start()
         self.is_running = True
-        self.timer.start(self.updates_interval_in_millis)
 
     def stop_updates(self):
         self.is_running = False
         self.timer.stop()
+        if self.consumer_worker is not None:
+            self.consumer_worker.stop()
         self.data_producer.stop()
 
     def on_close(self, event: QCloseEvent):
@@ -91,7 +130,17 @@ class Controller(MessageSender):
         event.accept()
 
     def create_new_consumer(self, rocket_packet_version: int):
+        if self.consumer_worker is not None:
+            self.consumer_worker.stop()
+            self.consumer_worker.snapshot_ready.disconnect(self.on_snapshot_ready)
+
         self.consumer = self.consumer_factory.create(self.data_producer, rocket_packet_version, self.current_config)
+        self.snapshot = None
+        self.snapshot_changed = False
+
+        # The snapshots are emitted from the worker thread, the queued connection delivers them on the GUI thread
+        self.consumer_worker = ConsumerWorker(self.consumer, self.data_producer)
+        self.consumer_worker.snapshot_ready.connect(self.on_snapshot_ready, Qt.QueuedConnection)
 
     @abc.abstractmethod
     def activate(self, filename: str) -> None:
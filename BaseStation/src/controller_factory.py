@@ -6,9 +6,16 @@ from src.config import ConfigLoader
 from src.data_processing.consumer_factory import ConsumerFactory
 from src.data_processing.gps.coordinate_conversion_strategy_factory import CoordinateConversionStrategyFactory
 from src.data_processing.gps.gps_fix_validator import GpsFixValidatorFactory
+from src.persistence.binary_data_persister import BinaryDataPersister
 from src.persistence.csv_data_persister import CsvDataPersister
+from src.persistence.flight_cache import FlightCache
+from src.persistence.flight_catalog import FlightCatalog
+from src.persistence.flight_catalog_indexer import FlightCatalogIndexer
+from src.persistence.sqlite_data_persister import SqliteDataPersister
 from src.real_time_controller import RealTimeController
 from src.realtime.checksum_validator import ChecksumValidator
+from src.realtime.journal_recovery import JournalRecovery
+from src.realtime.journal_writer import JournalWriter
 from src.realtime.serial_data_producer import SerialDataProducer
 from src.replay.file_data_producer import FileDataProducer
 from src.replay.playback_state import PlaybackState
@@ -25,9 +32,13 @@ from src.ui.replay_widget import ReplayWidget
 class ControllerFactory:
     def __init__(self):
         self.csv_data_persister = CsvDataPersister()
+        self.binary_data_persister = BinaryDataPersister()
+        self.sqlite_data_persister = SqliteDataPersister()
         self.rocket_packet_parser_factory = RocketPacketParserFactory()
-        self.rocket_packet_repository = RocketPacketRepository(self.csv_data_persister,
-                                                               self.rocket_packet_parser_factory)
+        self.rocket_packet_repository = RocketPacketRepository(
+            self.csv_data_persister, self.rocket_packet_parser_factory,
+            {BinaryDataPersister.EXTENSION: self.binary_data_persister,
+             SqliteDataPersister.EXTENSION: self.sqlite_data_persister}, FlightCache())
         self.coordinate_conversion_strategy_factory = CoordinateConversionStrategyFactory()
         self.gps_fix_validator_factory = GpsFixValidatorFactory()
 
@@ -37,11 +48,16 @@ class ControllerFactory:
         checksum_validator = ChecksumValidator()
         checksum_validator.register_message_listener(console)  # FIXME: maybe this should be done elsewhere...
 
+        journal_writer = JournalWriter(config.journal_config.directory, config.journal_config.fsync_interval_in_seconds)
+        journal_writer.register_message_listener(console)
+
         rocket_packet_parser = self.rocket_packet_parser_factory.create(config.rocket_packet_config.version)
         lock = threading.Lock()
         data_producer = SerialDataProducer(lock, self.rocket_packet_repository, rocket_packet_parser,
-                                           checksum_validator,
-                                           sampling_frequency=config.rocket_packet_config.sampling_frequency)
+                                           checksum_validator, baudrate=config.serial_port_config.baudrate,
+                                           start_character=config.serial_port_config.start_character,
+                                           sampling_frequency=config.rocket_packet_config.sampling_frequency,
+                                           journal_writer=journal_writer)
 
         consumer_factory = ConsumerFactory(self.coordinate_conversion_strategy_factory, self.gps_fix_validator_factory)
 
@@ -51,6 +67,8 @@ class ControllerFactory:
 
     def create_replay_controller(self, replay_widget: ReplayWidget, motor_widget: MotorWidget):
         config = ConfigLoader.load()
+        self.rocket_packet_repository.set_raw_journal_format(config.rocket_packet_config.version,
+                                                             config.serial_port_config.start_character)
 
         data_lock = threading.RLock()
         playback_lock = threading.Lock()
@@ -60,3 +78,25 @@ class ControllerFactory:
         consumer_factory = ConsumerFactory(self.coordinate_conversion_strategy_factory, self.gps_fix_validator_factory)
 
         return ReplayController(replay_widget, motor_widget, data_producer, consumer_factory, config, QTimer())
+
+    def create_journal_recovery(self) -> JournalRecovery:
+        config = ConfigLoader.load()
+        self.rocket_packet_repository.set_raw_journal_format(config.rocket_packet_config.version,
+                                                             config.serial_port_config.start_character)
+
+        return JournalRecovery(self.rocket_packet_repository, self.rocket_packet_parser_factory,
+                               config.journal_config.directory, SaveManager.BASE_PATH)
+
+    def create_flight_catalog_indexer(self) -> FlightCatalogIndexer:
+        config = ConfigLoader.load()
+
+        # The catalog is read on its own thread, so it gets a repository without the flight cache of the replays
+        rocket_packet_repository = RocketPacketRepository(
+            self.csv_data_persister, self.rocket_packet_parser_factory,
+            {BinaryDataPersister.EXTENSION: self.binary_data_persister,
+             SqliteDataPersister.EXTENSION: self.sqlite_data_persister})
+        rocket_packet_repository.set_raw_journal_format(config.rocket_packet_config.version,
+                                                        config.serial_port_config.start_character)
+
+        flight_catalog = FlightCatalog(rocket_packet_repository, self.sqlite_data_persister, SaveManager.BASE_PATH)
+        return FlightCatalogIndexer(flight_catalog)
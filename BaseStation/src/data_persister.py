@@ -1,5 +1,5 @@
 import abc
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 
 class DataPersister:
@@ -16,3 +16,20 @@ class DataPersister:
     @abc.abstractmethod
     def load(self, filename: str) -> Tuple[int, List[List]]:
         pass
+
+    def save_stream(self, filename: str, rocket_packet_version: int, field_names: List[str],
+                    rocket_packets_fields_chunks: Iterable[List[List]]):
+        """
+        Save the packets fields given in successive chunks. Persisters able to write a chunk at a time override this
+        method, so the fields of every packet never need to be in memory at once.
+        """
+        all_rocket_packets_fields = [packet_fields for chunk in rocket_packets_fields_chunks for packet_fields in chunk]
+        self.save(filename, rocket_packet_version, field_names, all_rocket_packets_fields)
+
+    def iter_load(self, filename: str) -> Tuple[int, Iterator[List[List]]]:
+        """
+        :return: A tuple as (rocket_packet_version, chunks), where chunks yields the packets fields in successive lists.
+                 Persisters able to read a chunk at a time override this method.
+        """
+        rocket_packet_version, all_rocket_packets_fields = self.load(filename)
+        return rocket_packet_version, iter([all_rocket_packets_fields])
@@ -41,5 +41,11 @@ class ApogeeCalculator:
 
         self.last_altitude_index = 0
 
+    def get_state(self):
+        return self.apogee, self.apogee_index, self.last_altitude_index
+
+    def set_state(self, state):
+        self.apogee, self.apogee_index, self.last_altitude_index = state
+
     def get_apogee(self):
         return self.apogee
@@ -0,0 +1,82 @@
+from typing import Dict
+
+import numpy as np
+
+
+class ColumnStore:
+    """
+    Typed, growable NumPy columns, one per field of a structured dtype. Indexing a column returns a view of its filled
+    part, which can be handed to pyqtgraph without conversion.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, dtype: np.dtype, initial_capacity: int = INITIAL_CAPACITY):
+        self.dtype = dtype
+        self.initial_capacity = initial_capacity
+        self._columns = self._allocate(initial_capacity)
+        self._length = 0
+
+    def append(self, columns: Dict[str, np.ndarray]):
+        """
+        :param columns: New values of every column, all with the same length. Missing columns are left to zero.
+        """
+        count = len(next(iter(columns.values()))) if columns else 0
+        new_length = self._length + count
+        self._reserve(new_length)
+
+        for name, values in columns.items():
+            self._columns[name][self._length:new_length] = values
+
+        self._length = new_length
+
+    def truncate(self, length: int):
+        """
+        Forget the values from length onwards, in place. The values of the views returned by snapshot() before are only
+        overwritten from length onwards, by the following appends.
+        """
+        self._length = min(max(length, 0), self._length)
+
+    def clear(self):
+        self._columns = self._allocate(self.initial_capacity)
+        self._length = 0
+
+    def snapshot(self) -> Dict[str, np.ndarray]:
+        """
+        :return: Read-only views of the filled part of every column. Since the store only ever writes after its current
+                 length, or to new arrays, these views keep their values while the store is updated by another thread,
+                 until it is truncated.
+        """
+        views = {}
+        for name, column in self._columns.items():
+            view = column[:self._length]
+            view.flags.writeable = False
+            views[name] = view
+
+        return views
+
+    def keys(self):
+        return self._columns.keys()
+
+    def get_capacity(self) -> int:
+        return len(next(iter(self._columns.values())))
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._columns[name][:self._length]
+
+    def __len__(self):
+        return self._length
+
+    def _allocate(self, capacity: int) -> Dict[str, np.ndarray]:
+        return {name: np.zeros(capacity, dtype=self.dtype[name]) for name in self.dtype.names}
+
+    def _reserve(self, length: int):
+        capacity = max(self.get_capacity(), 1)
+        if length > capacity:
+            while capacity < length:
+                capacity *= 2
+
+            for name, column in self._columns.items():
+                new_column = np.zeros(capacity, dtype=column.dtype)
+                new_column[:self._length] = column[:self._length]
+                self._columns[name] = new_column
@@ -1,10 +1,16 @@
-from typing import List
-from typing import Tuple
+from operator import attrgetter
+from typing import Dict, List, Tuple
+
+import numpy as np
 
 from src.data_processing.apogee import Apogee
 from src.data_processing.apogee_calculator import ApogeeCalculator
+from src.data_processing.column_store import ColumnStore
+from src.data_processing.consumer_snapshot import ConsumerSnapshot
+from src.data_processing.generation import Generation
 from src.data_processing.gps.gps_coordinates import GpsCoordinates
 from src.data_processing.gps.gps_processor import GpsProcessor
+from src.data_processing.gps.utm_coordinates import UTMCoordinates
 from src.data_processing.orientation.orientation import Orientation
 from src.data_processing.orientation.orientation_processor import OrientationProcessor
 from src.data_producer import DataProducer
@@ -13,33 +19,137 @@ from src.rocket_packet.rocket_packet import RocketPacket
 METERS2FEET = 3.28084
 
 
-class Consumer:  # TODO: add unit tests to this class
+class Consumer:
+    CHECKPOINT_INTERVAL = 1000
+
     def __init__(self, data_producer: DataProducer, apogee_calculator: ApogeeCalculator,
-                 gps_processor: GpsProcessor, orientation_processor: OrientationProcessor):
+                 gps_processor: GpsProcessor, orientation_processor: OrientationProcessor,
+                 rocket_packet_dtype: np.dtype = None, checkpoint_interval: int = CHECKPOINT_INTERVAL):
         self.data_producer = data_producer
+        self.rocket_packet_reader = data_producer.create_rocket_packet_reader()
         self.apogee_calculator = apogee_calculator
         self.gps_processor = gps_processor
         self.orientation_processor = orientation_processor
         self.rocket_packet_version = 2019
-        self.data = {}
-        self.create_keys_from_packet_format()
-        self.data["altitude_feet"] = []
-
-    def create_keys_from_packet_format(self):
-        for key in RocketPacket.keys():
-            self.data[key] = []
+        self.data = ColumnStore(self.create_column_dtype(rocket_packet_dtype))
+        self.checkpoint_interval = checkpoint_interval
+        # State of the processors every checkpoint_interval packets, as (packet_count, state) by increasing count
+        self.checkpoints = []
+        # Cut every time packets are forgotten, so the views of the data know which part of their history was replaced
+        self.generation = Generation()
+        self.positions_generation = Generation()
+
+    @staticmethod
+    def create_column_dtype(rocket_packet_dtype: np.dtype = None) -> np.dtype:
+        """
+        Build the dtype of the consumer columns from the dtype of the packets received. Fields not sent by this packet
+        version keep the type of the RocketPacket schema so every RocketPacket key still has a column.
+        """
+        fields = []
+        for field in RocketPacket.FIELDS:
+            if rocket_packet_dtype is not None and field.name in rocket_packet_dtype.names:
+                fields.append((field.name, rocket_packet_dtype[field.name].newbyteorder("=")))
+            else:
+                fields.append((field.name, field.dtype))
+        fields.append(("altitude_feet", np.float64))
+
+        return np.dtype(fields)
+
+    def update(self) -> bool:
+        """
+        :return: True if the data changed, either because new packets were processed or because of a rollback.
+        """
+        start_index, rocket_packets = self.rocket_packet_reader.read()
+        rolled_back = start_index < len(self.data)
+
+        if rolled_back:
+            self.rollback(start_index)
 
-    def update(self):
-        rocket_packets = self.data_producer.get_available_rocket_packets()
         if len(rocket_packets) > 0:
-            for packet in rocket_packets:
-                for key, value in packet.items():
-                    self.data[key].append(value)
-                self.data["altitude_feet"].append(packet.altitude * METERS2FEET)
-                self.gps_processor.update(packet)
+            first_packet_index = len(self.data)
+            self.data.append(self._to_columns(rocket_packets))
+            self._process_new_packets(first_packet_index, rocket_packets)
+
+        return rolled_back or len(rocket_packets) > 0
+
+    def _to_columns(self, rocket_packets: List[RocketPacket]):
+        count = len(rocket_packets)
+        columns = {key: np.fromiter(map(attrgetter(key), rocket_packets), self.data.dtype[key], count)
+                   for key in RocketPacket.keys()}
+        columns["altitude_feet"] = columns["altitude"] * METERS2FEET
+
+        return columns
+
+    def _process_new_packets(self, first_packet_index: int, rocket_packets: List[RocketPacket]):
+        """
+        Process the packets appended to the columns, saving a checkpoint every time the number of processed packets
+        reaches a multiple of the checkpoint interval.
+        """
+        position = 0
+        while position < len(rocket_packets):
+            packet_count = first_packet_index + position
+            next_checkpoint = (packet_count // self.checkpoint_interval + 1) * self.checkpoint_interval
+            end = min(len(rocket_packets), position + next_checkpoint - packet_count)
+
+            for packet in rocket_packets[position:end]:
                 self.orientation_processor.update(packet)
-
-            self.apogee_calculator.update(self.data["time_stamp"], self.data["altitude_feet"])
+            self.gps_processor.update_columns(self._get_gps_columns(first_packet_index + position,
+                                                                    first_packet_index + end))
+
+            position = end
+            packet_count = first_packet_index + end
+            self.apogee_calculator.update(self.data["time_stamp"][:packet_count],
+                                          self.data["altitude_feet"][:packet_count])
+
+            if packet_count == next_checkpoint:
+                self.checkpoints.append((packet_count, self._get_processors_state()))
+
+    def rollback(self, packet_count: int):
+        """
+        Forget every packet from packet_count onwards. The processors are restored to the last checkpoint before
+        packet_count and only the packets kept after this checkpoint are fed back to them.
+        """
+        self.data.truncate(packet_count)
+        packet_count = len(self.data)
+        self.generation = self.generation.cut(packet_count)
+
+        while self.checkpoints and self.checkpoints[-1][0] > packet_count:
+            self.checkpoints.pop()
+
+        if self.checkpoints:
+            checkpoint_packet_count, state = self.checkpoints[-1]
+            self._set_processors_state(state)
+        else:
+            checkpoint_packet_count = 0
+            self._reset_processors()
+
+        keys = RocketPacket.keys()
+        for row in zip(*[self.data[key][checkpoint_packet_count:] for key in keys]):
+            self.orientation_processor.update(RocketPacket(row))
+        self.gps_processor.update_columns(self._get_gps_columns(checkpoint_packet_count, packet_count))
+
+        self.apogee_calculator.update(self.data["time_stamp"], self.data["altitude_feet"])
+
+        # The positions of the kept packets are projected again to the same values
+        self.positions_generation = self.positions_generation.cut(len(self.get_projected_coordinates()[0]))
+
+    def _get_processors_state(self):
+        return (self.gps_processor.get_state(), self.orientation_processor.get_state(),
+                self.apogee_calculator.get_state())
+
+    def _set_processors_state(self, state):
+        gps_processor_state, orientation_processor_state, apogee_calculator_state = state
+        self.gps_processor.set_state(gps_processor_state)
+        self.orientation_processor.set_state(orientation_processor_state)
+        self.apogee_calculator.set_state(apogee_calculator_state)
+
+    def _get_gps_columns(self, start: int, end: int) -> Dict[str, np.ndarray]:
+        return {key: self.data[key][start:end] for key in GpsProcessor.COLUMNS}
+
+    def _reset_processors(self):
+        self.gps_processor.reset()
+        self.orientation_processor.reset()
+        self.apogee_calculator.reset()
 
     def __getitem__(self, key):
         return self.data[key]
@@ -57,21 +167,34 @@ class Consumer:  # TODO: add unit tests to this class
     def get_average_temperature(self):
         return self.data["temperature"][-1]
 
-    def get_projected_coordinates(self) -> Tuple[List, List]:
+    def get_projected_coordinates(self) -> Tuple[np.ndarray, np.ndarray]:
         return self.gps_processor.get_projected_coordinates()
 
     def get_last_gps_coordinates(self) -> GpsCoordinates:
         return self.gps_processor.get_last_coordinates()
 
+    def get_base_camp_spread(self) -> UTMCoordinates:
+        return self.gps_processor.get_base_camp_spread()
+
+    def get_orientation_spread(self) -> Orientation:
+        return self.orientation_processor.get_initialization_spread()
+
     def get_apogee(self) -> Apogee:
         return self.apogee_calculator.get_apogee()
 
+    def create_snapshot(self) -> ConsumerSnapshot:
+        return ConsumerSnapshot(self.data.snapshot(), self.get_apogee(), self.get_projected_coordinates(),
+                                self.get_last_gps_coordinates(), self.get_rocket_orientation(),
+                                self.get_base_camp_spread(), self.get_orientation_spread(), self.generation,
+                                self.positions_generation)
+
     def clear(self):
-        for data_list in self.data.values():
-            data_list.clear()
+        self.data.clear()
+        self.checkpoints = []
+        self.generation = self.generation.cut(0)
+        self.positions_generation = self.positions_generation.cut(0)
 
-        self.gps_processor.reset()
-        self.orientation_processor.reset()
+        self._reset_processors()
 
     def has_data(self):
-        return len(self.data["time_stamp"]) != 0
+        return len(self.data) != 0
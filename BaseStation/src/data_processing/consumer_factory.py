@@ -11,6 +11,7 @@ from src.data_processing.gps.gps_processor import GpsProcessor
 from src.data_processing.gps.utm_coordinates_converter import UTMCoordinatesConverter
 from src.data_processing.orientation.angular_speed_integrator import AngularSpeedIntegrator
 from src.data_producer import DataProducer
+from src.rocket_packet.rocket_packet_parser_factory import RocketPacketParserFactory
 
 
 class ConsumerFactory:
@@ -32,4 +33,6 @@ class ConsumerFactory:
         angular_speed_integrator = AngularSpeedIntegrator()
         orientation_processor = OrientationProcessor(orientation_initializer, angular_speed_integrator)
 
-        return Consumer(data_producer, ApogeeCalculator(), gps_processor, orientation_processor)
+        rocket_packet_dtype = RocketPacketParserFactory.create(rocket_packet_version).get_dtype()
+
+        return Consumer(data_producer, ApogeeCalculator(), gps_processor, orientation_processor, rocket_packet_dtype)
@@ -0,0 +1,77 @@
+from typing import Dict, Tuple
+
+import numpy as np
+
+from src.data_processing.apogee import Apogee
+from src.data_processing.generation import Generation
+from src.data_processing.gps.gps_coordinates import GpsCoordinates
+from src.data_processing.gps.utm_coordinates import UTMCoordinates
+from src.data_processing.orientation.orientation import Orientation
+
+
+class ConsumerSnapshot:
+    """
+    Immutable state of a Consumer after an update. It is created by the processing thread and handed to the GUI, which
+    can then render it without touching the Consumer.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], apogee: Apogee,
+                 projected_coordinates: Tuple[np.ndarray, np.ndarray], last_gps_coordinates: GpsCoordinates,
+                 rocket_orientation: Orientation, base_camp_spread: UTMCoordinates = None,
+                 orientation_spread: Orientation = None, generation: Generation = None,
+                 positions_generation: Generation = None):
+        """
+        :param base_camp_spread: Standard deviations in meters of the positions averaged into the base camp, or None
+                                 until the GPS is initialized.
+        :param orientation_spread: Standard deviations in degrees of the measures averaged into the initial
+                                   orientation, or None until the orientation is initialized.
+        :param generation: Generation of the packets, cut every time the Consumer forgets packets after a rollback or a
+                           clear. The packets of two snapshots of the same generation only differ by the packets added
+                           to the latest.
+        :param positions_generation: Generation of the projected coordinates, cut along with the packets.
+        """
+        self._columns = columns
+        self._apogee = apogee
+        self._projected_coordinates = projected_coordinates
+        self._last_gps_coordinates = last_gps_coordinates
+        self._rocket_orientation = rocket_orientation
+        self._base_camp_spread = base_camp_spread
+        self._orientation_spread = orientation_spread
+        self._generation = generation if generation is not None else Generation()
+        self._positions_generation = positions_generation if positions_generation is not None else Generation()
+
+    def __getitem__(self, key) -> np.ndarray:
+        return self._columns[key]
+
+    def __len__(self):
+        return len(self._columns["time_stamp"])
+
+    def has_data(self) -> bool:
+        return len(self) != 0
+
+    def get_apogee(self) -> Apogee:
+        return self._apogee
+
+    def get_projected_coordinates(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self._projected_coordinates
+
+    def get_last_gps_coordinates(self) -> GpsCoordinates:
+        return self._last_gps_coordinates
+
+    def get_rocket_orientation(self) -> Orientation:
+        return self._rocket_orientation
+
+    def get_base_camp_spread(self) -> UTMCoordinates:
+        return self._base_camp_spread
+
+    def get_orientation_spread(self) -> Orientation:
+        return self._orientation_spread
+
+    def get_generation(self) -> Generation:
+        return self._generation
+
+    def get_positions_generation(self) -> Generation:
+        return self._positions_generation
+
+    def get_average_temperature(self):
+        return self._columns["temperature"][-1]
@@ -0,0 +1,83 @@
+import logging
+import threading
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from src.data_processing.consumer import Consumer
+from src.data_processing.consumer_snapshot import ConsumerSnapshot
+from src.data_producer import DataProducer, DataProducerListener
+
+logger = logging.getLogger(__name__)
+
+
+class ConsumerWorker(QObject, DataProducerListener):
+    """
+    Run a Consumer on its own thread so GPS projection, orientation integration and apogee search never block the GUI.
+    The thread sleeps until the producer notifies new data, and a snapshot of the consumer is published with
+    snapshot_ready every time its data changes.
+    """
+
+    snapshot_ready = pyqtSignal(object)
+
+    def __init__(self, consumer: Consumer, data_producer: DataProducer):
+        super().__init__()
+        self.consumer = consumer
+        self.data_producer = data_producer
+        self.lock = threading.Lock()
+        self.new_data_event = threading.Event()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        if self.is_running():
+            return
+
+        self.stop_event.clear()
+        # Process the packets produced before the worker was started
+        self.new_data_event.set()
+        self.data_producer.register_listener(self)
+
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.data_producer.unregister_listener(self)
+        self.stop_event.set()
+        self.new_data_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def is_running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def notify_new_data(self):
+        self.new_data_event.set()
+
+    def run(self):
+        while True:
+            self.new_data_event.wait()
+            if self.stop_event.is_set():
+                break
+
+            # Packets produced while updating set the event again, so they are processed in the next batch
+            self.new_data_event.clear()
+            try:
+                self.update()
+            except Exception:
+                # An exception would end the thread, and no snapshot would ever be published again
+                logger.exception("ConsumerWorker: the packets could not be processed")
+
+    def update(self) -> ConsumerSnapshot:
+        """
+        Process the new packets right away. Can be called from any thread.
+        :return: The new snapshot, or None if the consumer data did not change.
+        """
+        with self.lock:
+            if not self.consumer.update():
+                return None
+            snapshot = self.consumer.create_snapshot()
+
+        self.snapshot_ready.emit(snapshot)
+
+        return snapshot
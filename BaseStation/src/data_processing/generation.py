@@ -0,0 +1,60 @@
+from typing import Tuple
+
+
+class Generation:
+    """
+    Version of a history that is appended to and sometimes cut back, as the packets of a Consumer after a rollback.
+    Every cut gives a new generation, which remembers the length kept by the last cuts, so a view of the history can be
+    cut back to the part that did not change instead of being rebuilt.
+    """
+
+    # Cuts remembered, far more than the generations a view can miss between two updates
+    MAX_CUT_COUNT = 64
+
+    def __init__(self, number: int = 0, kept_lengths: Tuple[int, ...] = ()):
+        """
+        :param kept_lengths: Length of the history kept by each of the last cuts, the last one giving this generation.
+        """
+        self._number = number
+        self._kept_lengths = kept_lengths
+
+    @property
+    def number(self) -> int:
+        return self._number
+
+    def cut(self, kept_length: int) -> "Generation":
+        """
+        :return: The generation of the history once cut back to kept_length, and possibly appended to again.
+        """
+        kept_lengths = (self._kept_lengths + (kept_length,))[-self.MAX_CUT_COUNT:]
+        return Generation(self._number + 1, kept_lengths)
+
+    def get_kept_length(self, previous: "Generation") -> int:
+        """
+        :param previous: An earlier generation of the history.
+        :return: The length of the history of previous that is unchanged in this generation, or 0 if the cuts since
+                 previous are not known.
+        """
+        if previous is None:
+            return 0
+
+        cut_count = self._number - previous.number
+        if not 0 < cut_count <= len(self._kept_lengths):
+            return 0
+
+        return min(self._kept_lengths[-cut_count:])
+
+    def __eq__(self, other):
+        if not isinstance(other, Generation):
+            return False
+
+        return self._number == other.number
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._number)
+
+    def __repr__(self):
+        return "Generation({!r})".format(self._number)
@@ -1,4 +1,7 @@
 import abc
+from typing import Tuple
+
+import numpy as np
 
 from src.data_processing.gps.gps_coordinates import GpsCoordinates
 
@@ -9,3 +12,10 @@ class CoordinateConversionStrategy:
     @abc.abstractmethod
     def to_decimal_degrees(self, latitude: float, longitude: float) -> GpsCoordinates:
         pass
+
+    @abc.abstractmethod
+    def to_decimal_degrees_arrays(self, latitudes: np.ndarray, longitudes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :return: The latitudes and longitudes in decimal degrees, as float64 arrays.
+        """
+        pass
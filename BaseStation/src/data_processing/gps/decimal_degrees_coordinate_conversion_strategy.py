@@ -1,3 +1,7 @@
+from typing import Tuple
+
+import numpy as np
+
 from src.data_processing.gps.coordinate_conversion_strategy import CoordinateConversionStrategy
 from src.data_processing.gps.gps_coordinates import GpsCoordinates
 
@@ -5,3 +9,6 @@ from src.data_processing.gps.gps_coordinates import GpsCoordinates
 class DecimalDegreesCoordinateConversionStrategy(CoordinateConversionStrategy):
     def to_decimal_degrees(self, latitude: float, longitude: float) -> GpsCoordinates:
         return GpsCoordinates(latitude, longitude)
+
+    def to_decimal_degrees_arrays(self, latitudes: np.ndarray, longitudes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return np.asarray(latitudes, dtype=np.float64), np.asarray(longitudes, dtype=np.float64)
@@ -1,3 +1,7 @@
+from typing import Tuple
+
+import numpy as np
+
 from src.data_processing.gps.coordinate_conversion_strategy import CoordinateConversionStrategy
 from src.data_processing.gps.gps_coordinates import GpsCoordinates
 
@@ -12,8 +16,19 @@ class DegreeDecimalMinutesCoordinateConversionStrategy(CoordinateConversionStrat
 
         return GpsCoordinates(dd_lat, dd_lon)
 
+    def to_decimal_degrees_arrays(self, latitudes: np.ndarray, longitudes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return self._ddmm2dd_array(latitudes), self._ddmm2dd_array(longitudes)
+
     @staticmethod
     def _ddmm2dd(coordinate: float):
         degrees = int(coordinate / 100)
         minutes = coordinate - (degrees * 100)
         return degrees + (minutes / 60)
+
+    @staticmethod
+    def _ddmm2dd_array(coordinates: np.ndarray) -> np.ndarray:
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        # Truncated toward zero like int(), so the minutes keep the sign of the coordinate
+        degrees = np.trunc(coordinates / 100)
+        minutes = coordinates - degrees * 100
+        return degrees + minutes / 60
@@ -1,4 +1,7 @@
 import abc
+from typing import Dict
+
+import numpy as np
 
 from src.rocket_packet.rocket_packet import RocketPacket
 
@@ -10,12 +13,23 @@ class GpsFixValidator:
     def is_fixed(self, rocket_packet: RocketPacket) -> bool:
         pass
 
+    @abc.abstractmethod
+    def get_fix_mask(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        :param columns: Columns of consecutive packets, by RocketPacket key.
+        :return: A boolean array telling which of the packets have a GPS fix.
+        """
+        pass
+
 
 class IndicatorCharacterGpsFixValidator(GpsFixValidator):
     def is_fixed(self, rocket_packet: RocketPacket) -> bool:
         return (self.is_valid_ns_indicator(rocket_packet.ns_indicator) and
                 self.is_valid_ew_indicator(rocket_packet.ew_indicator))
 
+    def get_fix_mask(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        return np.isin(columns["ns_indicator"], (b'N', b'S')) & np.isin(columns["ew_indicator"], (b'E', b'W'))
+
     @staticmethod
     def is_valid_ns_indicator(ns_indicator: bytes):
         return ns_indicator == b'N' or ns_indicator == b'S'
@@ -29,6 +43,9 @@ class UtmZoneGpsFixValidator(GpsFixValidator):
     def is_fixed(self, rocket_packet: RocketPacket) -> bool:
         return True  # Implement this to check if the coordinates are within the UTM zone limits
 
+    def get_fix_mask(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        return np.ones(len(columns["time_stamp"]), dtype=bool)
+
 
 class GpsFixValidatorFactory:
     def create(self, rocket_packet_version: int):
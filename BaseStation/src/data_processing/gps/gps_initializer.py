@@ -1,40 +1,72 @@
 import abc
-from typing import List
 
 from src.data_processing.gps.utm_coordinates import UTMCoordinates
+from src.data_processing.running_statistics import RunningStatistics
 
 
 class GpsInitializerListener:
     __metaclass__ = abc.ABCMeta
 
     @abc.abstractmethod
-    def notify_gps_initialized(self, base_camp_coordinates: UTMCoordinates):
+    def notify_gps_initialized(self, base_camp_coordinates: UTMCoordinates, base_camp_spread: UTMCoordinates):
+        """
+        :param base_camp_spread: Standard deviations in meters of the positions averaged into the base camp.
+        """
         pass
 
 
 class GpsInitializer:
+    """
+    Base camp position, averaged from the positions received during the initialization delay. Only the running mean
+    and variance of the positions are kept, so every position costs the same whatever the delay.
+    """
 
     def __init__(self, initialization_delay_in_seconds: float):
         self.initialization_delay = initialization_delay_in_seconds
         self.listeners = []
         self._first_timestamp = None
-        self._initialization_coordinates = []
+        self._easting_statistics = RunningStatistics()
+        self._northing_statistics = RunningStatistics()
 
     def register_listener(self, listener: GpsInitializerListener):
         self.listeners.append(listener)
 
     def update(self, timestamp: float, utm_coordinates: UTMCoordinates):
-        self._initialization_coordinates.append(utm_coordinates)
+        self._easting_statistics.update(utm_coordinates.easting)
+        self._northing_statistics.update(utm_coordinates.northing)
 
         elapsed_time = self._get_elapsed_time_since_first_timestamp(timestamp)
         if elapsed_time >= self.initialization_delay:
-            base_camp_coordinates = self._average(self._initialization_coordinates)
+            base_camp_coordinates = UTMCoordinates(self._easting_statistics.mean, self._northing_statistics.mean)
 
-            self._notify_listeners(base_camp_coordinates)
+            self._notify_listeners(base_camp_coordinates, self.get_spread())
+
+    def get_sample_count(self) -> int:
+        return self._easting_statistics.count
+
+    def get_spread(self) -> UTMCoordinates:
+        """
+        :return: The standard deviations in meters of the easting and the northing of the positions received so far,
+                 which tell how precise the base camp position is.
+        """
+        return UTMCoordinates(self._easting_statistics.get_standard_deviation(),
+                              self._northing_statistics.get_standard_deviation())
 
     def reset(self):
         self._first_timestamp = None
-        self._initialization_coordinates = []
+        self._easting_statistics.reset()
+        self._northing_statistics.reset()
+
+    def get_state(self):
+        """
+        :return: An opaque copy of the state, to be given back to set_state.
+        """
+        return self._first_timestamp, self._easting_statistics.get_state(), self._northing_statistics.get_state()
+
+    def set_state(self, state):
+        self._first_timestamp, easting_statistics_state, northing_statistics_state = state
+        self._easting_statistics.set_state(easting_statistics_state)
+        self._northing_statistics.set_state(northing_statistics_state)
 
     def _get_elapsed_time_since_first_timestamp(self, timestamp: float):
         if self._first_timestamp is None:
@@ -43,10 +75,6 @@ class GpsInitializer:
         else:
             return timestamp - self._first_timestamp
 
-    @staticmethod
-    def _average(initialization_coordinates: List[UTMCoordinates]):
-        return sum(initialization_coordinates, UTMCoordinates(0.0, 0.0)) / len(initialization_coordinates)
-
-    def _notify_listeners(self, base_camp_coordinates: UTMCoordinates):
+    def _notify_listeners(self, base_camp_coordinates: UTMCoordinates, base_camp_spread: UTMCoordinates):
         for listener in self.listeners:
-            listener.notify_gps_initialized(base_camp_coordinates)
+            listener.notify_gps_initialized(base_camp_coordinates, base_camp_spread)
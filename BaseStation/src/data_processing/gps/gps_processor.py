@@ -1,13 +1,23 @@
+import math
+from typing import Dict, Tuple
+
+import numpy as np
+
+from src.data_processing.column_store import ColumnStore
 from src.data_processing.gps.coordinate_conversion_strategy import CoordinateConversionStrategy
 from src.data_processing.gps.gps_coordinates import GpsCoordinates
 from src.data_processing.gps.gps_fix_validator import GpsFixValidator
 from src.data_processing.gps.gps_initializer import GpsInitializer, GpsInitializerListener
 from src.data_processing.gps.utm_coordinates import UTMCoordinates
 from src.data_processing.gps.utm_coordinates_converter import UTMCoordinatesConverter
+from src.data_processing.gps.utm_zone import UTMZone
 from src.rocket_packet.rocket_packet import RocketPacket
 
 
 class GpsProcessor(GpsInitializerListener):
+    # Columns read by update_columns
+    COLUMNS = ("time_stamp", "latitude", "longitude", "ns_indicator", "ew_indicator")
+    PROJECTED_COORDINATES_DTYPE = np.dtype([("easting", np.float64), ("northing", np.float64)])
 
     def __init__(self, gps_fix_validator: GpsFixValidator, coordinate_conversion_strategy: CoordinateConversionStrategy,
                  utm_coordinates_converter: UTMCoordinatesConverter, gps_initializer: GpsInitializer):
@@ -16,9 +26,9 @@ class GpsProcessor(GpsInitializerListener):
         self._utm_coordinates_converter = utm_coordinates_converter
         self._gps_initializer = gps_initializer
         self._gps_initializer.register_listener(self)
-        self._easting = []
-        self._northing = []
+        self._projected_coordinates = ColumnStore(self.PROJECTED_COORDINATES_DTYPE)
         self._base_camp_coordinates = UTMCoordinates(0.0, 0.0)
+        self._base_camp_spread = None
         self._last_coordinates = GpsCoordinates(0.0, 0.0)
         self._initializing_gps = True
 
@@ -28,32 +38,108 @@ class GpsProcessor(GpsInitializerListener):
                                                                                              rocket_packet.longitude)
             utm_coordinates = self._utm_coordinates_converter.decimal_degrees_to_utm(self._last_coordinates)
 
-            self._process_coordinates(rocket_packet.time_stamp, utm_coordinates)
+            # Positions that cannot be projected are ignored like positions without a fix
+            if math.isfinite(utm_coordinates.easting) and math.isfinite(utm_coordinates.northing):
+                self._process_coordinates(rocket_packet.time_stamp, utm_coordinates)
+
+    def update_columns(self, columns: Dict[str, np.ndarray]):
+        """
+        Process consecutive packets at once: the packets without a fix are masked out and the others are converted and
+        projected as whole arrays. Gives the same projected coordinates as calling update for every packet.
+        :param columns: Columns of the packets for every key of COLUMNS.
+        """
+        fix_mask = self._gps_fix_validator.get_fix_mask(columns)
+        if not fix_mask.any():
+            return
+
+        latitudes, longitudes = self._coordinate_conversion_strategy.to_decimal_degrees_arrays(
+            columns["latitude"][fix_mask], columns["longitude"][fix_mask])
+        eastings, northings = self._utm_coordinates_converter.decimal_degrees_to_utm_arrays(latitudes, longitudes)
+        time_stamps = columns["time_stamp"][fix_mask]
+
+        self._last_coordinates = GpsCoordinates(float(latitudes[-1]), float(longitudes[-1]))
+
+        projected_mask = np.isfinite(eastings) & np.isfinite(northings)
+        if not projected_mask.all():
+            eastings, northings = eastings[projected_mask], northings[projected_mask]
+            time_stamps = time_stamps[projected_mask]
+
+        # The base camp is only known once the initializer got enough positions, which are handled one by one
+        start = 0
+        while self._initializing_gps and start < len(eastings):
+            self._process_coordinates(float(time_stamps[start]),
+                                      UTMCoordinates(float(eastings[start]), float(northings[start])))
+            start += 1
+
+        if start < len(eastings):
+            self._projected_coordinates.append({
+                "easting": eastings[start:] - self._base_camp_coordinates.easting,
+                "northing": northings[start:] - self._base_camp_coordinates.northing})
 
     def _process_coordinates(self, timestamp: float, utm_coordinates: UTMCoordinates):
         if self._initializing_gps:
             self._gps_initializer.update(timestamp, utm_coordinates)
-            self._easting.append(0)
-            self._northing.append(0)
+            self._append_projected_coordinates(0.0, 0.0)
         else:
             relative_position = utm_coordinates - self._base_camp_coordinates
-            self._easting.append(relative_position.easting)
-            self._northing.append(relative_position.northing)
+            self._append_projected_coordinates(relative_position.easting, relative_position.northing)
+
+    def _append_projected_coordinates(self, easting: float, northing: float):
+        self._projected_coordinates.append({"easting": np.array([easting]), "northing": np.array([northing])})
 
-    def notify_gps_initialized(self, base_camp_coordinates: UTMCoordinates):
+    def notify_gps_initialized(self, base_camp_coordinates: UTMCoordinates, base_camp_spread: UTMCoordinates):
         self._base_camp_coordinates = base_camp_coordinates
+        self._base_camp_spread = base_camp_spread
         self._initializing_gps = False
 
+    def get_base_camp_spread(self) -> UTMCoordinates:
+        """
+        :return: The standard deviations in meters of the positions averaged into the base camp, which tell how precise
+                 the positions relative to the base camp are, or None until the GPS is initialized.
+        """
+        return self._base_camp_spread
+
+    def get_utm_zone(self) -> UTMZone:
+        """
+        :return: The zone of the projected coordinates, or None until the first position with a fix when the zone is
+                 detected.
+        """
+        return self._utm_coordinates_converter.get_utm_zone()
+
     def get_last_coordinates(self) -> GpsCoordinates:
         return self._last_coordinates
 
-    def get_projected_coordinates(self):
-        return self._easting, self._northing
+    def get_projected_coordinates(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :return: Read-only views of the eastings and northings relative to the base camp, which keep their values while
+                 the processor is updated.
+        """
+        columns = self._projected_coordinates.snapshot()
+        return columns["easting"], columns["northing"]
+
+    def get_state(self):
+        """
+        :return: An opaque and cheap copy of the state, to be given back to set_state. The projected coordinates are
+                 only appended to, so their store is shared instead of copied.
+        """
+        return (self._projected_coordinates, len(self._projected_coordinates), self._base_camp_coordinates,
+                self._base_camp_spread, self._last_coordinates, self._initializing_gps,
+                self._gps_initializer.get_state(), self._utm_coordinates_converter.get_state())
+
+    def set_state(self, state):
+        (projected_coordinates, length, self._base_camp_coordinates, self._base_camp_spread, self._last_coordinates,
+         self._initializing_gps, gps_initializer_state, utm_coordinates_converter_state) = state
+        projected_coordinates.truncate(length)
+        self._projected_coordinates = projected_coordinates
+        self._gps_initializer.set_state(gps_initializer_state)
+        self._utm_coordinates_converter.set_state(utm_coordinates_converter_state)
 
     def reset(self):
-        self._easting = []
-        self._northing = []
+        # A new store, since the current one may still be referenced by a saved state
+        self._projected_coordinates = ColumnStore(self.PROJECTED_COORDINATES_DTYPE)
         self._base_camp_coordinates = UTMCoordinates(0.0, 0.0)
+        self._base_camp_spread = None
         self._last_coordinates = GpsCoordinates(0.0, 0.0)
         self._gps_initializer.reset()
+        self._utm_coordinates_converter.reset()
         self._initializing_gps = True
@@ -1,20 +1,98 @@
-from pyproj import Proj
+from typing import Tuple
+
+import numpy as np
 
 from src.data_processing.gps.gps_coordinates import GpsCoordinates
 from src.data_processing.gps.utm_coordinates import UTMCoordinates
+from src.data_processing.gps.utm_projection_pool import UTMProjectionPool
 from src.data_processing.gps.utm_zone import UTMZone
 
 
 class UTMCoordinatesConverter:
-    def __init__(self, utm_zone: UTMZone):
-        self.converter = Proj("+proj=utm +zone={0}, +north +ellps=WGS84 +datum=WGS84 +units=m +no_defs"
-                              .format(utm_zone.value))
+    """
+    Projection of WGS84 coordinates in a UTM zone. Without a configured zone, the zone is the one of the first
+    plausible coordinates converted, and every following coordinates are projected in it so the positions stay
+    comparable. Coordinates converted before the zone is known, or outside of the UTM zones, give NaN or infinite
+    positions.
+    """
+
+    # Shared by every converter of the process
+    PROJECTION_POOL = UTMProjectionPool()
+
+    def __init__(self, utm_zone: UTMZone = None, projection_pool: UTMProjectionPool = PROJECTION_POOL):
+        """
+        :param utm_zone: Zone to project in, or None to detect it.
+        """
+        self.configured_utm_zone = utm_zone
+        self.projection_pool = projection_pool
+        self.utm_zone = None
+        self.transformer = None
+        self._set_utm_zone(utm_zone)
+
+    def get_utm_zone(self) -> UTMZone:
+        """
+        :return: The zone of the projected coordinates, or None if it is not detected yet.
+        """
+        return self.utm_zone
 
     def decimal_degrees_to_utm(self, gps_coordinates: GpsCoordinates) -> UTMCoordinates:
         """
         Converts coordinates in format DD.DDDD to UTM
         :return: easting, northing
         """
-        easting, northing = self.converter(gps_coordinates.decimal_degrees_longitude,
-                                           gps_coordinates.decimal_degrees_latitude)
+        latitude = gps_coordinates.decimal_degrees_latitude
+        longitude = gps_coordinates.decimal_degrees_longitude
+        if self.utm_zone is None and self._detect_utm_zone(np.array([latitude]), np.array([longitude])) > 0:
+            return UTMCoordinates(np.nan, np.nan)
+
+        easting, northing = self.transformer.transform(longitude, latitude)
         return UTMCoordinates(easting, northing)
+
+    def decimal_degrees_to_utm_arrays(self, latitudes: np.ndarray,
+                                      longitudes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converts arrays of coordinates in format DD.DDDD to UTM, in a single call to PROJ
+        :return: eastings, northings
+        """
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+
+        start = self._detect_utm_zone(latitudes, longitudes)
+        eastings = np.full(len(latitudes), np.nan)
+        northings = np.full(len(latitudes), np.nan)
+        if start < len(latitudes):
+            eastings[start:], northings[start:] = self.transformer.transform(longitudes[start:], latitudes[start:])
+
+        return eastings, northings
+
+    def get_state(self):
+        return self.utm_zone
+
+    def set_state(self, state):
+        self._set_utm_zone(state)
+
+    def reset(self):
+        self._set_utm_zone(self.configured_utm_zone)
+
+    def _detect_utm_zone(self, latitudes: np.ndarray, longitudes: np.ndarray) -> int:
+        """
+        Detect the zone from the first plausible coordinates. A receiver without a real fix may report (0, 0), and a
+        corrupted packet any position, which would put every following position in a wrong zone.
+        :return: The index of the first coordinates that can be projected, or len(latitudes) if the zone is unknown.
+        """
+        if self.utm_zone is not None:
+            return 0
+
+        plausible = (np.isfinite(latitudes) & np.isfinite(longitudes) &
+                     (latitudes >= UTMZone.MIN_LATITUDE) & (latitudes <= UTMZone.MAX_LATITUDE) &
+                     ((latitudes != 0) | (longitudes != 0)))
+        if not plausible.any():
+            return len(latitudes)
+
+        start = int(np.argmax(plausible))
+        self._set_utm_zone(UTMZone.from_decimal_degrees(float(latitudes[start]), float(longitudes[start])))
+        return start
+
+    def _set_utm_zone(self, utm_zone: UTMZone):
+        self.utm_zone = utm_zone
+        self.transformer = self.projection_pool.get(utm_zone) if utm_zone is not None else None
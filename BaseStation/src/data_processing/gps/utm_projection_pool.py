@@ -0,0 +1,55 @@
+import threading
+from collections import OrderedDict
+
+from pyproj import CRS, Transformer
+
+from src.data_processing.gps.utm_zone import UTMZone
+
+WGS84_EPSG = 4326
+# The WGS84 UTM zones are EPSG:326NN in the northern hemisphere and EPSG:327NN in the southern one
+WGS84_UTM_NORTH_EPSG = 32600
+WGS84_UTM_SOUTH_EPSG = 32700
+
+
+class UTMProjectionPool:
+    """
+    Transformers from WGS84 to the UTM zones, created on first use and kept for the least recently used max_size zones.
+    Creating a transformer parses the projection database, so it is shared by every converter of a zone instead of
+    being created by each consumer.
+    """
+
+    MAX_SIZE = 8
+
+    def __init__(self, max_size: int = MAX_SIZE):
+        self.max_size = max_size
+        self._transformers = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, utm_zone: UTMZone) -> Transformer:
+        # The bands of a zone share its projection
+        epsg = self.get_epsg(utm_zone)
+        with self._lock:
+            transformer = self._transformers.get(epsg)
+            if transformer is not None:
+                self._transformers.move_to_end(epsg)
+                return transformer
+
+        # Created outside of the lock, so a slow creation does not block the other zones
+        # always_xy keeps the (longitude, latitude) and (easting, northing) order whatever the CRS axis order
+        transformer = Transformer.from_crs(CRS.from_epsg(WGS84_EPSG), CRS.from_epsg(epsg), always_xy=True)
+
+        with self._lock:
+            transformer = self._transformers.setdefault(epsg, transformer)
+            self._transformers.move_to_end(epsg)
+            while len(self._transformers) > self.max_size:
+                self._transformers.popitem(last=False)
+
+        return transformer
+
+    @staticmethod
+    def get_epsg(utm_zone: UTMZone) -> int:
+        return (WGS84_UTM_NORTH_EPSG if utm_zone.is_north() else WGS84_UTM_SOUTH_EPSG) + utm_zone.number
+
+    def __len__(self):
+        with self._lock:
+            return len(self._transformers)
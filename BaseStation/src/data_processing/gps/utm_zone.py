@@ -1,6 +1,68 @@
-from enum import Enum
+import math
 
 
-class UTMZone(Enum):
-    zone_13S = "13s"    # Gaul HQ
-    zone_19t = "19t"    # Spaceport America
+class UTMZone:
+    """
+    UTM zone written as its number followed by its latitude band, as in "19t". The bands from N onwards are north of
+    the equator.
+    """
+
+    LATITUDE_BANDS = "CDEFGHJKLMNPQRSTUVWX"
+    MIN_LATITUDE = -80
+    MAX_LATITUDE = 84
+    BAND_HEIGHT = 8
+    ZONE_WIDTH = 6
+    ZONE_COUNT = 60
+
+    def __init__(self, value: str):
+        value = value.strip().lower()
+        number, band = value[:-1], value[-1:].upper()
+        if not number.isdigit() or not 1 <= int(number) <= self.ZONE_COUNT or not band or \
+                band not in self.LATITUDE_BANDS:
+            raise ValueError("Zone UTM invalide: " + value)
+
+        self.value = value
+        self.number = int(number)
+        self.band = band
+
+    @classmethod
+    def from_decimal_degrees(cls, latitude: float, longitude: float) -> "UTMZone":
+        """
+        Zone containing a position, with the exceptions of south-west Norway and Svalbard.
+        """
+        if not cls.MIN_LATITUDE <= latitude <= cls.MAX_LATITUDE:
+            raise ValueError("Latitude hors des zones UTM: {}".format(latitude))
+
+        longitude = (longitude + 180) % 360 - 180
+        number = min(int(math.floor((longitude + 180) / cls.ZONE_WIDTH)) + 1, cls.ZONE_COUNT)
+
+        if 56 <= latitude < 64 and 3 <= longitude < 12:
+            number = 32
+        elif latitude >= 72 and 0 <= longitude < 42:
+            number = (31 if longitude < 9 else 33 if longitude < 21 else 35 if longitude < 33 else 37)
+
+        # The last band, X, is 12 degrees high
+        band_index = min(int((latitude - cls.MIN_LATITUDE) // cls.BAND_HEIGHT), len(cls.LATITUDE_BANDS) - 1)
+        return cls("{}{}".format(number, cls.LATITUDE_BANDS[band_index].lower()))
+
+    def is_north(self) -> bool:
+        return self.band >= "N"
+
+    def __eq__(self, other):
+        if not isinstance(other, UTMZone):
+            return False
+
+        return self.value == other.value
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return "UTMZone({!r})".format(self.value)
+
+
+UTMZone.zone_13S = UTMZone("13s")   # Spaceport America
+UTMZone.zone_19t = UTMZone("19t")   # Gaul HQ
@@ -0,0 +1,189 @@
+import math
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from src.data_processing.column_store import ColumnStore
+from src.data_processing.generation import Generation
+
+
+class MinMaxDecimator:
+    """
+    Multi-resolution min/max envelope of one or more series sampled at increasing x values. Level k of the pyramid
+    keeps, for every bucket of 2 ** k consecutive samples, the index of the minimum and of the maximum of each series.
+    Drawing these samples instead of the whole history keeps every peak visible at a fraction of the cost.
+
+    The samples are copied when they are added, so the pyramid is only extended with the new samples on each update.
+    """
+
+    BUCKET_FACTOR = 2
+
+    def __init__(self, series_count: int = 1):
+        self.series_count = series_count
+        self._samples = ColumnStore(np.dtype([("x", np.float64)] +
+                                             [("y{}".format(i), np.float64) for i in range(series_count)]))
+        self._level_dtype = np.dtype([("i{}".format(i), np.int64) for i in range(2 * series_count)])
+        self._levels = []
+        self._generation = None
+
+    def update(self, x: Sequence, *series: Sequence, generation: Generation = None):
+        """
+        Synchronize the decimator with the whole history of the curve. Only the samples added since the last update
+        are processed. When the history was cut back, the pyramid is cut back to the part of the history kept and
+        extended from there.
+        :param x: The x value of every sample, in increasing order, or None to use the index of the samples.
+        :param generation: Generation of the history, as the generations of a ConsumerSnapshot. A history that was cut
+                           back can be longer than the known one, so it can not be detected from the samples alone.
+                           Without it, the history is only known to be replaced when it gets shorter, and the pyramid
+                           is then rebuilt.
+        """
+        length = len(series[0])
+        if generation != self._generation or length < len(self._samples):
+            kept_length = generation.get_kept_length(self._generation) if generation is not None else 0
+            self.truncate(min(kept_length, length))
+            self._generation = generation
+
+        start = len(self._samples)
+        if length > start:
+            columns = {"y{}".format(i): np.asarray(values[start:length], dtype=np.float64)
+                       for i, values in enumerate(series)}
+            columns["x"] = (np.arange(start, length, dtype=np.float64) if x is None
+                            else np.asarray(x[start:length], dtype=np.float64))
+            self._samples.append(columns)
+            self._update_levels()
+
+    def _update_levels(self):
+        child_count = len(self._samples)
+        level_index = 0
+
+        while child_count >= self.BUCKET_FACTOR:
+            if level_index == len(self._levels):
+                self._levels.append(ColumnStore(self._level_dtype))
+            level = self._levels[level_index]
+
+            start = len(level)
+            stop = child_count // self.BUCKET_FACTOR
+            if stop > start:
+                level.append(self._merge_children(level_index, start, stop))
+
+            child_count = len(level)
+            level_index += 1
+
+    def _merge_children(self, level_index: int, start: int, stop: int):
+        """
+        Compute the buckets [start, stop) of a level from the buckets of the level below, or from the raw samples.
+        """
+        child_start, child_stop = start * self.BUCKET_FACTOR, stop * self.BUCKET_FACTOR
+        columns = {}
+
+        for i in range(self.series_count):
+            values = self._samples["y{}".format(i)]
+
+            if level_index == 0:
+                candidates = np.arange(child_start, child_stop, dtype=np.int64).reshape(-1, self.BUCKET_FACTOR)
+                min_candidates, max_candidates = candidates, candidates
+            else:
+                child_level = self._levels[level_index - 1]
+                min_candidates = child_level["i{}".format(2 * i)][child_start:child_stop]
+                max_candidates = child_level["i{}".format(2 * i + 1)][child_start:child_stop]
+                min_candidates = min_candidates.reshape(-1, self.BUCKET_FACTOR)
+                max_candidates = max_candidates.reshape(-1, self.BUCKET_FACTOR)
+
+            rows = np.arange(len(min_candidates))
+            columns["i{}".format(2 * i)] = min_candidates[rows, np.argmin(values[min_candidates], axis=1)]
+            columns["i{}".format(2 * i + 1)] = max_candidates[rows, np.argmax(values[max_candidates], axis=1)]
+
+        return columns
+
+    def get_points(self, max_points: int, x_min: float = None, x_max: float = None) -> Tuple[np.ndarray, ...]:
+        """
+        :param max_points: Approximate maximum number of points returned, typically 2 per horizontal pixel.
+        :param x_min: Beginning of the visible range, or None for the whole history. The samples right outside of the
+                      range are included so the curve reaches the borders of the view.
+        :param x_max: End of the visible range, or None for the whole history.
+        :return: A tuple as (x, series...) with the samples needed to draw the envelope of the range.
+        """
+        indices = self.get_indices(max_points, x_min, x_max)
+
+        return (self._samples["x"][indices],) + tuple(self._samples["y{}".format(i)][indices]
+                                                      for i in range(self.series_count))
+
+    def get_indices(self, max_points: int, x_min: float = None, x_max: float = None) -> np.ndarray:
+        start, stop = self._get_index_range(x_min, x_max)
+        if stop - start <= max_points:
+            return np.arange(start, stop)
+
+        # Every bucket gives a minimum and a maximum per series
+        points_per_bucket = 2 * self.series_count
+        bucket_size = (stop - start) * points_per_bucket / max(max_points, 1)
+        level_index = max(min(math.ceil(math.log(bucket_size, self.BUCKET_FACTOR)), len(self._levels)), 0)
+
+        indices = np.concatenate(self._collect_indices(start, stop, level_index))
+        # The last sample is always drawn so the curve ends on the current value
+        return np.unique(np.append(indices, stop - 1))
+
+    def get_x(self) -> np.ndarray:
+        return self._samples["x"]
+
+    def get_series(self, series_index: int) -> np.ndarray:
+        return self._samples["y{}".format(series_index)]
+
+    def _get_index_range(self, x_min: float, x_max: float) -> Tuple[int, int]:
+        """
+        Binary search of the visible range in the x values, which are sorted.
+        """
+        length = len(self._samples)
+        x = self._samples["x"]
+
+        start = 0 if x_min is None else max(int(np.searchsorted(x, x_min, side="left")) - 1, 0)
+        stop = length if x_max is None else min(int(np.searchsorted(x, x_max, side="right")) + 1, length)
+
+        return start, max(start, stop)
+
+    def _collect_indices(self, start: int, stop: int, level_index: int) -> list:
+        """
+        Use the complete buckets of the level inside [start, stop) and the lower levels for the remaining samples on
+        each side of these buckets.
+        """
+        if start >= stop:
+            return []
+        if level_index == 0:
+            return [np.arange(start, stop)]
+
+        level = self._levels[level_index - 1]
+        bucket_size = self.BUCKET_FACTOR ** level_index
+        first_bucket = -(-start // bucket_size)
+        last_bucket = min(stop // bucket_size, len(level))
+
+        if first_bucket >= last_bucket:
+            return self._collect_indices(start, stop, level_index - 1)
+
+        buckets = np.stack([level[name][first_bucket:last_bucket] for name in self._level_dtype.names], axis=1)
+
+        return (self._collect_indices(start, first_bucket * bucket_size, level_index - 1) +
+                [buckets.ravel()] +
+                self._collect_indices(last_bucket * bucket_size, stop, level_index - 1))
+
+    def get_level_count(self) -> int:
+        return len(self._levels)
+
+    def truncate(self, length: int):
+        """
+        Forget the samples from length onwards. Only the buckets of the pyramid made of kept samples are kept.
+        """
+        self._samples.truncate(length)
+
+        bucket_size = 1
+        for level in self._levels:
+            bucket_size *= self.BUCKET_FACTOR
+            level.truncate(len(self._samples) // bucket_size)
+
+        while self._levels and len(self._levels[-1]) == 0:
+            self._levels.pop()
+
+    def clear(self):
+        self._samples.clear()
+        self._levels = []
+
+    def __len__(self):
+        return len(self._samples)
@@ -37,6 +37,14 @@ class AngularSpeedIntegrator:
         self.pitch = 0
         self.yaw = 0
 
+    def get_state(self):
+        return (self.last_time, self.last_angular_speed_x, self.last_angular_speed_y, self.last_angular_speed_z,
+                self.roll, self.pitch, self.yaw)
+
+    def set_state(self, state):
+        (self.last_time, self.last_angular_speed_x, self.last_angular_speed_y, self.last_angular_speed_z, self.roll,
+         self.pitch, self.yaw) = state
+
     @staticmethod
     def trap_integrate(next_x: float, next_y: float, actual_x: float, actual_y: float):
         return (next_x - actual_x) * ((next_y + actual_y) * 0.5)
@@ -3,6 +3,7 @@ import abc
 import math
 
 from src.data_processing.orientation.orientation import Orientation
+from src.data_processing.running_statistics import RunningStatistics
 from src.rocket_packet.rocket_packet import RocketPacket
 
 
@@ -20,9 +21,10 @@ class OrientationInitializer:
         self.initialization_delay = initialization_delay_in_seconds
         self.listeners = []
         self._first_timestamp = None
-        self._initialisation_roll = []
-        self._initialisation_pitch = []
-        self._initialisation_yaw = []
+        # Only the running mean and variance of the measures are kept
+        self._roll_statistics = RunningStatistics()
+        self._pitch_statistics = RunningStatistics()
+        self._yaw_statistics = RunningStatistics()
 
     def register_listener(self, listener: OrientationInitializerListener):
         self.listeners.append(listener)
@@ -35,11 +37,36 @@ class OrientationInitializer:
             initial_orientation = self._measure_initial_orientation()
             self._notify_listeners(rocket_packet.time_stamp, initial_orientation)
 
+    def get_sample_count(self) -> int:
+        return self._roll_statistics.count
+
+    def get_spread(self) -> Orientation:
+        """
+        :return: The standard deviations in degrees of the measures received so far, which tell how steady the rocket
+                 was during the initialization.
+        """
+        return Orientation(self._roll_statistics.get_standard_deviation(),
+                           self._pitch_statistics.get_standard_deviation(),
+                           self._yaw_statistics.get_standard_deviation())
+
     def reset(self):
         self._first_timestamp = None
-        self._initialisation_roll = []
-        self._initialisation_pitch = []
-        self._initialisation_yaw = []
+        self._roll_statistics.reset()
+        self._pitch_statistics.reset()
+        self._yaw_statistics.reset()
+
+    def get_state(self):
+        """
+        :return: An opaque copy of the state, to be given back to set_state.
+        """
+        return (self._first_timestamp, self._roll_statistics.get_state(), self._pitch_statistics.get_state(),
+                self._yaw_statistics.get_state())
+
+    def set_state(self, state):
+        self._first_timestamp, roll_statistics_state, pitch_statistics_state, yaw_statistics_state = state
+        self._roll_statistics.set_state(roll_statistics_state)
+        self._pitch_statistics.set_state(pitch_statistics_state)
+        self._yaw_statistics.set_state(yaw_statistics_state)
 
     def _get_elapsed_time_since_first_timestamp(self, timestamp: float):
         if self._first_timestamp is None:
@@ -55,9 +82,9 @@ class OrientationInitializer:
     def _accumulate_data(self, rocket_packet: RocketPacket):
         spherical_coordinates = self._to_spherical(rocket_packet.acceleration_x, rocket_packet.acceleration_y,
                                                    rocket_packet.acceleration_z)
-        self._initialisation_roll.append(math.degrees(math.sin(spherical_coordinates[1]) * spherical_coordinates[2]))
-        self._initialisation_pitch.append(math.degrees(math.cos(spherical_coordinates[1]) * spherical_coordinates[2]))
-        self._initialisation_yaw.append(0)
+        self._roll_statistics.update(math.degrees(math.sin(spherical_coordinates[1]) * spherical_coordinates[2]))
+        self._pitch_statistics.update(math.degrees(math.cos(spherical_coordinates[1]) * spherical_coordinates[2]))
+        self._yaw_statistics.update(0)
 
     def _to_spherical(self, accel_x, accel_y, accel_z):
         spherical = [0, 0, 0]
@@ -71,11 +98,8 @@ class OrientationInitializer:
         return math.sqrt(x ** 2 + y ** 2 + z ** 2)
 
     def _measure_initial_orientation(self):
-        roll = self._average(self._initialisation_roll)
-        pitch = self._average(self._initialisation_pitch)
-        yaw = self._average(self._initialisation_yaw)
+        roll = self._roll_statistics.mean
+        pitch = self._pitch_statistics.mean
+        yaw = self._yaw_statistics.mean
 
         return Orientation(0, 0, 0)
-
-    def _average(self, data: list):
-        return sum(data) / len(data)
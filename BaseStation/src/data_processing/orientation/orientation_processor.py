@@ -28,6 +28,24 @@ class OrientationProcessor(OrientationInitializerListener):
     def get_rocket_orientation(self) -> Orientation:
         return self._angular_speed_integrator.get_current_rocket_orientation()
 
+    def get_initialization_spread(self) -> Orientation:
+        """
+        :return: The standard deviations in degrees of the measures averaged into the initial orientation, which tell
+                 how steady the rocket was during the initialization, or None until the orientation is initialized.
+        """
+        if self._initialising:
+            return None
+        return self._orientation_initializer.get_spread()
+
+    def get_state(self):
+        return (self._initialising, self._orientation_initializer.get_state(),
+                self._angular_speed_integrator.get_state())
+
+    def set_state(self, state):
+        self._initialising, orientation_initializer_state, angular_speed_integrator_state = state
+        self._orientation_initializer.set_state(orientation_initializer_state)
+        self._angular_speed_integrator.set_state(angular_speed_integrator_state)
+
     def reset(self):
         self._initialising = True
         self._angular_speed_integrator.reset()
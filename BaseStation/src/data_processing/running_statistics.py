@@ -0,0 +1,41 @@
+import math
+
+
+class RunningStatistics:
+    """
+    Count, mean and variance of a stream of values in constant memory, updated with Welford's algorithm, which stays
+    accurate for values far from zero such as UTM coordinates.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._sum_of_squared_deviations = 0.0
+
+    def update(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._sum_of_squared_deviations += delta * (value - self.mean)
+
+    def get_variance(self) -> float:
+        """
+        :return: The population variance of the values, or 0 before the first value.
+        """
+        if self.count == 0:
+            return 0.0
+        return self._sum_of_squared_deviations / self.count
+
+    def get_standard_deviation(self) -> float:
+        return math.sqrt(self.get_variance())
+
+    def reset(self):
+        self.count = 0
+        self.mean = 0.0
+        self._sum_of_squared_deviations = 0.0
+
+    def get_state(self):
+        return self.count, self.mean, self._sum_of_squared_deviations
+
+    def set_state(self, state):
+        self.count, self.mean, self._sum_of_squared_deviations = state
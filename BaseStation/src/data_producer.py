@@ -2,17 +2,41 @@ import abc
 import threading
 from typing import List
 
+from src.packet_queue import PacketQueue, PacketQueueReader
 from src.rocket_packet.rocket_packet import RocketPacket
 
 
+class DataProducerListener:
+    __metaclass__ = abc.ABCMeta
+
+    @abc.abstractmethod
+    def notify_new_data(self):
+        """
+        Called from the thread of the producer every time its rocket packets change. Must return quickly.
+        """
+        pass
+
+
 class DataProducer:
     __metaclass__ = abc.ABCMeta
 
     def __init__(self, lock: threading.RLock):
-        self.available_rocket_packets = []
+        self.rocket_packets = PacketQueue(lock)
         self.lock = lock
         self.is_running = False
         self.thread = None
+        self.listeners = []
+
+    def register_listener(self, listener: DataProducerListener):
+        self.listeners.append(listener)
+
+    def unregister_listener(self, listener: DataProducerListener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def notify_new_data(self):
+        for listener in list(self.listeners):
+            listener.notify_new_data()
 
     @abc.abstractmethod
     def start(self):
@@ -24,16 +48,14 @@ class DataProducer:
         self.thread.join()
 
     def get_available_rocket_packets(self) -> List[RocketPacket]:
-        self.lock.acquire()
-        packet_list = list(self.available_rocket_packets)
-        self.lock.release()
+        return self.rocket_packets.to_list()
 
-        return packet_list
+    def create_rocket_packet_reader(self) -> PacketQueueReader:
+        return self.rocket_packets.create_reader()
 
     def add_rocket_packet(self, rocket_packet: RocketPacket):
-        self.lock.acquire()
-        self.available_rocket_packets.append(rocket_packet)
-        self.lock.release()
+        self.rocket_packets.append(rocket_packet)
+        self.notify_new_data()
 
     @abc.abstractmethod
     def clear_rocket_packets(self):
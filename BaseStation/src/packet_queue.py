@@ -0,0 +1,124 @@
+import threading
+import weakref
+from typing import List, Tuple
+
+
+class PacketQueueReader:
+    """Cursor of a single reader over a PacketQueue"""
+
+    def __init__(self, packet_queue):
+        self._packet_queue = packet_queue
+        self.cursor = 0
+
+    def read(self) -> Tuple[int, List]:
+        """
+        Return the packets appended since the last read.
+        :return: A tuple as (start_index, packets). start_index is lower than the number of packets already read when
+                 packets were removed from the queue in the meantime, in which case the reader must roll back to it.
+        """
+        return self._packet_queue.read(self)
+
+
+class PacketQueue:
+    """
+    Growable packet store with a single writer and any number of readers. Each reader keeps its own cursor so it only
+    gets the packets it has not seen yet instead of a copy of the whole history.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, lock: threading.RLock, initial_capacity: int = INITIAL_CAPACITY):
+        self.lock = lock
+        self.initial_capacity = initial_capacity
+        self._packets = [None] * initial_capacity
+        self._length = 0
+        self._readers = weakref.WeakSet()
+
+    def create_reader(self) -> PacketQueueReader:
+        reader = PacketQueueReader(self)
+
+        self.lock.acquire()
+        self._readers.add(reader)
+        self.lock.release()
+
+        return reader
+
+    def append(self, packet):
+        self.lock.acquire()
+        self._reserve(self._length + 1)
+        self._packets[self._length] = packet
+        self._length += 1
+        self.lock.release()
+
+    def extend(self, packets: List):
+        self.lock.acquire()
+        new_length = self._length + len(packets)
+        self._reserve(new_length)
+        self._packets[self._length:new_length] = packets
+        self._length = new_length
+        self.lock.release()
+
+    def pop(self):
+        self.lock.acquire()
+        packet = self._packets[self._length - 1]
+        self._truncate(self._length - 1)
+        self.lock.release()
+
+        return packet
+
+    def truncate(self, length: int):
+        self.lock.acquire()
+        self._truncate(length)
+        self.lock.release()
+
+    def clear(self):
+        self.lock.acquire()
+        self._packets = [None] * self.initial_capacity
+        self._length = 0
+        self._rewind_readers(0)
+        self.lock.release()
+
+    def read(self, reader: PacketQueueReader) -> Tuple[int, List]:
+        self.lock.acquire()
+        start_index = reader.cursor
+        packets = self._packets[start_index:self._length]
+        reader.cursor = self._length
+        self.lock.release()
+
+        return start_index, packets
+
+    def to_list(self) -> List:
+        self.lock.acquire()
+        packets = self._packets[:self._length]
+        self.lock.release()
+
+        return packets
+
+    def get_capacity(self) -> int:
+        return len(self._packets)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index: int):
+        if not -self._length <= index < self._length:
+            raise IndexError("PacketQueue index out of range")
+        return self._packets[index % self._length]
+
+    def _reserve(self, length: int):
+        capacity = max(len(self._packets), 1)
+        if length > len(self._packets):
+            while capacity < length:
+                capacity *= 2
+            self._packets.extend([None] * (capacity - len(self._packets)))
+
+    def _truncate(self, length: int):
+        length = max(length, 0)
+        if length < self._length:
+            self._packets[length:self._length] = [None] * (self._length - length)
+            self._length = length
+            self._rewind_readers(length)
+
+    def _rewind_readers(self, length: int):
+        for reader in self._readers:
+            reader.cursor = min(reader.cursor, length)
@@ -0,0 +1,314 @@
+import json
+import struct
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from src.data_persister import DataPersister
+from src.domain_error import DomainError
+
+
+class BinaryDataPersister(DataPersister):
+    """
+    Versioned binary container for flight recordings, much smaller and faster to load than CSV.
+
+    Layout, in little-endian:
+        - MAGIC, format version, header size
+        - JSON header: rocket packet version, field schema (name and NumPy type), sampling frequency, chunk size
+        - Chunks of at most chunk_size packets, each storing its columns one after the other
+        - Chunk index: offset, packet count, first and last time stamp of every chunk
+        - Trailer: offset of the chunk index and number of chunks
+    Every section starts on an ALIGNMENT boundary, so the columns can be used in place from a memory map.
+    """
+
+    EXTENSION = ".bin"
+    MAGIC = b"GAULBIN\x00"
+    FORMAT_VERSION = 1
+    CHUNK_SIZE = 4096
+    ALIGNMENT = 8
+    TIME_STAMP_FIELD = "time_stamp"
+    # Room left after the header of a streamed recording, whose sampling frequency is only known at the end
+    HEADER_RESERVE = 32
+
+    PREAMBLE = struct.Struct("<8sHHI")
+    TRAILER = struct.Struct("<QQ")
+    CHUNK_INDEX_DTYPE = np.dtype([("offset", "<u8"), ("count", "<u8"), ("first_time_stamp", "<f8"),
+                                  ("last_time_stamp", "<f8")])
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE):
+        super().__init__()
+        self.chunk_size = chunk_size
+
+    def save(self, filename: str, rocket_packet_version: int, field_names: List[str],
+             all_rocket_packets_fields: List[List]):
+        self.save_stream(filename, rocket_packet_version, field_names, [all_rocket_packets_fields])
+
+    def save_columns(self, filename: str, rocket_packet_version: int, field_names: List[str],
+                     columns: Dict[str, np.ndarray]):
+        """
+        :param columns: Values of every field, all with the same length. Their NumPy types are kept in the file.
+        """
+        columns = {name: self._to_fixed_width(np.asarray(columns[name])) for name in field_names}
+        packet_count = len(columns[field_names[0]]) if field_names else 0
+        time_stamps = columns.get(self.TIME_STAMP_FIELD)
+
+        sampling_frequency = 0.0
+        if time_stamps is not None and packet_count > 0:
+            sampling_frequency = self._get_sampling_frequency(packet_count, time_stamps[0], time_stamps[-1])
+        header_bytes = self._pad(self._create_header(rocket_packet_version, field_names,
+                                                     [columns[name].dtype for name in field_names],
+                                                     sampling_frequency))
+
+        try:
+            with open(filename, "wb") as file:
+                file.write(self.PREAMBLE.pack(self.MAGIC, self.FORMAT_VERSION, 0, len(header_bytes)))
+                file.write(header_bytes)
+
+                chunk_index = np.zeros(-(-packet_count // self.chunk_size), dtype=self.CHUNK_INDEX_DTYPE)
+                for i, start in enumerate(range(0, packet_count, self.chunk_size)):
+                    stop = min(start + self.chunk_size, packet_count)
+                    chunk_index[i] = (file.tell(), stop - start,
+                                      time_stamps[start] if time_stamps is not None else np.nan,
+                                      time_stamps[stop - 1] if time_stamps is not None else np.nan)
+
+                    for name in field_names:
+                        file.write(self._pad(columns[name][start:stop].tobytes()))
+
+                index_offset = file.tell()
+                file.write(chunk_index.tobytes())
+                file.write(self.TRAILER.pack(index_offset, len(chunk_index)))
+
+        except PermissionError:
+            raise DomainError("Impossible d'ouvrir le fichier " + filename)
+
+    def save_stream(self, filename: str, rocket_packet_version: int, field_names: List[str],
+                    rocket_packets_fields_chunks: Iterable[List[List]]):
+        """
+        Write a chunk as soon as chunk_size packets were received, so only the packets of the chunk being written are
+        in memory. The types of the fields are those of the first chunk. An integer field later receiving floats is
+        converted in place in the chunks already written, which is possible since both take 8 bytes.
+        """
+        try:
+            with open(filename, "w+b") as file:
+                self._write_stream(file, rocket_packet_version, field_names, rocket_packets_fields_chunks)
+        except PermissionError:
+            raise DomainError("Impossible d'ouvrir le fichier " + filename)
+
+    def _write_stream(self, file, rocket_packet_version: int, field_names: List[str],
+                      rocket_packets_fields_chunks: Iterable[List[List]]):
+        dtypes = None
+        chunk_index = []
+        pending = []
+
+        for rocket_packets_fields in rocket_packets_fields_chunks:
+            pending.extend(rocket_packets_fields)
+            while len(pending) >= self.chunk_size:
+                dtypes = self._write_rows(file, rocket_packet_version, field_names, dtypes, chunk_index,
+                                          pending[:self.chunk_size])
+                pending = pending[self.chunk_size:]
+
+        if pending or dtypes is None:
+            dtypes = self._write_rows(file, rocket_packet_version, field_names, dtypes, chunk_index, pending)
+
+        index_offset = file.tell()
+        chunk_index = np.array(chunk_index, dtype=self.CHUNK_INDEX_DTYPE)
+        file.write(chunk_index.tobytes())
+        file.write(self.TRAILER.pack(index_offset, len(chunk_index)))
+
+        # The header is completed in the room left for it, once the time stamps of every packet are known
+        sampling_frequency = 0.0
+        if len(chunk_index) > 0:
+            sampling_frequency = self._get_sampling_frequency(int(chunk_index["count"].sum()),
+                                                              chunk_index["first_time_stamp"][0],
+                                                              chunk_index["last_time_stamp"][-1])
+        file.seek(0)
+        _, _, _, header_size = self.PREAMBLE.unpack(file.read(self.PREAMBLE.size))
+        header_bytes = self._create_header(rocket_packet_version, field_names, dtypes, sampling_frequency)
+        file.seek(self.PREAMBLE.size)
+        file.write(header_bytes + b"\x00" * (header_size - len(header_bytes)))
+
+    def _write_rows(self, file, rocket_packet_version: int, field_names: List[str], dtypes: List[np.dtype],
+                    chunk_index: list, rows: List[List]) -> List[np.dtype]:
+        """
+        Write the rows as a new chunk, after the preamble and the header when it is the first chunk.
+        :return: The types of the fields, as given by the first chunk.
+        """
+        values = list(zip(*rows)) if rows else [[] for _ in field_names]
+        columns = [self._to_stream_type(np.asarray(field_values)) for field_values in values]
+
+        if dtypes is None:
+            dtypes = [column.dtype for column in columns]
+            header_bytes = self._create_header(rocket_packet_version, field_names, dtypes, 0.0)
+            header_bytes = self._pad(header_bytes + b"\x00" * self.HEADER_RESERVE)
+            file.write(self.PREAMBLE.pack(self.MAGIC, self.FORMAT_VERSION, 0, len(header_bytes)))
+            file.write(header_bytes)
+
+        for i, column in enumerate(columns):
+            if column.dtype != dtypes[i]:
+                promoted_dtype = np.result_type(dtypes[i], column.dtype)
+                if promoted_dtype != dtypes[i]:
+                    self._promote_written_column(file, dtypes, chunk_index, i, promoted_dtype)
+                columns[i] = column.astype(dtypes[i])
+
+        if rows:
+            time_stamps = columns[field_names.index(self.TIME_STAMP_FIELD)] \
+                if self.TIME_STAMP_FIELD in field_names else None
+            chunk_index.append((file.tell(), len(rows),
+                                time_stamps[0] if time_stamps is not None else np.nan,
+                                time_stamps[-1] if time_stamps is not None else np.nan))
+            for column in columns:
+                file.write(self._pad(column.tobytes()))
+            file.flush()
+
+        return dtypes
+
+    def _promote_written_column(self, file, dtypes: List[np.dtype], chunk_index: list, field_index: int,
+                                promoted_dtype: np.dtype):
+        dtype = dtypes[field_index]
+        if promoted_dtype.itemsize != dtype.itemsize:
+            raise DomainError("Types incompatibles pour le champ {}: {} et {}".format(field_index, dtype,
+                                                                                      promoted_dtype))
+
+        end = file.tell()
+        for offset, count, _, _ in chunk_index:
+            offset += sum(self._get_padded_size(count * dtypes[i].itemsize) for i in range(field_index))
+            file.seek(offset)
+            column = np.frombuffer(file.read(count * dtype.itemsize), dtype=dtype)
+            file.seek(offset)
+            file.write(column.astype(promoted_dtype).tobytes())
+        file.seek(end)
+
+        dtypes[field_index] = promoted_dtype
+
+    def _to_stream_type(self, column: np.ndarray) -> np.ndarray:
+        # The Python numbers of a chunk are stored on 8 bytes, whatever the platform, so the chunks share their types
+        if column.dtype.kind == "i":
+            column = column.astype(np.int64)
+        elif column.dtype.kind == "f":
+            column = column.astype(np.float64)
+        return self._to_fixed_width(column)
+
+    def load(self, filename: str) -> Tuple[int, List[List]]:
+        rocket_packet_version, rocket_packets_fields_chunks = self.iter_load(filename)
+        return rocket_packet_version, [packet_fields for chunk in rocket_packets_fields_chunks
+                                       for packet_fields in chunk]
+
+    def iter_load(self, filename: str) -> Tuple[int, Iterator[List[List]]]:
+        """
+        :return: A tuple as (rocket_packet_version, chunks), where chunks yields the packets fields of one chunk of the
+                 file at a time, read from the memory map.
+        """
+        header, chunk_index, buffer = self._open(filename)
+        return header["rocket_packet_version"], self._iter_chunks(header, chunk_index, buffer)
+
+    def _iter_chunks(self, header: dict, chunk_index: np.ndarray, buffer: np.ndarray) -> Iterator[List[List]]:
+        # The fields are taken in the order of the header, since the order of a dict is not kept before Python 3.6
+        fields = [np.dtype(type_string) for _, type_string in header["fields"]]
+
+        for offset, count, _, _ in chunk_index.tolist():
+            values = []
+            for dtype in fields:
+                values.append(np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).tolist())
+                offset += self._get_padded_size(count * dtype.itemsize)
+
+            yield [list(packet_fields) for packet_fields in zip(*values)]
+
+    def load_columns(self, filename: str) -> Tuple[int, Dict[str, np.ndarray]]:
+        """
+        :return: A tuple as (rocket_packet_version, columns), where columns is an OrderedDict in the order of the fields
+                 of the file. When the file has a single chunk, the columns are read-only views of the memory-mapped
+                 file, otherwise the chunks are concatenated.
+        """
+        header, chunk_index, buffer = self._open(filename)
+        return header["rocket_packet_version"], self._read_chunks(header, chunk_index, buffer)
+
+    def load_time_range(self, filename: str, start_time_stamp: float,
+                        end_time_stamp: float) -> Tuple[int, Dict[str, np.ndarray]]:
+        """
+        Only read the chunks overlapping [start_time_stamp, end_time_stamp], found with the chunk index.
+        """
+        header, chunk_index, buffer = self._open(filename)
+
+        overlapping = ((chunk_index["last_time_stamp"] >= start_time_stamp) &
+                       (chunk_index["first_time_stamp"] <= end_time_stamp))
+        columns = self._read_chunks(header, chunk_index[overlapping], buffer)
+
+        time_stamps = columns.get(self.TIME_STAMP_FIELD)
+        if time_stamps is not None:
+            in_range = (time_stamps >= start_time_stamp) & (time_stamps <= end_time_stamp)
+            columns = OrderedDict((name, column[in_range]) for name, column in columns.items())
+
+        return header["rocket_packet_version"], columns
+
+    def load_header(self, filename: str) -> dict:
+        header, _, _ = self._open(filename)
+        return header
+
+    def _open(self, filename: str) -> Tuple[dict, np.ndarray, np.ndarray]:
+        buffer = np.memmap(filename, dtype=np.uint8, mode="r")
+        if len(buffer) < self.PREAMBLE.size + self.TRAILER.size:
+            raise DomainError("Format de fichier invalide: " + filename)
+
+        magic, format_version, _, header_size = self.PREAMBLE.unpack_from(buffer, 0)
+        if magic != self.MAGIC:
+            raise DomainError("Format de fichier invalide: " + filename)
+        if format_version > self.FORMAT_VERSION:
+            raise DomainError("Version de fichier non supportée: " + str(format_version))
+
+        header_start = self.PREAMBLE.size
+        header = json.loads(bytes(buffer[header_start:header_start + header_size]).rstrip(b"\x00").decode("utf-8"))
+
+        index_offset, chunk_count = self.TRAILER.unpack_from(buffer, len(buffer) - self.TRAILER.size)
+        chunk_index = np.frombuffer(buffer, dtype=self.CHUNK_INDEX_DTYPE, count=chunk_count, offset=index_offset)
+
+        return header, chunk_index, buffer
+
+    def _read_chunks(self, header: dict, chunk_index: np.ndarray, buffer: np.ndarray) -> Dict[str, np.ndarray]:
+        fields = [(name, np.dtype(type_string)) for name, type_string in header["fields"]]
+        chunks = {name: [] for name, _ in fields}
+
+        for offset, count, _, _ in chunk_index.tolist():
+            for name, dtype in fields:
+                chunks[name].append(np.frombuffer(buffer, dtype=dtype, count=count, offset=offset))
+                offset += self._get_padded_size(count * dtype.itemsize)
+
+        columns = OrderedDict()
+        for name, dtype in fields:
+            if len(chunks[name]) == 1:
+                columns[name] = chunks[name][0]
+            elif chunks[name]:
+                columns[name] = np.concatenate(chunks[name])
+            else:
+                columns[name] = np.zeros(0, dtype=dtype)
+
+        return columns
+
+    @staticmethod
+    def _to_fixed_width(column: np.ndarray) -> np.ndarray:
+        # Python ints and strings have no fixed width on their own, their NumPy equivalents do
+        if column.dtype.kind == "O":
+            raise DomainError("Type de champ non supporté par le format binaire")
+        return column.astype(column.dtype.newbyteorder("<"), copy=False)
+
+    def _create_header(self, rocket_packet_version: int, field_names: List[str], dtypes: List[np.dtype],
+                       sampling_frequency: float) -> bytes:
+        header = {
+            "rocket_packet_version": rocket_packet_version,
+            "fields": [[name, dtype.str] for name, dtype in zip(field_names, dtypes)],
+            "sampling_frequency": sampling_frequency,
+            "chunk_size": self.chunk_size
+        }
+        return json.dumps(header).encode("utf-8")
+
+    @staticmethod
+    def _get_sampling_frequency(packet_count: int, first_time_stamp: float, last_time_stamp: float) -> float:
+        if packet_count < 2 or not last_time_stamp > first_time_stamp:
+            return 0.0
+        return float((packet_count - 1) / (last_time_stamp - first_time_stamp))
+
+    def _pad(self, data: bytes) -> bytes:
+        return data + b"\x00" * (self._get_padded_size(len(data)) - len(data))
+
+    def _get_padded_size(self, size: int) -> int:
+        return -(-size // self.ALIGNMENT) * self.ALIGNMENT
@@ -1,5 +1,5 @@
 import csv
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 from src.data_persister import DataPersister
 from src.domain_error import DomainError
@@ -7,14 +7,22 @@ from src.domain_error import DomainError
 
 class CsvDataPersister(DataPersister):
 
-    def __init__(self):
+    # Rows parsed at once by iter_load, which bounds the memory used by the packets fields being read
+    CHUNK_SIZE = 10000
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE):
         super().__init__()
         self.newline = ''
         self.delimiter = ','
         self.quoting = csv.QUOTE_NONNUMERIC
+        self.chunk_size = chunk_size
 
     def save(self, filename: str, rocket_packet_version: int, field_names: List[str],
              all_rocket_packets_fields: List[List]):
+        self.save_stream(filename, rocket_packet_version, field_names, [all_rocket_packets_fields])
+
+    def save_stream(self, filename: str, rocket_packet_version: int, field_names: List[str],
+                    rocket_packets_fields_chunks: Iterable[List[List]]):
         try:
             with open(filename, "w", newline=self.newline) as csv_file:
                 writer = csv.writer(csv_file, delimiter=self.delimiter, quoting=self.quoting)
@@ -22,24 +30,50 @@ class CsvDataPersister(DataPersister):
                 writer.writerow([rocket_packet_version])
                 writer.writerow(field_names)
 
-                for packet_fields in all_rocket_packets_fields:
-                    writer.writerow(packet_fields)
+                for rocket_packets_fields in rocket_packets_fields_chunks:
+                    writer.writerows(rocket_packets_fields)
 
         except PermissionError:
             raise DomainError("Impossible d'ouvrir le fichier " + filename)
 
     def load(self, filename: str) -> Tuple[int, List[List]]:
+        version, rocket_packets_fields_chunks = self.iter_load(filename)
+
         all_rocket_packets_fields = []
-        with open(filename, newline=self.newline) as csv_file:
+        for rocket_packets_fields in rocket_packets_fields_chunks:
+            all_rocket_packets_fields.extend(rocket_packets_fields)
+
+        return version, all_rocket_packets_fields
+
+    def iter_load(self, filename: str) -> Tuple[int, Iterator[List[List]]]:
+        """
+        The version and the headers are read right away, the packets fields as the chunks are consumed. The file stays
+        open until every chunk was read.
+        """
+        csv_file = open(filename, newline=self.newline)
+        try:
             reader = csv.reader(csv_file, delimiter=self.delimiter, quoting=self.quoting)
 
             version = next(reader, None)[0]
             headers = next(reader, None)
+        except BaseException:
+            csv_file.close()
+            raise
+
+        return version, self._read_chunks(csv_file, reader, len(headers))
 
-            for rocket_packet_field in reader:
-                if len(rocket_packet_field) == len(headers):
-                    all_rocket_packets_fields.append(rocket_packet_field)
+    def _read_chunks(self, csv_file, reader, field_count: int) -> Iterator[List[List]]:
+        with csv_file:
+            rocket_packets_fields = []
+            for rocket_packet_fields in reader:
+                if len(rocket_packet_fields) == field_count:
+                    rocket_packets_fields.append(rocket_packet_fields)
                 else:
                     pass  # FIXME: throw exception or ignore line?
-        csv_file.close()
-        return version, all_rocket_packets_fields
+
+                if len(rocket_packets_fields) == self.chunk_size:
+                    yield rocket_packets_fields
+                    rocket_packets_fields = []
+
+            if rocket_packets_fields:
+                yield rocket_packets_fields
@@ -0,0 +1,30 @@
+import hashlib
+
+HASH_BLOCK_SIZE = 1024 * 1024
+DIGEST_SIZE = 16
+
+
+def hash_file(filename: str, digest_size: int = DIGEST_SIZE) -> str:
+    """
+    :return: The hexadecimal SHA-256 digest of the content of the file, read by blocks and truncated to digest_size
+             bytes.
+    """
+    content_hash = hashlib.sha256()
+
+    with open(filename, "rb") as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+            content_hash.update(block)
+
+    return _truncate(content_hash, digest_size)
+
+
+def hash_text(text: str, digest_size: int = DIGEST_SIZE) -> str:
+    """
+    :return: The hexadecimal SHA-256 digest of the UTF-8 encoding of the text, truncated to digest_size bytes.
+    """
+    return _truncate(hashlib.sha256(text.encode("utf-8")), digest_size)
+
+
+def _truncate(content_hash, digest_size: int) -> str:
+    # SHA-256 rather than BLAKE2, which is only available from Python 3.6
+    return content_hash.hexdigest()[:2 * digest_size]
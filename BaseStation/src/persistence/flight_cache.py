@@ -0,0 +1,142 @@
+import glob
+import os
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from src.domain_error import DomainError
+from src.persistence.binary_data_persister import BinaryDataPersister
+from src.persistence.file_hash import hash_file, hash_text
+
+
+class FlightCache:
+    """
+    Binary copies of the packets fields of text flight files, so a flight opened again is read from a memory-mapped
+    columnar file instead of being parsed from its text.
+
+    An entry is named after the path of the flight file and a key made of its size, modification time and a hash of
+    its content, so a modified file is parsed again. The least recently used entries are deleted once the entries take
+    more than max_size bytes.
+    """
+
+    DIRECTORY = "./src/resources/cache/"
+    MAX_SIZE = 512 * 1024 * 1024
+    CACHED_EXTENSIONS = (".csv",)
+
+    def __init__(self, directory: str = DIRECTORY, max_size: int = MAX_SIZE,
+                 binary_data_persister: BinaryDataPersister = None):
+        self.directory = directory
+        self.max_size = max_size
+        self.binary_data_persister = binary_data_persister or BinaryDataPersister()
+
+    def is_cached_format(self, filename: str) -> bool:
+        return os.path.splitext(filename)[1].lower() in self.CACHED_EXTENSIONS
+
+    def load(self, filename: str) -> Tuple[int, Iterator[List[List]]]:
+        """
+        :return: A tuple as (rocket_packet_version, chunks) like DataPersister.iter_load, or None if the flight file is
+                 not in the cache.
+        """
+        entry_filename = self._get_entry_filename(filename)
+        if not os.path.exists(entry_filename):
+            return None
+
+        try:
+            rocket_packet_version, rocket_packets_fields_chunks = self.binary_data_persister.iter_load(entry_filename)
+        except (DomainError, ValueError, OSError):
+            self._remove(entry_filename)
+            return None
+
+        # The modification time of an entry is the time it was last used
+        os.utime(entry_filename)
+
+        return rocket_packet_version, rocket_packets_fields_chunks
+
+    def store(self, filename: str, rocket_packet_version: int, field_names: List[str],
+              rocket_packets_fields_chunks: Iterable[List[List]]) -> Iterator[List[List]]:
+        """
+        Pass the chunks through, keeping their columns to write the entry of the flight file once every chunk was read.
+        Only NumPy arrays are kept, which take much less memory than the fields lists.
+        """
+        entry_filename = self._get_entry_filename(filename)
+        column_chunks = {name: [] for name in field_names}
+        is_cacheable = True
+
+        for rocket_packets_fields in rocket_packets_fields_chunks:
+            if is_cacheable:
+                is_cacheable = self._add_column_chunks(column_chunks, field_names, rocket_packets_fields)
+            yield rocket_packets_fields
+
+        if not is_cacheable:
+            return
+
+        try:
+            columns = {name: np.concatenate(chunks) if chunks else np.zeros(0)
+                       for name, chunks in column_chunks.items()}
+            os.makedirs(self.directory, exist_ok=True)
+            self._remove_entries_of(filename)
+            self.binary_data_persister.save_columns(entry_filename, rocket_packet_version, field_names, columns)
+        except (DomainError, TypeError, ValueError, OSError):
+            # A flight whose fields cannot be stored in columns is parsed every time
+            self._remove(entry_filename)
+            return
+
+        self.evict()
+
+    def evict(self):
+        """
+        Delete the least recently used entries until the entries take at most max_size bytes.
+        """
+        entries = []
+        for entry_filename in glob.glob(os.path.join(self.directory, "*" + BinaryDataPersister.EXTENSION)):
+            try:
+                status = os.stat(entry_filename)
+            except OSError:
+                continue
+            entries.append((status.st_mtime, status.st_size, entry_filename))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_filename in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            self._remove(entry_filename)
+            total_size -= size
+
+    @staticmethod
+    def _add_column_chunks(column_chunks: dict, field_names: List[str], rocket_packets_fields: List[List]) -> bool:
+        """
+        :return: False if a column mixes text and numbers, which NumPy would silently turn into text.
+        """
+        for i, name in enumerate(field_names):
+            values = [packet_fields[i] for packet_fields in rocket_packets_fields]
+            column = np.asarray(values)
+            if column.dtype.kind in "US" and not all(isinstance(value, (str, bytes)) for value in values):
+                return False
+            column_chunks[name].append(column)
+
+        return True
+
+    def _get_entry_filename(self, filename: str) -> str:
+        entry_name = "{}_{}".format(self._get_path_key(filename), self._get_content_key(filename))
+        return os.path.join(self.directory, entry_name + BinaryDataPersister.EXTENSION)
+
+    def _remove_entries_of(self, filename: str):
+        for entry_filename in glob.glob(os.path.join(self.directory, self._get_path_key(filename) + "_*")):
+            self._remove(entry_filename)
+
+    @staticmethod
+    def _get_path_key(filename: str) -> str:
+        return hash_text(os.path.abspath(filename), digest_size=8)
+
+    @staticmethod
+    def _get_content_key(filename: str) -> str:
+        status = os.stat(filename)
+        key = "{}:{}:{}".format(status.st_size, status.st_mtime_ns, hash_file(filename))
+        return hash_text(key)
+
+    @staticmethod
+    def _remove(filename: str):
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
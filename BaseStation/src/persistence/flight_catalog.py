@@ -0,0 +1,224 @@
+import json
+import os
+import threading
+from typing import Callable, Dict, List
+
+from src.domain_error import DomainError
+from src.persistence.binary_data_persister import BinaryDataPersister
+from src.persistence.file_hash import hash_file
+from src.persistence.raw_journal import RawJournal
+from src.persistence.sqlite_data_persister import SqliteDataPersister
+from src.rocket_packet.rocket_packet_parser_factory import RocketPacketVersionException
+from src.rocket_packet.rocket_packet_repository import RocketPacketRepository
+
+
+class FlightSummary:
+    def __init__(self, filename: str, source_filename: str, size: int, modification_time: int, file_hash: str = None,
+                 rocket_packet_version: int = None, packet_count: int = None, duration: float = None,
+                 apogee: float = None, start_time: float = None, error: str = None):
+        """
+        :param source_filename: File the flight was read from, which differs from filename for the flights of a
+                                flight library.
+        :param size: Size of the source file when the flight was read.
+        :param modification_time: Modification time of the source file in nanoseconds when the flight was read.
+        :param start_time: Time stamp of the first packet.
+        :param error: Why the flight could not be read, or None if it was read.
+        """
+        self.filename = filename
+        self.source_filename = source_filename
+        self.size = size
+        self.modification_time = modification_time
+        self.file_hash = file_hash
+        self.rocket_packet_version = rocket_packet_version
+        self.packet_count = packet_count
+        self.duration = duration
+        self.apogee = apogee
+        self.start_time = start_time
+        self.error = error
+
+    def is_valid(self) -> bool:
+        return self.error is None
+
+    def is_up_to_date(self, status: os.stat_result) -> bool:
+        return self.size == status.st_size and self.modification_time == status.st_mtime_ns
+
+    def to_dict(self) -> dict:
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, values: dict) -> "FlightSummary":
+        return cls(**values)
+
+
+class FlightCatalog:
+    """
+    Summaries of the flights of a directory, kept in a catalog file so the flights can be listed without being read.
+
+    update() only reads the flights added or modified since the last update, found with their size and modification
+    time, and drops the flights deleted since. It can run on a background thread while the summaries are read.
+    """
+
+    CATALOG_FILENAME = "./src/resources/cache/catalog.json"
+    FORMAT_VERSION = 1
+    FLIGHT_EXTENSIONS = (".csv", BinaryDataPersister.EXTENSION, RawJournal.EXTENSION, SqliteDataPersister.EXTENSION)
+    ALTITUDE_FIELD = "altitude"
+
+    def __init__(self, rocket_packet_repository: RocketPacketRepository, sqlite_data_persister: SqliteDataPersister,
+                 directory: str, catalog_filename: str = CATALOG_FILENAME):
+        self.rocket_packet_repository = rocket_packet_repository
+        self.sqlite_data_persister = sqlite_data_persister
+        self.directory = directory
+        self.catalog_filename = catalog_filename
+        self.lock = threading.Lock()
+        self.summaries = {}
+
+    def get_summaries(self) -> List[FlightSummary]:
+        """
+        :return: The summaries of the flights, ordered by file name.
+        """
+        with self.lock:
+            return [self.summaries[filename] for filename in sorted(self.summaries)]
+
+    def load(self):
+        """
+        Read the catalog file. A missing or unreadable catalog is rebuilt by the next update.
+        """
+        try:
+            with open(self.catalog_filename, encoding="utf-8") as catalog_file:
+                catalog = json.load(catalog_file)
+            if catalog.get("format_version") != self.FORMAT_VERSION:
+                return
+            summaries = {values["filename"]: FlightSummary.from_dict(values) for values in catalog["flights"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+        with self.lock:
+            self.summaries = summaries
+
+    def save(self):
+        catalog = {"format_version": self.FORMAT_VERSION,
+                   "flights": [summary.to_dict() for summary in self.get_summaries()]}
+
+        os.makedirs(os.path.dirname(self.catalog_filename) or ".", exist_ok=True)
+        # The catalog is replaced in one step, so a crash never leaves a partial catalog
+        temporary_filename = self.catalog_filename + ".tmp"
+        with open(temporary_filename, "w", encoding="utf-8") as catalog_file:
+            json.dump(catalog, catalog_file)
+        os.replace(temporary_filename, self.catalog_filename)
+
+    def update(self, progress_callback: Callable[[int, int], None] = None) -> bool:
+        """
+        Read the flights added or modified since the last update and save the catalog if it changed. The summaries
+        are replaced once every flight was read.
+        :param progress_callback: Called as progress_callback(read_file_count, file_count_to_read) after every file.
+        :return: True if the summaries changed.
+        """
+        files = self._scan()
+
+        previous_summaries_by_source = {}
+        for summary in self.get_summaries():
+            previous_summaries_by_source.setdefault(summary.source_filename, []).append(summary)
+
+        summaries = []
+        changed_files = []
+        for filename, status in files.items():
+            previous_summaries = previous_summaries_by_source.get(filename)
+            if previous_summaries and all(summary.is_up_to_date(status) for summary in previous_summaries):
+                summaries.extend(previous_summaries)
+            else:
+                changed_files.append((filename, status))
+
+        for i, (filename, status) in enumerate(changed_files):
+            summaries.extend(self._summarize(filename, status))
+            if progress_callback is not None:
+                progress_callback(i + 1, len(changed_files))
+
+        changed = len(changed_files) > 0 or any(source not in files for source in previous_summaries_by_source)
+        with self.lock:
+            self.summaries = {summary.filename: summary for summary in summaries}
+
+        if changed:
+            self.save()
+
+        return changed
+
+    def _scan(self) -> Dict[str, os.stat_result]:
+        """
+        The flights of a library are invalidated by the modification time of the library. The last connection to a
+        library writes its WAL in the library when it is closed, so a saved flight always modifies the library file.
+        """
+        files = {}
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            return files
+
+        for entry in entries:
+            extension = os.path.splitext(entry.name)[1].lower()
+            if entry.is_file() and extension in self.FLIGHT_EXTENSIONS:
+                files[os.path.join(self.directory, entry.name)] = entry.stat()
+
+        return files
+
+    def _summarize(self, filename: str, status: os.stat_result) -> List[FlightSummary]:
+        if os.path.splitext(filename)[1].lower() == SqliteDataPersister.EXTENSION:
+            return self._summarize_library(filename, status)
+
+        summary = FlightSummary(filename, filename, status.st_size, status.st_mtime_ns)
+        try:
+            summary.file_hash = hash_file(filename)
+            self._read_flight(summary)
+        except (DomainError, RocketPacketVersionException, OSError, ValueError, TypeError, IndexError) as error:
+            # The flight is listed with its error, and only read again once it is modified
+            summary.error = str(error) or type(error).__name__
+
+        return [summary]
+
+    def _read_flight(self, summary: FlightSummary):
+        """
+        Compute the summary chunk by chunk, without keeping the packets.
+        """
+        if self.rocket_packet_repository.is_raw_journal(summary.filename):
+            self._read_raw_journal(summary)
+            return
+
+        version, rocket_packets_chunks = self.rocket_packet_repository.iter_load(summary.filename)
+
+        summary.rocket_packet_version = version
+        summary.packet_count = 0
+        last_time_stamp = None
+        for chunk in rocket_packets_chunks:
+            if not chunk:
+                continue
+            if summary.start_time is None:
+                summary.start_time = chunk[0].time_stamp
+            last_time_stamp = chunk[-1].time_stamp
+            apogee = max(rocket_packet.altitude for rocket_packet in chunk)
+            summary.apogee = apogee if summary.apogee is None else max(summary.apogee, apogee)
+            summary.packet_count += len(chunk)
+
+        if last_time_stamp is not None:
+            summary.duration = last_time_stamp - summary.start_time
+
+    def _read_raw_journal(self, summary: FlightSummary):
+        # Only the needed fields of a raw journal are decoded
+        version, raw_journal = self.rocket_packet_repository.load(summary.filename)
+
+        summary.rocket_packet_version = version
+        summary.packet_count = len(raw_journal)
+        if len(raw_journal) > 0:
+            time_stamps = raw_journal.get_time_stamps()
+            summary.start_time = float(time_stamps[0])
+            summary.duration = float(time_stamps[-1] - time_stamps[0])
+            summary.apogee = float(raw_journal.get_field(self.ALTITUDE_FIELD).max())
+
+    def _summarize_library(self, filename: str, status: os.stat_result) -> List[FlightSummary]:
+        try:
+            flights = self.sqlite_data_persister.get_flights(filename)
+        except DomainError as error:
+            return [FlightSummary(filename, filename, status.st_size, status.st_mtime_ns, error=str(error))]
+
+        return [FlightSummary(SqliteDataPersister.get_flight_filename(filename, flight.name), filename, status.st_size,
+                              status.st_mtime_ns, rocket_packet_version=flight.rocket_packet_version,
+                              packet_count=flight.packet_count, duration=flight.duration, apogee=flight.apogee)
+                for flight in flights]
@@ -0,0 +1,61 @@
+import threading
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from src.persistence.flight_catalog import FlightCatalog
+
+
+class FlightCatalogIndexer(QObject):
+    """
+    Update a FlightCatalog on a background thread, so the flights can be listed right away from the catalog file while
+    the new and modified flights are read. The progress and the end of an update are published with signals.
+    """
+
+    progressed = pyqtSignal(int, int)
+    updated = pyqtSignal()
+
+    def __init__(self, flight_catalog: FlightCatalog):
+        super().__init__()
+        self.flight_catalog = flight_catalog
+        self.lock = threading.Lock()
+        self.thread = None
+        self.update_requested = False
+
+    def start(self):
+        """
+        Start an update, or schedule one after the update in progress, which may have missed the latest files.
+        """
+        with self.lock:
+            if self.is_running():
+                self.update_requested = True
+                return
+
+            self.update_requested = False
+            # The catalog file is replaced in one step, so the thread can be stopped at any time
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def is_running(self) -> bool:
+        thread = self.thread
+        return thread is not None and thread.is_alive()
+
+    def wait(self):
+        thread = self.thread
+        if thread is not None:
+            thread.join()
+
+    def run(self):
+        if not self.flight_catalog.get_summaries():
+            self.flight_catalog.load()
+            self.updated.emit()
+
+        while True:
+            self.flight_catalog.update(self.progressed.emit)
+            self.updated.emit()
+
+            with self.lock:
+                if not self.update_requested:
+                    # Cleared under the lock, so an update requested from now on starts a new thread
+                    self.thread = None
+                    return
+                self.update_requested = False
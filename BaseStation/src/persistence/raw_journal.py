@@ -0,0 +1,127 @@
+from collections.abc import Sequence
+from typing import List
+
+import numpy as np
+
+from src.rocket_packet.rocket_packet import RocketPacket
+from src.rocket_packet.rocket_packet_parser import RocketPacketParser
+
+
+class RawJournal(Sequence):
+    """
+    Read-only sequence of the RocketPackets of a raw capture of the serial link, where every frame is the start
+    character, the packet and its checksum, exactly as received by SerialDataProducer.
+
+    The file is memory-mapped and only the offsets of the valid frames are computed when it is opened, so even very
+    large captures open quickly. The packets are decoded when they are accessed, and are not kept.
+    """
+
+    EXTENSION = ".raw"
+    # Bytes scanned at once while indexing the frames, which bounds the memory used by the index construction
+    BLOCK_SIZE = 16 * 1024 * 1024
+    # Frames decoded at once when reading a field of every packet
+    FIELD_BLOCK_SIZE = 1024 * 1024
+    # Frames whose payloads are gathered at once when decoding a slice of packets
+    PARSE_BLOCK_SIZE = 64 * 1024
+
+    def __init__(self, filename: str, rocket_packet_parser: RocketPacketParser, start_character: bytes):
+        self.filename = filename
+        self.rocket_packet_parser = rocket_packet_parser
+        self.payload_size = rocket_packet_parser.get_number_of_bytes()
+
+        # np.memmap cannot map an empty file
+        with open(filename, "rb") as file:
+            is_empty = file.seek(0, 2) == 0
+        self._buffer = np.zeros(0, dtype=np.uint8) if is_empty else np.memmap(filename, dtype=np.uint8, mode="r")
+
+        # Payload and checksum, the start character excluded
+        self.frame_offsets = self.build_frame_offsets(self._buffer, start_character, self.payload_size + 1)
+
+    @classmethod
+    def build_frame_offsets(cls, buffer: np.ndarray, start_character: bytes, frame_size: int) -> np.ndarray:
+        """
+        Vectorised equivalent of FrameSynchronizer: find the start characters followed by frame_size bytes with a valid
+        checksum, then drop the candidates inside an already accepted frame.
+        :return: The offsets of the start character of every valid frame.
+        """
+        start_value = start_character[0]
+        block_starts = []
+
+        for block_start in range(0, len(buffer), cls.BLOCK_SIZE):
+            # The block overlaps the next one, so the frames starting near its end are complete
+            block = buffer[block_start:block_start + cls.BLOCK_SIZE + frame_size + 1]
+            starts = np.flatnonzero(block[:cls.BLOCK_SIZE] == start_value)
+            starts = starts[starts + 1 + frame_size <= len(block)]
+
+            # Running sum modulo 256: the sum of a frame is the difference of two of its values, wrapping like the
+            # checksum
+            running_sum = np.zeros(len(block) + 1, dtype=np.uint8)
+            np.cumsum(block, dtype=np.uint8, out=running_sum[1:])
+            checksums = running_sum[starts + 1 + frame_size] - running_sum[starts + 1]
+
+            block_starts.append(starts[checksums == 255] + block_start)
+
+        starts = np.concatenate(block_starts) if block_starts else np.zeros(0, dtype=np.int64)
+        return cls._remove_overlapping_frames(starts.astype(np.int64), frame_size + 1)
+
+    @staticmethod
+    def _remove_overlapping_frames(starts: np.ndarray, frame_length: int) -> np.ndarray:
+        """
+        Keep the first frame of every group of overlapping frames, as FrameSynchronizer resumes its search after an
+        accepted frame. A frame only conflicts with the previous one in rare cases, so only these are looped over.
+        """
+        conflicts = np.flatnonzero(np.diff(starts) < frame_length) + 1
+        if len(conflicts) == 0:
+            return starts
+
+        keep = np.ones(len(starts), dtype=bool)
+        last_kept = -1
+        for i in conflicts.tolist():
+            previous = i - 1 if keep[i - 1] else last_kept
+            if starts[i] < starts[previous] + frame_length:
+                keep[i] = False
+                last_kept = previous
+            else:
+                last_kept = i
+
+        return starts[keep]
+
+    def get_time_stamps(self) -> np.ndarray:
+        return self.get_field("time_stamp")
+
+    def get_field(self, field_name: str) -> np.ndarray:
+        """
+        Decode a single field of every packet, without creating any RocketPacket.
+        """
+        dtype = self.rocket_packet_parser.get_dtype()
+        field_dtype, field_offset = dtype.fields[field_name][:2]
+        byte_offsets = 1 + field_offset + np.arange(field_dtype.itemsize)
+
+        values = np.zeros(len(self), dtype=field_dtype)
+        for start in range(0, len(self), self.FIELD_BLOCK_SIZE):
+            offsets = self.frame_offsets[start:start + self.FIELD_BLOCK_SIZE]
+            field_bytes = self._buffer[offsets[:, np.newaxis] + byte_offsets]
+            values[start:start + len(offsets)] = field_bytes.view(field_dtype).ravel()
+
+        return values
+
+    def __len__(self):
+        return len(self.frame_offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._parse_frames(self.frame_offsets[index])
+
+        offset = self.frame_offsets[index]
+        return self.rocket_packet_parser.parse(self._buffer[offset + 1:offset + 1 + self.payload_size].tobytes())
+
+    def _parse_frames(self, offsets: np.ndarray) -> List[RocketPacket]:
+        byte_offsets = 1 + np.arange(self.payload_size)
+
+        rocket_packets = []
+        for start in range(0, len(offsets), self.PARSE_BLOCK_SIZE):
+            block_offsets = offsets[start:start + self.PARSE_BLOCK_SIZE]
+            payloads = self._buffer[block_offsets[:, np.newaxis] + byte_offsets]
+            rocket_packets.extend(self.rocket_packet_parser.parse_many(payloads.tobytes()))
+
+        return rocket_packets
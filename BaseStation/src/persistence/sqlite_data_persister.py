@@ -0,0 +1,297 @@
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Iterable, Iterator, List, Tuple
+
+from src.data_persister import DataPersister
+from src.domain_error import DomainError
+
+
+class FlightMetadata:
+    def __init__(self, name: str, rocket_packet_version: int, packet_count: int, duration: float, apogee: float,
+                 max_voltage: float):
+        self.name = name
+        self.rocket_packet_version = rocket_packet_version
+        self.packet_count = packet_count
+        self.duration = duration
+        self.apogee = apogee
+        self.max_voltage = max_voltage
+
+
+class SqliteDataPersister(DataPersister):
+    """
+    Flight library: many flights in a single SQLite database, opened in WAL mode so the library can be read while a
+    flight is being written.
+
+    A flight is designated by the database file name and the flight name, separated by FLIGHT_SEPARATOR, as in
+    "flights.db::2019-06-20_12h00m". Without a flight name, save names the flight after the current time and load opens
+    the last saved flight.
+
+    The packets of every rocket packet version are stored in their own table, with a column by field and an index on
+    (flight_id, time_stamp), so a time window of a flight is read with an indexed query. The flights table keeps the
+    metadata of every flight, so the flights can be listed without reading their packets.
+    """
+
+    EXTENSION = ".db"
+    FLIGHT_SEPARATOR = "::"
+    FLIGHT_NAME_FORMAT = "%Y-%m-%d_%Hh%Mm%Ss"
+    # Rows fetched or inserted at once
+    CHUNK_SIZE = 10000
+    TIME_STAMP_FIELD = "time_stamp"
+    ALTITUDE_FIELD = "altitude"
+    VOLTAGE_FIELD = "voltage"
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE):
+        super().__init__()
+        self.chunk_size = chunk_size
+
+    @classmethod
+    def get_flight_filename(cls, database_filename: str, flight_name: str) -> str:
+        return database_filename + cls.FLIGHT_SEPARATOR + flight_name
+
+    @classmethod
+    def split_flight_filename(cls, filename: str) -> Tuple[str, str]:
+        """
+        :return: A tuple as (database_filename, flight_name), where flight_name is None if the flight is not named.
+        """
+        database_filename, separator, flight_name = filename.partition(cls.FLIGHT_SEPARATOR)
+        return database_filename, flight_name if separator and flight_name else None
+
+    def save(self, filename: str, rocket_packet_version: int, field_names: List[str],
+             all_rocket_packets_fields: List[List]):
+        self.save_stream(filename, rocket_packet_version, field_names, [all_rocket_packets_fields])
+
+    def save_stream(self, filename: str, rocket_packet_version: int, field_names: List[str],
+                    rocket_packets_fields_chunks: Iterable[List[List]]):
+        """
+        Save the flight in a single transaction, replacing the flight with the same name.
+        """
+        database_filename, flight_name = self.split_flight_filename(filename)
+        if flight_name is None:
+            flight_name = datetime.now().strftime(self.FLIGHT_NAME_FORMAT)
+
+        connection = self._connect(database_filename)
+        try:
+            with connection:
+                packets_table = self._create_packets_table(connection, rocket_packet_version, field_names)
+                connection.execute("DELETE FROM flights WHERE name = ?", (flight_name,))
+                flight_id = connection.execute(
+                    "INSERT INTO flights (name, rocket_packet_version, field_names, packet_count) VALUES (?, ?, ?, 0)",
+                    (flight_name, rocket_packet_version, json.dumps(field_names))).lastrowid
+
+                statistics = _FlightStatistics(field_names)
+                insert = "INSERT INTO {} VALUES (?, {})".format(packets_table, ", ".join("?" * len(field_names)))
+                for rocket_packets_fields in rocket_packets_fields_chunks:
+                    connection.executemany(insert, ([flight_id] + list(packet_fields)
+                                                    for packet_fields in rocket_packets_fields))
+                    statistics.update(rocket_packets_fields)
+
+                connection.execute(
+                    "UPDATE flights SET packet_count = ?, duration = ?, apogee = ?, max_voltage = ? WHERE id = ?",
+                    (statistics.packet_count, statistics.get_duration(), statistics.apogee, statistics.max_voltage,
+                     flight_id))
+        except sqlite3.Error as error:
+            raise DomainError("Impossible d'écrire le vol dans le fichier {}: {}".format(database_filename, error))
+        finally:
+            connection.close()
+
+    def load(self, filename: str) -> Tuple[int, List[List]]:
+        version, rocket_packets_fields_chunks = self.iter_load(filename)
+
+        all_rocket_packets_fields = []
+        for rocket_packets_fields in rocket_packets_fields_chunks:
+            all_rocket_packets_fields.extend(rocket_packets_fields)
+
+        return version, all_rocket_packets_fields
+
+    def iter_load(self, filename: str) -> Tuple[int, Iterator[List[List]]]:
+        connection, flight_id, version, packets_table = self._open_flight(filename)
+        cursor = self._select(connection, filename,
+                              "SELECT * FROM {} WHERE flight_id = ? ORDER BY rowid".format(packets_table), (flight_id,))
+        return version, self._read_chunks(connection, filename, cursor)
+
+    def load_time_range(self, filename: str, start_time_stamp: float,
+                        end_time_stamp: float) -> Tuple[int, List[List]]:
+        """
+        Only read the packets whose time stamp is in [start_time_stamp, end_time_stamp], found with the index.
+        """
+        connection, flight_id, version, packets_table = self._open_flight(filename)
+        cursor = self._select(
+            connection, filename,
+            "SELECT * FROM {} WHERE flight_id = ? AND {} BETWEEN ? AND ? ORDER BY {}, rowid".format(
+                packets_table, self.TIME_STAMP_FIELD, self.TIME_STAMP_FIELD),
+            (flight_id, start_time_stamp, end_time_stamp))
+
+        all_rocket_packets_fields = []
+        for rocket_packets_fields in self._read_chunks(connection, filename, cursor):
+            all_rocket_packets_fields.extend(rocket_packets_fields)
+
+        return version, all_rocket_packets_fields
+
+    def get_flights(self, database_filename: str) -> List[FlightMetadata]:
+        """
+        :return: The metadata of every flight of the library, ordered by name.
+        """
+        connection = self._connect(database_filename)
+        try:
+            rows = connection.execute("SELECT name, rocket_packet_version, packet_count, duration, apogee, max_voltage "
+                                      "FROM flights ORDER BY name").fetchall()
+        except sqlite3.Error as error:
+            raise DomainError("Impossible de lire la bibliothèque de vols {}: {}".format(database_filename, error))
+        finally:
+            connection.close()
+
+        return [FlightMetadata(*row) for row in rows]
+
+    def delete_flight(self, filename: str):
+        database_filename, flight_name = self.split_flight_filename(filename)
+
+        connection = self._connect(database_filename)
+        try:
+            with connection:
+                connection.execute("DELETE FROM flights WHERE name = ?", (flight_name,))
+        except sqlite3.Error as error:
+            raise DomainError("Impossible de supprimer le vol {}: {}".format(filename, error))
+        finally:
+            connection.close()
+
+    def _read_chunks(self, connection: sqlite3.Connection, filename: str,
+                     cursor: sqlite3.Cursor) -> Iterator[List[List]]:
+        try:
+            while True:
+                try:
+                    rows = cursor.fetchmany(self.chunk_size)
+                except sqlite3.Error as error:
+                    raise DomainError("Impossible de lire le vol {}: {}".format(filename, error))
+                if not rows:
+                    return
+                # The first column is the flight id
+                yield [list(row[1:]) for row in rows]
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _select(connection: sqlite3.Connection, filename: str, query: str, parameters: tuple) -> sqlite3.Cursor:
+        """
+        Execute a query whose rows are read by _read_chunks, which closes the connection. The connection is closed
+        here if the query fails.
+        """
+        try:
+            return connection.execute(query, parameters)
+        except sqlite3.Error as error:
+            connection.close()
+            raise DomainError("Impossible de lire le vol {}: {}".format(filename, error))
+
+    def _open_flight(self, filename: str) -> Tuple[sqlite3.Connection, int, int, str]:
+        database_filename, flight_name = self.split_flight_filename(filename)
+        if not os.path.exists(database_filename):
+            raise DomainError("Bibliothèque de vols introuvable: " + database_filename)
+
+        connection = self._connect(database_filename)
+        row = None
+        try:
+            if flight_name is None:
+                row = connection.execute(
+                    "SELECT id, rocket_packet_version FROM flights ORDER BY id DESC LIMIT 1").fetchone()
+            else:
+                row = connection.execute("SELECT id, rocket_packet_version FROM flights WHERE name = ?",
+                                         (flight_name,)).fetchone()
+        except sqlite3.Error as error:
+            raise DomainError("Impossible de lire le vol {}: {}".format(filename, error))
+        finally:
+            # The connection is handed over to the caller only when the flight is found
+            if row is None:
+                connection.close()
+
+        if row is None:
+            raise DomainError("Vol introuvable: " + filename)
+
+        flight_id, version = row
+        return connection, flight_id, version, self._get_packets_table_name(version)
+
+    def _connect(self, database_filename: str) -> sqlite3.Connection:
+        connection = None
+        try:
+            connection = sqlite3.connect(database_filename)
+            connection.execute("PRAGMA journal_mode = WAL")
+            # In WAL mode, a commit is durable once the WAL is synced at a checkpoint, which is much cheaper
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute("PRAGMA foreign_keys = ON")
+            connection.execute("CREATE TABLE IF NOT EXISTS flights (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL, "
+                               "rocket_packet_version INTEGER NOT NULL, field_names TEXT NOT NULL, "
+                               "packet_count INTEGER NOT NULL, duration REAL, apogee REAL, max_voltage REAL)")
+        except sqlite3.Error as error:
+            if connection is not None:
+                connection.close()
+            raise DomainError("Impossible d'ouvrir la bibliothèque de vols {}: {}".format(database_filename, error))
+
+        return connection
+
+    def _create_packets_table(self, connection: sqlite3.Connection, rocket_packet_version: int,
+                              field_names: List[str]) -> str:
+        packets_table = self._get_packets_table_name(rocket_packet_version)
+        columns = ", ".join(self._quote(name) for name in field_names)
+        connection.execute("CREATE TABLE IF NOT EXISTS {} (flight_id INTEGER NOT NULL REFERENCES flights (id) "
+                           "ON DELETE CASCADE, {})".format(packets_table, columns))
+
+        if self.TIME_STAMP_FIELD in field_names:
+            connection.execute("CREATE INDEX IF NOT EXISTS {} ON {} (flight_id, {})".format(
+                self._quote("index_packets_{}_time_stamp".format(int(rocket_packet_version))), packets_table,
+                self.TIME_STAMP_FIELD))
+        else:
+            connection.execute("CREATE INDEX IF NOT EXISTS {} ON {} (flight_id)".format(
+                self._quote("index_packets_{}".format(int(rocket_packet_version))), packets_table))
+
+        return packets_table
+
+    def _get_packets_table_name(self, rocket_packet_version: int) -> str:
+        return self._quote("packets_{}".format(int(rocket_packet_version)))
+
+    @staticmethod
+    def _quote(identifier: str) -> str:
+        return '"' + identifier.replace('"', '""') + '"'
+
+
+class _FlightStatistics:
+    def __init__(self, field_names: List[str]):
+        self.time_stamp_index = self._index_of(field_names, SqliteDataPersister.TIME_STAMP_FIELD)
+        self.altitude_index = self._index_of(field_names, SqliteDataPersister.ALTITUDE_FIELD)
+        self.voltage_index = self._index_of(field_names, SqliteDataPersister.VOLTAGE_FIELD)
+        self.packet_count = 0
+        self.first_time_stamp = None
+        self.last_time_stamp = None
+        self.apogee = None
+        self.max_voltage = None
+
+    def update(self, rocket_packets_fields: List[List]):
+        if not rocket_packets_fields:
+            return
+
+        self.packet_count += len(rocket_packets_fields)
+
+        if self.time_stamp_index is not None:
+            if self.first_time_stamp is None:
+                self.first_time_stamp = rocket_packets_fields[0][self.time_stamp_index]
+            self.last_time_stamp = rocket_packets_fields[-1][self.time_stamp_index]
+
+        if self.altitude_index is not None:
+            self.apogee = self._max(self.apogee, (fields[self.altitude_index] for fields in rocket_packets_fields))
+
+        if self.voltage_index is not None:
+            self.max_voltage = self._max(self.max_voltage,
+                                         (fields[self.voltage_index] for fields in rocket_packets_fields))
+
+    def get_duration(self) -> float:
+        if self.first_time_stamp is None:
+            return None
+        return self.last_time_stamp - self.first_time_stamp
+
+    @staticmethod
+    def _max(current, values) -> float:
+        maximum = max(values)
+        return maximum if current is None else max(current, maximum)
+
+    @staticmethod
+    def _index_of(field_names: List[str], field_name: str) -> int:
+        return field_names.index(field_name) if field_name in field_names else None
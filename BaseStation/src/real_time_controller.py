@@ -5,6 +5,7 @@ from src.config import Config
 from src.controller import Controller
 from src.data_processing.consumer_factory import ConsumerFactory
 from src.domain_error import DomainError
+from src.message_listener import MessageListener
 from src.message_type import MessageType
 from src.realtime.serial_data_producer import SerialDataProducer, NoConnectedDeviceException
 from src.save import SaveManager, SaveStatus
@@ -26,7 +27,7 @@ class RealTimeController(Controller):
         self.update_timer()
 
     def update_timer(self):
-        self.data_widget.set_time(self.consumer["time_stamp"][-1])
+        self.data_widget.set_time(self.snapshot["time_stamp"][-1])
 
     def real_time_button_callback(self):
         if not self.is_running:
@@ -61,8 +62,16 @@ class RealTimeController(Controller):
         if self.is_running:
             self.stop_updates()
 
+        # The flight was saved or dropped by the user, so its journal must not be recovered on the next start-up
+        self.data_producer.clear_rocket_packets()
+        self.save_manager.wait()
+
         event.accept()
 
+    def register_message_listener(self, message_listener: MessageListener):
+        super().register_message_listener(message_listener)
+        self.save_manager.register_message_listener(message_listener)
+
     def activate(self, _):
         self.data_widget.update_button_text(self.is_running)
 
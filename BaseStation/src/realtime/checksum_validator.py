@@ -5,10 +5,18 @@ from src.message_type import MessageType
 class ChecksumValidator(MessageSender):
 
     def validate(self, data_array: bytes):
-        checksum = sum(data_array) % 256
+        checksum = self.compute_checksum(data_array)
         if checksum == 255:
             return True
         else:
             self.notify_all_message_listeners("Invalid Checksum : expected = 255, calculated = {}".format(checksum),
                                               MessageType.WARNING)
             return False
+
+    def is_valid(self, data_array: bytes) -> bool:
+        """Same as validate, without notifying the message listeners"""
+        return self.compute_checksum(data_array) == 255
+
+    @staticmethod
+    def compute_checksum(data_array: bytes) -> int:
+        return sum(data_array) % 256
@@ -0,0 +1,62 @@
+from typing import List
+
+from src.realtime.checksum_validator import ChecksumValidator
+
+
+class FrameSynchronizer:
+    """
+    Extracts frames from the raw serial byte stream. A frame is the start character followed by frame_size bytes, the
+    last one being the checksum. Bytes are buffered so a frame can be split across reads, and a candidate frame that
+    fails validation only skips its start character: the search resumes at the next start character, even if it lies
+    inside the rejected candidate.
+    """
+
+    def __init__(self, start_character: bytes, frame_size: int, checksum_validator: ChecksumValidator):
+        self.start_character = start_character
+        self.frame_size = frame_size
+        self.checksum_validator = checksum_validator
+        self._buffer = bytearray()
+        self._synchronized = True
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """
+        :param data: The bytes read on the serial port since the last call.
+        :return: The content (payload and checksum, without the start character) of every valid frame completed by data.
+        """
+        self._buffer.extend(data)
+
+        frames = []
+        position = 0
+        while True:
+            start = self._buffer.find(self.start_character, position)
+            if start == -1:
+                position = len(self._buffer)
+                break
+
+            end = start + 1 + self.frame_size
+            if end > len(self._buffer):
+                position = start
+                break
+
+            candidate = bytes(self._buffer[start + 1:end])
+            if self._validate(candidate):
+                frames.append(candidate)
+                self._synchronized = True
+                position = end
+            else:
+                self._synchronized = False
+                position = start + 1
+
+        del self._buffer[:position]
+
+        return frames
+
+    def reset(self):
+        self._buffer = bytearray()
+        self._synchronized = True
+
+    def _validate(self, candidate: bytes) -> bool:
+        # Only report the first rejected frame, not every false start character found while resynchronising
+        if self._synchronized:
+            return self.checksum_validator.validate(candidate)
+        return self.checksum_validator.is_valid(candidate)
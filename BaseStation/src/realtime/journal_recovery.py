@@ -0,0 +1,65 @@
+import glob
+import os
+from typing import List
+
+from src.message_sender import MessageSender
+from src.message_type import MessageType
+from src.persistence.raw_journal import RawJournal
+from src.rocket_packet.rocket_packet_parser_factory import RocketPacketParserFactory
+from src.rocket_packet.rocket_packet_repository import RocketPacketRepository
+
+
+class JournalRecovery(MessageSender):
+    """
+    Convert the journals left behind by an acquisition that did not end normally into flight files.
+    """
+
+    FLIGHT_FILE_EXTENSION = ".csv"
+
+    def __init__(self, rocket_packet_repository: RocketPacketRepository,
+                 rocket_packet_parser_factory: RocketPacketParserFactory, journal_directory: str,
+                 flight_directory: str):
+        super().__init__()
+        self.rocket_packet_repository = rocket_packet_repository
+        self.rocket_packet_parser_factory = rocket_packet_parser_factory
+        self.journal_directory = journal_directory
+        self.flight_directory = flight_directory
+
+    def get_journals(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.journal_directory, "*" + RawJournal.EXTENSION)))
+
+    def recover_all(self) -> List[str]:
+        """
+        :return: The names of the recovered flight files.
+        """
+        flight_filenames = []
+        for journal_filename in self.get_journals():
+            flight_filename = self.recover(journal_filename)
+            if flight_filename is not None:
+                flight_filenames.append(flight_filename)
+
+        return flight_filenames
+
+    def recover(self, journal_filename: str) -> str:
+        """
+        Save the packets of the journal in a flight file, then delete the journal. A journal without any packet is
+        deleted without creating a flight file.
+        :return: The name of the flight file, or None if the journal was empty.
+        """
+        rocket_packet_version, rocket_packets = self.rocket_packet_repository.load(journal_filename)
+
+        flight_filename = None
+        if len(rocket_packets) > 0:
+            name = os.path.splitext(os.path.basename(journal_filename))[0]
+            flight_filename = os.path.join(self.flight_directory, name + self.FLIGHT_FILE_EXTENSION)
+            rocket_packet_parser = self.rocket_packet_parser_factory.create(rocket_packet_version)
+            self.rocket_packet_repository.save(flight_filename, rocket_packets[:], rocket_packet_parser)
+
+            self.notify_all_message_listeners("Journal récupéré dans le fichier: " + flight_filename,
+                                              MessageType.INFO)
+
+        # The journal memory map must be released before the file can be deleted on Windows
+        del rocket_packets
+        os.remove(journal_filename)
+
+        return flight_filename
@@ -0,0 +1,163 @@
+import itertools
+import os
+import threading
+import time
+from datetime import datetime
+
+from src.message_sender import MessageSender
+from src.message_type import MessageType
+from src.persistence.raw_journal import RawJournal
+
+
+class JournalWriter(MessageSender):
+    """
+    Write-ahead journal of an acquisition: the received frames are appended to a raw journal by a background thread,
+    so a crash or a power loss does not lose the flight. write() only queues the frames, so the serial loop never waits
+    for the disk. The queued frames are written in batches and synced to the disk every fsync_interval seconds.
+    """
+
+    # The microseconds and the counter keep a journal reopened right after a detach from reusing the detached name,
+    # while the names still sort in the order the journals were opened
+    FILENAME_FORMAT = "journal_%Y-%m-%d_%Hh%Mm%Ss%f_{:06d}"
+    # Shared by every writer of the process
+    _filename_counter = itertools.count()
+
+    def __init__(self, directory: str, fsync_interval: float = 1.0):
+        super().__init__()
+        self.directory = directory
+        self.fsync_interval = fsync_interval
+        self.filename = None
+
+        self._condition = threading.Condition()
+        self._pending = []
+        self._sync_requested = False
+        self._closing = False
+        self._accepting = False
+        self._thread = None
+
+    def open(self) -> str:
+        """
+        Start a new journal in the journal directory.
+        :return: The name of the journal file.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        name = datetime.now().strftime(self.FILENAME_FORMAT).format(next(self._filename_counter) % 1000000)
+        self.filename = os.path.join(self.directory, name + RawJournal.EXTENSION)
+        # Never appends to an existing journal, which may belong to a detached acquisition
+        file = open(self.filename, "xb")
+
+        self._pending = []
+        self._sync_requested = False
+        self._closing = False
+        self._accepting = True
+        self._thread = threading.Thread(target=self._run, args=(file,), daemon=True)
+        self._thread.start()
+
+        return self.filename
+
+    def is_open(self) -> bool:
+        return self._thread is not None
+
+    def write(self, data: bytes):
+        with self._condition:
+            # Once writing failed, the frames are only kept in memory
+            if self._accepting:
+                self._pending.append(data)
+                self._condition.notify()
+
+    def sync(self):
+        """
+        Block until every frame written so far is on the disk.
+        """
+        with self._condition:
+            if self._thread is None:
+                return
+            self._sync_requested = True
+            self._condition.notify()
+            while self._sync_requested and self._thread.is_alive():
+                self._condition.wait(self.fsync_interval)
+
+    def close(self):
+        """
+        Write the remaining frames and close the journal, which stays on the disk until it is discarded or recovered.
+        """
+        with self._condition:
+            thread = self._thread
+            if thread is None:
+                return
+            self._closing = True
+            self._condition.notify()
+
+        thread.join()
+        self._thread = None
+
+    def detach(self) -> str:
+        """
+        Close the journal and forget it, leaving its deletion to whoever saves its frames.
+        :return: The name of the journal file, or None if no journal was open.
+        """
+        if not self.is_open():
+            return None
+
+        self.close()
+        filename, self.filename = self.filename, None
+        return filename
+
+    def discard(self):
+        """
+        Close the journal and delete it, once its frames were saved in a flight file or dropped by the user.
+        """
+        if not self.is_open():
+            return
+
+        self.close()
+        try:
+            os.remove(self.filename)
+        except OSError:
+            pass
+        self.filename = None
+
+    def _run(self, file):
+        last_sync_time = time.monotonic()
+        unsynced = False
+
+        try:
+            while True:
+                with self._condition:
+                    while not (self._pending or self._sync_requested or self._closing):
+                        timeout = last_sync_time + self.fsync_interval - time.monotonic() if unsynced else None
+                        if timeout is not None and timeout <= 0:
+                            break
+                        self._condition.wait(timeout)
+
+                    batch, self._pending = self._pending, []
+                    sync_requested, closing = self._sync_requested, self._closing
+
+                if batch:
+                    file.write(b"".join(batch))
+                    unsynced = True
+
+                now = time.monotonic()
+                if unsynced and (sync_requested or closing or now - last_sync_time >= self.fsync_interval):
+                    file.flush()
+                    os.fsync(file.fileno())
+                    last_sync_time = now
+                    unsynced = False
+
+                if sync_requested:
+                    with self._condition:
+                        self._sync_requested = False
+                        self._condition.notify_all()
+
+                if closing:
+                    return
+        except OSError as error:
+            self.notify_all_message_listeners("Impossible d'écrire le journal {}: {}".format(self.filename, error),
+                                              MessageType.ERROR)
+        finally:
+            file.close()
+            with self._condition:
+                self._accepting = False
+                self._pending = []
+                self._sync_requested = False
+                self._condition.notify_all()
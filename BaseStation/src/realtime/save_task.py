@@ -0,0 +1,39 @@
+import os
+from typing import Callable, List
+
+from src.rocket_packet.rocket_packet import RocketPacket
+from src.rocket_packet.rocket_packet_parser import RocketPacketParser
+from src.rocket_packet.rocket_packet_repository import RocketPacketRepository
+
+
+class SaveTask:
+    """
+    Save of a snapshot of the packets of an acquisition. It does not access the data producer, so it can run on any
+    thread while the acquisition goes on with other packets.
+    """
+
+    def __init__(self, rocket_packet_repository: RocketPacketRepository, filename: str,
+                 rocket_packets: List[RocketPacket], rocket_packet_parser: RocketPacketParser,
+                 journal_filename: str = None):
+        """
+        :param journal_filename: Journal of the saved packets, deleted once the flight file is written. If the save
+                                 fails, it stays on the disk to be recovered on the next start-up.
+        """
+        self.rocket_packet_repository = rocket_packet_repository
+        self.filename = filename
+        self.rocket_packets = rocket_packets
+        self.rocket_packet_parser = rocket_packet_parser
+        self.journal_filename = journal_filename
+
+    def run(self, progress_callback: Callable[[int, int], None] = None):
+        self.rocket_packet_repository.save(self.filename, self.rocket_packets, self.rocket_packet_parser,
+                                           progress_callback=progress_callback)
+
+        if self.journal_filename is not None:
+            try:
+                os.remove(self.journal_filename)
+            except OSError:
+                pass
+
+    def get_packet_count(self) -> int:
+        return len(self.rocket_packets)
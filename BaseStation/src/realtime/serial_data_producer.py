@@ -7,6 +7,9 @@ import serial
 
 from src.data_producer import DataProducer
 from src.realtime.checksum_validator import ChecksumValidator
+from src.realtime.frame_synchronizer import FrameSynchronizer
+from src.realtime.journal_writer import JournalWriter
+from src.realtime.save_task import SaveTask
 from src.rocket_packet.rocket_packet_parser import RocketPacketParser
 from src.rocket_packet.rocket_packet_repository import RocketPacketRepository
 
@@ -18,12 +21,20 @@ class NoConnectedDeviceException(Exception):
 class SerialDataProducer(DataProducer):
     def __init__(self, lock: threading.Lock, rocket_packet_repository: RocketPacketRepository,
                  rocket_packet_parser: RocketPacketParser, checksum_validator: ChecksumValidator, baudrate=9600,
-                 start_character=b's', sampling_frequency=1.0):
+                 start_character=b's', sampling_frequency=1.0, journal_writer: JournalWriter = None):
+        """
+        :param journal_writer: Writer of the journal where the received frames are kept until they are saved, or None
+                               to only keep them in memory.
+        """
         super().__init__(lock)
         self.rocket_packet_repository = rocket_packet_repository
         self.rocket_packet_parser = rocket_packet_parser
         self.checksum_validator = checksum_validator
+        self.journal_writer = journal_writer
         self.unsaved_data = False
+        # Held while frames are journaled and their packets added, so a save takes the packets of exactly the frames of
+        # the journal it detaches. Not the lock of the packets, which is not reentrant and is taken by the packet queue.
+        self.journal_lock = threading.Lock()
 
         self.port = serial.Serial()
         self.port.baudrate = baudrate
@@ -32,6 +43,7 @@ class SerialDataProducer(DataProducer):
 
         # RocketPacket data + 1 byte for checksum
         self.num_bytes_to_read = self.rocket_packet_parser.get_number_of_bytes() + 1
+        self.frame_synchronizer = FrameSynchronizer(start_character, self.num_bytes_to_read, checksum_validator)
 
     def start(self):
         ports = self.detect_serial_ports()
@@ -39,6 +51,9 @@ class SerialDataProducer(DataProducer):
             raise NoConnectedDeviceException("Aucun récepteur connecté")
         self.port.port = ports[0]
         self.port.open()
+        self.frame_synchronizer.reset()
+        if self.journal_writer is not None and not self.journal_writer.is_open():
+            self.journal_writer.open()
 
         self.is_running = True
         self.thread = threading.Thread(target=self.run)
@@ -46,35 +61,86 @@ class SerialDataProducer(DataProducer):
 
     def run(self):
         while self.is_running:
-            c = self.port.read(1)
-            if c == self.start_character:
-                data_bytes = self.port.read(self.num_bytes_to_read)
-
-                if self.checksum_validator.validate(data_bytes):
-                    try:
-                        rocket_packet = self.rocket_packet_parser.parse(data_bytes[:-1])
-                        self.add_rocket_packet(rocket_packet)
-                        self.unsaved_data = True
-                    except struct.error as e:
-                        """
-                        This error can occur if we don't read enough bytes on the serial port or if the packet format is
-                        incorrect.
-                        """
-                        print("Invalid packet: " + str(e))
+            # Read everything already buffered by the OS, or block until at least one byte arrives or timeout expires
+            data = self.port.read(max(self.port.in_waiting, 1))
+            self.process_bytes(data)
         self.port.close()
 
+    def stop(self):
+        super().stop()
+        if self.journal_writer is not None:
+            self.journal_writer.sync()
+
+    def process_bytes(self, data: bytes):
+        frames = self.frame_synchronizer.feed(data)
+        if not frames:
+            return
+
+        # Strip the checksums so the payloads can be decoded in a single pass
+        payloads = b"".join(frame[:-1] for frame in frames)
+        try:
+            rocket_packets = self.rocket_packet_parser.parse_many(payloads)
+        except struct.error as e:
+            """
+            This error can occur if the packet format is incorrect.
+            """
+            print("Invalid packet: " + str(e))
+            rocket_packets = None
+
+        with self.journal_lock:
+            if self.journal_writer is not None:
+                self.journal_writer.write(b"".join(self.start_character + frame for frame in frames))
+            if rocket_packets is not None:
+                self.rocket_packets.extend(rocket_packets)
+                self.unsaved_data = True
+
+        if rocket_packets is not None:
+            self.notify_new_data()
+
     def save(self, filename: str):
-        self.rocket_packet_repository.save(filename, self.available_rocket_packets, self.rocket_packet_parser)
-        self.unsaved_data = False
+        self.create_save_task(filename).run()
+
+    def create_save_task(self, filename: str) -> SaveTask:
+        """
+        Take a snapshot of the packets to save, so the acquisition can be cleared and restarted while they are written.
+        The journal of these packets is handed over to the task, and the following frames go to a new journal. Can be
+        called while the acquisition is running.
+        """
+        with self.journal_lock:
+            save_task = SaveTask(self.rocket_packet_repository, filename, self.get_available_rocket_packets(),
+                                 self.rocket_packet_parser, self._detach_journal())
+            self.unsaved_data = False
+
+        return save_task
 
     def has_unsaved_data(self):
         return self.unsaved_data
 
     def clear_rocket_packets(self):
-        self.lock.acquire()
-        self.available_rocket_packets.clear()
-        self.unsaved_data = False
-        self.lock.release()
+        with self.journal_lock:
+            self.rocket_packets.clear()
+            self.unsaved_data = False
+            self._restart_journal()
+        self.notify_new_data()
+
+    def _detach_journal(self) -> str:
+        if self.journal_writer is None or not self.journal_writer.is_open():
+            return None
+
+        journal_filename = self.journal_writer.detach()
+        if self.is_running:
+            self.journal_writer.open()
+
+        return journal_filename
+
+    def _restart_journal(self):
+        """
+        Drop the journal once its frames are saved or cleared, and keep journaling the following frames in a new one.
+        """
+        if self.journal_writer is not None and self.journal_writer.is_open():
+            self.journal_writer.discard()
+            if self.is_running:
+                self.journal_writer.open()
 
     @staticmethod
     def detect_serial_ports():
@@ -1,14 +1,24 @@
 import threading
 import time
+from typing import List, Tuple
+
+import numpy as np
 
 from src.data_producer import DataProducer
+from src.persistence.raw_journal import RawJournal
 from src.replay.playback_state import PlaybackState
+from src.rocket_packet.rocket_packet import RocketPacket
 from src.rocket_packet.rocket_packet_repository import RocketPacketRepository
 
 
 class FileDataProducer(DataProducer):
 
     END_OF_PLAYBACK_SLEEP_DELAY = 1
+    # Packets due within a frame are emitted together instead of waking up once per packet
+    MIN_FRAME_PERIOD = 1 / 60
+    # Upper bound of a sleep, so that a change of the playback state during a long gap is applied quickly
+    MAX_SLEEP_DELAY = 0.25
+    AS_FAST_AS_POSSIBLE_BATCH_SIZE = 1000
 
     def __init__(self, rocket_packet_repository: RocketPacketRepository, data_lock: threading.RLock,
                  playback_lock: threading.Lock, playback_state: PlaybackState):
@@ -18,18 +28,46 @@ class FileDataProducer(DataProducer):
         self.playback_state = playback_state
         self.playback_lock = playback_lock
         self.all_rocket_packets = []
+        self.time_stamps = np.zeros(0)
         self.rocket_packet_version = None
         self.index = -1
+        # (monotonic time, time stamp, speed, going_forward) at the last change of the playback state
+        self._clock_origin = None
 
     def load(self, filename: str):
-        self.rocket_packet_version, rocket_packets = self.rocket_packet_repository.load(filename)
+        if self.rocket_packet_repository.is_raw_journal(filename):
+            self.rocket_packet_version, rocket_packets = self.rocket_packet_repository.load(filename)
+            # The packets of a raw journal are only decoded when the replay reaches them
+            time_stamps = rocket_packets.get_time_stamps().astype(np.float64)
+        else:
+            self.rocket_packet_version, rocket_packets, time_stamps = self._load_chunks(filename)
 
         self.lock.acquire()
         self.all_rocket_packets = rocket_packets
-        self.available_rocket_packets = list(self.all_rocket_packets)
-        self.index = self.get_total_packet_count() - 1
+        self.time_stamps = time_stamps
+        self.rocket_packets.clear()
+        if isinstance(rocket_packets, RawJournal):
+            self.index = -1
+        else:
+            self.rocket_packets.extend(self.all_rocket_packets)
+            self.index = self.get_total_packet_count() - 1
+        self._clock_origin = None
         self.lock.release()
 
+        self.notify_new_data()
+
+    def _load_chunks(self, filename: str) -> Tuple[int, List[RocketPacket], np.ndarray]:
+        rocket_packet_version, rocket_packets_chunks = self.rocket_packet_repository.iter_load(filename)
+
+        rocket_packets = []
+        time_stamps_chunks = [np.zeros(0)]
+        for chunk in rocket_packets_chunks:
+            rocket_packets.extend(chunk)
+            time_stamps_chunks.append(np.fromiter((rocket_packet.time_stamp for rocket_packet in chunk),
+                                                  dtype=np.float64, count=len(chunk)))
+
+        return rocket_packet_version, rocket_packets, np.concatenate(time_stamps_chunks)
+
     def reset_playback_state(self):
         self.playback_state.reset()
 
@@ -40,26 +78,45 @@ class FileDataProducer(DataProducer):
         return self.index
 
     def set_current_packet_index(self, new_index: int):
+        # The clock is reset with the index, so the replay thread never sees the new index with the former origin
         self.lock.acquire()
+        self._set_index(new_index)
+        self._clock_origin = None
+        self.lock.release()
+
+        self.notify_new_data()
 
+    def _move_to_packet_index(self, new_index: int, clock_origin=None):
+        """
+        :param clock_origin: If given, the packets are only moved if the clock still has this origin, so an index
+                             computed by the replay thread before a seek does not undo the seek.
+        """
+        self.lock.acquire()
+        if clock_origin is None or clock_origin is self._clock_origin:
+            self._set_index(new_index)
+        self.lock.release()
+
+        self.notify_new_data()
+
+    def _set_index(self, new_index: int):
         if new_index > self.index:
-            self.available_rocket_packets.extend(self.all_rocket_packets[self.index+1:new_index+1])
+            self.rocket_packets.extend(self.all_rocket_packets[self.index+1:new_index+1])
             self.index = new_index
         elif new_index < self.index:
-            self.available_rocket_packets = self.available_rocket_packets[0:new_index+1]
+            self.rocket_packets.truncate(new_index + 1)
             self.index = new_index
 
-        self.lock.release()
-
     def start(self):
         if self.playback_state.is_going_forward():
             self.clear_rocket_packets()
 
+        self._reset_clock()
         self.thread = threading.Thread(target=self.run, args=())
         self.is_running = True
         self.thread.start()
 
     def restart(self):
+        self._reset_clock()
         self.started_event.set()
         self.started_event.wait()
 
@@ -79,49 +136,74 @@ class FileDataProducer(DataProducer):
             self.update_replay()
 
     def update_replay(self):
-        if self.playback_state.is_going_forward():
-            self._play_next_frame()
-        else:
-            self._play_previous_frame()
+        self.playback_lock.acquire()
+        speed = self.playback_state.get_speed()
+        going_forward = self.playback_state.is_going_forward()
+        as_fast_as_possible = self.playback_state.is_as_fast_as_possible()
+        self.playback_lock.release()
 
-    def _play_next_frame(self):
-        if self._is_at_end_of_replay():
+        if self._is_at_end_of_replay(going_forward):
+            self._reset_clock()
             time.sleep(self.END_OF_PLAYBACK_SLEEP_DELAY)
-        elif self._is_before_last_packet():
-            self.add_next_rocket_packet()
+        elif as_fast_as_possible:
+            self._reset_clock()
+            self._play_next_batch(going_forward)
         else:
-            self.add_next_rocket_packet()
-            self._sleep_between_packets(self.index, self.index + 1)
-
-    def _is_at_end_of_replay(self):
-        return self.index == self.get_total_packet_count() - 1
-
-    def _is_before_last_packet(self):
-        return self.index == self.get_total_packet_count() - 2
+            self._play_due_packets(speed, going_forward)
 
-    def _sleep_between_packets(self, index_1: int, index_2: int):
-        sleep_time = self.all_rocket_packets[index_2].time_stamp - self.all_rocket_packets[index_1].time_stamp
+    def _is_at_end_of_replay(self, going_forward: bool) -> bool:
+        if going_forward:
+            return self.index == self.get_total_packet_count() - 1
+        return self.index <= 0
 
-        self.playback_lock.acquire()
-        sleep_time /= self.playback_state.get_speed()
-        self.playback_lock.release()
+    def _play_next_batch(self, going_forward: bool):
+        if going_forward:
+            self._move_to_packet_index(min(self.index + self.AS_FAST_AS_POSSIBLE_BATCH_SIZE,
+                                           self.get_total_packet_count() - 1))
+        else:
+            self._move_to_packet_index(max(self.index - self.AS_FAST_AS_POSSIBLE_BATCH_SIZE, 0))
+
+    def _play_due_packets(self, speed: float, going_forward: bool):
+        """
+        Emit, in a single batch, every packet whose time stamp was reached since the last wake-up, then sleep until the
+        next packet is due. The replay time is computed from a monotonic clock started at the last change of the
+        playback state, so the sleep granularity and the time spent emitting the packets do not accumulate as drift.
+        """
+        now = time.monotonic()
+        # A seek from the GUI thread resets the clock and moves the index, so both are read once under the lock
+        self.lock.acquire()
+        if self._clock_origin is None or self._clock_origin[2:] != (speed, going_forward):
+            origin_time_stamp = self.time_stamps[max(self.index, 0)]
+            self._clock_origin = (now, origin_time_stamp, speed, going_forward)
+        clock_origin = self._clock_origin
+        index = self.index
+        time_stamps = self.time_stamps
+        self.lock.release()
+        origin_time, origin_time_stamp = clock_origin[:2]
 
-        time.sleep(sleep_time)
+        elapsed_time_stamp = (now - origin_time) * speed
+        replay_time_stamp = origin_time_stamp + (elapsed_time_stamp if going_forward else -elapsed_time_stamp)
+        due_index = int(np.searchsorted(time_stamps, replay_time_stamp, side="right")) - 1
 
-    def _play_previous_frame(self):
-        if self._is_at_beginning_of_replay():
-            time.sleep(self.END_OF_PLAYBACK_SLEEP_DELAY)
-        elif self._is_on_second_packet():
-            self.pop_rocket_packet()
+        if going_forward:
+            new_index = max(due_index, index)
+            next_index = new_index + 1 if new_index < len(time_stamps) - 1 else None
         else:
-            self.pop_rocket_packet()
-            self._sleep_between_packets(self.index - 1, self.index)
+            new_index = min(max(due_index, 0), index)
+            next_index = new_index if new_index > 0 else None
 
-    def _is_at_beginning_of_replay(self):
-        return self.index == 0
+        if new_index != index:
+            self._move_to_packet_index(new_index, clock_origin)
 
-    def _is_on_second_packet(self):
-        return self.index == 1
+        if next_index is not None:
+            next_time = origin_time + abs(time_stamps[next_index] - origin_time_stamp) / speed
+            sleep_time = next_time - time.monotonic()
+            time.sleep(min(max(sleep_time, self.MIN_FRAME_PERIOD), self.MAX_SLEEP_DELAY))
+
+    def _reset_clock(self):
+        self.lock.acquire()
+        self._clock_origin = None
+        self.lock.release()
 
     def fast_forward(self):
         self.playback_lock.acquire()
@@ -133,29 +215,27 @@ class FileDataProducer(DataProducer):
         self.playback_state.rewind()
         self.playback_lock.release()
 
+    def toggle_as_fast_as_possible(self):
+        self.playback_lock.acquire()
+        self.playback_state.toggle_as_fast_as_possible()
+        self.playback_lock.release()
+
+    def is_as_fast_as_possible(self):
+        return self.playback_state.is_as_fast_as_possible()
+
     def get_speed(self):
         return self.playback_state.get_speed()
 
     def get_mode(self):
         return self.playback_state.get_mode()
 
-    def add_next_rocket_packet(self):
-        self.lock.acquire()
-        self.index += 1
-        self.add_rocket_packet(self.all_rocket_packets[self.index])
-        self.lock.release()
-
-    def pop_rocket_packet(self):
-        self.lock.acquire()
-        self.available_rocket_packets.pop()
-        self.index -= 1
-        self.lock.release()
-
     def clear_rocket_packets(self):
         self.lock.acquire()
-        self.available_rocket_packets.clear()
+        self.rocket_packets.clear()
         self.index = -1
         self.lock.release()
 
+        self.notify_new_data()
+
     def get_rocket_packet_version(self) -> int:
         return self.rocket_packet_version
@@ -9,9 +9,10 @@ class PlaybackState:
     min_speed_factor = 1.0
     max_speed_factor = 16.0
 
-    def __init__(self, speed_factor: float = 1, mode: Mode = Mode.FORWARD):
+    def __init__(self, speed_factor: float = 1, mode: Mode = Mode.FORWARD, as_fast_as_possible: bool = False):
         self.mode = mode
         self.speed_factor = min(max(speed_factor, self.min_speed_factor), self.max_speed_factor)
+        self.as_fast_as_possible = as_fast_as_possible
 
     def get_speed(self):
         return self.speed_factor
@@ -19,6 +20,15 @@ class PlaybackState:
     def get_mode(self):
         return self.mode
 
+    def is_as_fast_as_possible(self):
+        """
+        In this mode, the packets are replayed without waiting for their time stamps, for analysis.
+        """
+        return self.as_fast_as_possible
+
+    def toggle_as_fast_as_possible(self):
+        self.as_fast_as_possible = not self.as_fast_as_possible
+
     def fast_forward(self):
         if self.is_going_forward():
             self._speed_up()
@@ -59,3 +69,4 @@ class PlaybackState:
     def reset(self):
         self.mode = self.Mode.FORWARD
         self.speed_factor = 1.0
+        self.as_fast_as_possible = False
@@ -16,6 +16,7 @@ class ReplayController(Controller):
         self.data_widget.set_callback("play_pause", self.play_pause_button_callback)
         self.data_widget.set_callback("fast_forward", self.fast_forward_button_callback)
         self.data_widget.set_callback("rewind", self.rewind_button_callback)
+        self.data_widget.set_callback("as_fast_as_possible", self.as_fast_as_possible_button_callback)
         self.data_widget.set_control_bar_callback(self.control_bar_callback)
 
     def update_ui(self):
@@ -49,8 +50,13 @@ class ReplayController(Controller):
         self.data_producer.rewind()
         self.update_replay_speed_indicator()
 
+    def as_fast_as_possible_button_callback(self):
+        self.data_producer.toggle_as_fast_as_possible()
+        self.update_replay_speed_indicator()
+
     def update_replay_speed_indicator(self):
-        self.data_widget.update_replay_speed_text(self.data_producer.get_speed())
+        self.data_widget.update_replay_speed_text(self.data_producer.get_speed(),
+                                                  self.data_producer.is_as_fast_as_possible())
 
     def control_bar_callback(self, frame_index: int):
         self.data_producer.set_current_packet_index(frame_index)
@@ -64,7 +70,7 @@ class ReplayController(Controller):
         self.data_widget.set_control_bar_max_value(self.data_producer.get_total_packet_count() - 1)
         self.data_widget.set_play_button_text()
 
-        self.update()
+        self.refresh()
 
     def deactivate(self) -> bool:
         if self.is_running:
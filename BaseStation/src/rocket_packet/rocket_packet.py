@@ -1,118 +1,155 @@
 # -*- coding: utf-8 -*-
 import os
+from operator import attrgetter
+
+
+class RocketPacketField:
+    """Description of one RocketPacket field: its unit, the NumPy type used to store it and its default value"""
+
+    def __init__(self, name: str, unit: str = "", dtype: str = "f8", default=0):
+        self.name = name
+        self.unit = unit
+        self.dtype = dtype
+        self.default = default
+
+    def __repr__(self):
+        return "RocketPacketField({!r}, {!r}, {!r}, {!r})".format(self.name, self.unit, self.dtype, self.default)
+
+
+# Schema of RocketPacket, in the order of keys() and of the data_list given to its constructor
+ROCKET_PACKET_FIELDS = (
+    RocketPacketField("time_stamp", "s"),
+
+    # Vitesse angulaire en radian par seconde
+    RocketPacketField("angular_speed_x", "rad/s"),
+    RocketPacketField("angular_speed_y", "rad/s"),
+    RocketPacketField("angular_speed_z", "rad/s"),
+
+    # Acceleration en g
+    RocketPacketField("acceleration_x", "g"),
+    RocketPacketField("acceleration_y", "g"),
+    RocketPacketField("acceleration_z", "g"),
+
+    # Altitude en metres
+    RocketPacketField("altitude", "m"),
+
+    # Coordonnees GPS en degres
+    RocketPacketField("latitude", "deg"),
+    RocketPacketField("longitude", "deg"),
+
+    # Temperature en degres Celsius
+    RocketPacketField("temperature", "degC"),
+
+    # Orientation sous forme de quaternion
+    RocketPacketField("quaternion_w"),
+    RocketPacketField("quaternion_x"),
+    RocketPacketField("quaternion_y"),
+    RocketPacketField("quaternion_z"),
+
+    # Etat des systemes
+    RocketPacketField("acquisition_board_state_1", dtype="u1"),
+    RocketPacketField("acquisition_board_state_2", dtype="u1"),
+    RocketPacketField("acquisition_board_state_3", dtype="u1"),
+    RocketPacketField("power_supply_state_1", dtype="u1"),
+    RocketPacketField("power_supply_state_2", dtype="u1"),
+    RocketPacketField("payload_board_state_1", dtype="u1"),
+
+    # Donnees alimentation
+    RocketPacketField("voltage", "V"),
+    RocketPacketField("current", "A"),
+
+    # Champs magnetiques en milli-gauss
+    RocketPacketField("magnetometer_x", "mG"),
+    RocketPacketField("magnetometer_y", "mG"),
+    RocketPacketField("magnetometer_z", "mG"),
+
+    # Pression atmospherique
+    RocketPacketField("pressure", "Pa"),
+
+    # Indicateurs d'hemisphere GPS
+    RocketPacketField("ns_indicator", dtype="S1", default=b''),
+    RocketPacketField("ew_indicator", dtype="S1", default=b''),
+
+    # Temps UTC
+    RocketPacketField("utc_time", "s"),
+)
+
+_FIELD_NAMES = tuple(field.name for field in ROCKET_PACKET_FIELDS)
+_FIELDS_BY_NAME = {field.name: field for field in ROCKET_PACKET_FIELDS}
+_DEFAULTS = tuple(field.default for field in ROCKET_PACKET_FIELDS)
+_get_values = attrgetter(*_FIELD_NAMES)
 
 
 class RocketPacket:
+    FIELDS = ROCKET_PACKET_FIELDS
+
+    __slots__ = _FIELD_NAMES
 
     def __init__(self, data_list=None):
-        self.time_stamp = 0
-
-        # Vitesse angulaire en radian par seconde
-        self.angular_speed_x = 0
-        self.angular_speed_y = 0
-        self.angular_speed_z = 0
-
-        # Acceleration en g
-        self.acceleration_x = 0
-        self.acceleration_y = 0
-        self.acceleration_z = 0
-
-        # Champs magnetiques en milli-gauss
-        self.magnetometer_x = 0
-        self.magnetometer_y = 0
-        self.magnetometer_z = 0
-
-        # Temps UTC
-        self.utc_time = 0
-
-        # Altitude en metres
-        self.altitude = 0
-
-        # Coordonnees GPS en degres
-        self.latitude = 0
-        self.longitude = 0
-        self.ns_indicator = b''
-        self.ew_indicator = b''
-
-        # Temperature en degres Celsius
-        self.temperature = 0
-
-        # Orientation sous forme de quaternion
-        self.quaternion_w = 0
-        self.quaternion_x = 0
-        self.quaternion_y = 0
-        self.quaternion_z = 0
-
-        # Etat des systemes
-        self.acquisition_board_state_1 = 0
-        self.acquisition_board_state_2 = 0
-        self.acquisition_board_state_3 = 0
-        self.power_supply_state_1 = 0
-        self.power_supply_state_2 = 0
-        self.payload_board_state_1 = 0
-
-        # Donnees alimentation
-        self.voltage = 0
-        self.current = 0
-
-        if data_list is not None:
-            self._fill(data_list)
+        self._fill(_DEFAULTS if data_list is None else data_list)
+
+    @classmethod
+    def from_tuple(cls, values: tuple):
+        """
+        Build a packet from a sequence of values in the order of keys(), as produced by struct.unpack.
+        """
+        rocket_packet = cls.__new__(cls)
+        rocket_packet._fill(values)
+        return rocket_packet
 
     def _fill(self, data_list):
-        self.time_stamp = data_list[0]
-        self.angular_speed_x = data_list[1]
-        self.angular_speed_y = data_list[2]
-        self.angular_speed_z = data_list[3]
-        self.acceleration_x = data_list[4]
-        self.acceleration_y = data_list[5]
-        self.acceleration_z = data_list[6]
-        self.altitude = data_list[7]
-        self.latitude = data_list[8]
-        self.longitude = data_list[9]
-        self.temperature = data_list[10]
-        self.quaternion_w = data_list[11]
-        self.quaternion_x = data_list[12]
-        self.quaternion_y = data_list[13]
-        self.quaternion_z = data_list[14]
-        self.acquisition_board_state_1 = data_list[15]
-        self.acquisition_board_state_2 = data_list[16]
-        self.acquisition_board_state_3 = data_list[17]
-        self.power_supply_state_1 = data_list[18]
-        self.power_supply_state_2 = data_list[19]
-        self.payload_board_state_1 = data_list[20]
-        self.voltage = data_list[21]
-        self.current = data_list[22]
-        self.magnetometer_x = data_list[23]
-        self.magnetometer_y = data_list[24]
-        self.magnetometer_z = data_list[25]
-        self.pressure = data_list[26]
-        self.ns_indicator = data_list[27]
-        self.ew_indicator = data_list[28]
-        self.utc_time = data_list[29]
+        if len(data_list) != len(_FIELD_NAMES):
+            raise ValueError("Expected {} values, got {}".format(len(_FIELD_NAMES), len(data_list)))
+
+        for setter, value in zip(_SETTERS, data_list):
+            setter(self, value)
 
     @staticmethod
     def keys():
-        return ["time_stamp", "angular_speed_x", "angular_speed_y", "angular_speed_z", "acceleration_x",
-                "acceleration_y", "acceleration_z", "altitude", "latitude", "longitude", "temperature", "quaternion_w",
-                "quaternion_x", "quaternion_y", "quaternion_z", "acquisition_board_state_1",
-                "acquisition_board_state_2", "acquisition_board_state_3", "power_supply_state_1",
-                "power_supply_state_2", "payload_board_state_1", "voltage", "current", "magnetometer_x",
-                "magnetometer_y", "magnetometer_z", "pressure", "ns_indicator", "ew_indicator", "utc_time"]
+        return list(_FIELD_NAMES)
+
+    @staticmethod
+    def get_field(name: str) -> RocketPacketField:
+        """
+        :raises KeyError: If the packet has no field with this name.
+        """
+        return _FIELDS_BY_NAME[name]
+
+    @staticmethod
+    def has_field(name: str) -> bool:
+        return name in _FIELDS_BY_NAME
+
+    @staticmethod
+    def get_units():
+        return {field.name: field.unit for field in RocketPacket.FIELDS}
+
+    @staticmethod
+    def get_dtypes():
+        return {field.name: field.dtype for field in RocketPacket.FIELDS}
+
+    def values(self) -> tuple:
+        return _get_values(self)
 
     def items(self):
-        return self.__dict__.items()
+        return zip(_FIELD_NAMES, _get_values(self))
 
     def __str__(self):
         string = ""
-        for key in self.keys():
-            string += str(self.__dict__[key]) + ","
+        for value in _get_values(self):
+            string += str(value) + ","
         return string
 
     def __eq__(self, other):
         if type(other) is type(self):
-            return self.__dict__ == other.__dict__
+            return _get_values(self) == _get_values(other)
         return False
 
+    def __getstate__(self):
+        return _get_values(self)
+
+    def __setstate__(self, state):
+        self._fill(state)
+
     def print_data(self):
         # FIXME: convertir en methode __str__ et transferer la gestion de la console dans la fonction appelante
         os.system('cls' if os.name == 'nt' else 'clear')
@@ -148,3 +185,7 @@ class RocketPacket:
 
         print("Voltage                   : {}".format(self.voltage))
         print("Courant                   : {}\n".format(self.current))
+
+
+# Slot descriptors of every field, so a packet can be filled without looking up each attribute name
+_SETTERS = tuple(getattr(RocketPacket, name).__set__ for name in _FIELD_NAMES)
@@ -1,15 +1,53 @@
 import abc
+import logging
+import struct
+from operator import attrgetter, itemgetter
+from typing import Iterable, List
+
+import numpy as np
 
 from src.rocket_packet.rocket_packet import RocketPacket
 
+logger = logging.getLogger(__name__)
+
+STRUCT_TO_NUMPY_TYPES = {"c": "S1", "b": "i1", "B": "u1", "?": "?", "h": "i2", "H": "u2", "i": "i4", "I": "u4",
+                         "l": "i4", "L": "u4", "q": "i8", "Q": "u8", "f": "f4", "d": "f8"}
+
 
 class RocketPacketParser:
     __metaclass__ = abc.ABCMeta
 
-    def __init__(self, version: int, packet_format: str, num_bytes: int):
+    def __init__(self, version: int, packet_format: str, num_bytes: int, field_names: List[str],
+                 unsupported_field_names: Iterable[str] = ()):
+        """
+        :param field_names: Names of the packet fields, in the order they are sent by the rocket.
+        :param unsupported_field_names: RocketPacket fields sent by the rocket that must not be stored in RocketPacket.
+                                        Like the fields RocketPacket does not have, they are ignored by from_list and
+                                        written as 0 by to_list.
+        """
         self.version = version
         self.format = packet_format
+        self.struct = struct.Struct(packet_format)
         self.num_bytes = num_bytes
+        self.field_names = list(field_names)
+        self._dtype = None
+
+        unsupported_field_names = set(unsupported_field_names)
+        packet_field_names = [name for name in self.field_names
+                              if RocketPacket.has_field(name) and name not in unsupported_field_names]
+
+        # from_list appends the RocketPacket defaults to the received values and picks every RocketPacket field from
+        # this sequence in a single call, which is much cheaper than assigning the fields one by one
+        self._default_values = tuple(field.default for field in RocketPacket.FIELDS)
+        self._to_rocket_packet_order = itemgetter(
+            *[self.field_names.index(name) if name in packet_field_names else len(self.field_names) + i
+              for i, name in enumerate(RocketPacket.keys())])
+
+        # to_list does the opposite, with a trailing 0 for the fields not stored in RocketPacket
+        self._get_rocket_packet_values = attrgetter(*packet_field_names)
+        self._to_field_order = itemgetter(
+            *[packet_field_names.index(name) if name in packet_field_names else len(packet_field_names)
+              for name in self.field_names])
 
     def get_number_of_bytes(self):
         return self.num_bytes
@@ -17,18 +55,51 @@ class RocketPacketParser:
     def get_version(self) -> int:
         return self.version
 
-    @abc.abstractmethod
     def parse(self, data: bytes) -> RocketPacket:
-        pass
+        data_list = self.struct.unpack(data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("RocketPacket %d: %s", self.version, data_list)
+
+        return self.from_list(data_list)
+
+    def parse_many(self, buffer: bytes) -> List[RocketPacket]:
+        """
+        Decode contiguous packets, without start character nor checksum between them, in a single pass.
+        :raises struct.error: If the size of the buffer is not a multiple of the packet size.
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        rocket_packets = []
+        for data_list in self.struct.iter_unpack(buffer):
+            if debug:
+                logger.debug("RocketPacket %d: %s", self.version, data_list)
+            rocket_packets.append(self.from_list(data_list))
+
+        return rocket_packets
+
+    def parse_columns(self, buffer: bytes) -> np.ndarray:
+        """
+        Decode contiguous packets straight into a structured array, without creating any RocketPacket.
+        :raises ValueError: If the size of the buffer is not a multiple of the packet size.
+        """
+        return np.frombuffer(buffer, dtype=self.get_dtype())
+
+    def get_dtype(self) -> np.dtype:
+        """
+        :return: The NumPy structured dtype equivalent to the packet format, with one field per packet field name.
+        """
+        if self._dtype is None:
+            byte_order = self.format[0]
+            types = [byte_order + STRUCT_TO_NUMPY_TYPES[code] for code in self.format[1:]]
+            self._dtype = np.dtype(list(zip(self.get_field_names(), types)))
+
+        return self._dtype
 
-    @abc.abstractmethod
-    def get_field_names(self):
-        pass
+    def get_field_names(self) -> List[str]:
+        return list(self.field_names)
 
-    @abc.abstractmethod
     def to_list(self, packet: RocketPacket) -> list:
-        pass
+        return list(self._to_field_order(self._get_rocket_packet_values(packet) + (0,)))
 
-    @abc.abstractmethod
     def from_list(self, data: list) -> RocketPacket:
-        pass
+        return RocketPacket.from_tuple(self._to_rocket_packet_order(tuple(data) + self._default_values))
@@ -1,6 +1,11 @@
-from typing import List, Tuple
+import os
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
 
 from src.data_persister import DataPersister
+from src.domain_error import DomainError
+from src.persistence.flight_cache import FlightCache
+from src.persistence.raw_journal import RawJournal
+from src.persistence.sqlite_data_persister import SqliteDataPersister
 from src.rocket_packet.rocket_packet import RocketPacket
 from src.rocket_packet.rocket_packet_parser import RocketPacketParser
 from src.rocket_packet.rocket_packet_parser_factory import RocketPacketParserFactory
@@ -8,23 +13,112 @@ from src.rocket_packet.rocket_packet_parser_factory import RocketPacketParserFac
 
 class RocketPacketRepository:
 
-    def __init__(self, data_persister: DataPersister, rocket_packet_parser_factory: RocketPacketParserFactory):
+    PROGRESS_STEP = 10000
+
+    def __init__(self, data_persister: DataPersister, rocket_packet_parser_factory: RocketPacketParserFactory,
+                 data_persisters_by_extension: Dict[str, DataPersister] = None, flight_cache: FlightCache = None):
+        """
+        :param data_persister: Persister of the files whose extension is not in data_persisters_by_extension.
+        :param data_persisters_by_extension: Persisters by lowercase file extension, including the dot.
+        :param flight_cache: Cache of the parsed text flight files, which are not cached if it is None.
+        """
         self.data_persister = data_persister
         self.rocket_packet_parser_factory = rocket_packet_parser_factory
+        self.data_persisters_by_extension = dict(data_persisters_by_extension or {})
+        self.flight_cache = flight_cache
+        self.raw_journal_version = None
+        self.raw_journal_start_character = None
 
-    def save(self, filename: str, rocket_packets: List[RocketPacket], rocket_packet_parser: RocketPacketParser):
-        all_rocket_packets_fields = [rocket_packet_parser.to_list(rocket_packet) for rocket_packet in rocket_packets]
+    def set_raw_journal_format(self, rocket_packet_version: int, start_character: bytes):
+        """
+        Raw journals are captures of the serial link without any header, so their format comes from the configuration.
+        """
+        self.raw_journal_version = rocket_packet_version
+        self.raw_journal_start_character = start_character
 
-        self.data_persister.save(filename, rocket_packet_parser.get_version(), rocket_packet_parser.get_field_names(),
-                                 all_rocket_packets_fields)
+    def get_data_persister(self, filename: str) -> DataPersister:
+        # The flights of a flight library are designated by the library file name followed by the flight name
+        database_filename, _ = SqliteDataPersister.split_flight_filename(filename)
+        extension = os.path.splitext(database_filename)[1].lower()
+        return self.data_persisters_by_extension.get(extension, self.data_persister)
 
-    def load(self, filename: str) -> Tuple[int, List[RocketPacket]]:
-        rocket_packet_version, all_rocket_packet_fields = self.data_persister.load(filename)
+    def is_raw_journal(self, filename: str) -> bool:
+        return os.path.splitext(filename)[1].lower() == RawJournal.EXTENSION
 
-        rocket_packet_parser = self.rocket_packet_parser_factory.create(rocket_packet_version)
+    def save(self, filename: str, rocket_packets: List[RocketPacket], rocket_packet_parser: RocketPacketParser,
+             progress_callback: Callable[[int, int], None] = None):
+        """
+        The packets are converted and handed to the data persister PROGRESS_STEP at a time.
+        :param progress_callback: Called as progress_callback(saved_packet_count, packet_count) after every chunk.
+        """
+        rocket_packets_fields_chunks = self._iter_rocket_packets_fields(rocket_packets, rocket_packet_parser,
+                                                                        progress_callback)
+        self.get_data_persister(filename).save_stream(filename, rocket_packet_parser.get_version(),
+                                                      rocket_packet_parser.get_field_names(),
+                                                      rocket_packets_fields_chunks)
+
+    def _iter_rocket_packets_fields(self, rocket_packets: List[RocketPacket], rocket_packet_parser: RocketPacketParser,
+                                    progress_callback: Callable[[int, int], None]) -> Iterator[List[List]]:
+        for start in range(0, len(rocket_packets), self.PROGRESS_STEP):
+            chunk = rocket_packets[start:start + self.PROGRESS_STEP]
+            yield [rocket_packet_parser.to_list(rocket_packet) for rocket_packet in chunk]
+
+            if progress_callback is not None:
+                progress_callback(start + len(chunk), len(rocket_packets))
+
+    def load(self, filename: str) -> Tuple[int, Sequence[RocketPacket]]:
+        """
+        :return: A tuple as (rocket_packet_version, rocket_packets). The packets of a raw journal are a RawJournal, which
+                 only decodes them when they are accessed.
+        """
+        if self.is_raw_journal(filename):
+            return self._load_raw_journal(filename)
+
+        rocket_packet_version, rocket_packets_chunks = self.iter_load(filename)
 
         rocket_packets = []
-        for rocket_packet_fields in all_rocket_packet_fields:
-            rocket_packets.append(rocket_packet_parser.from_list(rocket_packet_fields))
+        for chunk in rocket_packets_chunks:
+            rocket_packets.extend(chunk)
 
         return rocket_packet_version, rocket_packets
+
+    def iter_load(self, filename: str) -> Tuple[int, Iterator[List[RocketPacket]]]:
+        """
+        Only the fields of the chunk being converted are kept in memory, instead of the fields of every packet.
+        :return: A tuple as (rocket_packet_version, chunks), where chunks yields the packets in successive lists.
+        """
+        if self.is_raw_journal(filename):
+            rocket_packet_version, raw_journal = self._load_raw_journal(filename)
+            return rocket_packet_version, (raw_journal[start:start + self.PROGRESS_STEP]
+                                           for start in range(0, len(raw_journal), self.PROGRESS_STEP))
+
+        rocket_packet_version, rocket_packets_fields_chunks = self._iter_load_fields(filename)
+
+        rocket_packet_parser = self.rocket_packet_parser_factory.create(rocket_packet_version)
+
+        rocket_packets_chunks = ([rocket_packet_parser.from_list(rocket_packet_fields)
+                                  for rocket_packet_fields in rocket_packets_fields]
+                                 for rocket_packets_fields in rocket_packets_fields_chunks)
+
+        return rocket_packet_version, rocket_packets_chunks
+
+    def _iter_load_fields(self, filename: str) -> Tuple[int, Iterator[List[List]]]:
+        if self.flight_cache is None or not self.flight_cache.is_cached_format(filename):
+            return self.get_data_persister(filename).iter_load(filename)
+
+        cached = self.flight_cache.load(filename)
+        if cached is not None:
+            return cached
+
+        rocket_packet_version, rocket_packets_fields_chunks = self.get_data_persister(filename).iter_load(filename)
+        field_names = self.rocket_packet_parser_factory.create(rocket_packet_version).get_field_names()
+
+        return rocket_packet_version, self.flight_cache.store(filename, rocket_packet_version, field_names,
+                                                              rocket_packets_fields_chunks)
+
+    def _load_raw_journal(self, filename: str) -> Tuple[int, RawJournal]:
+        if self.raw_journal_version is None:
+            raise DomainError("Format du journal brut inconnu: " + filename)
+
+        rocket_packet_parser = self.rocket_packet_parser_factory.create(self.raw_journal_version)
+        return self.raw_journal_version, RawJournal(filename, rocket_packet_parser, self.raw_journal_start_character)
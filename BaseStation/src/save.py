@@ -1,10 +1,14 @@
+import os
+import threading
 from datetime import datetime
 from enum import Enum
 
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
 from PyQt5.QtWidgets import QMessageBox
 
 from src.message_sender import MessageSender
 from src.message_type import MessageType
+from src.realtime.save_task import SaveTask
 from src.realtime.serial_data_producer import SerialDataProducer
 from src.ui.real_time_widget import RealTimeWidget
 
@@ -15,14 +19,26 @@ class SaveStatus(Enum):
     CANCELLED = 2
 
 
-class SaveManager(MessageSender):
+class SaveManager(QObject, MessageSender):
+    """
+    The flights are written by a background thread from a snapshot of the packets, so the window stays responsive and
+    a new acquisition can start while the previous flight is still being saved. The progress and the result of a save
+    are sent back to the GUI thread with signals, then to the message listeners.
+    """
 
     BASE_PATH = "./src/resources/"
 
+    save_progressed = pyqtSignal(str, int)
+    save_finished = pyqtSignal(str, str)
+
     def __init__(self, serial_data_producer: SerialDataProducer, real_time_widget: RealTimeWidget):
         super().__init__()
         self.serial_data_producer = serial_data_producer
         self.real_time_widget = real_time_widget
+        self.save_threads = []
+
+        self.save_progressed.connect(self.on_save_progressed, Qt.QueuedConnection)
+        self.save_finished.connect(self.on_save_finished, Qt.QueuedConnection)
 
     def save(self) -> SaveStatus:
         should_save = self.real_time_widget.show_save_message_box()
@@ -44,7 +60,46 @@ class SaveManager(MessageSender):
         default_path = self.BASE_PATH + datetime.now().strftime("%Y-%m-%d_%Hh%Mm") + ".csv"
         return self.real_time_widget.get_save_file_name(default_path)
 
-    def _save_data(self, filename: str):
-        self.serial_data_producer.save(filename)
-        message = "Données sauvegardées dans le fichier: " + filename
+    def is_saving(self) -> bool:
+        self.save_threads = [thread for thread in self.save_threads if thread.is_alive()]
+        return len(self.save_threads) > 0
+
+    def wait(self):
+        """
+        Block until every save in progress is written, so no flight is lost when the application closes.
+        """
+        for thread in self.save_threads:
+            thread.join()
+        self.save_threads = []
+
+    def on_save_progressed(self, filename: str, percentage: int):
+        message = "Sauvegarde de {} : {}%".format(os.path.basename(filename), percentage)
         self.notify_all_message_listeners(message, MessageType.INFO)
+
+    def on_save_finished(self, filename: str, error: str):
+        if error:
+            message = "Impossible de sauvegarder le fichier {}: {}".format(filename, error)
+            self.notify_all_message_listeners(message, MessageType.ERROR)
+        else:
+            message = "Données sauvegardées dans le fichier: " + filename
+            self.notify_all_message_listeners(message, MessageType.INFO)
+
+    def _save_data(self, filename: str):
+        save_task = self.serial_data_producer.create_save_task(filename)
+
+        thread = threading.Thread(target=self._run_save_task, args=(save_task,))
+        self.save_threads.append(thread)
+        thread.start()
+
+    def _run_save_task(self, save_task: SaveTask):
+        def progress_callback(converted_packet_count: int, packet_count: int):
+            self.save_progressed.emit(save_task.filename, 100 * converted_packet_count // packet_count)
+
+        error_message = ""
+        try:
+            save_task.run(progress_callback)
+        except Exception as error:
+            # Any error must be reported, since the user would otherwise believe the flight was saved
+            error_message = str(error) or type(error).__name__
+
+        self.save_finished.emit(save_task.filename, error_message)
@@ -2,6 +2,8 @@ from PyQt5 import QtWidgets, QtCore
 from pyqtgraph import PlotWidget, mkPen, mkBrush, TextItem
 
 from src.data_processing.apogee import Apogee
+from src.data_processing.generation import Generation
+from src.ui.decimated_curve import DecimatedCurve
 from src.ui.utils import set_minimum_expanding_size_policy
 
 
@@ -19,6 +21,7 @@ class AltitudeGraph(PlotWidget):
         self.plotItem.setLabel("left", "Altitude (ft)")
 
         self.altitude_curve = self.plot([0], [0], pen=mkPen(color='k', width=3))
+        self.decimated_altitude_curve = DecimatedCurve(self.plotItem, self.altitude_curve)
 
         self.current_timestamp = 0
         self.current_altitude = 0
@@ -32,14 +35,14 @@ class AltitudeGraph(PlotWidget):
         self.apogee_point = self.plotItem.scatterPlot([], [], pxMode=True, size=9, brush=mkBrush(color='b'))
         self.addItem(self.apogee_text, ignoreBounds=True)
 
-    def draw_altitude_curve(self, timestamps: list, altitudes: list):
+    def draw_altitude_curve(self, timestamps: list, altitudes: list, generation: Generation = None):
         nb_points = len(altitudes)
 
         if nb_points > 0:
             self.current_timestamp = timestamps[-1]
             self.current_altitude = int(altitudes[-1])
 
-            self.altitude_curve.setData(timestamps, altitudes)
+            self.decimated_altitude_curve.set_data(timestamps, altitudes, generation)
             self.current_altitude_point.setData([self.current_timestamp], [self.current_altitude])
             self.current_altitude_text.setPos(self.current_timestamp, self.current_altitude)
             self.current_altitude_text.setColor(color='k')
@@ -70,7 +73,7 @@ class AltitudeGraph(PlotWidget):
         self.reset_simulation()
 
     def reset_altitude(self):
-        self.altitude_curve.clear()
+        self.decimated_altitude_curve.clear()
         self.current_timestamp = 0
         self.current_altitude = 0
         self.current_altitude_point.clear()
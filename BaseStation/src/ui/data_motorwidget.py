@@ -192,19 +192,19 @@ class DataMotorWidget(QtWidgets.QWidget):
         button.setStyleSheet('background-color: #00ff1a')
 
     def draw_pressure_graph_1(self, timestamps: list, pressures: list):
-        self.pressure_graphic_view_1.draw_altitude_curve(timestamps, pressures)
+        self.pressure_graphic_view_1.draw_pressure_curve(timestamps, pressures)
 
     def draw_pressure_graph_2(self, timestamps: list, pressures: list):
-        self.pressure_graphic_view_2.draw_altitude_curve(timestamps, pressures)
+        self.pressure_graphic_view_2.draw_pressure_curve(timestamps, pressures)
 
     def draw_pressure_graph_3(self, timestamps: list, pressures: list):
-        self.pressure_graphic_view_3.draw_altitude_curve(timestamps, pressures)
+        self.pressure_graphic_view_3.draw_pressure_curve(timestamps, pressures)
 
     def draw_pressure_graph_4(self, timestamps: list, pressures: list):
-        self.pressure_graphic_view_4.draw_altitude_curve(timestamps, pressures)
+        self.pressure_graphic_view_4.draw_pressure_curve(timestamps, pressures)
 
     def draw_pressure_graph_banc(self, timestamps: list, pressures: list):
-        self.banc_graphic_view.draw_altitude_curve(timestamps, pressures)
+        self.banc_graphic_view.draw_pressure_curve(timestamps, pressures)
 
     def reset(self):
         self.pressure_graphic_view_1.reset()
@@ -4,10 +4,12 @@ from PyQt5 import QtWidgets
 from PyQt5.QtWidgets import QLabel
 
 from src.data_processing.apogee import Apogee
+from src.data_processing.generation import Generation
 from src.data_processing.gps.gps_coordinates import GpsCoordinates
 from src.data_processing.orientation.orientation import Orientation
 from src.openrocket_simulation import OpenRocketSimulation
 from src.ui.altitude_graph import AltitudeGraph
+from src.ui.decimated_curve import DecimatedCurve
 from src.ui.gl_rocket import GlRocket
 from src.ui.header import Header
 from src.ui.led import Led
@@ -38,6 +40,7 @@ class DataWidget(QtWidgets.QWidget):
         self.graphicsView_3.plotItem.setLabel("left", "Tension", "Volts")
         self.graphicsView_3.plotItem.showGrid(x=True, y=True)
         self.voltage_curve = self.graphicsView_3.plot([0], [0], pen=pqtg.mkPen(color='k', width=3))
+        self.decimated_voltage_curve = DecimatedCurve(self.graphicsView_3.plotItem, self.voltage_curve)
         
         """
         cylinder_mesh = gl.MeshData.cylinder(rows=2, cols=10, radius=[1.0, 1.0], length=5.0)
@@ -199,17 +202,17 @@ class DataWidget(QtWidgets.QWidget):
     def set_target_altitude(self, altitude):
         self.altitude_graph.set_target_altitude(altitude)
 
-    def draw_voltage(self, values: list):
-        self.voltage_curve.setData(values)
+    def draw_voltage(self, timestamps: list, voltages: list, generation: Generation = None):
+        self.decimated_voltage_curve.set_data(timestamps, voltages, generation)
 
-    def draw_altitude(self, timestamps: list, altitudes: list):
-        self.altitude_graph.draw_altitude_curve(timestamps, altitudes)
+    def draw_altitude(self, timestamps: list, altitudes: list, generation: Generation = None):
+        self.altitude_graph.draw_altitude_curve(timestamps, altitudes, generation)
 
     def draw_apogee(self, apogee: Apogee):
         self.altitude_graph.draw_apogee(apogee)
 
-    def draw_map(self, eastings: list, northings: list):
-        self.map.draw_map(eastings, northings)
+    def draw_map(self, eastings: list, northings: list, generation: Generation = None):
+        self.map.draw_map(eastings, northings, generation)
 
     def show_current_coordinates(self, gps_coordinates: GpsCoordinates):
         self.coordinates_label.setText("Lat: {:.6f} Long: {:.6f}".format(gps_coordinates.decimal_degrees_latitude,
@@ -230,7 +233,7 @@ class DataWidget(QtWidgets.QWidget):
         self.set_rocket_model_orientation(Orientation())
         self.reset_leds()
         self.set_thermometer_value(0)
-        self.voltage_curve.clear()
+        self.decimated_voltage_curve.clear()
 
     def reset_leds(self):
         for led in self.leds:
@@ -0,0 +1,57 @@
+from typing import Sequence
+
+from pyqtgraph import PlotDataItem, PlotItem
+
+from src.data_processing.generation import Generation
+from src.data_processing.min_max_decimator import MinMaxDecimator
+
+
+class DecimatedCurve:
+    """
+    Curve of a plot that only receives about POINTS_PER_PIXEL points per horizontal pixel of its visible range. The
+    points are taken from a min/max pyramid, so the peaks of the curve stay visible whatever the zoom level.
+    """
+
+    POINTS_PER_PIXEL = 2
+    DEFAULT_WIDTH_IN_PIXELS = 1000
+
+    def __init__(self, plot_item: PlotItem, curve: PlotDataItem):
+        self.view_box = plot_item.getViewBox()
+        self.curve = curve
+        self.decimator = MinMaxDecimator()
+
+        self.view_box.sigXRangeChanged.connect(self._on_x_range_changed)
+
+    def set_data(self, x: Sequence, y: Sequence, generation: Generation = None):
+        """
+        :param x: The whole history of the x values, or None to use the index of the values.
+        :param y: The whole history of the y values. Only the values added since the last call are processed.
+        :param generation: Generation of the ConsumerSnapshot of the history, which tells which part of it was replaced.
+        """
+        self.decimator.update(x, y, generation=generation)
+        self.redraw()
+
+    def redraw(self):
+        if len(self.decimator) == 0:
+            self.curve.clear()
+            return
+
+        # While the plot follows the data, the whole history is visible
+        if self.view_box.autoRangeEnabled()[0]:
+            x_min, x_max = None, None
+        else:
+            x_min, x_max = self.view_box.viewRange()[0]
+
+        self.curve.setData(*self.decimator.get_points(self.get_max_points(), x_min, x_max))
+
+    def get_max_points(self) -> int:
+        width = int(self.view_box.width())
+        return self.POINTS_PER_PIXEL * (width if width > 0 else self.DEFAULT_WIDTH_IN_PIXELS)
+
+    def clear(self):
+        self.decimator.clear()
+        self.curve.clear()
+
+    def _on_x_range_changed(self, *_):
+        if not self.view_box.autoRangeEnabled()[0] and len(self.decimator) > 0:
+            self.redraw()
@@ -0,0 +1,123 @@
+import os
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QLabel,
+                             QAbstractItemView, QHeaderView)
+
+from src.persistence.flight_catalog import FlightSummary
+from src.persistence.flight_catalog_indexer import FlightCatalogIndexer
+
+
+class FlightCatalogDialog(QDialog):
+    """
+    List of the flights of the flight catalog, shown right away and refreshed as the catalog indexer reads the new
+    flights. The user opens a flight of the list or browses for any file.
+    """
+
+    COLUMNS = ["Vol", "Version", "Paquets", "Durée (s)", "Apogée (m)", "Début (s)"]
+
+    def __init__(self, flight_catalog_indexer: FlightCatalogIndexer, parent=None):
+        super().__init__(parent)
+        self.flight_catalog_indexer = flight_catalog_indexer
+        self.filenames = []
+        self.browse_requested = False
+
+        self.setWindowTitle("Ouvrir un vol")
+        self.resize(800, 500)
+
+        self.table = QTableWidget(0, len(self.COLUMNS), self)
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.cellDoubleClicked.connect(self.accept)
+
+        self.status_label = QLabel(self)
+
+        browse_button = QPushButton("Parcourir...", self)
+        browse_button.clicked.connect(self.browse)
+        open_button = QPushButton("Ouvrir", self)
+        open_button.setDefault(True)
+        open_button.clicked.connect(self.accept)
+        cancel_button = QPushButton("Annuler", self)
+        cancel_button.clicked.connect(self.reject)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.status_label)
+        buttons.addStretch()
+        buttons.addWidget(browse_button)
+        buttons.addWidget(open_button)
+        buttons.addWidget(cancel_button)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.table)
+        layout.addLayout(buttons)
+
+        self.flight_catalog_indexer.progressed.connect(self.on_catalog_progressed, Qt.QueuedConnection)
+        self.flight_catalog_indexer.updated.connect(self.on_catalog_updated, Qt.QueuedConnection)
+        self.on_catalog_updated()
+
+    def select_flight(self) -> str:
+        """
+        :return: The file name of the chosen flight, or an empty string if none was chosen or the user asked to
+                 browse for a file.
+        """
+        self.flight_catalog_indexer.start()
+        self.exec_()
+
+        self.flight_catalog_indexer.progressed.disconnect(self.on_catalog_progressed)
+        self.flight_catalog_indexer.updated.disconnect(self.on_catalog_updated)
+
+        if self.result() != QDialog.Accepted or self.browse_requested:
+            return ""
+
+        row = self.table.currentRow()
+        return self.filenames[row] if 0 <= row < len(self.filenames) else ""
+
+    def browse(self):
+        self.browse_requested = True
+        self.accept()
+
+    def on_catalog_progressed(self, read_file_count: int, file_count: int):
+        self.status_label.setText("Indexation des vols: {}/{}".format(read_file_count, file_count))
+
+    def on_catalog_updated(self):
+        selected_row = self.table.currentRow()
+        selected_filename = self.filenames[selected_row] if 0 <= selected_row < len(self.filenames) else None
+
+        summaries = self.flight_catalog_indexer.flight_catalog.get_summaries()
+        self.filenames = [summary.filename for summary in summaries]
+
+        self.table.setRowCount(len(summaries))
+        for row, summary in enumerate(summaries):
+            for column, text in enumerate(self._get_cells(summary)):
+                item = QTableWidgetItem(text)
+                if column > 0:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                if not summary.is_valid():
+                    item.setToolTip(summary.error)
+                self.table.setItem(row, column, item)
+
+        if selected_filename in self.filenames:
+            self.table.selectRow(self.filenames.index(selected_filename))
+
+        if not self.flight_catalog_indexer.is_running():
+            self.status_label.setText("{} vols".format(len(summaries)))
+
+    @staticmethod
+    def _get_cells(summary: FlightSummary) -> list:
+        name = os.path.basename(summary.filename)
+        if not summary.is_valid():
+            return [name, "", "", "", "", "Illisible"]
+
+        return [name, FlightCatalogDialog._format(summary.rocket_packet_version, "{:.0f}"),
+                FlightCatalogDialog._format(summary.packet_count, "{}"),
+                FlightCatalogDialog._format(summary.duration, "{:.1f}"),
+                FlightCatalogDialog._format(summary.apogee, "{:.0f}"),
+                FlightCatalogDialog._format(summary.start_time, "{:.1f}")]
+
+    @staticmethod
+    def _format(value, value_format: str) -> str:
+        return value_format.format(value) if value is not None else "-"
@@ -0,0 +1,30 @@
+import collections
+import time
+
+
+class FrameTimeCounter:
+    """Duration of the last frames painted, in seconds"""
+
+    def __init__(self, frame_count: int = 100):
+        self.frame_times = collections.deque(maxlen=frame_count)
+        self.total_frame_count = 0
+        self._start_time = None
+
+    def start(self):
+        self._start_time = time.perf_counter()
+
+    def stop(self):
+        self.frame_times.append(time.perf_counter() - self._start_time)
+        self.total_frame_count += 1
+
+    def is_window_complete(self) -> bool:
+        """
+        :return: True after every frame_count frames, when the last frames are all new since the previous window.
+        """
+        return self.total_frame_count > 0 and self.total_frame_count % self.frame_times.maxlen == 0
+
+    def get_average_frame_time(self) -> float:
+        return sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
+
+    def get_max_frame_time(self) -> float:
+        return max(self.frame_times, default=0.0)
@@ -1,11 +1,16 @@
+import logging
+
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from PyQt5 import QtCore
 from PyQt5.QtWidgets import QOpenGLWidget
 
 from src.data_processing.orientation.orientation import Orientation
+from src.ui.frame_time_counter import FrameTimeCounter
 from src.ui.utils import set_minimum_expanding_size_policy
 
+logger = logging.getLogger(__name__)
+
 
 class GlRocket(QOpenGLWidget):
     def __init__(self, parent):
@@ -16,22 +21,38 @@ class GlRocket(QOpenGLWidget):
         self.fin_vertices = [(0.3, 0, 1), (0.3, 0, 0), (0.7, 0, 0.1), (0.7, 0, 0.5)]
         self._rocket_orientation = Orientation()
         self.angle = 0
+        self.rocket_display_list = None
+        self.frame_time_counter = FrameTimeCounter()
+
+    def build_rocket_display_list(self) -> int:
+        """
+        Compile the rocket geometry once, so painting a frame only has to set the orientation and call the list.
+        """
+        quadric = gluNewQuadric()
+        gluQuadricNormals(quadric, GLU_SMOOTH)
+
+        display_list = glGenLists(1)
+        glNewList(display_list, GL_COMPILE)
+        self.draw_rocket(quadric)
+        glEndList()
+
+        gluDeleteQuadric(quadric)
 
-    def draw_rocket(self):
+        return display_list
+
+    def draw_rocket(self, quadric):
         cm = 2  # Centre de masse. Unités à partir du bas
         glTranslatef(0, 0, -cm)
-        self.draw_tube()
+        self.draw_tube(quadric)
         self.draw_fins()
         glTranslatef(0, 0, 5.5)
-        self.draw_cone()
+        self.draw_cone(quadric)
         glTranslatef(0, 0, -5.5 + cm)
 
     @staticmethod
-    def draw_tube():
+    def draw_tube(quadric):
         glColor3b(120, 120, 120)
-        cyl = gluNewQuadric()
-        gluQuadricNormals(cyl, GLU_SMOOTH)
-        gluCylinder(cyl, 0.3, 0.3, 5.5, 50, 5)  # (obj, base radius, top radius, length, res, res)
+        gluCylinder(quadric, 0.3, 0.3, 5.5, 50, 5)  # (obj, base radius, top radius, length, res, res)
 
     def draw_fins(self):
         glColor3b(115, 0, 0)
@@ -52,26 +73,33 @@ class GlRocket(QOpenGLWidget):
         glEnd()
 
     @staticmethod
-    def draw_cone():
+    def draw_cone(quadric):
         glColor3b(115, 0, 0)
-        con = gluNewQuadric()
-        gluQuadricNormals(con, GLU_SMOOTH)
-        gluCylinder(con, 0.3, 0, 1.5, 50, 5)
+        gluCylinder(quadric, 0.3, 0, 1.5, 50, 5)
 
     def set_rocket_model_orientation(self, orientation: Orientation):
         self._rocket_orientation = orientation
         self.update()
 
     def paintGL(self):
+        self.frame_time_counter.start()
+
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         glMatrixMode(GL_MODELVIEW)
         glPushMatrix()
         glLoadIdentity()
         glRotatef(*self._rocket_orientation.to_axis_angles())
-        self.draw_rocket()
+        glCallList(self.rocket_display_list)
         glPopMatrix()
         glFlush()
 
+        self.frame_time_counter.stop()
+        if self.frame_time_counter.is_window_complete() and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GlRocket frame time over the last %d frames: %.3f ms average, %.3f ms max",
+                         len(self.frame_time_counter.frame_times),
+                         self.frame_time_counter.get_average_frame_time() * 1000,
+                         self.frame_time_counter.get_max_frame_time() * 1000)
+
     def initializeGL(self):
         glMatrixMode(GL_PROJECTION)
         gluPerspective(45.0, 0.5, 0.1, 50.0)
@@ -82,3 +110,20 @@ class GlRocket(QOpenGLWidget):
         glDepthFunc(GL_LEQUAL)
         glEnable(GL_DEPTH_TEST)
         glShadeModel(GL_SMOOTH)
+
+        # initializeGL is called again with a new context when the widget is reparented. The context is already
+        # current here, and releasing it would leave the new display list without a context to be compiled in
+        if self.rocket_display_list is not None:
+            glDeleteLists(self.rocket_display_list, 1)
+        self.rocket_display_list = self.build_rocket_display_list()
+        self.context().aboutToBeDestroyed.connect(self.free_gl_resources)
+
+    def free_gl_resources(self):
+        """
+        Delete the display list before the context is destroyed, outside of the painting of the widget.
+        """
+        if self.rocket_display_list is not None:
+            self.makeCurrent()
+            glDeleteLists(self.rocket_display_list, 1)
+            self.rocket_display_list = None
+            self.doneCurrent()
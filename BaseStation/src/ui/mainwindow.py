@@ -1,13 +1,16 @@
 import os
 
 from PyQt5.QtGui import QIcon, QCloseEvent
-from PyQt5.QtWidgets import QDesktopWidget, QMainWindow, QStackedWidget, QFileDialog, QWidget
+from PyQt5.QtWidgets import QDesktopWidget, QMainWindow, QStackedWidget, QFileDialog, QWidget, QInputDialog
 
 from src.controller_factory import ControllerFactory
+from src.domain_error import DomainError
 from src.message_type import MessageType
+from src.persistence.sqlite_data_persister import SqliteDataPersister
 from src.rocket_packet.rocket_packet_parser_factory import RocketPacketVersionException
 from src.ui import utils
 from src.ui.configdialog import ConfigDialog
+from src.ui.flight_catalog_dialog import FlightCatalogDialog
 from src.ui.console_message_listener import ConsoleMessageListener
 from src.ui.homewidget import HomeWidget
 from src.ui.menu_bar import MenuBar
@@ -46,6 +49,12 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("GAUL BaseStation")
         self.set_stylesheet("src/resources/mainwindow.css")
 
+        self.recover_journals()
+
+        # The catalog is indexed from the start, so the flight list is up to date when it is opened
+        self.flight_catalog_indexer = self.controller_factory.create_flight_catalog_indexer()
+        self.flight_catalog_indexer.start()
+
     def create_menu_bar(self):
         menu_bar = MenuBar(self)
 
@@ -72,20 +81,74 @@ class MainWindow(QMainWindow):
             except RocketPacketVersionException as error:
                 self.status_bar.notify(str(error), MessageType.ERROR)
 
+    def recover_journals(self):
+        """
+        Save the flights of the acquisitions interrupted by a crash, whose frames were only written in a journal.
+        """
+        journal_recovery = self.controller_factory.create_journal_recovery()
+        journal_recovery.register_message_listener(self.status_bar)
+        try:
+            journal_recovery.recover_all()
+        except (DomainError, RocketPacketVersionException, OSError) as error:
+            self.status_bar.notify(str(error), MessageType.ERROR)
+
     def save_as(self):  # TODO
         pass
 
     def load_flight_data(self):
+        flight_catalog_dialog = FlightCatalogDialog(self.flight_catalog_indexer, self)
+        filename = flight_catalog_dialog.select_flight()
+
+        if flight_catalog_dialog.browse_requested:
+            self.browse_flight_data()
+        elif filename:
+            self.open_flight_data(filename)
+
+    def browse_flight_data(self):
         filename, _ = QFileDialog.getOpenFileName(caption="Open File", directory="./src/resources/",
-                                                  filter="All Files (*);; CSV Files (*.csv)")
+                                                  filter="All Files (*);; CSV Files (*.csv);; Binary Files (*.bin);; "
+                                                         "Raw Journals (*.raw);; Flight Libraries (*.db)")
+        if filename.lower().endswith(SqliteDataPersister.EXTENSION):
+            filename = self.select_library_flight(filename)
+
         if filename:
-            deactivated = True
-            if self.active_controller is not None:
-                deactivated = self.active_controller.deactivate()
+            self.open_flight_data(filename)
+
+    def open_flight_data(self, filename: str):
+        deactivated = True
+        if self.active_controller is not None:
+            deactivated = self.active_controller.deactivate()
 
-            if deactivated:
-                self.open_replay()
-                self.active_controller.activate(filename)
+        if deactivated:
+            self.open_replay()
+            self.active_controller.activate(filename)
+
+    def select_library_flight(self, database_filename: str) -> str:
+        """
+        :return: The file name of the flight chosen in the flight library, or an empty string if none was chosen.
+        """
+        try:
+            flights = self.controller_factory.sqlite_data_persister.get_flights(database_filename)
+        except DomainError as error:
+            self.status_bar.notify(str(error), MessageType.ERROR)
+            return ""
+
+        if not flights:
+            self.status_bar.notify("Aucun vol dans la bibliothèque " + database_filename, MessageType.WARNING)
+            return ""
+
+        flight_names = {}
+        for flight in flights:
+            duration = "{:.1f} s".format(flight.duration) if flight.duration is not None else "-"
+            apogee = "{:.0f} m".format(flight.apogee) if flight.apogee is not None else "-"
+            label = "{} ({} paquets, durée: {}, apogée: {})".format(flight.name, flight.packet_count, duration, apogee)
+            flight_names[label] = flight.name
+
+        label, accepted = QInputDialog.getItem(self, "Ouvrir un vol", "Vol:", list(flight_names.keys()), 0, False)
+        if not accepted:
+            return ""
+
+        return SqliteDataPersister.get_flight_filename(database_filename, flight_names[label])
 
     def add_simulation(self):
         filename, _ = QFileDialog.getOpenFileName(caption="Open File", directory="./src/resources/",
@@ -1,10 +1,16 @@
+import numpy as np
 from PyQt5 import QtWidgets, QtCore
 from pyqtgraph import PlotWidget, mkPen, TextItem, mkBrush
 
+from src.data_processing.generation import Generation
+from src.data_processing.min_max_decimator import MinMaxDecimator
 from src.ui.utils import set_minimum_expanding_size_policy
 
 
 class Map(PlotWidget):
+    POINTS_PER_PIXEL = 2
+    DEFAULT_WIDTH_IN_PIXELS = 400
+
     def __init__(self, parent: QtWidgets.QWidget):
         super().__init__(parent)
 
@@ -18,6 +24,9 @@ class Map(PlotWidget):
         self.plotItem.showGrid(x=True, y=True)
 
         self.positions_on_map = self.plot([0], [0], pen=mkPen(color='k', width=3))
+        # The trajectory is not sorted along any axis, so the extremes of both coordinates are kept in time order
+        self.positions_decimator = MinMaxDecimator(series_count=2)
+        self.plotItem.getViewBox().sigRangeChanged.connect(self._on_range_changed)
 
         self.current_coordinates = 0, 0
         self.current_coordinates_text = TextItem("", anchor=(1, 1), color=(0, 0, 0, 0))
@@ -26,15 +35,61 @@ class Map(PlotWidget):
                                                                    brush=mkBrush(color='r'))
         self.addItem(self.current_coordinates_text, ignoreBounds=True)
 
-    def draw_map(self, eastings: list, northings: list):
-        self.positions_on_map.setData(eastings, northings)
+    def draw_map(self, eastings: list, northings: list, generation: Generation = None):
+        """
+        :param generation: Positions generation of the ConsumerSnapshot. The positions are indexed by their order, so
+                           a trajectory replaced after a rollback can only be told apart by its generation.
+        """
+        self.positions_decimator.update(None, eastings, northings, generation=generation)
+        self.draw_positions()
 
         if len(eastings) > 0:
             self.current_coordinates_point.setData([eastings[-1:]], northings[-1:])
             self.current_coordinates_text.setPos(eastings[-1], northings[-1])
             self.current_coordinates_text.setColor(color='k')
 
+    def draw_positions(self):
+        if len(self.positions_decimator) == 0:
+            return
+
+        view_box = self.plotItem.getViewBox()
+        if any(view_box.autoRangeEnabled()):
+            first_index, last_index = None, None
+        else:
+            first_index, last_index = self._get_visible_index_range(*view_box.viewRange())
+            if first_index is None:
+                self.positions_on_map.clear()
+                return
+
+        _, eastings, northings = self.positions_decimator.get_points(self.get_max_points(), first_index, last_index)
+        self.positions_on_map.setData(eastings, northings)
+
+    def _get_visible_index_range(self, easting_range, northing_range):
+        """
+        :return: The indices of the first and last positions inside the view, which are drawn with every position
+                 between them, or (None, None) if no position is visible.
+        """
+        eastings = self.positions_decimator.get_series(0)
+        northings = self.positions_decimator.get_series(1)
+        visible = ((eastings >= easting_range[0]) & (eastings <= easting_range[1]) &
+                   (northings >= northing_range[0]) & (northings <= northing_range[1]))
+
+        visible_indices = np.flatnonzero(visible)
+        if len(visible_indices) == 0:
+            return None, None
+
+        return visible_indices[0], visible_indices[-1]
+
+    def _on_range_changed(self, *_):
+        if not any(self.plotItem.getViewBox().autoRangeEnabled()):
+            self.draw_positions()
+
+    def get_max_points(self) -> int:
+        width = int(self.plotItem.getViewBox().width())
+        return self.POINTS_PER_PIXEL * (width if width > 0 else self.DEFAULT_WIDTH_IN_PIXELS)
+
     def reset(self):
+        self.positions_decimator.clear()
         self.positions_on_map.clear()
 
         self.current_coordinates = 0, 0
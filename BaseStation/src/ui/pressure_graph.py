@@ -1,5 +1,6 @@
 from PyQt5 import QtWidgets, QtCore
 from pyqtgraph import PlotWidget, mkPen, mkBrush, TextItem
+from src.ui.decimated_curve import DecimatedCurve
 from src.ui.utils import set_minimum_expanding_size_policy
 
 
@@ -13,6 +14,7 @@ class PressureGraph(PlotWidget):
         self.set_graph_left_legend("Pressure (p)")
 
         self.pressure_curve = self.plot([0], [0], pen=mkPen(color='k', width=3))
+        self.decimated_pressure_curve = DecimatedCurve(self.plotItem, self.pressure_curve)
 
         self.current_timestamp = 0
         self.current_pressure = 0
@@ -27,11 +29,10 @@ class PressureGraph(PlotWidget):
             self.current_timestamp = timestamps[-1]
             self.current_pressure = int(pressures[-1])
 
-            self.altitude_curve.setData(timestamps, pressures)
-            self.current_altitude_point.setData([self.current_timestamp], [self.current_altitude])
-            self.current_altitude_text.setPos(self.current_timestamp, self.current_altitude)
-            self.current_altitude_text.setColor(color='k')
-
+            self.decimated_pressure_curve.set_data(timestamps, pressures)
+            self.current_pressure_point.setData([self.current_timestamp], [self.current_pressure])
+            self.current_pressure_text.setPos(self.current_timestamp, self.current_pressure)
+            self.current_pressure_text.setColor(color='k')
             self.current_pressure_text.setText("{}p".format(self.current_pressure))
 
     def set_graph_title(self, title: str):
@@ -43,13 +44,13 @@ class PressureGraph(PlotWidget):
     def set_graph_left_legend(self, name: str):
         self.plotItem.setLabel("left", name)
 
-    def reset_altitude(self):
-        self.pressure_curve.clear()
+    def reset_pressure(self):
+        self.decimated_pressure_curve.clear()
         self.current_timestamp = 0
         self.current_pressure = 0
         self.current_pressure_point.clear()
-        self.current_pressure_point.setPos(0, self.current_altitude)
+        self.current_pressure_text.setPos(0, self.current_pressure)
         self.current_pressure_text.setColor(color=(0, 0, 0, 0))
 
     def reset(self):
-        self.reset_altitude()
+        self.reset_pressure()
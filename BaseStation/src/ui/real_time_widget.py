@@ -45,6 +45,7 @@ class RealTimeWidget(DataWidget):
     @staticmethod
     def get_save_file_name(default_path: str) -> str:
         filename, _ = QFileDialog.getSaveFileName(caption="Save File", directory=default_path,
-                                                  filter="All Files (*);; CSV Files (*.csv)",
+                                                  filter="All Files (*);; CSV Files (*.csv);; Binary Files (*.bin);; "
+                                                         "Flight Libraries (*.db)",
                                                   options=QFileDialog.Options())
         return filename
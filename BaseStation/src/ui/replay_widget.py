@@ -7,6 +7,7 @@ class ReplayWidget(DataWidget):
 
     PLAY_TEXT = "Play"
     PAUSE_TEXT = "Pause"
+    AS_FAST_AS_POSSIBLE_TEXT = "Max"
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -19,6 +20,9 @@ class ReplayWidget(DataWidget):
         self.init_button(self.play_pause_button, "play_pause_button", self.PLAY_TEXT, self.on_play_pause)
         self.fast_forward_button = QPushButton(self.widget)
         self.init_button(self.fast_forward_button, "fast_forward_button", "FF", self.fast_forward)
+        self.as_fast_as_possible_button = QPushButton(self.widget)
+        self.init_button(self.as_fast_as_possible_button, "as_fast_as_possible_button", self.AS_FAST_AS_POSSIBLE_TEXT,
+                         self.as_fast_as_possible)
         self.speedLabel = QLabel()
         self.main_layout.addWidget(self.speedLabel)
 
@@ -43,14 +47,20 @@ class ReplayWidget(DataWidget):
         except KeyError:
             pass
 
+    def as_fast_as_possible(self):
+        try:
+            self.callbacks["as_fast_as_possible"]()
+        except KeyError:
+            pass
+
     def set_play_button_text(self):
         self.play_pause_button.setText(self.PLAY_TEXT)
 
     def set_pause_button_text(self):
         self.play_pause_button.setText(self.PAUSE_TEXT)
 
-    def update_replay_speed_text(self, speed):
-        self.speedLabel.setText('{}x'.format(speed))
+    def update_replay_speed_text(self, speed, as_fast_as_possible: bool = False):
+        self.speedLabel.setText(self.AS_FAST_AS_POSSIBLE_TEXT if as_fast_as_possible else '{}x'.format(speed))
 
     def set_control_bar_max_value(self, max_value: int):
         self.control_bar.setMaximum(max_value)
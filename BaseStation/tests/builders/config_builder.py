@@ -1,4 +1,4 @@
-from src.config import RocketPacketConfig, SerialPortConfig, Config, GpsConfig, OrientationConfig
+from src.config import RocketPacketConfig, SerialPortConfig, Config, GpsConfig, OrientationConfig, JournalConfig
 from src.data_processing.gps.utm_zone import UTMZone
 
 
@@ -17,6 +17,9 @@ class ConfigBuilder:
         self.baudrate = 9600
         self.timeout = 1
 
+        self.journal_directory = "journals"
+        self.fsync_interval = 1.0
+
         self.target_altitude = 10000
         self.gui_fps = 30.0
 
@@ -33,6 +36,7 @@ class ConfigBuilder:
         gps_config = GpsConfig(self.gps_device_name, self.utm_zone, self.gps_initialisation_delay)
         orientation_config = OrientationConfig(self.orientation_initialization_delay)
         serial_port_config = SerialPortConfig(self.start_character, self.baudrate, self.timeout)
+        journal_config = JournalConfig(self.journal_directory, self.fsync_interval)
 
         return Config(self.target_altitude, self.gui_fps, rocket_packet_config, gps_config, orientation_config,
-                      serial_port_config)
+                      serial_port_config, journal_config)
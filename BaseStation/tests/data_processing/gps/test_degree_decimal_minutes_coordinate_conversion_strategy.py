@@ -1,26 +1,42 @@
 from unittest import TestCase
 
+import numpy as np
 from parameterized import parameterized
 
 from src.data_processing.gps.degree_decimal_minutes_coordinate_conversion_strategy import \
     DegreeDecimalMinutesCoordinateConversionStrategy
 
 
+COORDINATES = [
+    ("gaul_HQ", 4646.7579, -7116.5728, 46.779298, -71.276213),
+    ("spaceport_america", 3259.4167, -10658.4988, 32.990278, -106.974980),
+    ("north_east_hemisphere", 4851.3968, 221.1333, 48.856613, 2.3522219),  # Paris
+    ("south_west_hemisphere", -2254.4108, -4310.3738, -22.9068467, -43.1728965),  # Rio de Janeiro
+    ("south_east_hemisphere", -3352.0492, 15112.4194, -33.867487, 151.206990)  # Sydney
+]
+
+
 class DegreeDecimalMinutesCoordinateConversionStrategyTest(TestCase):
     FLOATING_POINT_PRECISION = 6
 
     def setUp(self):
         self.conversion_strategy = DegreeDecimalMinutesCoordinateConversionStrategy()
 
-    @parameterized.expand([
-        ("gaul_HQ", 4646.7579, -7116.5728, 46.779298, -71.276213),
-        ("spaceport_america", 3259.4167, -10658.4988, 32.990278, -106.974980),
-        ("north_east_hemisphere", 4851.3968, 221.1333, 48.856613, 2.3522219),  # Paris
-        ("south_west_hemisphere", -2254.4108, -4310.3738, -22.9068467, -43.1728965),  # Rio de Janeiro
-        ("south_east_hemisphere", -3352.0492, 15112.4194, -33.867487, 151.206990)  # Sydney
-    ])
+    @parameterized.expand(COORDINATES)
     def test_to_decimal_degree_should_convert_from_degree_decimal_minutes(self, _, ddm_lat, ddm_long, dd_lat, dd_long):
         gps_coordinates = self.conversion_strategy.to_decimal_degrees(ddm_lat, ddm_long)
 
         self.assertAlmostEqual(gps_coordinates.decimal_degrees_latitude, dd_lat, self.FLOATING_POINT_PRECISION)
         self.assertAlmostEqual(gps_coordinates.decimal_degrees_longitude, dd_long, self.FLOATING_POINT_PRECISION)
+
+    def test_to_decimal_degrees_arrays_should_convert_like_to_decimal_degrees(self):
+        _, ddm_latitudes, ddm_longitudes, _, _ = zip(*COORDINATES)
+
+        latitudes, longitudes = self.conversion_strategy.to_decimal_degrees_arrays(np.array(ddm_latitudes),
+                                                                                   np.array(ddm_longitudes))
+
+        for latitude, longitude, ddm_latitude, ddm_longitude in zip(latitudes, longitudes, ddm_latitudes,
+                                                                    ddm_longitudes):
+            gps_coordinates = self.conversion_strategy.to_decimal_degrees(ddm_latitude, ddm_longitude)
+            self.assertAlmostEqual(latitude, gps_coordinates.decimal_degrees_latitude, 12)
+            self.assertAlmostEqual(longitude, gps_coordinates.decimal_degrees_longitude, 12)
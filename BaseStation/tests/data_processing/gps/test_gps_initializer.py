@@ -1,5 +1,5 @@
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
 
 from src.data_processing.gps.gps_initializer import GpsInitializer, GpsInitializerListener
 from src.data_processing.gps.utm_coordinates import UTMCoordinates
@@ -30,7 +30,7 @@ class GpsInitializerTest(TestCase):
 
         self.gps_initializer.update(3, self.INITIAL_COORDINATES - self.NOISE)
 
-        self.gps_initializer_listener.notify_gps_initialized.assert_called_with(self.INITIAL_COORDINATES)
+        self.gps_initializer_listener.notify_gps_initialized.assert_called_with(self.INITIAL_COORDINATES, ANY)
 
     def test_update_should_notify_listeners_when_elapsed_time_equals_delay(self):
         self.gps_initializer.update(0, UTMCoordinates(1.0, 5.0))
@@ -38,11 +38,48 @@ class GpsInitializerTest(TestCase):
 
         self.gps_initializer.update(2, UTMCoordinates(6.5, 9.0))
 
-        self.gps_initializer_listener.notify_gps_initialized.assert_called_with(UTMCoordinates(3.0, 7.0))
+        self.gps_initializer_listener.notify_gps_initialized.assert_called_with(UTMCoordinates(3.0, 7.0), ANY)
 
     def test_update_should_notify_listeners_given_no_delay(self):
         self.gps_initializer.initialization_delay = 0
 
         self.gps_initializer.update(0, self.INITIAL_COORDINATES)
 
-        self.gps_initializer_listener.notify_gps_initialized.assert_called_with(self.INITIAL_COORDINATES)
+        self.gps_initializer_listener.notify_gps_initialized.assert_called_with(self.INITIAL_COORDINATES, ANY)
+
+    def test_update_should_notify_listeners_with_spread_of_base_camp_positions(self):
+        self.gps_initializer.update(0, UTMCoordinates(1.0, 5.0))
+        self.gps_initializer.update(1, UTMCoordinates(3.0, 9.0))
+
+        self.gps_initializer.update(2, UTMCoordinates(2.0, 7.0))
+
+        base_camp_spread = self.gps_initializer_listener.notify_gps_initialized.call_args[0][1]
+        self.assertEqual(base_camp_spread, self.gps_initializer.get_spread())
+        self.assertAlmostEqual(base_camp_spread.easting, (2 / 3) ** 0.5)
+        self.assertAlmostEqual(base_camp_spread.northing, (8 / 3) ** 0.5)
+
+    def test_get_spread_should_return_standard_deviations_of_positions(self):
+        self.gps_initializer.update(0, UTMCoordinates(1.0, 5.0))
+        self.gps_initializer.update(1, UTMCoordinates(3.0, 9.0))
+
+        self.assertEqual(self.gps_initializer.get_sample_count(), 2)
+        self.assertEqual(self.gps_initializer.get_spread(), UTMCoordinates(1.0, 2.0))
+
+    def test_set_state_should_forget_positions_updated_after_get_state(self):
+        self.gps_initializer.update(0, UTMCoordinates(1.0, 5.0))
+        state = self.gps_initializer.get_state()
+        self.gps_initializer.update(1, UTMCoordinates(100.0, 100.0))
+
+        self.gps_initializer.set_state(state)
+        self.gps_initializer.update(2, UTMCoordinates(5.0, 7.0))
+
+        self.gps_initializer_listener.notify_gps_initialized.assert_called_once_with(UTMCoordinates(3.0, 6.0),
+                                                                                 UTMCoordinates(2.0, 1.0))
+
+    def test_reset_should_forget_positions(self):
+        self.gps_initializer.update(0, UTMCoordinates(1.0, 5.0))
+
+        self.gps_initializer.reset()
+
+        self.assertEqual(self.gps_initializer.get_sample_count(), 0)
+        self.assertEqual(self.gps_initializer.get_spread(), UTMCoordinates(0.0, 0.0))
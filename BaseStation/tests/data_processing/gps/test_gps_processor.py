@@ -1,13 +1,18 @@
 from unittest import TestCase
 from unittest.mock import Mock
 
+import numpy as np
+
 from src.data_processing.gps.coordinate_conversion_strategy import CoordinateConversionStrategy
 from src.data_processing.gps.gps_coordinates import GpsCoordinates
-from src.data_processing.gps.gps_fix_validator import GpsFixValidator
+from src.data_processing.gps.degree_decimal_minutes_coordinate_conversion_strategy import \
+    DegreeDecimalMinutesCoordinateConversionStrategy
+from src.data_processing.gps.gps_fix_validator import GpsFixValidator, IndicatorCharacterGpsFixValidator
 from src.data_processing.gps.gps_initializer import GpsInitializer
 from src.data_processing.gps.gps_processor import GpsProcessor
 from src.data_processing.gps.utm_coordinates import UTMCoordinates
 from src.data_processing.gps.utm_coordinates_converter import UTMCoordinatesConverter
+from src.data_processing.gps.utm_zone import UTMZone
 from tests.rocket_packet.rocket_packet_builder import RocketPacketBuilder
 
 
@@ -21,6 +26,7 @@ class GpsProcessorTest(TestCase):
     MOVEMENT_EASTING = 6
     MOVEMENT_NORTHING = 7
     MOVEMENT = UTMCoordinates(MOVEMENT_EASTING, MOVEMENT_NORTHING)
+    BASE_CAMP_SPREAD = UTMCoordinates(0.5, 1.5)
 
     def setUp(self):
         self.gps_fix_validator = Mock(spec=GpsFixValidator)
@@ -57,15 +63,146 @@ class GpsProcessorTest(TestCase):
         self.gps_processor.update(rocket_packet)
 
         self.gps_initializer.update.assert_called_with(self.TIMESTAMP, self.INITIAL_COORDINATES)
-        self.assertEqual(self.gps_processor.get_projected_coordinates(), ([0.0], [0.0]))
+        self.assert_projected_coordinates_equal([0.0], [0.0])
 
     def test_update_should_process_positions_in_reference_to_base_camp_after_initialization(self):
         rocket_packet = RocketPacketBuilder().build()
         self.gps_fix_validator.is_fixed.return_value = True
         self.utm_coordinates_converter.decimal_degrees_to_utm.return_value = self.INITIAL_COORDINATES + self.MOVEMENT
-        self.gps_processor.notify_gps_initialized(self.INITIAL_COORDINATES)
+        self.gps_processor.notify_gps_initialized(self.INITIAL_COORDINATES, self.BASE_CAMP_SPREAD)
 
         self.gps_processor.update(rocket_packet)
 
-        self.assertEqual(self.gps_processor.get_projected_coordinates(), ([self.MOVEMENT_EASTING],
-                                                                          [self.MOVEMENT_NORTHING]))
+        self.assert_projected_coordinates_equal([self.MOVEMENT_EASTING], [self.MOVEMENT_NORTHING])
+
+    def test_get_base_camp_spread_should_return_spread_given_by_initializer(self):
+        self.assertIsNone(self.gps_processor.get_base_camp_spread())
+
+        self.gps_processor.notify_gps_initialized(self.INITIAL_COORDINATES, self.BASE_CAMP_SPREAD)
+
+        self.assertEqual(self.gps_processor.get_base_camp_spread(), self.BASE_CAMP_SPREAD)
+
+    def test_reset_should_forget_base_camp_spread(self):
+        self.gps_processor.notify_gps_initialized(self.INITIAL_COORDINATES, self.BASE_CAMP_SPREAD)
+
+        self.gps_processor.reset()
+
+        self.assertIsNone(self.gps_processor.get_base_camp_spread())
+
+    def test_set_state_should_restore_base_camp_and_forget_later_positions(self):
+        rocket_packet = RocketPacketBuilder().build()
+        self.gps_fix_validator.is_fixed.return_value = True
+        self.utm_coordinates_converter.decimal_degrees_to_utm.return_value = self.INITIAL_COORDINATES + self.MOVEMENT
+        self.gps_processor.notify_gps_initialized(self.INITIAL_COORDINATES, self.BASE_CAMP_SPREAD)
+        self.gps_processor.update(rocket_packet)
+        state = self.gps_processor.get_state()
+        self.gps_processor.update(rocket_packet)
+        self.gps_processor.reset()
+
+        self.gps_processor.set_state(state)
+        self.gps_processor.update(rocket_packet)
+
+        self.gps_initializer.set_state.assert_called_with(self.gps_initializer.get_state.return_value)
+        self.utm_coordinates_converter.set_state.assert_called_with(
+            self.utm_coordinates_converter.get_state.return_value)
+        self.assert_projected_coordinates_equal([self.MOVEMENT_EASTING] * 2, [self.MOVEMENT_NORTHING] * 2)
+
+    def test_update_columns_should_only_project_packets_with_gps_fix(self):
+        self.gps_fix_validator.get_fix_mask.return_value = np.array([False, True, True])
+        self.coordinate_conversion_strategy.to_decimal_degrees_arrays.side_effect = lambda latitudes, longitudes: (
+            latitudes, longitudes)
+        self.utm_coordinates_converter.decimal_degrees_to_utm_arrays.return_value = (
+            np.array([self.INITIAL_COORDINATES.easting + self.MOVEMENT_EASTING] * 2),
+            np.array([self.INITIAL_COORDINATES.northing + self.MOVEMENT_NORTHING] * 2))
+        self.gps_processor.notify_gps_initialized(self.INITIAL_COORDINATES, self.BASE_CAMP_SPREAD)
+
+        self.gps_processor.update_columns(self.create_columns([1, 2, 3]))
+
+        latitudes, longitudes = self.utm_coordinates_converter.decimal_degrees_to_utm_arrays.call_args[0]
+        self.assertEqual(latitudes.tolist(), [self.DD_LAT] * 2)
+        self.assertEqual(longitudes.tolist(), [self.DD_LONG] * 2)
+        self.assertEqual(self.gps_processor.get_last_coordinates(), self.GPS_COORDINATES)
+        self.assert_projected_coordinates_equal([self.MOVEMENT_EASTING] * 2, [self.MOVEMENT_NORTHING] * 2)
+
+    def test_update_columns_should_give_positions_to_initializer_until_gps_is_initialized(self):
+        self.gps_fix_validator.get_fix_mask.return_value = np.array([True, True, True])
+        self.coordinate_conversion_strategy.to_decimal_degrees_arrays.side_effect = lambda latitudes, longitudes: (
+            latitudes, longitudes)
+        self.utm_coordinates_converter.decimal_degrees_to_utm_arrays.return_value = (
+            np.array([self.INITIAL_COORDINATES.easting] * 2 +
+                     [self.INITIAL_COORDINATES.easting + self.MOVEMENT_EASTING]),
+            np.array([self.INITIAL_COORDINATES.northing] * 2 +
+                     [self.INITIAL_COORDINATES.northing + self.MOVEMENT_NORTHING]))
+        self.gps_initializer.update.side_effect = lambda timestamp, coordinates: (
+            self.gps_processor.notify_gps_initialized(coordinates, self.BASE_CAMP_SPREAD) if timestamp >= 2 else None)
+
+        self.gps_processor.update_columns(self.create_columns([1, 2, 3]))
+
+        self.assertEqual(self.gps_initializer.update.call_count, 2)
+        self.assert_projected_coordinates_equal([0.0, 0.0, self.MOVEMENT_EASTING], [0.0, 0.0, self.MOVEMENT_NORTHING])
+
+    def test_update_columns_should_ignore_packets_without_gps_fix(self):
+        self.gps_fix_validator.get_fix_mask.return_value = np.array([False, False])
+
+        self.gps_processor.update_columns(self.create_columns([1, 2]))
+
+        self.utm_coordinates_converter.decimal_degrees_to_utm_arrays.assert_not_called()
+        self.assertEqual(self.gps_processor.get_last_coordinates(), self.NO_COORDINATES)
+        self.assert_projected_coordinates_equal([], [])
+
+    def test_update_columns_should_ignore_positions_that_cannot_be_projected(self):
+        self.gps_fix_validator.get_fix_mask.return_value = np.array([True, True, True])
+        self.coordinate_conversion_strategy.to_decimal_degrees_arrays.side_effect = lambda latitudes, longitudes: (
+            latitudes, longitudes)
+        self.utm_coordinates_converter.decimal_degrees_to_utm_arrays.return_value = (
+            np.array([np.nan, self.INITIAL_COORDINATES.easting + self.MOVEMENT_EASTING, np.inf]),
+            np.array([np.nan, self.INITIAL_COORDINATES.northing + self.MOVEMENT_NORTHING, np.inf]))
+        self.gps_processor.notify_gps_initialized(self.INITIAL_COORDINATES, self.BASE_CAMP_SPREAD)
+
+        self.gps_processor.update_columns(self.create_columns([1, 2, 3]))
+
+        self.assert_projected_coordinates_equal([self.MOVEMENT_EASTING], [self.MOVEMENT_NORTHING])
+
+    def test_update_should_ignore_position_that_cannot_be_projected(self):
+        self.gps_fix_validator.is_fixed.return_value = True
+        self.utm_coordinates_converter.decimal_degrees_to_utm.return_value = UTMCoordinates(np.nan, np.nan)
+
+        self.gps_processor.update(RocketPacketBuilder().build())
+
+        self.gps_initializer.update.assert_not_called()
+        self.assert_projected_coordinates_equal([], [])
+
+    def assert_projected_coordinates_equal(self, eastings, northings):
+        projected_eastings, projected_northings = self.gps_processor.get_projected_coordinates()
+        self.assertEqual(projected_eastings.tolist(), eastings)
+        self.assertEqual(projected_northings.tolist(), northings)
+
+    def create_columns(self, time_stamps):
+        count = len(time_stamps)
+        return {"time_stamp": np.array(time_stamps, dtype=np.float64), "latitude": np.full(count, self.DD_LAT),
+                "longitude": np.full(count, self.DD_LONG), "ns_indicator": np.full(count, b'N'),
+                "ew_indicator": np.full(count, b'W')}
+
+    def test_update_columns_should_project_like_update_given_real_conversions(self):
+        columns = self.create_columns(np.arange(20, dtype=np.float64))
+        columns["latitude"] = np.linspace(3259.4167, 3259.5167, 20)
+        columns["longitude"] = np.linspace(-10658.4988, -10658.3988, 20)
+        columns["ns_indicator"][3] = b''
+        gps_processor = self.create_real_gps_processor()
+        expected_gps_processor = self.create_real_gps_processor()
+
+        gps_processor.update_columns(columns)
+        for row in zip(*[columns[key] for key in GpsProcessor.COLUMNS]):
+            expected_gps_processor.update(RocketPacketBuilder().with_timestamp(row[0]).with_latitude(row[1])
+                                          .with_longitude(row[2]).with_ns_indicator(row[3])
+                                          .with_ew_indicator(row[4]).build())
+
+        for projected, expected in zip(gps_processor.get_projected_coordinates(),
+                                       expected_gps_processor.get_projected_coordinates()):
+            np.testing.assert_allclose(projected, expected, atol=1e-6)
+        self.assertEqual(len(gps_processor.get_projected_coordinates()[0]), 19)
+
+    @staticmethod
+    def create_real_gps_processor():
+        return GpsProcessor(IndicatorCharacterGpsFixValidator(), DegreeDecimalMinutesCoordinateConversionStrategy(),
+                            UTMCoordinatesConverter(UTMZone.zone_13S), GpsInitializer(5))
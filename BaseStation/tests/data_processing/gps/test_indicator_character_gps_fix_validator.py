@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+import numpy as np
 from parameterized import parameterized
 
 from src.data_processing.gps.gps_fix_validator import IndicatorCharacterGpsFixValidator
@@ -30,6 +31,14 @@ class IndicatorCharacterGpsFixValidatorTest(TestCase):
 
         self.assertFalse(is_fixed)
 
+    def test_get_fix_mask_should_tell_which_packets_have_valid_indicator_characters(self):
+        columns = {"ns_indicator": np.array([b'N', b'S', b'M', b'N', b''], dtype="S1"),
+                   "ew_indicator": np.array([b'E', b'W', b'E', b'F', b''], dtype="S1")}
+
+        fix_mask = self.gps_fix_validator.get_fix_mask(columns)
+
+        self.assertEqual(fix_mask.tolist(), [True, True, False, False, False])
+
     @staticmethod
     def create_rocket_packet(ns_indicator: bytes, ew_indicator: bytes):
         return RocketPacketBuilder().with_ns_indicator(ns_indicator).with_ew_indicator(ew_indicator).build()
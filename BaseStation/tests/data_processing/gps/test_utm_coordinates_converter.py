@@ -1,5 +1,8 @@
+import math
 import unittest
 
+import numpy as np
+
 from src.data_processing.gps.gps_coordinates import GpsCoordinates
 from src.data_processing.gps.utm_coordinates_converter import UTMCoordinatesConverter
 from src.data_processing.gps.utm_zone import UTMZone
@@ -29,3 +32,86 @@ class UTMCoordinatesConverterTest(unittest.TestCase):
 
         self.assertAlmostEqual(utm_coordinates.easting, 315470, self.FLOATING_POINT_PRECISION)
         self.assertAlmostEqual(utm_coordinates.northing, 3651941, self.FLOATING_POINT_PRECISION)
+
+    def test_decimal_degrees_to_utm_arrays_should_project_every_coordinate(self):
+        converter = UTMCoordinatesConverter(UTMZone.zone_13S)
+
+        eastings, northings = converter.decimal_degrees_to_utm_arrays(np.array([32.990278, 32.990278]),
+                                                                      np.array([-106.974980, -106.974980]))
+
+        self.assertEqual(eastings.dtype, np.float64)
+        np.testing.assert_almost_equal(eastings, [315470, 315470], self.FLOATING_POINT_PRECISION)
+        np.testing.assert_almost_equal(northings, [3651941, 3651941], self.FLOATING_POINT_PRECISION)
+
+    def test_decimal_degrees_to_utm_should_detect_zone_of_first_coordinates(self):
+        converter = UTMCoordinatesConverter()
+
+        utm_coordinates = converter.decimal_degrees_to_utm(GpsCoordinates(32.990278, -106.974980))
+
+        self.assertEqual(converter.get_utm_zone(), UTMZone.zone_13S)
+        self.assertAlmostEqual(utm_coordinates.easting, 315470, self.FLOATING_POINT_PRECISION)
+        self.assertAlmostEqual(utm_coordinates.northing, 3651941, self.FLOATING_POINT_PRECISION)
+
+    def test_decimal_degrees_to_utm_arrays_should_keep_detected_zone(self):
+        converter = UTMCoordinatesConverter()
+
+        converter.decimal_degrees_to_utm_arrays(np.array([46.779298]), np.array([-71.276213]))
+        converter.decimal_degrees_to_utm_arrays(np.array([32.990278]), np.array([-106.974980]))
+
+        self.assertEqual(converter.get_utm_zone(), UTMZone.zone_19t)
+
+    def test_decimal_degrees_to_utm_should_not_detect_zone_from_position_without_real_fix(self):
+        converter = UTMCoordinatesConverter()
+
+        utm_coordinates = converter.decimal_degrees_to_utm(GpsCoordinates(0.0, 0.0))
+
+        self.assertIsNone(converter.get_utm_zone())
+        self.assertTrue(math.isnan(utm_coordinates.easting))
+        self.assertTrue(math.isnan(utm_coordinates.northing))
+
+    def test_decimal_degrees_to_utm_arrays_should_detect_zone_of_first_plausible_coordinates(self):
+        converter = UTMCoordinatesConverter()
+
+        eastings, northings = converter.decimal_degrees_to_utm_arrays(np.array([0.0, 89.5, 32.990278]),
+                                                                      np.array([0.0, 10.0, -106.974980]))
+
+        self.assertEqual(converter.get_utm_zone(), UTMZone.zone_13S)
+        self.assertTrue(np.isnan(eastings[:2]).all())
+        self.assertTrue(np.isnan(northings[:2]).all())
+        self.assertAlmostEqual(eastings[2], 315470, self.FLOATING_POINT_PRECISION)
+        self.assertAlmostEqual(northings[2], 3651941, self.FLOATING_POINT_PRECISION)
+
+    def test_decimal_degrees_to_utm_arrays_should_not_raise_given_only_positions_outside_utm_zones(self):
+        converter = UTMCoordinatesConverter()
+
+        eastings, northings = converter.decimal_degrees_to_utm_arrays(np.array([-85.0, 89.5]), np.array([0.0, 10.0]))
+
+        self.assertIsNone(converter.get_utm_zone())
+        self.assertTrue(np.isnan(eastings).all())
+        self.assertTrue(np.isnan(northings).all())
+
+    def test_reset_should_forget_detected_zone_but_keep_configured_zone(self):
+        detecting_converter = UTMCoordinatesConverter()
+        detecting_converter.decimal_degrees_to_utm(GpsCoordinates(46.779298, -71.276213))
+        configured_converter = UTMCoordinatesConverter(UTMZone.zone_13S)
+
+        detecting_converter.reset()
+        configured_converter.reset()
+
+        self.assertIsNone(detecting_converter.get_utm_zone())
+        self.assertEqual(configured_converter.get_utm_zone(), UTMZone.zone_13S)
+
+    def test_set_state_should_restore_zone(self):
+        converter = UTMCoordinatesConverter()
+        state = converter.get_state()
+        converter.decimal_degrees_to_utm(GpsCoordinates(46.779298, -71.276213))
+
+        converter.set_state(state)
+
+        self.assertIsNone(converter.get_utm_zone())
+
+    def test_converters_of_same_zone_should_share_their_transformer(self):
+        converter = UTMCoordinatesConverter(UTMZone.zone_19t)
+        other_converter = UTMCoordinatesConverter(UTMZone.zone_19t)
+
+        self.assertIs(converter.transformer, other_converter.transformer)
@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from src.data_processing.gps.utm_projection_pool import UTMProjectionPool
+from src.data_processing.gps.utm_zone import UTMZone
+
+
+class UTMProjectionPoolTest(TestCase):
+    def setUp(self):
+        self.projection_pool = UTMProjectionPool(max_size=2)
+
+    def test_get_should_create_transformer_once_by_zone(self):
+        transformer = self.projection_pool.get(UTMZone("19t"))
+
+        self.assertIs(self.projection_pool.get(UTMZone("19t")), transformer)
+        self.assertIs(self.projection_pool.get(UTMZone("19u")), transformer)
+        self.assertEqual(len(self.projection_pool), 1)
+
+    def test_get_should_separate_hemispheres(self):
+        north_transformer = self.projection_pool.get(UTMZone("56n"))
+        south_transformer = self.projection_pool.get(UTMZone("56h"))
+
+        self.assertIsNot(north_transformer, south_transformer)
+
+    def test_get_should_drop_least_recently_used_zone(self):
+        transformer = self.projection_pool.get(UTMZone("13s"))
+        self.projection_pool.get(UTMZone("19t"))
+        self.projection_pool.get(UTMZone("13s"))
+
+        self.projection_pool.get(UTMZone("56h"))
+
+        self.assertEqual(len(self.projection_pool), 2)
+        self.assertIs(self.projection_pool.get(UTMZone("13s")), transformer)
@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from src.data_processing.gps.utm_zone import UTMZone
+
+
+class UTMZoneTest(TestCase):
+    @parameterized.expand([
+        ("gaul_HQ", 46.779298, -71.276213, "19t"),
+        ("spaceport_america", 32.990278, -106.974980, "13s"),
+        ("sydney", -33.867487, 151.206990, "56h"),
+        ("antimeridian", 10.0, 180.0, "1p"),
+        ("south_west_norway", 60.39299, 5.32415, "32v"),
+        ("svalbard", 78.22, 15.65, "33x")
+    ])
+    def test_from_decimal_degrees_should_return_zone_containing_position(self, _, latitude, longitude, value):
+        utm_zone = UTMZone.from_decimal_degrees(latitude, longitude)
+
+        self.assertEqual(utm_zone, UTMZone(value))
+
+    def test_from_decimal_degrees_should_reject_position_outside_utm_zones(self):
+        self.assertRaises(ValueError, UTMZone.from_decimal_degrees, 85.0, 0.0)
+
+    @parameterized.expand([("no_band", "19"), ("no_number", "t"), ("invalid_number", "61t"), ("invalid_band", "19o")])
+    def test_constructor_should_reject_invalid_zone(self, _, value):
+        self.assertRaises(ValueError, UTMZone, value)
+
+    def test_is_north_should_depend_on_latitude_band(self):
+        self.assertTrue(UTMZone("19T").is_north())
+        self.assertTrue(UTMZone("31n").is_north())
+        self.assertFalse(UTMZone("56h").is_north())
@@ -28,6 +28,16 @@ class AngularSpeedIntegratorTest(TestCase):
 
         self.assertEqual(self.integrator.get_current_rocket_orientation(), Orientation(55.0, 60.0, 65.0))
 
+    def test_set_state_should_restore_orientation_and_last_angular_speed(self):
+        self.integrator.integrate(1, 1, 2, 3)
+        state = self.integrator.get_state()
+        self.integrator.integrate(2, 10, 10, 10)
+
+        self.integrator.set_state(state)
+        self.integrator.integrate(2, 1, 2, 3)
+
+        self.assertEqual(self.integrator.get_current_rocket_orientation(), Orientation(1.5, 3.0, 4.5))
+
     def reset_should_reset_current_orientation(self):
         self.integrator.set_initial_orientation(5, Orientation(5, 10, 15))
         self.integrator.integrate(6, 1, 1, 1)
@@ -0,0 +1,68 @@
+import math
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.data_processing.orientation.orientation import Orientation
+from src.data_processing.orientation.orientation_initializer import OrientationInitializer, \
+    OrientationInitializerListener
+from tests.rocket_packet.rocket_packet_builder import RocketPacketBuilder
+
+
+class OrientationInitializerTest(TestCase):
+    INITIALIZATION_DELAY_IN_SECONDS = 2
+    # Accelerations leaning 45 and 30 degrees from the z axis towards the y axis, which are measured as a roll
+    LEANING_45_DEGREES = (0, 1, 1)
+    LEANING_30_DEGREES = (0, 1, math.sqrt(3))
+    FLOATING_POINT_PRECISION = 9
+
+    def setUp(self):
+        self.orientation_initializer = OrientationInitializer(self.INITIALIZATION_DELAY_IN_SECONDS)
+
+        self.orientation_initializer_listener = Mock(spec=OrientationInitializerListener)
+        self.orientation_initializer.register_listener(self.orientation_initializer_listener)
+
+    def test_update_should_notify_listeners_after_delay(self):
+        self.update(0, self.LEANING_45_DEGREES)
+
+        self.update(2, self.LEANING_45_DEGREES)
+
+        self.orientation_initializer_listener.notify_orientation_initialized.assert_called_once_with(
+            2, Orientation(0, 0, 0))
+
+    def test_get_spread_should_return_standard_deviations_of_measures(self):
+        self.update(0, self.LEANING_45_DEGREES)
+        self.update(1, self.LEANING_30_DEGREES)
+
+        spread = self.orientation_initializer.get_spread()
+
+        self.assertEqual(self.orientation_initializer.get_sample_count(), 2)
+        self.assertAlmostEqual(spread.roll, 7.5, self.FLOATING_POINT_PRECISION)
+        self.assertAlmostEqual(spread.pitch, 0, self.FLOATING_POINT_PRECISION)
+        self.assertEqual(spread.yaw, 0)
+
+    def test_set_state_should_forget_measures_updated_after_get_state(self):
+        self.update(0, self.LEANING_45_DEGREES)
+        state = self.orientation_initializer.get_state()
+        self.update(1, self.LEANING_30_DEGREES)
+
+        self.orientation_initializer.set_state(state)
+
+        self.assertEqual(self.orientation_initializer.get_sample_count(), 1)
+        self.assertEqual(self.orientation_initializer.get_spread(), Orientation(0, 0, 0))
+
+    def test_reset_should_forget_measures(self):
+        self.update(0, self.LEANING_45_DEGREES)
+        self.update(1, self.LEANING_30_DEGREES)
+
+        self.orientation_initializer.reset()
+
+        self.assertEqual(self.orientation_initializer.get_sample_count(), 0)
+        self.assertEqual(self.orientation_initializer.get_spread(), Orientation(0, 0, 0))
+
+    def update(self, timestamp: float, acceleration: tuple):
+        rocket_packet = RocketPacketBuilder().with_timestamp(timestamp)\
+            .with_acceleration_x(acceleration[0])\
+            .with_acceleration_y(acceleration[1])\
+            .with_acceleration_z(acceleration[2])\
+            .build()
+        self.orientation_initializer.update(rocket_packet)
@@ -13,6 +13,7 @@ class OrientationProcessorTest(TestCase):
     SUBSEQUENT_TIMESTAMP = 5.5
     INITIAL_ORIENTATION = Orientation(1, 2, 3)
     CURRENT_ORIENTATION = Orientation(4, 5, 6)
+    INITIALIZATION_SPREAD = Orientation(0.5, 1.5, 0)
     ANGULAR_SPEED_X = 7
     ANGULAR_SPEED_Y = 8
     ANGULAR_SPEED_Z = 9
@@ -56,6 +57,15 @@ class OrientationProcessorTest(TestCase):
 
         self.assertEqual(orientation, self.CURRENT_ORIENTATION)
 
+    def test_get_initialization_spread_should_return_none_until_orientation_is_initialized(self):
+        self.assertIsNone(self.orientation_processor.get_initialization_spread())
+
+    def test_get_initialization_spread_should_return_spread_of_initializer_once_initialized(self):
+        self.orientation_initializer.get_spread.return_value = self.INITIALIZATION_SPREAD
+        self.orientation_processor.notify_orientation_initialized(self.INITIAL_TIMESTAMP, self.INITIAL_ORIENTATION)
+
+        self.assertEqual(self.orientation_processor.get_initialization_spread(), self.INITIALIZATION_SPREAD)
+
     def test_reset_should_reset_orientation_initializer_and_angular_speed_calculator(self):
         self.orientation_processor.reset()
 
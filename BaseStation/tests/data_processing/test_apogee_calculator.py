@@ -17,6 +17,19 @@ class ApogeeCalculatorTest(unittest.TestCase):
 
         self.assertEqual(self.apogee_calculator.get_apogee(), Apogee(5, 804))
 
+    def test_set_state_should_restore_apogee_search(self):
+        points = [0, 100, 194, 256, 500, 804, 300, 1000, 600, 9]
+        timestamps = self._generate_timestamps_for(points)
+        self.apogee_calculator.update(timestamps[:7], points[:7])
+        state = self.apogee_calculator.get_state()
+        self.apogee_calculator.update(timestamps, points)
+
+        self.apogee_calculator.set_state(state)
+
+        self.assertEqual(self.apogee_calculator.get_apogee(), Apogee(5, 804))
+        self.apogee_calculator.update(timestamps, points)
+        self.assertEqual(self.apogee_calculator.get_apogee(), Apogee(7, 1000))
+
     def test_update_distinguish_real_apogee(self):
         points = [0, 100, 194, 256, 500, 804, 300, 1000, 600, 9]
         timestamps = self._generate_timestamps_for(points)
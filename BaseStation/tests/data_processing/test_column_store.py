@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+from src.data_processing.column_store import ColumnStore
+
+
+class ColumnStoreTest(unittest.TestCase):
+    DTYPE = np.dtype([("time_stamp", np.float64), ("state", np.uint8)])
+    INITIAL_CAPACITY = 2
+
+    def setUp(self):
+        self.column_store = ColumnStore(self.DTYPE, self.INITIAL_CAPACITY)
+
+    def test_constructor_should_create_one_typed_column_per_dtype_field(self):
+        self.assertEqual(set(self.column_store.keys()), {"time_stamp", "state"})
+        self.assertEqual(self.column_store["state"].dtype, np.uint8)
+
+    def test_getitem_should_return_only_filled_values(self):
+        self.column_store.append({"time_stamp": np.array([1.0]), "state": np.array([1])})
+
+        self.assertEqual(self.column_store["time_stamp"].tolist(), [1.0])
+        self.assertEqual(len(self.column_store), 1)
+
+    def test_append_should_grow_columns_and_keep_values(self):
+        self.column_store.append({"time_stamp": np.array([1.0, 2.0])})
+
+        self.column_store.append({"time_stamp": np.array([3.0, 4.0, 5.0])})
+
+        self.assertEqual(self.column_store["time_stamp"].tolist(), [1.0, 2.0, 3.0, 4.0, 5.0])
+        self.assertGreaterEqual(self.column_store.get_capacity(), 5)
+
+    def test_append_should_leave_missing_columns_to_zero(self):
+        self.column_store.append({"time_stamp": np.array([1.0, 2.0])})
+
+        self.assertEqual(self.column_store["state"].tolist(), [0, 0])
+
+    def test_truncate_should_forget_values_after_length(self):
+        self.column_store.append({"time_stamp": np.array([1.0, 2.0, 3.0])})
+
+        self.column_store.truncate(1)
+        self.column_store.append({"time_stamp": np.array([4.0])})
+
+        self.assertEqual(self.column_store["time_stamp"].tolist(), [1.0, 4.0])
+
+    def test_truncate_should_keep_values_in_place(self):
+        self.column_store.append({"time_stamp": np.array([1.0, 2.0, 3.0])})
+        snapshot = self.column_store.snapshot()
+
+        self.column_store.truncate(1)
+        self.column_store.append({"time_stamp": np.array([4.0])})
+
+        self.assertEqual(snapshot["time_stamp"].tolist(), [1.0, 4.0, 3.0])
+        self.assertFalse(snapshot["time_stamp"].flags.writeable)
+
+    def test_clear_should_remove_all_values(self):
+        self.column_store.append({"time_stamp": np.array([1.0, 2.0, 3.0])})
+
+        self.column_store.clear()
+
+        self.assertEqual(len(self.column_store), 0)
+        self.assertEqual(self.column_store.get_capacity(), self.INITIAL_CAPACITY)
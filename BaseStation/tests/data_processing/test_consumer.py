@@ -1,13 +1,20 @@
 import threading
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, ANY
+
+import numpy as np
 
 from src.data_processing.apogee_calculator import ApogeeCalculator
 from src.data_processing.consumer import Consumer
 from src.data_processing.gps.gps_processor import GpsProcessor
+from src.data_processing.gps.utm_coordinates import UTMCoordinates
+from src.data_processing.orientation.angular_speed_integrator import AngularSpeedIntegrator
+from src.data_processing.orientation.orientation import Orientation
+from src.data_processing.orientation.orientation_initializer import OrientationInitializer
 from src.data_processing.orientation.orientation_processor import OrientationProcessor
 from src.data_producer import DataProducer
 from src.rocket_packet.rocket_packet import RocketPacket
+from src.rocket_packet.rocket_packet_parser_2019 import RocketPacketParser2019
 
 
 class ConsumerTest(unittest.TestCase):
@@ -24,6 +31,7 @@ class ConsumerTest(unittest.TestCase):
         self.apogee_calculator = Mock(spec=ApogeeCalculator)
         self.apogee_calculator.get_apogee.return_value = self.APOGEE
         self.gps_processor = Mock(spec=GpsProcessor)
+        self.gps_processor.get_projected_coordinates.return_value = (np.zeros(0), np.zeros(0))
         self.orientation_processor = Mock(spec=OrientationProcessor)
 
         self.consumer = Consumer(self.producer, self.apogee_calculator, self.gps_processor, self.orientation_processor)
@@ -34,18 +42,20 @@ class ConsumerTest(unittest.TestCase):
     def test_getitem(self):
         time_stamps = [0, 1, 2, 3, 4, 5]
 
-        self.consumer.data["time_stamp"] = time_stamps
+        self.consumer.data.append({"time_stamp": np.array(time_stamps)})
 
-        self.assertEqual(self.consumer["time_stamp"], time_stamps)
-        self.assertEqual(self.consumer["altitude"], [])
+        self.assertEqual(self.consumer["time_stamp"].tolist(), time_stamps)
+        self.assertEqual(self.consumer["altitude"].tolist(), [0] * len(time_stamps))
         self.assertRaises(KeyError, self.consumer.__getitem__, "invalid_key")
 
     def test_update(self):
         number_of_properties = len(RocketPacket().keys())
         dummy_data_list1 = [i for i in range(number_of_properties)]
         dummy_data_list2 = [2 * i for i in range(number_of_properties)]
+        dummy_data_list1[27:29] = [b'N', b'W']
+        dummy_data_list2[27:29] = [b'S', b'E']
         rocket_packet_list = [RocketPacket(dummy_data_list1), RocketPacket(dummy_data_list2)]
-        self.producer.get_available_rocket_packets = Mock(return_value=rocket_packet_list)
+        self.add_rocket_packets(rocket_packet_list)
 
         self.consumer.update()
 
@@ -54,15 +64,196 @@ class ConsumerTest(unittest.TestCase):
             for key, value in rocket_packet_list[i].items():
                 self.assertEqual(self.consumer[key][i], value)
 
-    def test_update_with_no_data(self):
-        self.producer.get_available_rocket_packets = Mock(return_value=[])
+    def test_update_should_convert_altitude_to_feet(self):
+        rocket_packet = self.create_rocket_packet(0)
+        rocket_packet.altitude = 100
+        self.add_rocket_packets([rocket_packet])
+
+        self.consumer.update()
+
+        self.assertAlmostEqual(self.consumer["altitude_feet"][0], 328.084)
+
+    def test_update_should_store_columns_with_rocket_packet_types(self):
+        rocket_packet_dtype = RocketPacketParser2019().get_dtype()
+        self.consumer = Consumer(self.producer, self.apogee_calculator, self.gps_processor, self.orientation_processor,
+                                 rocket_packet_dtype)
+        self.add_rocket_packets([self.create_rocket_packet(0)])
 
         self.consumer.update()
 
+        self.assertEqual(self.consumer["pressure"].dtype, np.uint32)
+        self.assertEqual(self.consumer["magnetometer_x"].dtype, np.int16)
+        self.assertEqual(self.consumer["voltage"].dtype, np.float64)
+        self.assertEqual(self.consumer["ns_indicator"].dtype, np.dtype("S1"))
+
+    def test_update_with_no_data(self):
+        data_changed = self.consumer.update()
+
+        self.assertFalse(data_changed)
         self.assertEqual(len(self.consumer["time_stamp"]), 0)
 
+    def test_update_should_return_true_when_data_changed(self):
+        self.add_rocket_packets([self.create_rocket_packet(0)])
+
+        self.assertTrue(self.consumer.update())
+        self.producer.rocket_packets.clear()
+        self.assertTrue(self.consumer.update())
+
+    def test_create_snapshot_should_keep_data_of_last_update(self):
+        self.gps_processor.get_projected_coordinates.return_value = ([], [])
+        self.add_rocket_packets([self.create_rocket_packet(0)])
+        self.consumer.update()
+
+        snapshot = self.consumer.create_snapshot()
+        self.add_rocket_packets([self.create_rocket_packet(1)])
+        self.consumer.update()
+
+        self.assertEqual(snapshot["time_stamp"].tolist(), [0])
+        self.assertEqual(snapshot.get_apogee(), self.APOGEE)
+
+    def test_create_snapshot_should_keep_base_camp_spread(self):
+        self.gps_processor.get_projected_coordinates.return_value = ([], [])
+        self.gps_processor.get_base_camp_spread.return_value = UTMCoordinates(0.5, 1.5)
+
+        snapshot = self.consumer.create_snapshot()
+
+        self.assertEqual(snapshot.get_base_camp_spread(), UTMCoordinates(0.5, 1.5))
+
+    def test_create_snapshot_should_keep_orientation_spread(self):
+        spread = Orientation(0.5, 1.5, 0)
+        self.orientation_processor.get_initialization_spread.return_value = spread
+
+        snapshot = self.consumer.create_snapshot()
+
+        self.assertEqual(snapshot.get_orientation_spread(), spread)
+
+    def test_create_snapshot_should_change_generation_after_rollback(self):
+        self.gps_processor.get_projected_coordinates.return_value = ([], [])
+        self.add_rocket_packets([self.create_rocket_packet(0), self.create_rocket_packet(1)])
+        self.consumer.update()
+        snapshot = self.consumer.create_snapshot()
+
+        self.producer.rocket_packets.truncate(1)
+        self.add_rocket_packets([self.create_rocket_packet(2), self.create_rocket_packet(3)])
+        self.consumer.update()
+
+        self.assertNotEqual(self.consumer.create_snapshot().get_generation(), snapshot.get_generation())
+
+    def test_create_snapshot_should_give_kept_lengths_since_previous_snapshot(self):
+        self.add_rocket_packets([self.create_rocket_packet(i) for i in range(4)])
+        self.consumer.update()
+        self.gps_processor.get_projected_coordinates.return_value = (np.zeros(2), np.zeros(2))
+        snapshot = self.consumer.create_snapshot()
+
+        self.producer.rocket_packets.truncate(3)
+        self.consumer.update()
+        self.producer.rocket_packets.truncate(1)
+        self.consumer.update()
+
+        new_snapshot = self.consumer.create_snapshot()
+        self.assertEqual(new_snapshot.get_generation().get_kept_length(snapshot.get_generation()), 1)
+        self.assertEqual(new_snapshot.get_positions_generation().get_kept_length(
+            snapshot.get_positions_generation()), 2)
+
+    def test_update_should_only_process_new_packets(self):
+        self.add_rocket_packets([self.create_rocket_packet(0), self.create_rocket_packet(1)])
+        self.consumer.update()
+        self.add_rocket_packets([self.create_rocket_packet(2)])
+
+        self.consumer.update()
+
+        self.assertEqual(self.consumer["time_stamp"].tolist(), [0, 1, 2])
+        self.assertEqual(self.get_gps_processed_time_stamps(), [0, 1, 2])
+        self.assertEqual(self.orientation_processor.update.call_count, 3)
+
+    def test_update_should_keep_data_when_no_new_packet(self):
+        self.add_rocket_packets([self.create_rocket_packet(0)])
+        self.consumer.update()
+
+        self.consumer.update()
+
+        self.assertEqual(self.consumer["time_stamp"].tolist(), [0])
+        self.gps_processor.update_columns.assert_called_once_with(ANY)
+
+    def test_update_should_roll_back_when_producer_packets_were_removed(self):
+        self.add_rocket_packets([self.create_rocket_packet(i) for i in range(3)])
+        self.consumer.update()
+        self.producer.rocket_packets.pop()
+
+        self.consumer.update()
+
+        self.assertEqual(self.consumer["time_stamp"].tolist(), [0, 1])
+        self.assertEqual(self.consumer["altitude_feet"].tolist(), [0, 0])
+
+    def test_update_should_roll_back_before_appending_when_producer_packets_were_replaced(self):
+        self.add_rocket_packets([self.create_rocket_packet(i) for i in range(3)])
+        self.consumer.update()
+        self.producer.rocket_packets.clear()
+        self.add_rocket_packets([self.create_rocket_packet(i) for i in range(10, 14)])
+
+        self.consumer.update()
+
+        self.assertEqual(self.consumer["time_stamp"].tolist(), [10, 11, 12, 13])
+
+    def test_rollback_should_reprocess_kept_packets(self):
+        self.add_rocket_packets([self.create_rocket_packet(i) for i in range(3)])
+        self.consumer.update()
+        self.gps_processor.reset_mock()
+        self.orientation_processor.reset_mock()
+
+        self.consumer.rollback(2)
+
+        self.gps_processor.reset.assert_called_with()
+        self.orientation_processor.reset.assert_called_with()
+        self.apogee_calculator.reset.assert_called_with()
+        self.assertEqual(self.get_gps_processed_time_stamps(), [0, 1])
+        self.assertEqual(self.orientation_processor.update.call_count, 2)
+
+    def test_update_should_save_checkpoint_every_checkpoint_interval(self):
+        self.consumer = Consumer(self.producer, self.apogee_calculator, self.gps_processor, self.orientation_processor,
+                                 checkpoint_interval=2)
+        self.add_rocket_packets([self.create_rocket_packet(i) for i in range(5)])
+
+        self.consumer.update()
+
+        self.assertEqual([packet_count for packet_count, _ in self.consumer.checkpoints], [2, 4])
+
+    def test_rollback_should_restore_last_checkpoint_and_reprocess_only_following_packets(self):
+        self.consumer = Consumer(self.producer, self.apogee_calculator, self.gps_processor, self.orientation_processor,
+                                 checkpoint_interval=2)
+        self.add_rocket_packets([self.create_rocket_packet(i) for i in range(7)])
+        self.consumer.update()
+        self.gps_processor.reset_mock()
+        self.orientation_processor.reset_mock()
+
+        self.consumer.rollback(5)
+
+        self.gps_processor.reset.assert_not_called()
+        self.gps_processor.set_state.assert_called_with(self.gps_processor.get_state.return_value)
+        self.orientation_processor.set_state.assert_called_with(self.orientation_processor.get_state.return_value)
+        self.apogee_calculator.set_state.assert_called_with(self.apogee_calculator.get_state.return_value)
+        self.assertEqual(self.get_gps_processed_time_stamps(), [4])
+        self.assertEqual([packet_count for packet_count, _ in self.consumer.checkpoints], [2, 4])
+
+    def test_rollback_should_give_same_state_as_processing_from_start(self):
+        rocket_packets = [self.create_moving_rocket_packet(i) for i in range(50)]
+        self.consumer = self.create_consumer_with_real_processors(checkpoint_interval=8)
+        self.consumer.data_producer.rocket_packets.extend(rocket_packets)
+        self.consumer.update()
+
+        self.consumer.rollback(21)
+
+        expected_consumer = self.create_consumer_with_real_processors(checkpoint_interval=8)
+        expected_consumer.data_producer.rocket_packets.extend(rocket_packets[:21])
+        expected_consumer.update()
+        orientation = self.consumer.get_rocket_orientation()
+        expected_orientation = expected_consumer.get_rocket_orientation()
+        self.assertEqual((orientation.roll, orientation.pitch, orientation.yaw),
+                         (expected_orientation.roll, expected_orientation.pitch, expected_orientation.yaw))
+        self.assertEqual(self.consumer.get_apogee(), expected_consumer.get_apogee())
+
     def test_clear_should_empty_data_lists(self):
-        self.producer.get_available_rocket_packets = Mock(return_value=[RocketPacket()])
+        self.add_rocket_packets([RocketPacket()])
         self.consumer.update()
 
         self.consumer.clear()
@@ -70,11 +261,11 @@ class ConsumerTest(unittest.TestCase):
         self.assert_consumer_contains_no_data()
 
     def assert_consumer_contains_no_data(self):
-        for data_list in self.consumer.data.values():
-            self.assertEqual(len(data_list), 0)
+        for key in self.consumer.data.keys():
+            self.assertEqual(len(self.consumer[key]), 0)
 
     def test_has_data_should_return_true_when_consumer_has_data(self):
-        self.producer.get_available_rocket_packets = Mock(return_value=[RocketPacket()])
+        self.add_rocket_packets([RocketPacket()])
         self.consumer.update()
 
         consumer_has_data = self.consumer.has_data()
@@ -82,9 +273,37 @@ class ConsumerTest(unittest.TestCase):
         self.assertTrue(consumer_has_data)
 
     def test_has_data_should_return_false_when_consumer_has_no_data(self):
-        self.producer.get_available_rocket_packets = Mock(return_value=[])
         self.consumer.update()
 
         consumer_has_data = self.consumer.has_data()
 
         self.assertFalse(consumer_has_data)
+
+    def get_gps_processed_time_stamps(self):
+        return [time_stamp for call in self.gps_processor.update_columns.call_args_list
+                for time_stamp in call[0][0]["time_stamp"].tolist()]
+
+    def add_rocket_packets(self, rocket_packets):
+        for rocket_packet in rocket_packets:
+            self.producer.add_rocket_packet(rocket_packet)
+
+    def create_consumer_with_real_processors(self, checkpoint_interval):
+        orientation_processor = OrientationProcessor(OrientationInitializer(1), AngularSpeedIntegrator())
+        return Consumer(DataProducer(threading.Lock()), ApogeeCalculator(), self.gps_processor, orientation_processor,
+                        checkpoint_interval=checkpoint_interval)
+
+    @staticmethod
+    def create_moving_rocket_packet(timestamp):
+        rocket_packet = RocketPacket()
+        rocket_packet.time_stamp = timestamp / 10
+        rocket_packet.acceleration_z = 1
+        rocket_packet.angular_speed_x = timestamp % 7
+        rocket_packet.angular_speed_y = timestamp % 3
+        rocket_packet.altitude = 100 * timestamp - 3 * timestamp ** 2
+        return rocket_packet
+
+    @staticmethod
+    def create_rocket_packet(timestamp):
+        rocket_packet = RocketPacket()
+        rocket_packet.time_stamp = timestamp
+        return rocket_packet
@@ -0,0 +1,92 @@
+import threading
+import unittest
+from unittest.mock import Mock, MagicMock
+
+from src.data_processing.consumer import Consumer
+from src.data_processing.consumer_snapshot import ConsumerSnapshot
+from src.data_processing.consumer_worker import ConsumerWorker
+from src.data_producer import DataProducer
+
+
+class ConsumerWorkerTest(unittest.TestCase):
+    TIMEOUT_IN_SECONDS = 1
+
+    def setUp(self):
+        self.data_producer = Mock(spec=DataProducer)
+        self.consumer = MagicMock(spec=Consumer)
+        self.snapshot = Mock(spec=ConsumerSnapshot)
+        self.consumer.create_snapshot.return_value = self.snapshot
+        self.snapshot_listener = Mock()
+
+        self.consumer_worker = ConsumerWorker(self.consumer, self.data_producer)
+        self.consumer_worker.snapshot_ready.connect(self.snapshot_listener)
+
+    def tearDown(self):
+        self.consumer_worker.stop()
+
+    def test_update_should_publish_snapshot_when_consumer_data_changed(self):
+        self.consumer.update.return_value = True
+
+        snapshot = self.consumer_worker.update()
+
+        self.assertEqual(snapshot, self.snapshot)
+        self.snapshot_listener.assert_called_with(self.snapshot)
+
+    def test_update_should_not_publish_snapshot_when_consumer_data_did_not_change(self):
+        self.consumer.update.return_value = False
+
+        snapshot = self.consumer_worker.update()
+
+        self.assertIsNone(snapshot)
+        self.consumer.create_snapshot.assert_not_called()
+        self.snapshot_listener.assert_not_called()
+
+    def test_start_should_register_worker_as_data_producer_listener(self):
+        self.consumer.update.return_value = False
+
+        self.consumer_worker.start()
+
+        self.data_producer.register_listener.assert_called_with(self.consumer_worker)
+
+    def test_start_should_process_packets_produced_before_start(self):
+        updated = threading.Event()
+        self.consumer.update.side_effect = lambda: updated.set()
+
+        self.consumer_worker.start()
+
+        self.assertTrue(updated.wait(self.TIMEOUT_IN_SECONDS))
+
+    def test_notify_new_data_should_update_consumer_from_worker_thread(self):
+        updated = threading.Semaphore(0)
+        self.consumer.update.side_effect = lambda: updated.release()
+        self.consumer_worker.start()
+        self.assertTrue(updated.acquire(timeout=self.TIMEOUT_IN_SECONDS))
+
+        self.consumer_worker.notify_new_data()
+
+        self.assertTrue(updated.acquire(timeout=self.TIMEOUT_IN_SECONDS))
+
+    def test_worker_thread_should_keep_running_when_update_raises(self):
+        updated = threading.Semaphore(0)
+
+        def update():
+            updated.release()
+            raise ValueError()
+
+        self.consumer.update.side_effect = update
+        self.consumer_worker.start()
+        self.assertTrue(updated.acquire(timeout=self.TIMEOUT_IN_SECONDS))
+
+        self.consumer_worker.notify_new_data()
+
+        self.assertTrue(updated.acquire(timeout=self.TIMEOUT_IN_SECONDS))
+        self.assertTrue(self.consumer_worker.is_running())
+
+    def test_stop_should_stop_worker_thread(self):
+        self.consumer.update.return_value = False
+        self.consumer_worker.start()
+
+        self.consumer_worker.stop()
+
+        self.assertFalse(self.consumer_worker.is_running())
+        self.data_producer.unregister_listener.assert_called_with(self.consumer_worker)
@@ -0,0 +1,30 @@
+import unittest
+
+from src.data_processing.generation import Generation
+
+
+class GenerationTest(unittest.TestCase):
+
+    def test_cut_should_give_next_generation(self):
+        generation = Generation()
+
+        self.assertNotEqual(generation.cut(10), generation)
+        self.assertEqual(generation.cut(10), Generation(1))
+
+    def test_get_kept_length_should_return_shortest_length_kept_since_previous_generation(self):
+        previous = Generation().cut(5)
+
+        generation = previous.cut(10).cut(3).cut(20)
+
+        self.assertEqual(generation.get_kept_length(previous), 3)
+
+    def test_get_kept_length_should_return_zero_when_cuts_since_previous_generation_are_forgotten(self):
+        previous = Generation()
+        generation = previous
+        for _ in range(Generation.MAX_CUT_COUNT + 1):
+            generation = generation.cut(10)
+
+        self.assertEqual(generation.get_kept_length(previous), 0)
+
+    def test_get_kept_length_should_return_zero_without_previous_generation(self):
+        self.assertEqual(Generation().cut(10).get_kept_length(None), 0)
@@ -0,0 +1,137 @@
+import unittest
+
+import numpy as np
+
+from src.data_processing.generation import Generation
+from src.data_processing.min_max_decimator import MinMaxDecimator
+
+
+class MinMaxDecimatorTest(unittest.TestCase):
+    SAMPLE_COUNT = 10000
+    MAX_POINTS = 200
+
+    def setUp(self):
+        self.x = np.arange(self.SAMPLE_COUNT) / 10.0
+        self.y = np.sin(self.x) * self.x
+        self.decimator = MinMaxDecimator()
+
+    def test_get_points_should_return_all_samples_when_they_fit(self):
+        self.decimator.update(self.x[:50], self.y[:50])
+
+        x, y = self.decimator.get_points(self.MAX_POINTS)
+
+        self.assertEqual(x.tolist(), self.x[:50].tolist())
+        self.assertEqual(y.tolist(), self.y[:50].tolist())
+
+    def test_get_points_should_return_at_most_max_points(self):
+        self.decimator.update(self.x, self.y)
+
+        x, _ = self.decimator.get_points(self.MAX_POINTS)
+
+        self.assertLessEqual(len(x), self.MAX_POINTS + 1)
+
+    def test_get_points_should_keep_extremes_and_last_sample(self):
+        self.decimator.update(self.x, self.y)
+
+        x, y = self.decimator.get_points(self.MAX_POINTS)
+
+        self.assertEqual(y.max(), self.y.max())
+        self.assertEqual(y.min(), self.y.min())
+        self.assertEqual(x[-1], self.x[-1])
+
+    def test_get_points_should_keep_extremes_of_visible_range(self):
+        self.decimator.update(self.x, self.y)
+        x_min, x_max = 123.4, 567.8
+
+        x, y = self.decimator.get_points(self.MAX_POINTS, x_min, x_max)
+
+        visible = (self.x >= x_min) & (self.x <= x_max)
+        self.assertLessEqual(x[0], x_min)
+        self.assertGreaterEqual(x[-1], x_max)
+        self.assertEqual(y.max(), self.y[visible].max())
+        self.assertEqual(y.min(), self.y[visible].min())
+
+    def test_get_points_should_return_raw_samples_of_visible_range_when_they_fit(self):
+        self.decimator.update(self.x, self.y)
+        x_min, x_max = 500.0, 510.0
+
+        x, y = self.decimator.get_points(self.MAX_POINTS, x_min, x_max)
+
+        first, last = np.searchsorted(self.x, x_min) - 1, np.searchsorted(self.x, x_max, side="right") + 1
+        self.assertEqual(x.tolist(), self.x[first:last].tolist())
+        self.assertEqual(y.tolist(), self.y[first:last].tolist())
+
+    def test_update_should_give_same_pyramid_when_samples_arrive_in_batches(self):
+        other_decimator = MinMaxDecimator()
+        other_decimator.update(self.x, self.y)
+
+        for length in range(0, self.SAMPLE_COUNT + 1, 777):
+            self.decimator.update(self.x[:length], self.y[:length])
+        self.decimator.update(self.x, self.y)
+
+        self.assertEqual(self.decimator.get_indices(self.MAX_POINTS).tolist(),
+                         other_decimator.get_indices(self.MAX_POINTS).tolist())
+
+    def test_update_should_rebuild_pyramid_when_history_was_truncated(self):
+        self.decimator.update(self.x, self.y)
+
+        self.decimator.update(self.x[:10], self.y[:10])
+
+        self.assertEqual(len(self.decimator), 10)
+        self.assertEqual(self.decimator.get_points(self.MAX_POINTS)[1].tolist(), self.y[:10].tolist())
+
+    def test_update_should_rebuild_pyramid_when_generation_changes(self):
+        self.decimator.update(None, self.y[:10], generation=Generation())
+        other_y = self.y[:20] + 1000
+
+        self.decimator.update(None, other_y, generation=Generation(1))
+
+        self.assertEqual(self.decimator.get_points(self.MAX_POINTS)[1].tolist(), other_y.tolist())
+
+    def test_update_should_cut_pyramid_back_to_length_kept_by_new_generation(self):
+        generation = Generation()
+        self.decimator.update(self.x, self.y, generation=generation)
+        kept_length = self.SAMPLE_COUNT // 3
+        other_y = np.concatenate([self.y[:kept_length], self.y[kept_length:] + 1000])
+        other_decimator = MinMaxDecimator()
+        other_decimator.update(self.x, other_y)
+
+        self.decimator.update(self.x, other_y, generation=generation.cut(kept_length + 10).cut(kept_length))
+
+        self.assertEqual(self.decimator.get_indices(self.MAX_POINTS).tolist(),
+                         other_decimator.get_indices(self.MAX_POINTS).tolist())
+        self.assertEqual(self.decimator.get_points(self.MAX_POINTS)[1].tolist(),
+                         other_decimator.get_points(self.MAX_POINTS)[1].tolist())
+
+    def test_truncate_should_only_keep_buckets_of_kept_samples(self):
+        self.decimator.update(None, self.y[:20])
+
+        self.decimator.truncate(5)
+
+        self.assertEqual(len(self.decimator), 5)
+        self.assertEqual(self.decimator.get_level_count(), 2)
+
+    def test_update_should_extend_pyramid_when_generation_is_unchanged(self):
+        self.decimator.update(None, self.y[:10], generation=Generation(1))
+
+        self.decimator.update(None, self.y[:20] + 1000, generation=Generation(1))
+
+        self.assertEqual(self.decimator.get_points(self.MAX_POINTS)[1].tolist(),
+                         self.y[:10].tolist() + (self.y[10:20] + 1000).tolist())
+
+    def test_update_should_use_sample_index_when_x_is_none(self):
+        self.decimator.update(None, [5.0, 6.0, 7.0])
+
+        x, _ = self.decimator.get_points(self.MAX_POINTS)
+
+        self.assertEqual(x.tolist(), [0.0, 1.0, 2.0])
+
+    def test_get_points_should_keep_extremes_of_every_series(self):
+        decimator = MinMaxDecimator(series_count=2)
+        other_y = np.cos(self.x / 3) * self.x
+        decimator.update(None, self.y, other_y)
+
+        _, y, decimated_other_y = decimator.get_points(self.MAX_POINTS)
+
+        self.assertEqual(y.max(), self.y.max())
+        self.assertEqual(decimated_other_y.min(), other_y.min())
@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+import numpy as np
+
+from src.data_processing.running_statistics import RunningStatistics
+
+
+class RunningStatisticsTest(TestCase):
+    # Values far from zero, like UTM northings, where a naive sum of squares loses its precision
+    VALUES = [5000000.1, 5000000.4, 4999999.8, 5000000.3, 5000000.0]
+
+    def setUp(self):
+        self.running_statistics = RunningStatistics()
+
+    def test_init_should_have_no_spread(self):
+        self.assertEqual(self.running_statistics.count, 0)
+        self.assertEqual(self.running_statistics.get_variance(), 0.0)
+        self.assertEqual(self.running_statistics.get_standard_deviation(), 0.0)
+
+    def test_update_should_compute_mean_and_variance_of_values(self):
+        for value in self.VALUES:
+            self.running_statistics.update(value)
+
+        self.assertEqual(self.running_statistics.count, len(self.VALUES))
+        self.assertAlmostEqual(self.running_statistics.mean, np.mean(self.VALUES), places=6)
+        self.assertAlmostEqual(self.running_statistics.get_variance(), np.var(self.VALUES), places=6)
+        self.assertAlmostEqual(self.running_statistics.get_standard_deviation(), np.std(self.VALUES), places=6)
+
+    def test_reset_should_forget_values(self):
+        self.running_statistics.update(1.0)
+        self.running_statistics.update(3.0)
+
+        self.running_statistics.reset()
+
+        self.assertEqual(self.running_statistics.count, 0)
+        self.assertEqual(self.running_statistics.mean, 0.0)
+        self.assertEqual(self.running_statistics.get_variance(), 0.0)
+
+    def test_set_state_should_forget_values_updated_after_get_state(self):
+        self.running_statistics.update(1.0)
+        self.running_statistics.update(3.0)
+        state = self.running_statistics.get_state()
+        self.running_statistics.update(11.0)
+
+        self.running_statistics.set_state(state)
+
+        self.assertEqual(self.running_statistics.count, 2)
+        self.assertEqual(self.running_statistics.mean, 2.0)
+        self.assertEqual(self.running_statistics.get_variance(), 1.0)
@@ -0,0 +1,147 @@
+import errno
+import os
+import unittest
+
+import numpy as np
+
+from src.domain_error import DomainError
+from src.persistence.binary_data_persister import BinaryDataPersister
+
+
+class BinaryDataPersisterTest(unittest.TestCase):
+    TEMPORARY_FILENAME = "tmp.bin"
+    ROCKET_PACKET_VERSION = 2019
+    FIELD_NAMES = ["time_stamp", "altitude", "pressure", "ns_indicator"]
+    CHUNK_SIZE = 4
+    PACKET_COUNT = 10
+    SAMPLING_FREQUENCY = 2.0
+
+    def setUp(self):
+        self.columns = {
+            "time_stamp": np.arange(self.PACKET_COUNT, dtype=np.float64) / self.SAMPLING_FREQUENCY,
+            "altitude": np.linspace(0, 1000, self.PACKET_COUNT, dtype=np.float32),
+            "pressure": np.arange(self.PACKET_COUNT, dtype=np.uint32) * 1000,
+            "ns_indicator": np.array([b'N'] * self.PACKET_COUNT, dtype="S1")
+        }
+
+        self.persister = BinaryDataPersister(self.CHUNK_SIZE)
+
+    def test_save_columns_load_columns_should_keep_values_and_types(self):
+        self.persister.save_columns(self.TEMPORARY_FILENAME, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                                    self.columns)
+
+        version, columns = self.persister.load_columns(self.TEMPORARY_FILENAME)
+
+        self.assertEqual(version, self.ROCKET_PACKET_VERSION)
+        self.assertEqual(list(columns.keys()), self.FIELD_NAMES)
+        for name in self.FIELD_NAMES:
+            self.assertEqual(columns[name].dtype, self.columns[name].dtype)
+            np.testing.assert_array_equal(columns[name], self.columns[name])
+
+    def test_load_columns_should_return_views_of_file_when_single_chunk(self):
+        self.persister = BinaryDataPersister(chunk_size=self.PACKET_COUNT)
+        self.persister.save_columns(self.TEMPORARY_FILENAME, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                                    self.columns)
+
+        _, columns = self.persister.load_columns(self.TEMPORARY_FILENAME)
+
+        self.assertFalse(columns["altitude"].flags.owndata)
+        self.assertFalse(columns["altitude"].flags.writeable)
+
+    def test_save_load(self):
+        all_rocket_packets_fields = [[0.0, 10.5, 1000, "N"], [0.5, 11.5, 1001, "S"]]
+        self.persister.save(self.TEMPORARY_FILENAME, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            all_rocket_packets_fields)
+
+        version, loaded_packets_fields = self.persister.load(self.TEMPORARY_FILENAME)
+
+        self.assertEqual(version, self.ROCKET_PACKET_VERSION)
+        self.assertEqual(loaded_packets_fields, all_rocket_packets_fields)
+
+    def test_load_should_return_fields_in_order_of_file_over_several_chunks(self):
+        self.persister.save_columns(self.TEMPORARY_FILENAME, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                                    self.columns)
+
+        _, loaded_packets_fields = self.persister.load(self.TEMPORARY_FILENAME)
+
+        self.assertEqual(len(loaded_packets_fields), self.PACKET_COUNT)
+        self.assertEqual(loaded_packets_fields[5], [2.5, self.columns["altitude"][5].item(), 5000, b'N'])
+
+    def test_save_load_without_packets(self):
+        self.persister.save(self.TEMPORARY_FILENAME, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES, [])
+
+        version, loaded_packets_fields = self.persister.load(self.TEMPORARY_FILENAME)
+
+        self.assertEqual(version, self.ROCKET_PACKET_VERSION)
+        self.assertEqual(loaded_packets_fields, [])
+
+    def test_iter_load_should_yield_one_chunk_per_chunk_of_file(self):
+        self.persister.save_columns(self.TEMPORARY_FILENAME, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                                    self.columns)
+
+        version, chunks = self.persister.iter_load(self.TEMPORARY_FILENAME)
+
+        self.assertEqual(version, self.ROCKET_PACKET_VERSION)
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+
+    def test_save_stream_should_write_chunks_before_end_of_stream(self):
+        file_sizes = []
+
+        def get_chunks():
+            for i in range(3):
+                yield [[i * 2 + 0.0, 10.5, 1000, "N"], [i * 2 + 1.0, 11.5, 1001, "S"]]
+                file_sizes.append(os.path.getsize(self.TEMPORARY_FILENAME))
+
+        self.persister.save_stream(self.TEMPORARY_FILENAME, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                                   get_chunks())
+
+        self.assertEqual(file_sizes[0], 0)
+        self.assertGreater(file_sizes[1], 0)
+        _, chunks = self.persister.iter_load(self.TEMPORARY_FILENAME)
+        self.assertEqual([[packet_fields[0] for packet_fields in chunk] for chunk in chunks],
+                         [[0.0, 1.0, 2.0, 3.0], [4.0, 5.0]])
+        header = self.persister.load_header(self.TEMPORARY_FILENAME)
+        self.assertAlmostEqual(header["sampling_frequency"], 1.0)
+
+    def test_save_stream_should_convert_written_integers_when_later_chunk_has_floats(self):
+        chunks = [[[0.0, 10, 1000, "N"]] * self.CHUNK_SIZE, [[2.0, 10.5, 1001, "S"]]]
+
+        self.persister.save_stream(self.TEMPORARY_FILENAME, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES, chunks)
+
+        header = self.persister.load_header(self.TEMPORARY_FILENAME)
+        self.assertEqual(np.dtype(header["fields"][1][1]), np.float64)
+        _, loaded_packets_fields = self.persister.load(self.TEMPORARY_FILENAME)
+        self.assertEqual([packet_fields[1] for packet_fields in loaded_packets_fields], [10.0] * 4 + [10.5])
+        self.assertEqual(loaded_packets_fields[-1], [2.0, 10.5, 1001, "S"])
+
+    def test_load_header_should_return_schema_and_sampling_frequency(self):
+        self.persister.save_columns(self.TEMPORARY_FILENAME, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                                    self.columns)
+
+        header = self.persister.load_header(self.TEMPORARY_FILENAME)
+
+        self.assertEqual([name for name, _ in header["fields"]], self.FIELD_NAMES)
+        self.assertAlmostEqual(header["sampling_frequency"], self.SAMPLING_FREQUENCY)
+        self.assertEqual(header["chunk_size"], self.CHUNK_SIZE)
+
+    def test_load_time_range_should_only_return_packets_in_range(self):
+        self.persister.save_columns(self.TEMPORARY_FILENAME, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                                    self.columns)
+
+        _, columns = self.persister.load_time_range(self.TEMPORARY_FILENAME, 1.5, 3)
+
+        np.testing.assert_array_equal(columns["time_stamp"], [1.5, 2, 2.5, 3])
+        np.testing.assert_array_equal(columns["pressure"], [3000, 4000, 5000, 6000])
+
+    def test_load_should_raise_domain_error_when_file_is_not_binary_recording(self):
+        with open(self.TEMPORARY_FILENAME, "w") as file:
+            file.write("2019\n" + ",".join(self.FIELD_NAMES) * 4)
+
+        self.assertRaises(DomainError, self.persister.load, self.TEMPORARY_FILENAME)
+
+    def tearDown(self):
+        try:
+            os.remove(self.TEMPORARY_FILENAME)
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
@@ -57,6 +57,25 @@ class CsvDataPersisterTest(unittest.TestCase):
         self.assertEqual(version, self.ROCKET_PACKET_VERSION)
         self.assertEqual(loaded_packets_fields, self.ALL_ROCKET_PACKETS_FIELDS)
 
+    def test_iter_load_should_return_packets_fields_in_chunks_of_chunk_size(self):
+        self.persister = CsvDataPersister(chunk_size=2)
+        self.persister.save(self.TEMPORARY_FILENAME, self.ROCKET_PACKET_VERSION, self.ROCKET_PACKET_FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS)
+
+        version, chunks = self.persister.iter_load(self.TEMPORARY_FILENAME)
+
+        self.assertEqual(version, self.ROCKET_PACKET_VERSION)
+        self.assertEqual(list(chunks), [self.ALL_ROCKET_PACKETS_FIELDS[:2], self.ALL_ROCKET_PACKETS_FIELDS[2:]])
+
+    def test_save_stream_should_write_every_chunk(self):
+        chunks = iter([self.ALL_ROCKET_PACKETS_FIELDS[:1], self.ALL_ROCKET_PACKETS_FIELDS[1:]])
+
+        self.persister.save_stream(self.TEMPORARY_FILENAME, self.ROCKET_PACKET_VERSION, self.ROCKET_PACKET_FIELD_NAMES,
+                                   chunks)
+
+        _, loaded_packets_fields = self.persister.load(self.TEMPORARY_FILENAME)
+        self.assertEqual(loaded_packets_fields, self.ALL_ROCKET_PACKETS_FIELDS)
+
     def read_version_from_file(self, filename: str):
         with open(filename, newline=self.persister.newline) as file:
             reader = csv.reader(file, delimiter=self.persister.delimiter)
@@ -0,0 +1,28 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.persistence.file_hash import hash_file, hash_text
+
+
+class FileHashTest(unittest.TestCase):
+    CONTENT = "Gaul Avionique"
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, "flight.csv")
+        with open(self.filename, "w") as file:
+            file.write(self.CONTENT)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_hash_file_should_return_truncated_sha256_of_content(self):
+        digest = hash_file(self.filename, digest_size=8)
+
+        self.assertEqual(digest, hashlib.sha256(self.CONTENT.encode("utf-8")).hexdigest()[:16])
+
+    def test_hash_text_should_match_hash_of_file_with_same_content(self):
+        self.assertEqual(hash_text(self.CONTENT), hash_file(self.filename))
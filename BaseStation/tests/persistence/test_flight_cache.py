@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+
+from src.persistence.binary_data_persister import BinaryDataPersister
+from src.persistence.csv_data_persister import CsvDataPersister
+from src.persistence.flight_cache import FlightCache
+
+
+class FlightCacheTest(unittest.TestCase):
+    ROCKET_PACKET_VERSION = 2019
+    FIELD_NAMES = ["time_stamp", "altitude", "ns_indicator"]
+    ALL_ROCKET_PACKETS_FIELDS = [[0.0, 10.5, "N"], [1.0, 20.5, "N"], [2.0, 30.5, "S"]]
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.flight_filename = os.path.join(self.directory.name, "flight.csv")
+        CsvDataPersister().save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                                self.ALL_ROCKET_PACKETS_FIELDS)
+
+        self.flight_cache = FlightCache(os.path.join(self.directory.name, "cache"),
+                                        binary_data_persister=BinaryDataPersister(chunk_size=2))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_should_return_none_when_flight_is_not_cached(self):
+        self.assertIsNone(self.flight_cache.load(self.flight_filename))
+
+    def test_load_should_return_stored_fields_by_chunks(self):
+        self.store(self.flight_filename, self.ALL_ROCKET_PACKETS_FIELDS)
+
+        version, chunks = self.flight_cache.load(self.flight_filename)
+
+        self.assertEqual(version, self.ROCKET_PACKET_VERSION)
+        self.assertEqual(list(chunks), [self.ALL_ROCKET_PACKETS_FIELDS[:2], self.ALL_ROCKET_PACKETS_FIELDS[2:]])
+
+    def test_store_should_pass_chunks_through(self):
+        chunks = [self.ALL_ROCKET_PACKETS_FIELDS[:1], self.ALL_ROCKET_PACKETS_FIELDS[1:]]
+
+        stored_chunks = list(self.flight_cache.store(self.flight_filename, self.ROCKET_PACKET_VERSION,
+                                                     self.FIELD_NAMES, iter(chunks)))
+
+        self.assertEqual(stored_chunks, chunks)
+
+    def test_store_should_not_cache_flight_until_every_chunk_was_read(self):
+        chunks = self.flight_cache.store(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                                         iter([self.ALL_ROCKET_PACKETS_FIELDS]))
+
+        next(chunks)
+
+        self.assertIsNone(self.flight_cache.load(self.flight_filename))
+
+    def test_store_should_not_cache_column_mixing_text_and_numbers(self):
+        self.store(self.flight_filename, [[0.0, 10.5, "N"], [1.0, 20.5, 0.0]])
+
+        self.assertIsNone(self.flight_cache.load(self.flight_filename))
+
+    def test_load_should_return_none_when_flight_file_was_modified(self):
+        self.store(self.flight_filename, self.ALL_ROCKET_PACKETS_FIELDS)
+
+        CsvDataPersister().save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                                self.ALL_ROCKET_PACKETS_FIELDS[:1])
+
+        self.assertIsNone(self.flight_cache.load(self.flight_filename))
+
+    def test_store_should_replace_entry_of_modified_flight_file(self):
+        self.store(self.flight_filename, self.ALL_ROCKET_PACKETS_FIELDS)
+        CsvDataPersister().save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                                self.ALL_ROCKET_PACKETS_FIELDS[:1])
+
+        self.store(self.flight_filename, self.ALL_ROCKET_PACKETS_FIELDS[:1])
+
+        self.assertEqual(len(os.listdir(self.flight_cache.directory)), 1)
+
+    def test_evict_should_delete_least_recently_used_entries_above_max_size(self):
+        other_flight_filename = os.path.join(self.directory.name, "other_flight.csv")
+        CsvDataPersister().save(other_flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                                self.ALL_ROCKET_PACKETS_FIELDS)
+        self.store(self.flight_filename, self.ALL_ROCKET_PACKETS_FIELDS)
+        self.store(other_flight_filename, self.ALL_ROCKET_PACKETS_FIELDS)
+        entry_size = os.path.getsize(self.flight_cache._get_entry_filename(self.flight_filename))
+        self.set_entry_access_time(self.flight_filename, 1)
+        self.set_entry_access_time(other_flight_filename, 2)
+        self.flight_cache.max_size = entry_size
+
+        self.flight_cache.evict()
+
+        self.assertIsNone(self.flight_cache.load(self.flight_filename))
+        self.assertIsNotNone(self.flight_cache.load(other_flight_filename))
+
+    def store(self, filename, all_rocket_packets_fields):
+        for _ in self.flight_cache.store(filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                                         iter([all_rocket_packets_fields])):
+            pass
+
+    def set_entry_access_time(self, filename, access_time):
+        os.utime(self.flight_cache._get_entry_filename(filename), (access_time, access_time))
@@ -0,0 +1,143 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from src.persistence.csv_data_persister import CsvDataPersister
+from src.persistence.flight_catalog import FlightCatalog
+from src.persistence.sqlite_data_persister import SqliteDataPersister
+from src.rocket_packet.rocket_packet import RocketPacket
+from src.rocket_packet.rocket_packet_parser_factory import RocketPacketParserFactory
+from src.rocket_packet.rocket_packet_repository import RocketPacketRepository
+
+
+class FlightCatalogTest(unittest.TestCase):
+    ROCKET_PACKET_VERSION = 2019
+    ALTITUDES = [10.0, 300.0, 120.0]
+    FIRST_TIME_STAMP = 2.0
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.flights_directory = os.path.join(self.directory.name, "flights")
+        os.mkdir(self.flights_directory)
+        self.catalog_filename = os.path.join(self.directory.name, "cache", "catalog.json")
+
+        self.rocket_packet_parser_factory = RocketPacketParserFactory()
+        self.sqlite_data_persister = SqliteDataPersister()
+        self.rocket_packet_repository = RocketPacketRepository(
+            CsvDataPersister(), self.rocket_packet_parser_factory,
+            {SqliteDataPersister.EXTENSION: self.sqlite_data_persister})
+
+        self.flight_catalog = self.create_flight_catalog()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_update_should_summarize_every_flight(self):
+        filename = self.save_flight("flight.csv")
+
+        self.flight_catalog.update()
+
+        summary, = self.flight_catalog.get_summaries()
+        self.assertEqual(summary.filename, filename)
+        self.assertTrue(summary.is_valid())
+        self.assertEqual(summary.rocket_packet_version, self.ROCKET_PACKET_VERSION)
+        self.assertEqual(summary.packet_count, len(self.ALTITUDES))
+        self.assertEqual(summary.start_time, self.FIRST_TIME_STAMP)
+        self.assertEqual(summary.duration, len(self.ALTITUDES) - 1)
+        self.assertEqual(summary.apogee, max(self.ALTITUDES))
+        self.assertIsNotNone(summary.file_hash)
+
+    def test_update_should_only_read_new_and_modified_flights(self):
+        self.save_flight("flight.csv")
+        self.save_flight("other_flight.csv")
+        self.flight_catalog.update()
+        self.save_flight("other_flight.csv", altitudes=[1.0])
+        progress_callback = Mock()
+
+        self.flight_catalog.update(progress_callback)
+
+        progress_callback.assert_called_once_with(1, 1)
+        summaries = self.flight_catalog.get_summaries()
+        self.assertEqual([summary.packet_count for summary in summaries], [len(self.ALTITUDES), 1])
+
+    def test_update_should_drop_deleted_flights(self):
+        filename = self.save_flight("flight.csv")
+        self.flight_catalog.update()
+        os.remove(filename)
+
+        changed = self.flight_catalog.update()
+
+        self.assertTrue(changed)
+        self.assertEqual(self.flight_catalog.get_summaries(), [])
+
+    def test_update_should_return_false_when_no_flight_changed(self):
+        self.save_flight("flight.csv")
+        self.flight_catalog.update()
+
+        self.assertFalse(self.flight_catalog.update())
+
+    def test_update_should_keep_unreadable_flight_with_its_error(self):
+        filename = os.path.join(self.flights_directory, "notes.csv")
+        with open(filename, "w") as file:
+            file.write("not a flight\n")
+
+        self.flight_catalog.update()
+
+        summary, = self.flight_catalog.get_summaries()
+        self.assertFalse(summary.is_valid())
+
+    def test_update_should_summarize_every_flight_of_a_library(self):
+        database_filename = os.path.join(self.flights_directory, "flights.db")
+        self.save_flight(SqliteDataPersister.get_flight_filename(database_filename, "first"))
+        self.save_flight(SqliteDataPersister.get_flight_filename(database_filename, "second"))
+
+        self.flight_catalog.update()
+
+        self.assertEqual([summary.filename for summary in self.flight_catalog.get_summaries()],
+                         [SqliteDataPersister.get_flight_filename(database_filename, "first"),
+                          SqliteDataPersister.get_flight_filename(database_filename, "second")])
+        self.assertEqual(self.flight_catalog.get_summaries()[0].apogee, max(self.ALTITUDES))
+
+    def test_load_should_read_summaries_saved_by_update(self):
+        filename = self.save_flight("flight.csv")
+        self.flight_catalog.update()
+
+        flight_catalog = self.create_flight_catalog()
+        flight_catalog.load()
+
+        summary, = flight_catalog.get_summaries()
+        self.assertEqual(summary.filename, filename)
+        self.assertEqual(summary.apogee, max(self.ALTITUDES))
+        self.assertFalse(flight_catalog.update())
+
+    def test_load_should_ignore_invalid_catalog(self):
+        os.makedirs(os.path.dirname(self.catalog_filename))
+        with open(self.catalog_filename, "w") as catalog_file:
+            catalog_file.write("{")
+
+        self.flight_catalog.load()
+
+        self.assertEqual(self.flight_catalog.get_summaries(), [])
+
+    def create_flight_catalog(self):
+        return FlightCatalog(self.rocket_packet_repository, self.sqlite_data_persister, self.flights_directory,
+                             self.catalog_filename)
+
+    def save_flight(self, name, altitudes=ALTITUDES):
+        rocket_packets = []
+        for i, altitude in enumerate(altitudes):
+            rocket_packet = RocketPacket()
+            rocket_packet.time_stamp = self.FIRST_TIME_STAMP + i
+            rocket_packet.altitude = altitude
+            rocket_packets.append(rocket_packet)
+
+        filename = os.path.join(self.flights_directory, name)
+        # The modification time must change even when the flight is saved twice within the clock resolution
+        previous_status = os.stat(filename) if os.path.exists(filename) else None
+        self.rocket_packet_repository.save(filename, rocket_packets,
+                                           self.rocket_packet_parser_factory.create(self.ROCKET_PACKET_VERSION))
+        if previous_status is not None:
+            os.utime(filename, ns=(previous_status.st_atime_ns, previous_status.st_mtime_ns + 1000000))
+
+        return filename
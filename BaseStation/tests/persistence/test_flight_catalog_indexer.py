@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import ANY, Mock
+
+from src.persistence.flight_catalog import FlightCatalog, FlightSummary
+from src.persistence.flight_catalog_indexer import FlightCatalogIndexer
+
+
+class FlightCatalogIndexerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.flight_catalog = Mock(spec=FlightCatalog)
+        self.flight_catalog.get_summaries.return_value = []
+        self.updated_listener = Mock()
+
+        self.flight_catalog_indexer = FlightCatalogIndexer(self.flight_catalog)
+        self.flight_catalog_indexer.updated.connect(self.updated_listener)
+
+    def test_run_should_load_catalog_file_before_first_update(self):
+        self.flight_catalog_indexer.run()
+
+        self.flight_catalog.load.assert_called_with()
+        self.flight_catalog.update.assert_called_once_with(ANY)
+        self.assertEqual(self.updated_listener.call_count, 2)
+
+    def test_run_should_not_load_catalog_file_when_catalog_has_summaries(self):
+        self.flight_catalog.get_summaries.return_value = [Mock(spec=FlightSummary)]
+
+        self.flight_catalog_indexer.run()
+
+        self.flight_catalog.load.assert_not_called()
+        self.updated_listener.assert_called_once_with()
+
+    def test_run_should_update_again_when_update_was_requested_while_running(self):
+        self.flight_catalog_indexer.update_requested = True
+
+        self.flight_catalog_indexer.run()
+
+        self.assertEqual(self.flight_catalog.update.call_count, 2)
+
+    def test_start_should_update_catalog_on_another_thread(self):
+        self.flight_catalog_indexer.start()
+        self.flight_catalog_indexer.wait()
+
+        self.flight_catalog.update.assert_called_once_with(ANY)
+        self.assertFalse(self.flight_catalog_indexer.is_running())
@@ -0,0 +1,95 @@
+import errno
+import os
+import random
+import unittest
+
+import numpy as np
+
+from src.persistence.raw_journal import RawJournal
+from src.realtime.checksum_validator import ChecksumValidator
+from src.realtime.frame_synchronizer import FrameSynchronizer
+from src.rocket_packet.rocket_packet_parser_2019 import RocketPacketParser2019
+
+
+class RawJournalTest(unittest.TestCase):
+    TEMPORARY_FILENAME = "tmp.raw"
+    START_CHARACTER = b's'
+    PACKET_COUNT = 5
+
+    def setUp(self):
+        self.parser = RocketPacketParser2019()
+        self.payloads = [self.create_payload(i) for i in range(self.PACKET_COUNT)]
+
+    def test_len_should_return_number_of_valid_frames(self):
+        invalid_frame = self.START_CHARACTER + self.payloads[0] + bytes([0])
+        self.write_journal(bytes([1, 2, 3]) + self.frame(self.payloads[0]) + invalid_frame +
+                           b"".join(self.frame(payload) for payload in self.payloads[1:]))
+
+        journal = RawJournal(self.TEMPORARY_FILENAME, self.parser, self.START_CHARACTER)
+
+        self.assertEqual(len(journal), self.PACKET_COUNT)
+
+    def test_getitem_should_decode_frame_with_parser(self):
+        self.write_journal(b"".join(self.frame(payload) for payload in self.payloads))
+
+        journal = RawJournal(self.TEMPORARY_FILENAME, self.parser, self.START_CHARACTER)
+
+        self.assertEqual(journal[2], self.parser.parse(self.payloads[2]))
+        self.assertEqual(journal[-1], self.parser.parse(self.payloads[-1]))
+
+    def test_getitem_with_slice_should_decode_every_frame_of_slice(self):
+        self.write_journal(b"".join(self.frame(payload) for payload in self.payloads))
+
+        journal = RawJournal(self.TEMPORARY_FILENAME, self.parser, self.START_CHARACTER)
+
+        self.assertEqual(journal[1:4], [self.parser.parse(payload) for payload in self.payloads[1:4]])
+        self.assertEqual(journal[4:4], [])
+
+    def test_get_time_stamps_should_decode_time_stamp_of_every_frame(self):
+        self.write_journal(b"".join(self.frame(payload) for payload in self.payloads))
+
+        journal = RawJournal(self.TEMPORARY_FILENAME, self.parser, self.START_CHARACTER)
+
+        np.testing.assert_array_equal(journal.get_time_stamps(), [i / 10 for i in range(self.PACKET_COUNT)])
+
+    def test_empty_journal_should_have_no_packet(self):
+        self.write_journal(b"")
+
+        journal = RawJournal(self.TEMPORARY_FILENAME, self.parser, self.START_CHARACTER)
+
+        self.assertEqual(len(journal), 0)
+        self.assertEqual(len(journal.get_time_stamps()), 0)
+
+    def test_build_frame_offsets_should_find_same_frames_as_frame_synchronizer(self):
+        frame_size = 4
+        generator = random.Random(42)
+        data = bytes(generator.choice([ord(self.START_CHARACTER), generator.randrange(256)]) for _ in range(5000))
+        frame_synchronizer = FrameSynchronizer(self.START_CHARACTER, frame_size, ChecksumValidator())
+        expected_frames = frame_synchronizer.feed(data)
+
+        class SmallBlockRawJournal(RawJournal):
+            BLOCK_SIZE = 64
+
+        offsets = SmallBlockRawJournal.build_frame_offsets(np.frombuffer(data, dtype=np.uint8), self.START_CHARACTER,
+                                                           frame_size)
+
+        self.assertGreater(len(expected_frames), 0)
+        self.assertEqual([data[offset + 1:offset + 1 + frame_size] for offset in offsets.tolist()], expected_frames)
+
+    def create_payload(self, index: int) -> bytes:
+        values = [index / 10, 46.7, 71.2, b'N', b'W', 0, 100.0 * index, 101325, 20.0] + [index] * 12
+        return self.parser.struct.pack(*values)
+
+    def frame(self, payload: bytes) -> bytes:
+        return self.START_CHARACTER + payload + bytes([(255 - sum(payload)) % 256])
+
+    def write_journal(self, data: bytes):
+        with open(self.TEMPORARY_FILENAME, "wb") as file:
+            file.write(data)
+
+    def tearDown(self):
+        try:
+            os.remove(self.TEMPORARY_FILENAME)
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
@@ -0,0 +1,158 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.domain_error import DomainError
+from src.persistence.sqlite_data_persister import SqliteDataPersister
+
+
+class SqliteDataPersisterTest(unittest.TestCase):
+    ROCKET_PACKET_VERSION = 2019
+    FIELD_NAMES = ["time_stamp", "altitude", "voltage", "ns_indicator"]
+    ALL_ROCKET_PACKETS_FIELDS = [[0.0, 10.0, 3.5, "N"], [1.0, 50.0, 3.7, "N"], [2.0, 30.0, 3.6, "S"],
+                                 [3.0, 5.0, 3.4, "S"]]
+    FLIGHT_NAME = "flight"
+    OTHER_FLIGHT_NAME = "other_flight"
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.database_filename = os.path.join(self.directory.name, "flights.db")
+        self.flight_filename = SqliteDataPersister.get_flight_filename(self.database_filename, self.FLIGHT_NAME)
+
+        self.persister = SqliteDataPersister(chunk_size=3)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_save_load(self):
+        self.persister.save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS)
+
+        version, loaded_packets_fields = self.persister.load(self.flight_filename)
+
+        self.assertEqual(version, self.ROCKET_PACKET_VERSION)
+        self.assertEqual(loaded_packets_fields, self.ALL_ROCKET_PACKETS_FIELDS)
+
+    def test_iter_load_should_return_packets_fields_in_chunks_of_chunk_size(self):
+        self.persister.save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS)
+
+        _, chunks = self.persister.iter_load(self.flight_filename)
+
+        self.assertEqual(list(chunks), [self.ALL_ROCKET_PACKETS_FIELDS[:3], self.ALL_ROCKET_PACKETS_FIELDS[3:]])
+
+    def test_save_should_keep_other_flights_of_library(self):
+        other_flight_filename = SqliteDataPersister.get_flight_filename(self.database_filename, self.OTHER_FLIGHT_NAME)
+        self.persister.save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS)
+
+        self.persister.save(other_flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS[:1])
+
+        self.assertEqual(self.persister.load(self.flight_filename)[1], self.ALL_ROCKET_PACKETS_FIELDS)
+        self.assertEqual(self.persister.load(other_flight_filename)[1], self.ALL_ROCKET_PACKETS_FIELDS[:1])
+
+    def test_save_should_replace_flight_with_same_name(self):
+        self.persister.save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS)
+
+        self.persister.save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS[:2])
+
+        self.assertEqual(self.persister.load(self.flight_filename)[1], self.ALL_ROCKET_PACKETS_FIELDS[:2])
+        self.assertEqual(len(self.persister.get_flights(self.database_filename)), 1)
+
+    def test_load_should_open_last_saved_flight_when_flight_is_not_named(self):
+        self.persister.save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS)
+        self.persister.save(self.database_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS[:1])
+
+        _, loaded_packets_fields = self.persister.load(self.database_filename)
+
+        self.assertEqual(loaded_packets_fields, self.ALL_ROCKET_PACKETS_FIELDS[:1])
+
+    def test_load_should_raise_domain_error_when_flight_does_not_exist(self):
+        self.persister.save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS)
+        other_flight_filename = SqliteDataPersister.get_flight_filename(self.database_filename, self.OTHER_FLIGHT_NAME)
+
+        self.assertRaises(DomainError, self.persister.load, other_flight_filename)
+
+    def test_load_time_range_should_only_return_packets_in_range(self):
+        self.persister.save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS)
+
+        _, loaded_packets_fields = self.persister.load_time_range(self.flight_filename, 0.5, 2.0)
+
+        self.assertEqual(loaded_packets_fields, self.ALL_ROCKET_PACKETS_FIELDS[1:3])
+
+    def test_load_time_range_should_use_time_stamp_index(self):
+        self.persister.save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS)
+
+        with sqlite3.connect(self.database_filename) as connection:
+            plan = connection.execute("EXPLAIN QUERY PLAN SELECT * FROM packets_2019 WHERE flight_id = 1 AND "
+                                      "time_stamp BETWEEN 0 AND 1").fetchall()
+
+        self.assertIn("index_packets_2019_time_stamp", str(plan))
+
+    def test_get_flights_should_return_metadata_of_every_flight(self):
+        other_flight_filename = SqliteDataPersister.get_flight_filename(self.database_filename, self.OTHER_FLIGHT_NAME)
+        self.persister.save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS)
+        self.persister.save(other_flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS[:1])
+
+        flights = self.persister.get_flights(self.database_filename)
+
+        self.assertEqual([flight.name for flight in flights], [self.FLIGHT_NAME, self.OTHER_FLIGHT_NAME])
+        self.assertEqual(flights[0].rocket_packet_version, self.ROCKET_PACKET_VERSION)
+        self.assertEqual(flights[0].packet_count, 4)
+        self.assertEqual(flights[0].duration, 3.0)
+        self.assertEqual(flights[0].apogee, 50.0)
+        self.assertEqual(flights[0].max_voltage, 3.7)
+
+    def test_save_should_open_database_in_wal_mode(self):
+        self.persister.save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS)
+
+        with sqlite3.connect(self.database_filename) as connection:
+            journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+        self.assertEqual(journal_mode, "wal")
+
+    def test_delete_flight_should_delete_its_packets(self):
+        self.persister.save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS)
+
+        self.persister.delete_flight(self.flight_filename)
+
+        with sqlite3.connect(self.database_filename) as connection:
+            packet_count = connection.execute("SELECT COUNT(*) FROM packets_2019").fetchone()[0]
+        self.assertEqual(packet_count, 0)
+        self.assertEqual(self.persister.get_flights(self.database_filename), [])
+
+    def test_delete_flight_should_raise_domain_error_when_database_refuses_deletion(self):
+        self.persister.save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS)
+        with sqlite3.connect(self.database_filename) as connection:
+            connection.execute("CREATE TRIGGER refuse_deletion BEFORE DELETE ON flights "
+                               "BEGIN SELECT RAISE(ABORT, 'refused'); END")
+
+        self.assertRaises(DomainError, self.persister.delete_flight, self.flight_filename)
+
+    def test_load_should_raise_domain_error_when_flights_table_is_invalid(self):
+        with sqlite3.connect(self.database_filename) as connection:
+            connection.execute("CREATE TABLE flights (name TEXT)")
+
+        self.assertRaises(DomainError, self.persister.load, self.flight_filename)
+
+    def test_iter_load_should_raise_domain_error_when_packets_table_is_missing(self):
+        self.persister.save(self.flight_filename, self.ROCKET_PACKET_VERSION, self.FIELD_NAMES,
+                            self.ALL_ROCKET_PACKETS_FIELDS)
+        with sqlite3.connect(self.database_filename) as connection:
+            connection.execute("DROP TABLE packets_2019")
+
+        self.assertRaises(DomainError, self.persister.iter_load, self.flight_filename)
@@ -48,3 +48,13 @@ class ChecksumValidatorTest(unittest.TestCase):
         self.checksum_validator.validate(data_bytes)
 
         message_listener.notify.assert_called_with(AnyString(), MessageType.WARNING)
+
+    def test_is_valid_should_not_notify_listeners_when_invalid_checksum(self):
+        data_bytes = bytes([0])
+        message_listener = Mock(spec=MessageListener)
+        self.checksum_validator.register_message_listener(message_listener)
+
+        is_valid = self.checksum_validator.is_valid(data_bytes)
+
+        self.assertFalse(is_valid)
+        message_listener.notify.assert_not_called()
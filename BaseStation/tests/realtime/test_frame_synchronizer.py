@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import Mock
+
+from src.message_listener import MessageListener
+from src.realtime.checksum_validator import ChecksumValidator
+from src.realtime.frame_synchronizer import FrameSynchronizer
+
+
+class FrameSynchronizerTest(unittest.TestCase):
+    START_CHARACTER = b's'
+    PAYLOAD = bytes([1, 2, 3])
+    OTHER_PAYLOAD = bytes([4, 5, 6])
+    FRAME_SIZE = len(PAYLOAD) + 1
+
+    def setUp(self):
+        self.checksum_validator = ChecksumValidator()
+        self.frame_synchronizer = FrameSynchronizer(self.START_CHARACTER, self.FRAME_SIZE, self.checksum_validator)
+
+    def test_feed_should_return_frame_when_complete_frame_received(self):
+        frames = self.frame_synchronizer.feed(self.START_CHARACTER + self.with_checksum(self.PAYLOAD))
+
+        self.assertEqual(frames, [self.with_checksum(self.PAYLOAD)])
+
+    def test_feed_should_return_every_frame_received_in_one_chunk(self):
+        data = self.frame(self.PAYLOAD) + self.frame(self.OTHER_PAYLOAD)
+
+        frames = self.frame_synchronizer.feed(data)
+
+        self.assertEqual(frames, [self.with_checksum(self.PAYLOAD), self.with_checksum(self.OTHER_PAYLOAD)])
+
+    def test_feed_should_skip_bytes_before_start_character(self):
+        frames = self.frame_synchronizer.feed(bytes([7, 8, 9]) + self.frame(self.PAYLOAD))
+
+        self.assertEqual(frames, [self.with_checksum(self.PAYLOAD)])
+
+    def test_feed_should_wait_for_frame_split_across_reads(self):
+        data = self.frame(self.PAYLOAD)
+
+        first_frames = self.frame_synchronizer.feed(data[:2])
+        second_frames = self.frame_synchronizer.feed(data[2:])
+
+        self.assertEqual(first_frames, [])
+        self.assertEqual(second_frames, [self.with_checksum(self.PAYLOAD)])
+
+    def test_feed_should_resynchronise_on_start_character_inside_invalid_frame(self):
+        truncated_frame = self.START_CHARACTER + bytes([1, 2])
+
+        frames = self.frame_synchronizer.feed(truncated_frame + self.frame(self.PAYLOAD))
+
+        self.assertEqual(frames, [self.with_checksum(self.PAYLOAD)])
+
+    def test_feed_should_notify_only_once_per_resynchronisation(self):
+        message_listener = Mock(spec=MessageListener)
+        self.checksum_validator.register_message_listener(message_listener)
+        garbage = self.START_CHARACTER + self.START_CHARACTER + self.START_CHARACTER + bytes([0, 0, 0, 0])
+
+        self.frame_synchronizer.feed(garbage + self.frame(self.PAYLOAD))
+
+        self.assertEqual(message_listener.notify.call_count, 1)
+
+    def test_reset_should_drop_buffered_bytes(self):
+        data = self.frame(self.PAYLOAD)
+        self.frame_synchronizer.feed(data[:2])
+
+        self.frame_synchronizer.reset()
+        frames = self.frame_synchronizer.feed(data[2:])
+
+        self.assertEqual(frames, [])
+
+    def frame(self, payload: bytes) -> bytes:
+        return self.START_CHARACTER + self.with_checksum(payload)
+
+    @staticmethod
+    def with_checksum(payload: bytes) -> bytes:
+        return payload + bytes([(255 - sum(payload)) % 256])
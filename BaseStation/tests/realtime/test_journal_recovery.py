@@ -0,0 +1,68 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.persistence.csv_data_persister import CsvDataPersister
+from src.realtime.journal_recovery import JournalRecovery
+from src.rocket_packet.rocket_packet_parser_2019 import RocketPacketParser2019
+from src.rocket_packet.rocket_packet_parser_factory import RocketPacketParserFactory
+from src.rocket_packet.rocket_packet_repository import RocketPacketRepository
+
+
+class JournalRecoveryTest(unittest.TestCase):
+    ROCKET_PACKET_VERSION = 2019
+    START_CHARACTER = b's'
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.journal_directory = os.path.join(self.directory, "journals")
+        os.makedirs(self.journal_directory)
+        self.parser = RocketPacketParser2019()
+
+        self.rocket_packet_repository = RocketPacketRepository(CsvDataPersister(), RocketPacketParserFactory())
+        self.rocket_packet_repository.set_raw_journal_format(self.ROCKET_PACKET_VERSION, self.START_CHARACTER)
+        self.journal_recovery = JournalRecovery(self.rocket_packet_repository, RocketPacketParserFactory(),
+                                                self.journal_directory, self.directory)
+
+    def test_recover_all_should_save_journal_packets_in_flight_file(self):
+        payloads = [self.create_payload(i) for i in range(3)]
+        self.write_journal("journal_1.raw", b"".join(self.frame(payload) for payload in payloads))
+
+        flight_filenames = self.journal_recovery.recover_all()
+
+        self.assertEqual(flight_filenames, [os.path.join(self.directory, "journal_1.csv")])
+        _, rocket_packets = self.rocket_packet_repository.load(flight_filenames[0])
+        self.assertEqual(rocket_packets, [self.parser.parse(payload) for payload in payloads])
+
+    def test_recover_all_should_delete_recovered_journals(self):
+        self.write_journal("journal_1.raw", self.frame(self.create_payload(0)))
+        self.write_journal("journal_2.raw", b"")
+
+        self.journal_recovery.recover_all()
+
+        self.assertEqual(self.journal_recovery.get_journals(), [])
+
+    def test_recover_should_not_create_flight_file_when_journal_is_empty(self):
+        journal_filename = self.write_journal("journal_1.raw", b"")
+
+        flight_filename = self.journal_recovery.recover(journal_filename)
+
+        self.assertIsNone(flight_filename)
+        self.assertEqual(os.listdir(self.directory), ["journals"])
+
+    def create_payload(self, index: int) -> bytes:
+        values = [index / 10, 46.7, 71.2, b'N', b'W', 0, 100.0 * index, 101325, 20.0] + [index] * 12
+        return self.parser.struct.pack(*values)
+
+    def frame(self, payload: bytes) -> bytes:
+        return self.START_CHARACTER + payload + bytes([(255 - sum(payload)) % 256])
+
+    def write_journal(self, name: str, data: bytes) -> str:
+        filename = os.path.join(self.journal_directory, name)
+        with open(filename, "wb") as file:
+            file.write(data)
+        return filename
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
@@ -0,0 +1,111 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from src.message_listener import MessageListener
+from src.realtime.journal_writer import JournalWriter
+
+
+class JournalWriterTest(unittest.TestCase):
+    FRAME = b's' + bytes(range(10))
+    OTHER_FRAME = b's' + bytes(range(10, 20))
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.journal_writer = JournalWriter(os.path.join(self.directory, "journals"), fsync_interval=60)
+
+    def test_open_should_create_journal_in_directory(self):
+        filename = self.journal_writer.open()
+
+        self.assertTrue(os.path.isfile(filename))
+        self.assertEqual(os.path.dirname(filename), self.journal_writer.directory)
+        self.assertTrue(self.journal_writer.is_open())
+
+    def test_close_should_write_every_frame(self):
+        filename = self.journal_writer.open()
+        self.journal_writer.write(self.FRAME)
+        self.journal_writer.write(self.OTHER_FRAME)
+
+        self.journal_writer.close()
+
+        self.assertEqual(self.read(filename), self.FRAME + self.OTHER_FRAME)
+        self.assertFalse(self.journal_writer.is_open())
+
+    @patch("os.fsync")
+    def test_sync_should_write_frames_to_disk_before_returning(self, patched_fsync):
+        filename = self.journal_writer.open()
+        self.journal_writer.write(self.FRAME)
+
+        self.journal_writer.sync()
+
+        self.assertEqual(self.read(filename), self.FRAME)
+        patched_fsync.assert_called_once()
+        self.journal_writer.close()
+
+    def test_discard_should_delete_journal(self):
+        filename = self.journal_writer.open()
+        self.journal_writer.write(self.FRAME)
+
+        self.journal_writer.discard()
+
+        self.assertFalse(os.path.exists(filename))
+        self.assertFalse(self.journal_writer.is_open())
+
+    def test_detach_should_keep_journal_and_return_its_name(self):
+        filename = self.journal_writer.open()
+        self.journal_writer.write(self.FRAME)
+
+        detached_filename = self.journal_writer.detach()
+
+        self.assertEqual(detached_filename, filename)
+        with open(filename, "rb") as file:
+            self.assertEqual(file.read(), self.FRAME)
+        self.assertFalse(self.journal_writer.is_open())
+
+    @patch("src.realtime.journal_writer.datetime")
+    def test_open_should_not_reuse_name_of_detached_journal_in_same_instant(self, patched_datetime):
+        patched_datetime.now.return_value = datetime(2019, 6, 22, 10, 30, 15, 123456)
+        detached_filename = self.journal_writer.open()
+        self.journal_writer.write(self.FRAME)
+        self.journal_writer.detach()
+
+        filename = self.journal_writer.open()
+        self.journal_writer.write(self.OTHER_FRAME)
+        self.journal_writer.close()
+
+        self.assertNotEqual(filename, detached_filename)
+        self.assertEqual(self.read(detached_filename), self.FRAME)
+        self.assertEqual(self.read(filename), self.OTHER_FRAME)
+
+    def test_write_should_ignore_frames_when_journal_is_not_open(self):
+        self.journal_writer.write(self.FRAME)
+
+        self.journal_writer.sync()
+        self.journal_writer.close()
+
+        self.assertFalse(os.path.exists(self.journal_writer.directory))
+
+    @patch("os.fsync", side_effect=OSError("disk full"))
+    def test_write_error_should_be_notified_and_stop_journaling(self, _):
+        message_listener = Mock(spec=MessageListener)
+        self.journal_writer.register_message_listener(message_listener)
+        self.journal_writer.open()
+        self.journal_writer.write(self.FRAME)
+
+        self.journal_writer.sync()
+        self.journal_writer.write(self.OTHER_FRAME)
+        self.journal_writer.close()
+
+        message_listener.notify.assert_called_once()
+
+    @staticmethod
+    def read(filename: str) -> bytes:
+        with open(filename, "rb") as file:
+            return file.read()
+
+    def tearDown(self):
+        self.journal_writer.close()
+        shutil.rmtree(self.directory)
@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from src.domain_error import DomainError
+from src.realtime.save_task import SaveTask
+from src.rocket_packet.rocket_packet import RocketPacket
+from src.rocket_packet.rocket_packet_parser import RocketPacketParser
+from src.rocket_packet.rocket_packet_repository import RocketPacketRepository
+
+
+class SaveTaskTest(unittest.TestCase):
+    FILENAME = "foo/bar.csv"
+
+    def setUp(self):
+        self.rocket_packet_repository = Mock(spec=RocketPacketRepository)
+        self.rocket_packet_parser = Mock(spec=RocketPacketParser)
+        self.rocket_packets = [RocketPacket(), RocketPacket()]
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.journal_filename = os.path.join(self.directory.name, "journal.raw")
+        open(self.journal_filename, "wb").close()
+
+        self.save_task = SaveTask(self.rocket_packet_repository, self.FILENAME, self.rocket_packets,
+                                  self.rocket_packet_parser, self.journal_filename)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_run_should_save_rocket_packets_with_progress_callback(self):
+        progress_callback = Mock()
+
+        self.save_task.run(progress_callback)
+
+        self.rocket_packet_repository.save.assert_called_with(self.FILENAME, self.rocket_packets,
+                                                              self.rocket_packet_parser,
+                                                              progress_callback=progress_callback)
+
+    def test_run_should_remove_journal_once_saved(self):
+        self.save_task.run()
+
+        self.assertFalse(os.path.exists(self.journal_filename))
+
+    def test_run_should_keep_journal_when_save_fails(self):
+        self.rocket_packet_repository.save.side_effect = DomainError("error")
+
+        self.assertRaises(DomainError, self.save_task.run)
+        self.assertTrue(os.path.exists(self.journal_filename))
@@ -1,8 +1,11 @@
+import threading
 import unittest
 from unittest.mock import Mock
 
+from src.data_producer import DataProducerListener
 from src.rocket_packet.rocket_packet_parser import RocketPacketParser
 from src.realtime.checksum_validator import ChecksumValidator
+from src.realtime.journal_writer import JournalWriter
 from src.realtime.serial_data_producer import SerialDataProducer
 from src.rocket_packet.rocket_packet import RocketPacket
 from src.rocket_packet.rocket_packet_repository import RocketPacketRepository
@@ -11,6 +14,8 @@ from src.rocket_packet.rocket_packet_repository import RocketPacketRepository
 class SerialDataProducerTest(unittest.TestCase):
     BYTES_IN_PACKET = 74
     SAVE_FILE_PATH = "foo/bar.csv"
+    START_CHARACTER = b's'
+    SAVE_THREAD_TIMEOUT_IN_SECONDS = 0.1
 
     def setUp(self):
         self.lock = Mock()
@@ -18,16 +23,24 @@ class SerialDataProducerTest(unittest.TestCase):
         self.rocket_packet_parser = Mock(spec=RocketPacketParser)
         self.rocket_packet_parser.get_number_of_bytes.return_value = self.BYTES_IN_PACKET
         self.checksum_validator = Mock(spec=ChecksumValidator)
+        self.checksum_validator.validate.return_value = True
+        self.checksum_validator.is_valid.return_value = True
+
+        self.journal_writer = Mock(spec=JournalWriter)
+        self.journal_writer.is_open.return_value = True
+        self.journal_writer.detach.return_value = None
 
         self.serial_data_producer = SerialDataProducer(self.lock, self.rocket_packet_repository,
-                                                       self.rocket_packet_parser, self.checksum_validator)
+                                                       self.rocket_packet_parser, self.checksum_validator,
+                                                       start_character=self.START_CHARACTER,
+                                                       journal_writer=self.journal_writer)
 
     def test_save_should_call_repository_with_flight_data(self):
         self.serial_data_producer.save(self.SAVE_FILE_PATH)
 
         self.rocket_packet_repository.save.assert_called_with(self.SAVE_FILE_PATH,
-                                                              self.serial_data_producer.available_rocket_packets,
-                                                              self.rocket_packet_parser)
+                                                              self.serial_data_producer.get_available_rocket_packets(),
+                                                              self.rocket_packet_parser, progress_callback=None)
 
     def test_no_unsaved_data_after_save(self):
         self.serial_data_producer.unsaved_data = True
@@ -36,6 +49,44 @@ class SerialDataProducerTest(unittest.TestCase):
 
         self.assertFalse(self.serial_data_producer.has_unsaved_data())
 
+    def test_save_should_detach_journal(self):
+        self.journal_writer.detach.return_value = None
+
+        self.serial_data_producer.save(self.SAVE_FILE_PATH)
+
+        self.journal_writer.detach.assert_called_with()
+        self.journal_writer.open.assert_not_called()
+
+    def test_save_should_start_new_journal_when_running(self):
+        self.serial_data_producer.is_running = True
+
+        self.serial_data_producer.save(self.SAVE_FILE_PATH)
+
+        self.journal_writer.detach.assert_called_with()
+        self.journal_writer.open.assert_called_with()
+
+    def test_create_save_task_should_keep_snapshot_of_rocket_packets(self):
+        self.serial_data_producer.add_rocket_packet(RocketPacket())
+
+        save_task = self.serial_data_producer.create_save_task(self.SAVE_FILE_PATH)
+        self.serial_data_producer.clear_rocket_packets()
+
+        self.assertEqual(save_task.get_packet_count(), 1)
+        self.rocket_packet_repository.save.assert_not_called()
+
+    def test_create_save_task_should_hand_over_journal(self):
+        self.journal_writer.detach.return_value = "journal.raw"
+
+        save_task = self.serial_data_producer.create_save_task(self.SAVE_FILE_PATH)
+
+        self.assertEqual(save_task.journal_filename, "journal.raw")
+        self.journal_writer.discard.assert_not_called()
+
+    def test_clear_rocket_packets_should_discard_journal(self):
+        self.serial_data_producer.clear_rocket_packets()
+
+        self.journal_writer.discard.assert_called_with()
+
     def test_clear_rocket_packets_should_clear_all_rocket_packets(self):
         rocket_packet = RocketPacket()
         self.serial_data_producer.add_rocket_packet(rocket_packet)
@@ -50,3 +101,59 @@ class SerialDataProducerTest(unittest.TestCase):
         self.serial_data_producer.clear_rocket_packets()
 
         self.assertFalse(self.serial_data_producer.has_unsaved_data())
+
+    def test_process_bytes_should_add_parsed_rocket_packet_for_each_frame(self):
+        rocket_packets = [RocketPacket(), RocketPacket()]
+        self.rocket_packet_parser.parse_many.return_value = rocket_packets
+        frame = self.START_CHARACTER + bytes(self.BYTES_IN_PACKET + 1)
+
+        self.serial_data_producer.process_bytes(frame + frame)
+
+        self.assertEqual(self.serial_data_producer.get_available_rocket_packets(), rocket_packets)
+        self.rocket_packet_parser.parse_many.assert_called_once_with(bytes(2 * self.BYTES_IN_PACKET))
+        self.assertTrue(self.serial_data_producer.has_unsaved_data())
+
+    def test_process_bytes_should_write_every_frame_to_journal(self):
+        self.rocket_packet_parser.parse_many.return_value = [RocketPacket(), RocketPacket()]
+        frame = self.START_CHARACTER + bytes(self.BYTES_IN_PACKET + 1)
+
+        self.serial_data_producer.process_bytes(bytes([1, 2]) + frame + frame)
+
+        self.journal_writer.write.assert_called_once_with(frame + frame)
+
+    def test_process_bytes_should_notify_listeners_once_per_batch(self):
+        listener = Mock(spec=DataProducerListener)
+        self.serial_data_producer.register_listener(listener)
+        self.rocket_packet_parser.parse_many.return_value = [RocketPacket(), RocketPacket()]
+        frame = self.START_CHARACTER + bytes(self.BYTES_IN_PACKET + 1)
+
+        self.serial_data_producer.process_bytes(frame + frame)
+
+        listener.notify_new_data.assert_called_once_with()
+
+    def test_create_save_task_should_take_packets_of_frames_written_to_detached_journal(self):
+        self.rocket_packet_parser.parse_many.return_value = [RocketPacket(), RocketPacket()]
+        frame = self.START_CHARACTER + bytes(self.BYTES_IN_PACKET + 1)
+        save_tasks = []
+        save_thread = threading.Thread(
+            target=lambda: save_tasks.append(self.serial_data_producer.create_save_task(self.SAVE_FILE_PATH)))
+
+        def write(_):
+            # The acquisition thread is between the journal and the packets when the save is requested
+            save_thread.start()
+            save_thread.join(self.SAVE_THREAD_TIMEOUT_IN_SECONDS)
+            self.journal_writer.detach.assert_not_called()
+
+        self.journal_writer.write.side_effect = write
+        self.serial_data_producer.process_bytes(frame + frame)
+        save_thread.join()
+
+        self.assertEqual(save_tasks[0].get_packet_count(), 2)
+        self.assertFalse(self.serial_data_producer.has_unsaved_data())
+
+    def test_process_bytes_should_not_parse_when_frame_incomplete(self):
+        self.serial_data_producer.process_bytes(self.START_CHARACTER + bytes(self.BYTES_IN_PACKET))
+
+        self.rocket_packet_parser.parse_many.assert_not_called()
+        self.journal_writer.write.assert_not_called()
+        self.assertEqual(self.serial_data_producer.get_available_rocket_packets(), [])
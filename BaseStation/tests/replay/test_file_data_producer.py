@@ -1,7 +1,11 @@
 import threading
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
+import numpy as np
+
+from src.data_producer import DataProducerListener
+from src.persistence.raw_journal import RawJournal
 from src.replay.file_data_producer import FileDataProducer
 from src.replay.playback_state import PlaybackState
 from src.rocket_packet.rocket_packet import RocketPacket
@@ -28,12 +32,17 @@ class FileDataProducerTest(unittest.TestCase):
         rocket_packet_3.time_stamp = self.TIME_STAMP_3
         self.data = [rocket_packet_1, rocket_packet_2, rocket_packet_3]
 
-        def fake_load(filename):
-            return (self.ROCKET_PACKET_VERSION, self.data) if filename == self.SAVE_FILE_PATH else (None, [])
+        def fake_iter_load(filename):
+            return (self.ROCKET_PACKET_VERSION, iter([self.data[:2], self.data[2:]])) \
+                if filename == self.SAVE_FILE_PATH else (None, iter([]))
 
         self.rocket_packet_repository = MagicMock(spec=RocketPacketRepository)
-        self.rocket_packet_repository.load.side_effect = fake_load
+        self.rocket_packet_repository.iter_load.side_effect = fake_iter_load
+        self.rocket_packet_repository.is_raw_journal.side_effect = lambda filename: filename.endswith(".raw")
         self.playback_state = MagicMock(spec=PlaybackState)
+        self.playback_state.get_speed.return_value = self.NORMAL_SPEED
+        self.playback_state.is_going_forward.return_value = True
+        self.playback_state.is_as_fast_as_possible.return_value = False
 
         self.file_data_producer = FileDataProducer(self.rocket_packet_repository, self.DATA_LOCK, self.PLAYBACK_LOCK,
                                                    self.playback_state)
@@ -51,11 +60,30 @@ class FileDataProducerTest(unittest.TestCase):
         self.assertEqual(self.file_data_producer.all_rocket_packets, self.data)
         self.assertEqual(self.file_data_producer.get_available_rocket_packets(), self.data)
 
+    def test_load_should_read_time_stamps_of_every_chunk(self):
+        self.file_data_producer.load(self.SAVE_FILE_PATH)
+
+        self.assertEqual(self.file_data_producer.time_stamps.tolist(),
+                         [self.TIME_STAMP_1, self.TIME_STAMP_2, self.TIME_STAMP_3])
+
     def test_load_should_set_index_at_last_packet(self):
         self.file_data_producer.load(self.SAVE_FILE_PATH)
 
         self.assertEqual(self.file_data_producer.get_current_packet_index(), len(self.data) - 1)
 
+    def test_load_should_not_decode_raw_journal_packets(self):
+        raw_journal = MagicMock(spec=RawJournal)
+        raw_journal.__len__.return_value = len(self.data)
+        raw_journal.get_time_stamps.return_value = np.array([self.TIME_STAMP_1, self.TIME_STAMP_2, self.TIME_STAMP_3])
+        self.rocket_packet_repository.load.return_value = (self.ROCKET_PACKET_VERSION, raw_journal)
+
+        self.file_data_producer.load("capture.raw")
+
+        raw_journal.__getitem__.assert_not_called()
+        self.assertEqual(self.file_data_producer.get_current_packet_index(), -1)
+        self.assertEqual(self.file_data_producer.get_total_packet_count(), len(self.data))
+        self.assertEqual(self.file_data_producer.get_available_rocket_packets(), [])
+
     def test_load_should_set_rocket_packet_version(self):
         self.file_data_producer.load(self.SAVE_FILE_PATH)
 
@@ -102,6 +130,11 @@ class FileDataProducerTest(unittest.TestCase):
 
         self.playback_state.fast_forward.assert_called_with()
 
+    def test_toggle_as_fast_as_possible_should_call_playback_state(self):
+        self.file_data_producer.toggle_as_fast_as_possible()
+
+        self.playback_state.toggle_as_fast_as_possible.assert_called_with()
+
     def test_rewind_should_call_playback_state(self):
         self.file_data_producer.rewind()
 
@@ -110,68 +143,100 @@ class FileDataProducerTest(unittest.TestCase):
     def test_clear_rocket_packets_should_remove_all_available_rocket_packets(self):
         self.file_data_producer.clear_rocket_packets()
 
-        self.assertEqual(self.file_data_producer.available_rocket_packets, [])
+        self.assertEqual(self.file_data_producer.get_available_rocket_packets(), [])
 
+    @patch('time.monotonic')
     @patch('time.sleep')
-    def test_update_replay_should_push_data_when_fast_forwarding_during_replay(self, _):
+    def test_update_replay_should_push_all_due_packets_in_one_batch_when_fast_forwarding(self, _, patched_monotonic):
         self.file_data_producer.load(self.SAVE_FILE_PATH)
-        self.playback_state.is_going_forward.return_value = True
-        self.file_data_producer.index = initial_index = len(self.data) - 3
-        initial_number_of_available_packets = len(self.file_data_producer.available_rocket_packets)
+        self.file_data_producer.set_current_packet_index(0)
+        listener = Mock(spec=DataProducerListener)
+        self.file_data_producer.register_listener(listener)
+        patched_monotonic.return_value = 100
+        self.file_data_producer.update_replay()
+
+        patched_monotonic.return_value = 100 + self.TIME_STAMP_3 - self.TIME_STAMP_1
+        self.file_data_producer.update_replay()
+
+        self.assertEqual(self.file_data_producer.get_current_packet_index(), len(self.data) - 1)
+        self.assertListEqual(self.file_data_producer.get_available_rocket_packets(), self.data)
+        listener.notify_new_data.assert_called_once_with()
+
+    @patch('time.monotonic', return_value=100)
+    @patch('time.sleep')
+    def test_update_replay_should_not_push_data_before_next_packet_is_due(self, _, __):
+        self.file_data_producer.load(self.SAVE_FILE_PATH)
+        self.file_data_producer.set_current_packet_index(0)
 
         self.file_data_producer.update_replay()
 
-        self.assertEqual(len(self.file_data_producer.available_rocket_packets), initial_number_of_available_packets + 1)
-        self.assertEqual(self.file_data_producer.index, initial_index + 1)
+        self.assertEqual(self.file_data_producer.get_current_packet_index(), 0)
 
+    @patch('time.monotonic', return_value=100)
     @patch('time.sleep')
-    def test_update_replay_should_sleep_when_fast_forwarding_during_replay(self, patched_time_sleep):
+    def test_update_replay_should_sleep_until_next_packet_when_fast_forwarding(self, patched_time_sleep, _):
         self.file_data_producer.load(self.SAVE_FILE_PATH)
-        self.playback_state.get_speed.return_value = self.NORMAL_SPEED
-        self.playback_state.is_going_forward.return_value = True
-        self.file_data_producer.index = 0
+        self.file_data_producer.set_current_packet_index(0)
+        self.file_data_producer.MAX_SLEEP_DELAY = self.TIME_STAMP_3
 
         self.file_data_producer.update_replay()
 
-        patched_time_sleep.assert_called_with(self.TIME_STAMP_3 - self.TIME_STAMP_2)
+        patched_time_sleep.assert_called_with(self.TIME_STAMP_2 - self.TIME_STAMP_1)
 
+    @patch('time.monotonic', return_value=100)
     @patch('time.sleep')
-    def test_update_replay_should_sleep_less_when_fast_forwarding_faster_during_replay(self, patched_time_sleep):
+    def test_update_replay_should_sleep_less_when_fast_forwarding_faster(self, patched_time_sleep, _):
         self.file_data_producer.load(self.SAVE_FILE_PATH)
-        self.playback_state.is_going_forward.return_value = True
+        self.file_data_producer.set_current_packet_index(0)
+        self.file_data_producer.MAX_SLEEP_DELAY = self.TIME_STAMP_3
         self.playback_state.get_speed.return_value = self.FAST_SPEED
-        self.file_data_producer.index = 0
 
         self.file_data_producer.update_replay()
 
-        sleep_time = (self.TIME_STAMP_3 - self.TIME_STAMP_2) / self.FAST_SPEED
-        patched_time_sleep.assert_called_with(sleep_time)
+        patched_time_sleep.assert_called_with((self.TIME_STAMP_2 - self.TIME_STAMP_1) / self.FAST_SPEED)
 
-    def test_update_replay_should_push_data_when_fast_forwarding_before_last_packet(self):
+    @patch('time.monotonic')
+    @patch('time.sleep')
+    def test_update_replay_should_not_accumulate_drift_when_waking_up_late(self, patched_time_sleep,
+                                                                           patched_monotonic):
         self.file_data_producer.load(self.SAVE_FILE_PATH)
-        self.playback_state.is_going_forward.return_value = True
-        self.file_data_producer.index = initial_index = len(self.data) - 2
-        initial_number_of_available_packets = len(self.file_data_producer.available_rocket_packets)
+        self.file_data_producer.set_current_packet_index(0)
+        self.file_data_producer.MAX_SLEEP_DELAY = self.TIME_STAMP_3
+        patched_monotonic.return_value = 100
+        self.file_data_producer.update_replay()
+        lateness = 0.5
 
+        patched_monotonic.return_value = 100 + self.TIME_STAMP_2 - self.TIME_STAMP_1 + lateness
         self.file_data_producer.update_replay()
 
-        self.assertEqual(len(self.file_data_producer.available_rocket_packets), initial_number_of_available_packets + 1)
-        self.assertEqual(self.file_data_producer.index, initial_index + 1)
+        self.assertEqual(self.file_data_producer.get_current_packet_index(), 1)
+        patched_time_sleep.assert_called_with(self.TIME_STAMP_3 - self.TIME_STAMP_2 - lateness)
 
+    @patch('time.monotonic', return_value=100)
     @patch('time.sleep')
-    def test_update_replay_should_not_sleep_when_fast_forwarding_before_last_packet(self, patched_time_sleep):
+    def test_update_replay_should_sleep_at_least_one_frame_when_packets_are_late(self, patched_time_sleep, _):
         self.file_data_producer.load(self.SAVE_FILE_PATH)
-        self.playback_state.is_going_forward.return_value = True
-        self.file_data_producer.index = len(self.data) - 2
+        self.playback_state.is_going_forward.return_value = False
+
+        self.file_data_producer.update_replay()
+
+        patched_time_sleep.assert_called_with(self.file_data_producer.MIN_FRAME_PERIOD)
+
+    @patch('time.sleep')
+    def test_update_replay_should_push_a_whole_batch_without_sleeping_when_as_fast_as_possible(self,
+                                                                                             patched_time_sleep):
+        self.file_data_producer.load(self.SAVE_FILE_PATH)
+        self.file_data_producer.clear_rocket_packets()
+        self.playback_state.is_as_fast_as_possible.return_value = True
 
         self.file_data_producer.update_replay()
 
+        self.assertListEqual(self.file_data_producer.get_available_rocket_packets(), self.data)
         patched_time_sleep.assert_not_called()
 
     @patch('time.sleep')
     def test_update_replay_should_sleep_when_fast_forwarding_at_end_of_replay(self, patched_time_sleep):
         self.file_data_producer.load(self.SAVE_FILE_PATH)
-        self.playback_state.is_going_forward.return_value = True
         self.file_data_producer.index = len(self.data) - 1
 
         self.file_data_producer.update_replay()
@@ -187,59 +252,67 @@ class FileDataProducerTest(unittest.TestCase):
 
         patched_time_sleep.assert_called_with(self.file_data_producer.END_OF_PLAYBACK_SLEEP_DELAY)
 
-    def test_update_replay_should_pop_data_when_rewinding_on_second_packet(self):
+    @patch('time.monotonic')
+    @patch('time.sleep')
+    def test_update_replay_should_pop_data_once_its_time_stamp_is_passed_when_rewinding(self, _, patched_monotonic):
         self.file_data_producer.load(self.SAVE_FILE_PATH)
         self.playback_state.is_going_forward.return_value = False
-        self.file_data_producer.index = 1
-        initial_number_of_available_packets = len(self.file_data_producer.available_rocket_packets)
+        patched_monotonic.return_value = 100
+        self.file_data_producer.update_replay()
 
+        patched_monotonic.return_value = 100.1
         self.file_data_producer.update_replay()
 
-        self.assertEqual(len(self.file_data_producer.available_rocket_packets), initial_number_of_available_packets - 1)
-        self.assertEqual(self.file_data_producer.index, 0)
+        self.assertEqual(self.file_data_producer.get_current_packet_index(), len(self.data) - 2)
+        self.assertListEqual(self.file_data_producer.get_available_rocket_packets(), self.data[:-1])
 
+    @patch('time.monotonic')
     @patch('time.sleep')
-    def test_update_replay_should_not_sleep_when_rewinding_on_second_packet(self, patched_time_sleep):
+    def test_update_replay_should_sleep_until_next_pop_when_rewinding(self, patched_time_sleep, patched_monotonic):
         self.file_data_producer.load(self.SAVE_FILE_PATH)
+        self.file_data_producer.MAX_SLEEP_DELAY = self.TIME_STAMP_3
         self.playback_state.is_going_forward.return_value = False
-        self.file_data_producer.index = 1
+        patched_monotonic.return_value = 100
+        self.file_data_producer.update_replay()
 
+        patched_monotonic.return_value = 100.5
         self.file_data_producer.update_replay()
 
-        patched_time_sleep.assert_not_called()
+        patched_time_sleep.assert_called_with(self.TIME_STAMP_3 - self.TIME_STAMP_2 - 0.5)
 
+    @patch('time.monotonic')
     @patch('time.sleep')
-    def test_update_replay_should_pop_data_when_rewinding_during_replay(self, _):
+    def test_update_replay_should_restart_clock_when_speed_changes(self, _, patched_monotonic):
         self.file_data_producer.load(self.SAVE_FILE_PATH)
-        self.playback_state.is_going_forward.return_value = False
-        initial_index = self.file_data_producer.index
-        initial_number_of_available_packets = len(self.file_data_producer.available_rocket_packets)
+        self.file_data_producer.set_current_packet_index(0)
+        patched_monotonic.return_value = 100
+        self.file_data_producer.update_replay()
+        self.playback_state.get_speed.return_value = self.FAST_SPEED
 
+        patched_monotonic.return_value = 102
         self.file_data_producer.update_replay()
 
-        self.assertEqual(len(self.file_data_producer.available_rocket_packets), initial_number_of_available_packets - 1)
-        self.assertEqual(self.file_data_producer.index, initial_index - 1)
+        self.assertEqual(self.file_data_producer.get_current_packet_index(), 0)
 
+    @patch('time.monotonic')
     @patch('time.sleep')
-    def test_update_replay_should_sleep_when_rewinding_during_replay(self, patched_time_sleep):
+    def test_update_replay_should_not_undo_a_seek_made_while_computing_due_packets(self, _, patched_monotonic):
         self.file_data_producer.load(self.SAVE_FILE_PATH)
-        self.playback_state.get_speed.return_value = self.NORMAL_SPEED
-        self.playback_state.is_going_forward.return_value = False
-
+        self.file_data_producer.set_current_packet_index(0)
+        patched_monotonic.return_value = 100
         self.file_data_producer.update_replay()
+        patched_monotonic.return_value = 100 + self.TIME_STAMP_3 - self.TIME_STAMP_1
+        searchsorted = np.searchsorted
 
-        patched_time_sleep.assert_called_with(self.TIME_STAMP_2 - self.TIME_STAMP_1)
+        def seek_then_searchsorted(*args, **kwargs):
+            self.file_data_producer.set_current_packet_index(1)
+            return searchsorted(*args, **kwargs)
 
-    @patch('time.sleep')
-    def test_update_replay_should_sleep_less_when_rewinding_faster_during_replay(self, patched_time_sleep):
-        self.file_data_producer.load(self.SAVE_FILE_PATH)
-        self.playback_state.is_going_forward.return_value = False
-        self.playback_state.get_speed.return_value = self.FAST_SPEED
-
-        self.file_data_producer.update_replay()
+        with patch('numpy.searchsorted', side_effect=seek_then_searchsorted):
+            self.file_data_producer.update_replay()
 
-        sleep_time = (self.TIME_STAMP_2 - self.TIME_STAMP_1) / self.FAST_SPEED
-        patched_time_sleep.assert_called_with(sleep_time)
+        self.assertEqual(self.file_data_producer.get_current_packet_index(), 1)
+        self.assertListEqual(self.file_data_producer.get_available_rocket_packets(), self.data[:2])
 
     def test_set_current_packet_index_should_push_data_when_new_index_is_bigger(self):
         self.file_data_producer.load(self.SAVE_FILE_PATH)
@@ -251,6 +324,15 @@ class FileDataProducerTest(unittest.TestCase):
         self.assertEqual(self.file_data_producer.get_current_packet_index(), new_index)
         self.assertListEqual(self.file_data_producer.get_available_rocket_packets(), self.data)
 
+    def test_set_current_packet_index_should_notify_listeners(self):
+        self.file_data_producer.load(self.SAVE_FILE_PATH)
+        listener = Mock(spec=DataProducerListener)
+        self.file_data_producer.register_listener(listener)
+
+        self.file_data_producer.set_current_packet_index(0)
+
+        listener.notify_new_data.assert_called_with()
+
     def test_set_current_packet_index_should_pop_data_when_new_index_is_smaller(self):
         self.file_data_producer.load(self.SAVE_FILE_PATH)
         new_index = 0
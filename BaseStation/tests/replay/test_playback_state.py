@@ -90,3 +90,18 @@ class PlaybackStateTest(unittest.TestCase):
         playback_state.reset()
 
         self.assertEqual(playback_state.get_speed(), 1)
+
+    def test_toggle_as_fast_as_possible_should_switch_mode_on_and_off(self):
+        playback_state = PlaybackState()
+
+        playback_state.toggle_as_fast_as_possible()
+        self.assertTrue(playback_state.is_as_fast_as_possible())
+        playback_state.toggle_as_fast_as_possible()
+        self.assertFalse(playback_state.is_as_fast_as_possible())
+
+    def test_reset_should_disable_as_fast_as_possible(self):
+        playback_state = PlaybackState(as_fast_as_possible=True)
+
+        playback_state.reset()
+
+        self.assertFalse(playback_state.is_as_fast_as_possible())
@@ -7,6 +7,9 @@ class RocketPacketBuilder:
         self.angular_speed_x = 0
         self.angular_speed_y = 0
         self.angular_speed_z = 0
+        self.acceleration_x = 0
+        self.acceleration_y = 0
+        self.acceleration_z = 0
         self.latitude = 0.0
         self.longitude = 0.0
         self.ns_indicator = b'N'
@@ -28,6 +31,18 @@ class RocketPacketBuilder:
         self.angular_speed_z = angular_speed_z
         return self
 
+    def with_acceleration_x(self, acceleration_x: float):
+        self.acceleration_x = acceleration_x
+        return self
+
+    def with_acceleration_y(self, acceleration_y: float):
+        self.acceleration_y = acceleration_y
+        return self
+
+    def with_acceleration_z(self, acceleration_z: float):
+        self.acceleration_z = acceleration_z
+        return self
+
     def with_latitude(self, latitude: float):
         self.latitude = latitude
         return self
@@ -51,6 +66,9 @@ class RocketPacketBuilder:
         rocket_packet.angular_speed_x = self.angular_speed_x
         rocket_packet.angular_speed_y = self.angular_speed_y
         rocket_packet.angular_speed_z = self.angular_speed_z
+        rocket_packet.acceleration_x = self.acceleration_x
+        rocket_packet.acceleration_y = self.acceleration_y
+        rocket_packet.acceleration_z = self.acceleration_z
         rocket_packet.latitude = self.latitude
         rocket_packet.longitude = self.longitude
         rocket_packet.ns_indicator = self.ns_indicator
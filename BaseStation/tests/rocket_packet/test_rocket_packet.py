@@ -0,0 +1,67 @@
+import pickle
+import unittest
+
+from src.rocket_packet.rocket_packet import RocketPacket
+
+
+class RocketPacketTest(unittest.TestCase):
+    NUMBER_OF_FIELDS = len(RocketPacket.keys())
+
+    def setUp(self):
+        self.values = tuple(float(i) for i in range(self.NUMBER_OF_FIELDS))
+
+    def test_constructor_should_set_default_values(self):
+        rocket_packet = RocketPacket()
+
+        self.assertEqual(rocket_packet.time_stamp, 0)
+        self.assertEqual(rocket_packet.ns_indicator, b'')
+
+    def test_constructor_should_fill_fields_in_keys_order(self):
+        rocket_packet = RocketPacket(self.values)
+
+        self.assertEqual(rocket_packet.time_stamp, 0.0)
+        self.assertEqual(rocket_packet.altitude, 7.0)
+        self.assertEqual(rocket_packet.utc_time, 29.0)
+
+    def test_from_tuple_should_return_same_packet_as_constructor(self):
+        self.assertEqual(RocketPacket.from_tuple(self.values), RocketPacket(self.values))
+
+    def test_from_tuple_should_raise_value_error_when_number_of_values_is_wrong(self):
+        self.assertRaises(ValueError, RocketPacket.from_tuple, self.values[:-1])
+
+    def test_rocket_packet_should_not_accept_unknown_field(self):
+        rocket_packet = RocketPacket()
+
+        self.assertRaises(AttributeError, setattr, rocket_packet, "unknown_field", 0)
+
+    def test_items_should_return_values_with_their_key(self):
+        rocket_packet = RocketPacket(self.values)
+
+        self.assertEqual(list(rocket_packet.items()), list(zip(RocketPacket.keys(), self.values)))
+
+    def test_eq_should_compare_values(self):
+        rocket_packet = RocketPacket(self.values)
+        other_rocket_packet = RocketPacket(self.values)
+
+        self.assertEqual(rocket_packet, other_rocket_packet)
+        other_rocket_packet.altitude = -1
+        self.assertNotEqual(rocket_packet, other_rocket_packet)
+
+    def test_get_field_should_return_field_metadata(self):
+        field = RocketPacket.get_field("altitude")
+
+        self.assertEqual(field.unit, "m")
+        self.assertEqual(field.dtype, "f8")
+        self.assertEqual(RocketPacket.get_field("ns_indicator").dtype, "S1")
+        self.assertRaises(KeyError, RocketPacket.get_field, "invalid_key")
+
+    def test_get_units_should_return_unit_of_every_field(self):
+        units = RocketPacket.get_units()
+
+        self.assertEqual(list(units.keys()), RocketPacket.keys())
+        self.assertEqual(units["angular_speed_x"], "rad/s")
+
+    def test_pickle_should_keep_values(self):
+        rocket_packet = RocketPacket(self.values)
+
+        self.assertEqual(pickle.loads(pickle.dumps(rocket_packet)), rocket_packet)
@@ -60,6 +60,18 @@ class RocketPacketParser2017Test(unittest.TestCase):
 
         self.assertRaises(struct.error, self.parser.parse, invalid_data_bytes)
 
+    def test_parse_many_should_return_one_rocket_packet_per_packet_in_buffer(self):
+        data_bytes = struct.pack(self.parser.format, *self.data)
+
+        rocket_packets = self.parser.parse_many(data_bytes * 3)
+
+        self.assertEqual(rocket_packets, [self.expected_rocket_packet] * 3)
+
+    def test_parse_many_should_raise_struct_error_given_partial_packet(self):
+        data_bytes = struct.pack(self.parser.format, *self.data)
+
+        self.assertRaises(struct.error, self.parser.parse_many, data_bytes[:-1])
+
     def test_get_field_names_should_return_the_names_of_all_rocket_packet_2017_fields(self):
         field_names = self.parser.get_field_names()
 
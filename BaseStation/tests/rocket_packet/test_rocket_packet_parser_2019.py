@@ -57,6 +57,41 @@ class RocketPacketParser2019Test(unittest.TestCase):
 
         self.assertRaises(struct.error, self.parser.parse, invalid_data_bytes)
 
+    def test_parse_should_log_unpacked_data_at_debug_level(self):
+        data_bytes = struct.pack(self.parser.format, *self.data)
+
+        with self.assertLogs("src.rocket_packet.rocket_packet_parser", level="DEBUG") as logs:
+            self.parser.parse(data_bytes)
+
+        self.assertEqual(len(logs.records), 1)
+
+    def test_parse_many_should_return_one_rocket_packet_per_packet_in_buffer(self):
+        data_bytes = struct.pack(self.parser.format, *self.data)
+
+        rocket_packets = self.parser.parse_many(data_bytes * 3)
+
+        self.assertEqual(rocket_packets, [self.expected_rocket_packet] * 3)
+
+    def test_parse_many_should_raise_struct_error_given_partial_packet(self):
+        data_bytes = struct.pack(self.parser.format, *self.data)
+
+        self.assertRaises(struct.error, self.parser.parse_many, data_bytes[:-1])
+
+    def test_get_dtype_should_match_packet_format(self):
+        dtype = self.parser.get_dtype()
+
+        self.assertEqual(dtype.names, tuple(self.EXPECTED_FIELD_NAMES))
+        self.assertEqual(dtype.itemsize, self.parser.get_number_of_bytes())
+
+    def test_parse_columns_should_decode_every_packet_in_buffer(self):
+        data_bytes = struct.pack(self.parser.format, *self.data)
+
+        columns = self.parser.parse_columns(data_bytes * 2)
+
+        self.assertEqual(len(columns), 2)
+        self.assertEqual(columns["altitude"].tolist(), [self.ALTITUDE] * 2)
+        self.assertEqual(columns["ns_indicator"].tolist(), [self.NS_INDICATOR] * 2)
+
     def test_get_field_names_should_return_the_name_of_all_rocket_packet_2019_field(self):
         field_names = self.parser.get_field_names()
 
@@ -1,7 +1,10 @@
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, ANY, call, patch
 
 from src.data_persister import DataPersister
+from src.domain_error import DomainError
+from src.persistence.flight_cache import FlightCache
+from src.persistence.raw_journal import RawJournal
 from src.rocket_packet.rocket_packet import RocketPacket
 from src.rocket_packet.rocket_packet_parser import RocketPacketParser
 from src.rocket_packet.rocket_packet_parser_factory import RocketPacketParserFactory
@@ -21,6 +24,8 @@ class RocketPacketRepositoryTest(TestCase):
     def setUp(self):
         # TODO: use mockito library to configure mocks
         self.data_persister = Mock(spec=DataPersister)
+        self.data_persister.save_stream.side_effect = self.save_stream
+        self.saved_rocket_packets_fields = None
         self.rocket_packet_parser_factory = Mock(spec=RocketPacketParserFactory)
         self.rocket_packet_parser = Mock(spec=RocketPacketParser)
 
@@ -34,11 +39,35 @@ class RocketPacketRepositoryTest(TestCase):
         self.rocket_packet_repository.save(self.A_FILENAME, [self.A_ROCKET_PACKET, self.ANOTHER_ROCKET_PACKET],
                                            self.rocket_packet_parser)
 
-        self.data_persister.save.assert_called_with(self.A_FILENAME, self.A_ROCKET_PACKET_VERSION,
-                                                    self.ROCKET_PACKET_FIELD_NAMES, self.A_ROCKET_PACKET_FIELDS_LIST)
+        self.data_persister.save_stream.assert_called_with(self.A_FILENAME, self.A_ROCKET_PACKET_VERSION,
+                                                           self.ROCKET_PACKET_FIELD_NAMES, ANY)
+        self.assertEqual(self.saved_rocket_packets_fields, self.A_ROCKET_PACKET_FIELDS_LIST)
+
+    def test_save_should_hand_rocket_packets_fields_to_data_persister_by_chunks(self):
+        self.rocket_packet_repository.PROGRESS_STEP = 1
+        self.rocket_packet_parser.to_list.side_effect = self.A_ROCKET_PACKET_FIELDS_LIST
+        chunks = []
+        self.data_persister.save_stream.side_effect = lambda filename, version, field_names, fields_chunks: \
+            chunks.extend(fields_chunks)
+
+        self.rocket_packet_repository.save(self.A_FILENAME, [self.A_ROCKET_PACKET, self.ANOTHER_ROCKET_PACKET],
+                                           self.rocket_packet_parser)
+
+        self.assertEqual(chunks, [[fields] for fields in self.A_ROCKET_PACKET_FIELDS_LIST])
+
+    def test_save_should_report_progress_every_progress_step(self):
+        self.rocket_packet_repository.PROGRESS_STEP = 1
+        self.rocket_packet_parser.to_list.side_effect = self.A_ROCKET_PACKET_FIELDS_LIST
+        progress_callback = Mock()
+
+        self.rocket_packet_repository.save(self.A_FILENAME, [self.A_ROCKET_PACKET, self.ANOTHER_ROCKET_PACKET],
+                                           self.rocket_packet_parser, progress_callback=progress_callback)
+
+        self.assertEqual(progress_callback.call_args_list, [call(1, 2), call(2, 2)])
 
     def test_load_should_return_rocket_packets_assembled_from_fields_lists(self):
-        self.data_persister.load.return_value = (self.A_ROCKET_PACKET_VERSION, self.A_ROCKET_PACKET_FIELDS_LIST)
+        self.data_persister.iter_load.return_value = (self.A_ROCKET_PACKET_VERSION,
+                                                      iter([self.A_ROCKET_PACKET_FIELDS_LIST]))
         self.rocket_packet_parser_factory.create.return_value = self.rocket_packet_parser
         self.rocket_packet_parser.from_list.side_effect = [self.A_ROCKET_PACKET, self.ANOTHER_ROCKET_PACKET]
 
@@ -46,9 +75,128 @@ class RocketPacketRepositoryTest(TestCase):
 
         self.assertEquals(rocket_packets, [self.A_ROCKET_PACKET, self.ANOTHER_ROCKET_PACKET])
 
+    def test_iter_load_should_convert_fields_chunks_lazily(self):
+        fields_chunks = iter([self.A_ROCKET_PACKET_FIELDS_LIST[:1], self.A_ROCKET_PACKET_FIELDS_LIST[1:]])
+        self.data_persister.iter_load.return_value = (self.A_ROCKET_PACKET_VERSION, fields_chunks)
+        self.rocket_packet_parser_factory.create.return_value = self.rocket_packet_parser
+        self.rocket_packet_parser.from_list.side_effect = [self.A_ROCKET_PACKET, self.ANOTHER_ROCKET_PACKET]
+
+        _, rocket_packets_chunks = self.rocket_packet_repository.iter_load(self.A_FILENAME)
+
+        self.rocket_packet_parser.from_list.assert_not_called()
+        self.assertEqual(next(rocket_packets_chunks), [self.A_ROCKET_PACKET])
+        self.assertEqual(self.rocket_packet_parser.from_list.call_count, 1)
+        self.assertEqual(next(rocket_packets_chunks), [self.ANOTHER_ROCKET_PACKET])
+
+    def test_save_should_use_data_persister_of_file_extension(self):
+        binary_data_persister = Mock(spec=DataPersister)
+        self.rocket_packet_repository = RocketPacketRepository(self.data_persister, self.rocket_packet_parser_factory,
+                                                               {".bin": binary_data_persister})
+        self.rocket_packet_parser.to_list.side_effect = self.A_ROCKET_PACKET_FIELDS_LIST
+
+        self.rocket_packet_repository.save("rocketPackets.BIN", [self.A_ROCKET_PACKET, self.ANOTHER_ROCKET_PACKET],
+                                           self.rocket_packet_parser)
+
+        binary_data_persister.save_stream.assert_called_with("rocketPackets.BIN", ANY, ANY, ANY)
+        self.data_persister.save_stream.assert_not_called()
+
+    def test_get_data_persister_should_use_library_extension_for_library_flights(self):
+        sqlite_data_persister = Mock(spec=DataPersister)
+        self.rocket_packet_repository = RocketPacketRepository(self.data_persister, self.rocket_packet_parser_factory,
+                                                               {".db": sqlite_data_persister})
+
+        data_persister = self.rocket_packet_repository.get_data_persister("flights.db::2019-06-20_12h00m")
+
+        self.assertEqual(data_persister, sqlite_data_persister)
+
+    def test_load_should_use_default_data_persister_when_extension_is_unknown(self):
+        binary_data_persister = Mock(spec=DataPersister)
+        self.rocket_packet_repository = RocketPacketRepository(self.data_persister, self.rocket_packet_parser_factory,
+                                                               {".bin": binary_data_persister})
+        self.data_persister.iter_load.return_value = (self.A_ROCKET_PACKET_VERSION, iter([]))
+
+        self.rocket_packet_repository.load(self.A_FILENAME)
+
+        self.data_persister.iter_load.assert_called_with(self.A_FILENAME)
+        binary_data_persister.iter_load.assert_not_called()
+
+    def test_load_should_read_cached_fields_without_data_persister(self):
+        flight_cache = self.create_flight_cache()
+        flight_cache.load.return_value = (self.A_ROCKET_PACKET_VERSION, iter([self.A_ROCKET_PACKET_FIELDS_LIST]))
+        self.rocket_packet_parser_factory.create.return_value = self.rocket_packet_parser
+        self.rocket_packet_parser.from_list.side_effect = [self.A_ROCKET_PACKET, self.ANOTHER_ROCKET_PACKET]
+
+        _, rocket_packets = self.rocket_packet_repository.load(self.A_FILENAME)
+
+        self.assertEqual(rocket_packets, [self.A_ROCKET_PACKET, self.ANOTHER_ROCKET_PACKET])
+        self.data_persister.iter_load.assert_not_called()
+
+    def test_load_should_store_fields_in_cache_when_flight_is_not_cached(self):
+        flight_cache = self.create_flight_cache()
+        flight_cache.load.return_value = None
+        flight_cache.store.side_effect = lambda filename, version, field_names, chunks: chunks
+        fields_chunks = iter([self.A_ROCKET_PACKET_FIELDS_LIST])
+        self.data_persister.iter_load.return_value = (self.A_ROCKET_PACKET_VERSION, fields_chunks)
+        self.rocket_packet_parser_factory.create.return_value = self.rocket_packet_parser
+        self.rocket_packet_parser.get_field_names.return_value = self.ROCKET_PACKET_FIELD_NAMES
+
+        self.rocket_packet_repository.load(self.A_FILENAME)
+
+        flight_cache.store.assert_called_with(self.A_FILENAME, self.A_ROCKET_PACKET_VERSION,
+                                              self.ROCKET_PACKET_FIELD_NAMES, fields_chunks)
+
+    def test_load_should_not_cache_formats_not_cached(self):
+        flight_cache = self.create_flight_cache()
+        flight_cache.is_cached_format.return_value = False
+        self.data_persister.iter_load.return_value = (self.A_ROCKET_PACKET_VERSION, iter([]))
+
+        self.rocket_packet_repository.load(self.A_FILENAME)
+
+        flight_cache.load.assert_not_called()
+        flight_cache.store.assert_not_called()
+
+    def test_load_should_raise_domain_error_when_raw_journal_format_is_not_set(self):
+        self.assertRaises(DomainError, self.rocket_packet_repository.load, "capture.raw")
+
+    @patch("src.rocket_packet.rocket_packet_repository.RawJournal")
+    def test_load_should_open_raw_journal_with_configured_format(self, raw_journal_class):
+        raw_journal_class.EXTENSION = RawJournal.EXTENSION
+        self.rocket_packet_parser_factory.create.return_value = self.rocket_packet_parser
+        self.rocket_packet_repository.set_raw_journal_format(self.A_ROCKET_PACKET_VERSION, b's')
+
+        version, rocket_packets = self.rocket_packet_repository.load("capture.raw")
+
+        self.rocket_packet_parser_factory.create.assert_called_with(self.A_ROCKET_PACKET_VERSION)
+        raw_journal_class.assert_called_with("capture.raw", self.rocket_packet_parser, b's')
+        self.assertEqual(version, self.A_ROCKET_PACKET_VERSION)
+        self.assertEqual(rocket_packets, raw_journal_class.return_value)
+        self.data_persister.iter_load.assert_not_called()
+
+    @patch("src.rocket_packet.rocket_packet_repository.RawJournal")
+    def test_iter_load_should_decode_raw_journal_by_chunks(self, raw_journal_class):
+        raw_journal_class.EXTENSION = RawJournal.EXTENSION
+        rocket_packets = [self.A_ROCKET_PACKET, self.ANOTHER_ROCKET_PACKET, self.A_ROCKET_PACKET]
+        raw_journal_class.return_value = rocket_packets
+        self.rocket_packet_repository.PROGRESS_STEP = 2
+        self.rocket_packet_repository.set_raw_journal_format(self.A_ROCKET_PACKET_VERSION, b's')
+
+        _, rocket_packets_chunks = self.rocket_packet_repository.iter_load("capture.raw")
+
+        self.assertEqual(list(rocket_packets_chunks), [rocket_packets[:2], rocket_packets[2:]])
+
     def test_load_should_return_rocket_packet_version(self):
-        self.data_persister.load.return_value = (self.A_ROCKET_PACKET_VERSION, [])
+        self.data_persister.iter_load.return_value = (self.A_ROCKET_PACKET_VERSION, iter([]))
 
         version, _ = self.rocket_packet_repository.load(self.A_FILENAME)
 
         self.assertEqual(version, self.A_ROCKET_PACKET_VERSION)
+
+    def create_flight_cache(self):
+        flight_cache = Mock(spec=FlightCache)
+        flight_cache.is_cached_format.return_value = True
+        self.rocket_packet_repository = RocketPacketRepository(self.data_persister, self.rocket_packet_parser_factory,
+                                                               flight_cache=flight_cache)
+        return flight_cache
+
+    def save_stream(self, filename, rocket_packet_version, field_names, rocket_packets_fields_chunks):
+        self.saved_rocket_packets_fields = [fields for chunk in rocket_packets_fields_chunks for fields in chunk]
@@ -0,0 +1,163 @@
+import csv
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from src.batch_analysis import FlightAnalysis, analyze_flight, analyze_flights, main
+from src.data_processing.apogee_calculator import ApogeeCalculator
+from src.data_processing.consumer import Consumer, METERS2FEET
+from src.data_processing.consumer_factory import ConsumerFactory
+from src.data_processing.gps.gps_processor import GpsProcessor
+from src.data_processing.gps.utm_coordinates import UTMCoordinates
+from src.data_processing.orientation.orientation import Orientation
+from src.data_processing.orientation.orientation_processor import OrientationProcessor
+from src.persistence.binary_data_persister import BinaryDataPersister
+from src.persistence.csv_data_persister import CsvDataPersister
+from src.rocket_packet.rocket_packet import RocketPacket
+from src.rocket_packet.rocket_packet_parser_factory import RocketPacketParserFactory
+from src.rocket_packet.rocket_packet_repository import RocketPacketRepository
+from tests.builders.config_builder import ConfigBuilder
+
+
+class BatchAnalysisTest(unittest.TestCase):
+    ROCKET_PACKET_VERSION = 2017
+    FIRST_TIME_STAMP = 2.0
+    ALTITUDES = [10.0, 300.0, 120.0]
+    VOLTAGES = [12.0, 11.5, 11.8]
+    EASTING = [0.0, 3.0]
+    NORTHING = [0.0, 4.0]
+    BASE_CAMP_SPREAD = UTMCoordinates(0.6, 0.8)
+    ORIENTATION_SPREAD = Orientation(1.2, 1.6, 0.0)
+    # The orientation of the real pipeline needs an acceleration, so the rocket stands still on the pad
+    GRAVITY = 9.81
+    # The packets send the altitude as a float32
+    FLOATING_POINT_PRECISION = 3
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.config = ConfigBuilder().build()
+
+        self.gps_processor = Mock(spec=GpsProcessor)
+        self.gps_processor.get_projected_coordinates.return_value = (self.EASTING, self.NORTHING)
+        self.gps_processor.get_base_camp_spread.return_value = self.BASE_CAMP_SPREAD
+        self.consumer_factory = Mock(spec=ConsumerFactory)
+        self.consumer_factory.create.side_effect = self.create_consumer
+
+        self.filename = self.save_flight("flight.csv")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_analyze_flight_should_summarize_the_processed_flight(self):
+        analysis = analyze_flight(self.filename, self.config, consumer_factory=self.consumer_factory)
+
+        self.assertTrue(analysis.is_valid())
+        self.assertEqual(analysis.rocket_packet_version, self.ROCKET_PACKET_VERSION)
+        self.assertEqual(analysis.packet_count, len(self.ALTITUDES))
+        self.assertEqual(analysis.duration, len(self.ALTITUDES) - 1)
+        self.assertAlmostEqual(analysis.apogee_altitude_feet, max(self.ALTITUDES) * METERS2FEET,
+                               self.FLOATING_POINT_PRECISION)
+        self.assertEqual(analysis.apogee_time_stamp, self.FIRST_TIME_STAMP + 1)
+        self.assertEqual(analysis.time_to_apogee, 1)
+        self.assertEqual(analysis.drift_distance, 5)
+        self.assertAlmostEqual(analysis.base_camp_spread, 1)
+        self.assertAlmostEqual(analysis.orientation_spread, 2)
+        self.assertAlmostEqual(analysis.max_voltage_drop, 0.5)
+        self.assertIsNone(analysis.columns_filename)
+
+    def test_analyze_flight_should_not_compute_the_voltage_drop_of_packets_without_voltage(self):
+        filename = self.save_flight("flight_2019.csv", rocket_packet_version=2019)
+
+        analysis = analyze_flight(filename, self.config, consumer_factory=self.consumer_factory)
+
+        self.assertTrue(analysis.is_valid())
+        self.assertIsNone(analysis.max_voltage_drop)
+
+    def test_analyze_flight_should_save_the_processed_columns(self):
+        columns_directory = os.path.join(self.directory.name, "processed")
+
+        analysis = analyze_flight(self.filename, self.config, columns_directory, self.consumer_factory)
+
+        self.assertEqual(analysis.columns_filename, os.path.join(columns_directory, "flight_processed.bin"))
+        version, columns = BinaryDataPersister().load_columns(analysis.columns_filename)
+        self.assertEqual(version, self.ROCKET_PACKET_VERSION)
+        self.assertEqual(columns["altitude"].tolist(), self.ALTITUDES)
+        for altitude_feet, altitude in zip(columns["altitude_feet"], self.ALTITUDES):
+            self.assertAlmostEqual(altitude_feet, altitude * METERS2FEET, self.FLOATING_POINT_PRECISION)
+
+    def test_analyze_flight_should_report_a_flight_that_cannot_be_read(self):
+        filename = os.path.join(self.directory.name, "missing.csv")
+
+        analysis = analyze_flight(filename, self.config, consumer_factory=self.consumer_factory)
+
+        self.assertFalse(analysis.is_valid())
+        self.assertEqual(analysis.filename, filename)
+
+    def test_analyze_flights_should_keep_the_order_of_the_files_and_report_failures(self):
+        other_filename = self.save_flight("other_flight.csv")
+
+        def create_consumer(data_producer, rocket_packet_version, config):
+            if self.consumer_factory.create.call_count == 1:
+                raise RuntimeError("pipeline")
+            return self.create_consumer(data_producer, rocket_packet_version, config)
+
+        self.consumer_factory.create.side_effect = create_consumer
+
+        analyses = analyze_flights([self.filename, other_filename], self.config, max_workers=1,
+                                   consumer_factory=self.consumer_factory)
+
+        self.assertEqual([analysis.filename for analysis in analyses], [self.filename, other_filename])
+        self.assertEqual(analyses[0].error, "pipeline")
+        self.assertEqual(analyses[1].error, None)
+
+    def test_analyze_flights_should_spread_the_files_across_processes(self):
+        filenames = [os.path.join(self.directory.name, "missing_{}.csv".format(i)) for i in range(2)] + [self.filename]
+
+        analyses = analyze_flights(filenames, self.config, max_workers=2)
+
+        self.assertEqual([analysis.filename for analysis in analyses], filenames)
+        self.assertFalse(any(analysis.is_valid() for analysis in analyses[:2]))
+        # The flight goes through the whole pipeline of a worker, not through the mocks of the test
+        analysis = analyses[2]
+        self.assertTrue(analysis.is_valid(), analysis.error)
+        self.assertEqual(analysis.packet_count, len(self.ALTITUDES))
+        self.assertAlmostEqual(analysis.apogee_altitude_feet, max(self.ALTITUDES) * METERS2FEET,
+                               self.FLOATING_POINT_PRECISION)
+        self.assertEqual(analysis.apogee_time_stamp, self.FIRST_TIME_STAMP + 1)
+
+    def test_main_should_write_the_summary_and_fail_when_a_flight_fails(self):
+        filename = os.path.join(self.directory.name, "missing.csv")
+        summary_filename = os.path.join(self.directory.name, "summary.csv")
+
+        exit_code = main([filename, "-o", summary_filename, "-j", "1"])
+
+        self.assertEqual(exit_code, 1)
+        with open(summary_filename, newline="") as file:
+            header, row = list(csv.reader(file))
+        self.assertEqual(tuple(header), FlightAnalysis.FIELD_NAMES)
+        self.assertEqual(row[0], filename)
+
+    def create_consumer(self, data_producer, rocket_packet_version, config):
+        rocket_packet_dtype = RocketPacketParserFactory.create(rocket_packet_version).get_dtype()
+        orientation_processor = Mock(spec=OrientationProcessor)
+        orientation_processor.get_initialization_spread.return_value = self.ORIENTATION_SPREAD
+        return Consumer(data_producer, ApogeeCalculator(), self.gps_processor, orientation_processor,
+                        rocket_packet_dtype)
+
+    def save_flight(self, name, rocket_packet_version=ROCKET_PACKET_VERSION):
+        rocket_packets = []
+        for i, (altitude, voltage) in enumerate(zip(self.ALTITUDES, self.VOLTAGES)):
+            rocket_packet = RocketPacket()
+            rocket_packet.time_stamp = self.FIRST_TIME_STAMP + i
+            rocket_packet.altitude = altitude
+            rocket_packet.voltage = voltage
+            rocket_packet.acceleration_z = self.GRAVITY
+            rocket_packets.append(rocket_packet)
+
+        rocket_packet_parser_factory = RocketPacketParserFactory()
+        filename = os.path.join(self.directory.name, name)
+        RocketPacketRepository(CsvDataPersister(), rocket_packet_parser_factory).save(
+            filename, rocket_packets, rocket_packet_parser_factory.create(rocket_packet_version))
+
+        return filename
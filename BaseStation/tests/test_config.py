@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+from configparser import ConfigParser
+
+from src.config import ConfigLoader, JournalConfig
+
+
+class ConfigLoaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.config_filename = os.path.join(self.directory.name, "config.ini")
+
+        self.config_parser = ConfigParser()
+        self.config_parser.read(ConfigLoader.FILENAME)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_should_read_journal_section(self):
+        self.config_parser["journal"]["directory"] = "./journals/"
+        self.config_parser["journal"]["fsync_interval_in_seconds"] = "2.5"
+        self.write_config()
+
+        config = ConfigLoader.load(self.config_filename)
+
+        self.assertEqual(config.journal_config.directory, "./journals/")
+        self.assertEqual(config.journal_config.fsync_interval_in_seconds, 2.5)
+
+    def test_load_should_use_default_journal_config_when_config_has_no_journal_section(self):
+        self.config_parser.remove_section("journal")
+        self.write_config()
+
+        config = ConfigLoader.load(self.config_filename)
+
+        self.assertEqual(config.journal_config.directory, JournalConfig.DEFAULT_DIRECTORY)
+        self.assertEqual(config.journal_config.fsync_interval_in_seconds,
+                         JournalConfig.DEFAULT_FSYNC_INTERVAL_IN_SECONDS)
+
+    def write_config(self):
+        with open(self.config_filename, "w") as config_file:
+            self.config_parser.write(config_file)
@@ -6,6 +6,9 @@ from PyQt5.QtCore import QTimer
 from src.controller import Controller
 from src.data_processing.consumer import Consumer
 from src.data_processing.consumer_factory import ConsumerFactory
+from src.data_processing.consumer_snapshot import ConsumerSnapshot
+from src.data_processing.generation import Generation
+from src.data_processing.consumer_worker import ConsumerWorker
 from src.data_processing.gps.gps_coordinates import GpsCoordinates
 from src.data_processing.orientation.orientation import Orientation
 from src.data_producer import DataProducer
@@ -26,6 +29,8 @@ class ControllerTest(unittest.TestCase):
     EASTINGS = [32]
     NORTHINGS = [52]
     GPS_COORDINATES = GpsCoordinates(46.77930, -71.27621)
+    GENERATION = Generation(3)
+    POSITIONS_GENERATION = Generation(2)
     VOLTAGE = 3.3
     BOARD_STATE_1 = True
     BOARD_STATE_2 = True
@@ -44,6 +49,9 @@ class ControllerTest(unittest.TestCase):
         self.data_motor_widget = Mock(spec=DataMotorWidget)
         self.data_producer = Mock(spec=DataProducer)
         self.consumer = MagicMock(spec=Consumer)
+        self.snapshot = MagicMock(spec=ConsumerSnapshot)
+        self.consumer.update.return_value = True
+        self.consumer.create_snapshot.return_value = self.snapshot
         self.consumer_factory = Mock(spec=ConsumerFactory)
         self.consumer_factory.create.return_value = self.consumer
         config = ConfigBuilder().with_gui_fps(1000 / self.UPDATES_INTERVAL_IN_MILLIS).build()
@@ -52,25 +60,50 @@ class ControllerTest(unittest.TestCase):
         self.controller = Controller(self.data_widget, self.data_motor_widget, self.data_producer, self.consumer_factory, config, self.qtimer)
         self.controller.create_new_consumer(self.A_ROCKET_PACKET_VERSION)
 
-    def test_update_should_update_consumer(self):
+    def test_update_should_not_update_consumer(self):
+        self.controller.on_snapshot_ready(self.snapshot)
+
+        self.controller.update()
+
+        self.consumer.update.assert_not_called()
+
+    def test_update_should_not_update_ui_when_no_snapshot_was_received(self):
         self.controller.update()
 
+        self.assert_ui_not_updated()
+
+    def test_refresh_should_update_consumer_and_render_its_snapshot(self):
+        self.snapshot.has_data.return_value = True
+        self.setup_consumer_data()
+
+        self.controller.refresh()
+
         self.consumer.update.assert_called_with()
+        self.data_widget.draw_altitude.assert_called_with(self.TIMESTAMPS, self.ALTITUDES, self.GENERATION)
+
+    def test_create_new_consumer_should_forget_previous_snapshot(self):
+        self.controller.on_snapshot_ready(self.snapshot)
+
+        self.controller.create_new_consumer(self.A_ROCKET_PACKET_VERSION)
+
+        self.assertIsNone(self.controller.snapshot)
 
     def test_update_should_update_plots_when_consumer_has_data(self):
-        self.consumer.has_data.return_value = True
+        self.snapshot.has_data.return_value = True
+        self.controller.on_snapshot_ready(self.snapshot)
         self.setup_consumer_data()
 
         self.controller.update()
 
-        self.data_widget.draw_altitude.assert_called_with(self.TIMESTAMPS, self.ALTITUDES)
+        self.data_widget.draw_altitude.assert_called_with(self.TIMESTAMPS, self.ALTITUDES, self.GENERATION)
         self.data_widget.draw_apogee.assert_called_with(self.APOGEE)
-        self.data_widget.draw_map.assert_called_with(self.EASTINGS, self.NORTHINGS)
+        self.data_widget.draw_map.assert_called_with(self.EASTINGS, self.NORTHINGS, self.POSITIONS_GENERATION)
         self.data_widget.show_current_coordinates.assert_called_with(self.GPS_COORDINATES)
-        self.data_widget.draw_voltage.assert_called_with(self.VOLTAGE)
+        self.data_widget.draw_voltage.assert_called_with(self.TIMESTAMPS, self.VOLTAGE, self.GENERATION)
 
     def test_update_should_update_leds_when_consumer_has_data(self):
-        self.consumer.has_data.return_value = True
+        self.snapshot.has_data.return_value = True
+        self.controller.on_snapshot_ready(self.snapshot)
         self.setup_consumer_data()
 
         self.controller.update()
@@ -78,32 +111,37 @@ class ControllerTest(unittest.TestCase):
         self.assert_leds_updated()
 
     def test_update_should_update_thermometer_when_consumer_has_data(self):
-        self.consumer.has_data.return_value = True
-        self.consumer.get_average_temperature.return_value = self.TEMPERATURE
+        self.snapshot.has_data.return_value = True
+        self.controller.on_snapshot_ready(self.snapshot)
+        self.snapshot.get_average_temperature.return_value = self.TEMPERATURE
 
         self.controller.update()
 
         self.data_widget.set_thermometer_value.assert_called_with(self.TEMPERATURE)
 
     def test_update_should_update_3d_model_when_consumer_has_data(self):
-        self.consumer.has_data.return_value = True
-        self.consumer.get_rocket_orientation.return_value = self.ORIENTATION
+        self.snapshot.has_data.return_value = True
+        self.controller.on_snapshot_ready(self.snapshot)
+        self.snapshot.get_rocket_orientation.return_value = self.ORIENTATION
 
         self.controller.update()
 
         self.data_widget.set_rocket_model_orientation.assert_called_with(self.ORIENTATION)
 
     def test_update_should_not_update_ui_when_consumer_has_no_data(self):
-        self.consumer.has_data.return_value = False
+        self.snapshot.has_data.return_value = False
+        self.controller.on_snapshot_ready(self.snapshot)
 
         self.controller.update()
 
         self.assert_ui_not_updated()
 
-    def test_update_should_clear_consumer(self):
+    def test_update_should_not_clear_consumer(self):
+        self.controller.on_snapshot_ready(self.snapshot)
+
         self.controller.update()
 
-        self.consumer.clear.assert_called_with()
+        self.consumer.clear.assert_not_called()
 
     @patch("src.controller.OpenRocketSimulation")
     def test_add_open_rocket_simulation_should_show_simulation_in_ui(self, simulation):
@@ -139,10 +177,46 @@ class ControllerTest(unittest.TestCase):
 
         self.data_producer.start.assert_called_with()
 
-    def test_start_updates_should_start_timer_with_updates_interval(self):
+    def test_on_snapshot_ready_should_schedule_render_within_updates_interval(self):
+        self.qtimer.isActive.return_value = False
+
+        self.controller.on_snapshot_ready(self.snapshot)
+
+        interval = self.qtimer.start.call_args[0][0]
+        self.assertLessEqual(interval, self.UPDATES_INTERVAL_IN_MILLIS)
+
+    def test_on_snapshot_ready_should_not_schedule_another_render_when_one_is_pending(self):
+        self.qtimer.isActive.return_value = True
+
+        self.controller.on_snapshot_ready(self.snapshot)
+
+        self.qtimer.start.assert_not_called()
+
+    def test_update_should_not_render_same_snapshot_twice(self):
+        self.snapshot.has_data.return_value = True
+        self.setup_consumer_data()
+        self.controller.on_snapshot_ready(self.snapshot)
+        self.controller.update()
+        self.data_widget.reset_mock()
+
+        self.controller.update()
+
+        self.assert_ui_not_updated()
+
+    def test_start_updates_should_start_consumer_worker(self):
+        self.controller.consumer_worker = Mock(spec=ConsumerWorker)
+
         self.controller.start_updates()
 
-        self.qtimer.start.assert_called_with(self.UPDATES_INTERVAL_IN_MILLIS)
+        self.controller.consumer_worker.start.assert_called_with()
+
+    def test_stop_updates_should_stop_consumer_worker(self):
+        consumer_worker = Mock(spec=ConsumerWorker)
+        self.controller.consumer_worker = consumer_worker
+
+        self.controller.stop_updates()
+
+        consumer_worker.stop.assert_called_with()
 
     def test_stop_updates_should_stop_producer(self):
         self.controller.stop_updates()
@@ -167,10 +241,12 @@ class ControllerTest(unittest.TestCase):
                 "acquisition_board_state_3": [self.BOARD_STATE_3], "power_supply_state_1": [self.POWER_SUPPLY_STATE_1],
                 "power_supply_state_2": [self.POWER_SUPPLY_STATE_2],
                 "payload_board_state_1": [self.PAYLOAD_BOARD_STATE_1], "time_stamp": self.TIMESTAMPS}
-        self.consumer.__getitem__.side_effect = lambda arg: data[arg]
-        self.consumer.get_projected_coordinates.return_value = (self.EASTINGS, self.NORTHINGS)
-        self.consumer.get_last_gps_coordinates.return_value = self.GPS_COORDINATES
-        self.consumer.get_apogee.return_value = self.APOGEE
+        self.snapshot.__getitem__.side_effect = lambda arg: data[arg]
+        self.snapshot.get_projected_coordinates.return_value = (self.EASTINGS, self.NORTHINGS)
+        self.snapshot.get_last_gps_coordinates.return_value = self.GPS_COORDINATES
+        self.snapshot.get_apogee.return_value = self.APOGEE
+        self.snapshot.get_generation.return_value = self.GENERATION
+        self.snapshot.get_positions_generation.return_value = self.POSITIONS_GENERATION
 
     def assert_leds_updated(self):
         calls = [call(1, self.BOARD_STATE_1), call(2, self.BOARD_STATE_2), call(3, self.BOARD_STATE_3),
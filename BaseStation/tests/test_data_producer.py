@@ -1,7 +1,8 @@
 import threading
 import unittest
+from unittest.mock import Mock
 
-from src.data_producer import DataProducer
+from src.data_producer import DataProducer, DataProducerListener
 from src.rocket_packet.rocket_packet import RocketPacket
 
 
@@ -16,8 +17,8 @@ class DataProducerTest(unittest.TestCase):
 
         copy = self.data_producer.get_available_rocket_packets()
 
-        self.assertEqual(copy, self.data_producer.available_rocket_packets)
-        self.assertFalse(copy is self.data_producer.available_rocket_packets)
+        self.assertEqual(copy, self.data_producer.get_available_rocket_packets())
+        self.assertFalse(copy is self.data_producer.get_available_rocket_packets())
 
     def test_add_rocket_packet_should_add_packet_to_list(self):
         initial_packet_number = len(self.data_producer.get_available_rocket_packets())
@@ -26,3 +27,32 @@ class DataProducerTest(unittest.TestCase):
 
         final_packet_number = len(self.data_producer.get_available_rocket_packets())
         self.assertEqual(final_packet_number, initial_packet_number + 1)
+
+    def test_rocket_packet_reader_should_only_return_new_packets(self):
+        reader = self.data_producer.create_rocket_packet_reader()
+        first_packet, second_packet = RocketPacket(), RocketPacket()
+        self.data_producer.add_rocket_packet(first_packet)
+        reader.read()
+        self.data_producer.add_rocket_packet(second_packet)
+
+        start_index, rocket_packets = reader.read()
+
+        self.assertEqual(start_index, 1)
+        self.assertEqual(rocket_packets, [second_packet])
+
+    def test_add_rocket_packet_should_notify_listeners(self):
+        listener = Mock(spec=DataProducerListener)
+        self.data_producer.register_listener(listener)
+
+        self.data_producer.add_rocket_packet(RocketPacket())
+
+        listener.notify_new_data.assert_called_with()
+
+    def test_unregister_listener_should_stop_notifications(self):
+        listener = Mock(spec=DataProducerListener)
+        self.data_producer.register_listener(listener)
+        self.data_producer.unregister_listener(listener)
+
+        self.data_producer.add_rocket_packet(RocketPacket())
+
+        listener.notify_new_data.assert_not_called()
@@ -0,0 +1,105 @@
+import threading
+import unittest
+
+from src.packet_queue import PacketQueue
+
+
+class PacketQueueTest(unittest.TestCase):
+    INITIAL_CAPACITY = 2
+
+    def setUp(self):
+        self.packet_queue = PacketQueue(threading.RLock(), self.INITIAL_CAPACITY)
+
+    def test_append_should_grow_backing_store_when_full(self):
+        for i in range(self.INITIAL_CAPACITY + 1):
+            self.packet_queue.append(i)
+
+        self.assertEqual(len(self.packet_queue), self.INITIAL_CAPACITY + 1)
+        self.assertGreater(self.packet_queue.get_capacity(), self.INITIAL_CAPACITY)
+        self.assertEqual(self.packet_queue.to_list(), [0, 1, 2])
+
+    def test_extend_should_add_all_packets(self):
+        self.packet_queue.extend([0, 1, 2, 3, 4])
+
+        self.assertEqual(self.packet_queue.to_list(), [0, 1, 2, 3, 4])
+
+    def test_read_should_return_all_packets_on_first_read(self):
+        reader = self.packet_queue.create_reader()
+        self.packet_queue.extend([0, 1, 2])
+
+        start_index, packets = reader.read()
+
+        self.assertEqual(start_index, 0)
+        self.assertEqual(packets, [0, 1, 2])
+
+    def test_read_should_return_only_packets_appended_since_last_read(self):
+        reader = self.packet_queue.create_reader()
+        self.packet_queue.extend([0, 1])
+        reader.read()
+        self.packet_queue.append(2)
+
+        start_index, packets = reader.read()
+
+        self.assertEqual(start_index, 2)
+        self.assertEqual(packets, [2])
+
+    def test_read_should_return_nothing_when_no_new_packet(self):
+        reader = self.packet_queue.create_reader()
+        self.packet_queue.append(0)
+        reader.read()
+
+        start_index, packets = reader.read()
+
+        self.assertEqual(start_index, 1)
+        self.assertEqual(packets, [])
+
+    def test_readers_should_keep_independent_cursors(self):
+        first_reader = self.packet_queue.create_reader()
+        second_reader = self.packet_queue.create_reader()
+        self.packet_queue.append(0)
+        first_reader.read()
+        self.packet_queue.append(1)
+
+        _, first_reader_packets = first_reader.read()
+        _, second_reader_packets = second_reader.read()
+
+        self.assertEqual(first_reader_packets, [1])
+        self.assertEqual(second_reader_packets, [0, 1])
+
+    def test_truncate_should_rewind_readers_past_new_length(self):
+        reader = self.packet_queue.create_reader()
+        self.packet_queue.extend([0, 1, 2, 3])
+        reader.read()
+
+        self.packet_queue.truncate(1)
+        self.packet_queue.append(4)
+
+        start_index, packets = reader.read()
+        self.assertEqual(start_index, 1)
+        self.assertEqual(packets, [4])
+
+    def test_pop_should_return_last_packet_and_rewind_readers(self):
+        reader = self.packet_queue.create_reader()
+        self.packet_queue.extend([0, 1])
+        reader.read()
+
+        packet = self.packet_queue.pop()
+
+        self.assertEqual(packet, 1)
+        self.assertEqual(reader.read(), (1, []))
+
+    def test_clear_should_remove_all_packets_and_rewind_readers(self):
+        reader = self.packet_queue.create_reader()
+        self.packet_queue.extend([0, 1])
+        reader.read()
+
+        self.packet_queue.clear()
+
+        self.assertEqual(len(self.packet_queue), 0)
+        self.assertEqual(reader.read(), (0, []))
+
+    def test_getitem_should_support_negative_index(self):
+        self.packet_queue.extend([0, 1, 2])
+
+        self.assertEqual(self.packet_queue[-1], 2)
+        self.assertRaises(IndexError, self.packet_queue.__getitem__, 3)
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import Mock, MagicMock, ANY
+from unittest.mock import Mock, MagicMock
 
 from PyQt5.QtCore import QTimer
 from PyQt5.QtGui import QCloseEvent
@@ -52,13 +52,14 @@ class RealTimeControllerTest(unittest.TestCase):
 
         self.real_time_widget.update_button_text.assert_called_with(False)
 
-    def test_real_time_button_callback_should_start_timer_when_is_not_running(self):
+    def test_real_time_button_callback_should_start_consumer_worker_when_is_not_running(self):
         self.serial_data_producer.has_unsaved_data.return_value = True
 
         self.real_time_controller.real_time_button_callback()
 
         self.serial_data_producer.start.assert_called_with()
-        self.qtimer.start.assert_called_with(ANY)
+        self.assertTrue(self.real_time_controller.consumer_worker.is_running())
+        self.real_time_controller.consumer_worker.stop()
 
     def test_real_time_button_callback_should_update_button_text_when_is_not_running(self):
         self.serial_data_producer.has_unsaved_data.return_value = True
@@ -126,6 +127,29 @@ class RealTimeControllerTest(unittest.TestCase):
         self.qtimer.stop.assert_called_with()
         self.serial_data_producer.stop.assert_called_with()
 
+    def test_on_close_should_clear_rocket_packets_so_journal_is_not_recovered(self):
+        self.serial_data_producer.has_unsaved_data.return_value = True
+        self.save_manager.save.return_value = SaveStatus.UNSAVED
+
+        self.real_time_controller.on_close(self.event)
+
+        self.serial_data_producer.clear_rocket_packets.assert_called_with()
+
+    def test_on_close_should_wait_for_saves_in_progress(self):
+        self.serial_data_producer.has_unsaved_data.return_value = True
+        self.save_manager.save.return_value = SaveStatus.SAVED
+
+        self.real_time_controller.on_close(self.event)
+
+        self.save_manager.wait.assert_called_with()
+
+    def test_register_message_listener_should_register_listener_on_save_manager(self):
+        listener = Mock(spec=MessageListener)
+
+        self.real_time_controller.register_message_listener(listener)
+
+        self.save_manager.register_message_listener.assert_called_with(listener)
+
     def test_on_close_should_not_close_when_cancelled_save_status(self):
         self.serial_data_producer.has_unsaved_data.return_value = True
         self.save_manager.save.return_value = SaveStatus.CANCELLED
@@ -1,10 +1,11 @@
 import unittest
-from unittest.mock import Mock, MagicMock, ANY
+from unittest.mock import Mock, MagicMock
 
 from PyQt5.QtCore import QTimer
 
 from src.data_processing.consumer import Consumer
 from src.data_processing.consumer_factory import ConsumerFactory
+from src.data_processing.consumer_snapshot import ConsumerSnapshot
 from src.replay.file_data_producer import FileDataProducer
 from src.replay_controller import ReplayController
 from src.ui.replay_widget import ReplayWidget
@@ -35,6 +36,15 @@ class ReplayControllerTest(unittest.TestCase):
         self.replay_controller = ReplayController(self.replay_widget, self.motor_widget, self.file_data_producer, self.consumer_factory,
                                                   config, self.qtimer)
 
+    def test_as_fast_as_possible_button_callback_should_toggle_mode_and_update_speed_indicator(self):
+        self.file_data_producer.get_speed.return_value = 1
+        self.file_data_producer.is_as_fast_as_possible.return_value = True
+
+        self.replay_controller.as_fast_as_possible_button_callback()
+
+        self.file_data_producer.toggle_as_fast_as_possible.assert_called_with()
+        self.replay_widget.update_replay_speed_text.assert_called_with(1, True)
+
     def test_control_bar_callback_should_pass_frame_index_to_data_producer(self):
         frame_index = 3
 
@@ -49,14 +59,14 @@ class ReplayControllerTest(unittest.TestCase):
 
         self.file_data_producer.restart.assert_called_with()
 
-    def test_play_pause_button_callback_should_start_timer_when_is_paused_and_not_running(self):
+    def test_play_pause_button_callback_should_start_updates_when_is_paused_and_not_running(self):
         self.file_data_producer.is_suspended.return_value = True
         self.replay_controller.is_running = False
 
         self.replay_controller.play_pause_button_callback()
 
         self.file_data_producer.start.assert_called_with()
-        self.qtimer.start.assert_called_with(ANY)
+        self.assertTrue(self.replay_controller.is_running)
 
     def test_play_pause_button_callback_should_not_start_timer_when_is_paused_and_running(self):
         self.file_data_producer.is_suspended.return_value = True
@@ -115,11 +125,14 @@ class ReplayControllerTest(unittest.TestCase):
 
     def test_activate_should_update_ui(self):
         data = {"time_stamp": self.TIMESTAMPS, "altitude_feet": self.ALTITUDE_DATA}
-        self.consumer.__getitem__.side_effect = lambda arg: data.get(arg, self.DEFAULT_VALUES)
+        snapshot = MagicMock(spec=ConsumerSnapshot)
+        snapshot.__getitem__.side_effect = lambda arg: data.get(arg, self.DEFAULT_VALUES)
+        self.consumer.create_snapshot.return_value = snapshot
 
         self.replay_controller.activate(self.A_FILENAME)
 
-        self.replay_widget.draw_altitude.assert_called_with(self.TIMESTAMPS, self.ALTITUDE_DATA)
+        self.replay_widget.draw_altitude.assert_called_with(self.TIMESTAMPS, self.ALTITUDE_DATA,
+                                                            snapshot.get_generation.return_value)
 
     def test_deactivate_should_stop_timer_when_is_running(self):
         self.replay_controller.is_running = True
@@ -1,10 +1,12 @@
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock, patch
 
 from PyQt5.QtWidgets import QMessageBox
 
 from src.message_listener import MessageListener
+from src.domain_error import DomainError
 from src.message_type import MessageType
+from src.realtime.save_task import SaveTask
 from src.realtime.serial_data_producer import SerialDataProducer
 from src.save import SaveManager, SaveStatus
 from src.ui.real_time_widget import RealTimeWidget
@@ -20,26 +22,97 @@ class SaveManagerTest(TestCase):
         self.serial_data_producer = Mock(spec=SerialDataProducer)
         self.real_time_widget = Mock(spec=RealTimeWidget)
 
+        self.save_task = Mock(spec=SaveTask)
+        self.save_task.filename = self.A_FILE_NAME
+        self.serial_data_producer.create_save_task.return_value = self.save_task
+
         self.save_manager = SaveManager(self.serial_data_producer, self.real_time_widget)
+        self.save_manager.save_progressed = Mock()
+        self.save_manager.save_finished = Mock()
 
     def test_save_should_save_when_user_saves(self):
         self.real_time_widget.show_save_message_box.return_value = QMessageBox.Yes
         self.real_time_widget.get_save_file_name.return_value = self.A_FILE_NAME
 
         self.save_manager.save()
+        self.save_manager.wait()
 
-        self.serial_data_producer.save.assert_called_with(self.A_FILE_NAME)
+        self.serial_data_producer.create_save_task.assert_called_with(self.A_FILE_NAME)
+        self.save_task.run.assert_called_with(ANY)
 
-    def test_save_should_notify_message_listener_when_user_saves(self):
-        listener = Mock(spec=MessageListener)
-        self.save_manager.register_message_listener(listener)
+    @patch("threading.Thread")
+    def test_save_should_write_file_on_another_thread(self, thread_class):
+        self.real_time_widget.show_save_message_box.return_value = QMessageBox.Yes
+        self.real_time_widget.get_save_file_name.return_value = self.A_FILE_NAME
+
+        self.save_manager.save()
+
+        thread_class.return_value.start.assert_called_with()
+        self.save_task.run.assert_not_called()
+
+    def test_save_should_emit_save_finished_when_file_is_written(self):
+        self.real_time_widget.show_save_message_box.return_value = QMessageBox.Yes
+        self.real_time_widget.get_save_file_name.return_value = self.A_FILE_NAME
+
+        self.save_manager.save()
+        self.save_manager.wait()
+
+        self.save_manager.save_finished.emit.assert_called_with(self.A_FILE_NAME, "")
+
+    def test_save_should_emit_save_finished_with_error_when_save_fails(self):
+        self.save_task.run.side_effect = DomainError("Impossible d'ouvrir le fichier")
+        self.real_time_widget.show_save_message_box.return_value = QMessageBox.Yes
+        self.real_time_widget.get_save_file_name.return_value = self.A_FILE_NAME
+
+        self.save_manager.save()
+        self.save_manager.wait()
+
+        self.save_manager.save_finished.emit.assert_called_with(self.A_FILE_NAME, "Impossible d'ouvrir le fichier")
+
+    def test_save_should_emit_save_finished_with_error_when_save_fails_unexpectedly(self):
+        self.save_task.run.side_effect = ValueError()
         self.real_time_widget.show_save_message_box.return_value = QMessageBox.Yes
         self.real_time_widget.get_save_file_name.return_value = self.A_FILE_NAME
 
         self.save_manager.save()
+        self.save_manager.wait()
+
+        self.save_manager.save_finished.emit.assert_called_with(self.A_FILE_NAME, "ValueError")
+
+    def test_save_should_emit_save_progressed_as_percentage(self):
+        self.save_task.run.side_effect = lambda progress_callback: progress_callback(1, 4)
+        self.real_time_widget.show_save_message_box.return_value = QMessageBox.Yes
+        self.real_time_widget.get_save_file_name.return_value = self.A_FILE_NAME
+
+        self.save_manager.save()
+        self.save_manager.wait()
+
+        self.save_manager.save_progressed.emit.assert_called_with(self.A_FILE_NAME, 25)
+
+    def test_on_save_finished_should_notify_message_listener(self):
+        listener = Mock(spec=MessageListener)
+        self.save_manager.register_message_listener(listener)
+
+        self.save_manager.on_save_finished(self.A_FILE_NAME, "")
 
         listener.notify.assert_called_with(AnyStringWith(self.A_FILE_NAME), MessageType.INFO)
 
+    def test_on_save_finished_should_notify_error_when_save_failed(self):
+        listener = Mock(spec=MessageListener)
+        self.save_manager.register_message_listener(listener)
+
+        self.save_manager.on_save_finished(self.A_FILE_NAME, "error")
+
+        listener.notify.assert_called_with(AnyStringWith(self.A_FILE_NAME), MessageType.ERROR)
+
+    def test_on_save_progressed_should_notify_message_listener(self):
+        listener = Mock(spec=MessageListener)
+        self.save_manager.register_message_listener(listener)
+
+        self.save_manager.on_save_progressed(self.A_FILE_NAME, 25)
+
+        listener.notify.assert_called_with(AnyStringWith("25%"), MessageType.INFO)
+
     def test_save_should_return_saved_status_when_user_saves(self):
         self.real_time_widget.show_save_message_box.return_value = QMessageBox.Yes
         self.real_time_widget.get_save_file_name.return_value = self.A_FILE_NAME
@@ -54,7 +127,7 @@ class SaveManagerTest(TestCase):
 
         self.save_manager.save()
 
-        self.serial_data_producer.save.assert_not_called()
+        self.serial_data_producer.create_save_task.assert_not_called()
 
     def test_save_should_return_cancelled_status_when_user_chooses_no_file(self):
         self.real_time_widget.show_save_message_box.return_value = QMessageBox.Yes
@@ -69,7 +142,7 @@ class SaveManagerTest(TestCase):
 
         self.save_manager.save()
 
-        self.serial_data_producer.save.assert_not_called()
+        self.serial_data_producer.create_save_task.assert_not_called()
 
     def test_save_should_return_unsaved_status_when_user_doesnt_save(self):
         self.real_time_widget.show_save_message_box.return_value = QMessageBox.No
@@ -83,7 +156,7 @@ class SaveManagerTest(TestCase):
 
         self.save_manager.save()
 
-        self.serial_data_producer.save.assert_not_called()
+        self.serial_data_producer.create_save_task.assert_not_called()
 
     def test_save_should_return_cancelled_status_when_user_cancels(self):
         self.real_time_widget.show_save_message_box.return_value = QMessageBox.Cancel
@@ -0,0 +1,43 @@
+import unittest
+from unittest.mock import patch
+
+from src.ui.frame_time_counter import FrameTimeCounter
+
+
+class FrameTimeCounterTest(unittest.TestCase):
+    FRAME_COUNT = 2
+
+    def setUp(self):
+        self.frame_time_counter = FrameTimeCounter(self.FRAME_COUNT)
+
+    def count_frame(self, start_time: float, stop_time: float):
+        with patch("time.perf_counter", side_effect=[start_time, stop_time]):
+            self.frame_time_counter.start()
+            self.frame_time_counter.stop()
+
+    def test_get_average_frame_time_should_return_zero_without_frame(self):
+        self.assertEqual(self.frame_time_counter.get_average_frame_time(), 0.0)
+        self.assertEqual(self.frame_time_counter.get_max_frame_time(), 0.0)
+
+    def test_get_average_frame_time_should_average_frames(self):
+        self.count_frame(10.0, 10.5)
+        self.count_frame(11.0, 12.5)
+
+        self.assertEqual(self.frame_time_counter.get_average_frame_time(), 1.0)
+        self.assertEqual(self.frame_time_counter.get_max_frame_time(), 1.5)
+
+    def test_get_average_frame_time_should_only_average_last_frames(self):
+        self.count_frame(10.0, 14.0)
+        self.count_frame(15.0, 15.5)
+        self.count_frame(16.0, 17.5)
+
+        self.assertEqual(self.frame_time_counter.get_average_frame_time(), 1.0)
+        self.assertEqual(self.frame_time_counter.total_frame_count, 3)
+
+    def test_is_window_complete_should_return_true_every_frame_count_frames(self):
+        completions = []
+        for i in range(2 * self.FRAME_COUNT):
+            self.count_frame(float(i), i + 0.5)
+            completions.append(self.frame_time_counter.is_window_complete())
+
+        self.assertEqual(completions, [False, True, False, True])